@@ -0,0 +1,43 @@
+"""appointments no overlap exclusion constraint
+
+Revision ID: 3c9d2f1a7b64
+Revises: 94600ace37ba
+Create Date: 2026-10-18 10:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d2f1a7b64'
+down_revision: Union[str, Sequence[str], None] = '94600ace37ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # appointments is not part of the migration chain yet; databases that create it
+    # from the models get the constraint from AppointmentModel.__table_args__.
+    if not sa.inspect(op.get_bind()).has_table('appointments'):
+        return
+
+    op.execute(
+        """
+        ALTER TABLE appointments
+        ADD CONSTRAINT appointments_no_overlap_per_user
+        EXCLUDE USING gist (user_id WITH =, tstzrange(start_at, end_at, '[)') WITH &&)
+        WHERE (status <> 'CANCELED')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if sa.inspect(op.get_bind()).has_table('appointments'):
+        op.drop_constraint('appointments_no_overlap_per_user', 'appointments')
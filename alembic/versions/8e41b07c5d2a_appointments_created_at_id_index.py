@@ -0,0 +1,34 @@
+"""appointments created_at id index
+
+Revision ID: 8e41b07c5d2a
+Revises: 3c9d2f1a7b64
+Create Date: 2026-10-18 14:37:05.611942
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41b07c5d2a'
+down_revision: Union[str, Sequence[str], None] = '3c9d2f1a7b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # appointments is not part of the migration chain yet; databases that create it
+    # from the models get the index from AppointmentModel.__table_args__.
+    if not sa.inspect(op.get_bind()).has_table('appointments'):
+        return
+
+    op.create_index('ix_appointments_created_at_id', 'appointments', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if sa.inspect(op.get_bind()).has_table('appointments'):
+        op.drop_index('ix_appointments_created_at_id', table_name='appointments')
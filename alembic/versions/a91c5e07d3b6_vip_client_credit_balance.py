@@ -0,0 +1,58 @@
+"""vip client credit balance
+
+Revision ID: a91c5e07d3b6
+Revises: f4b19c7e2a05
+Create Date: 2026-10-18 21:26:07.552914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91c5e07d3b6'
+down_revision: Union[str, Sequence[str], None] = 'f4b19c7e2a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    # vip_client and client_credit_entry are not part of the migration chain yet;
+    # databases that create them from the models get the foreign key from
+    # VipClientCreditBalanceModel and have no ledger to backfill.
+    foreign_keys = []
+    if inspector.has_table('vip_client'):
+        foreign_keys.append(sa.ForeignKeyConstraint(['vip_client_id'], ['vip_client.id']))
+
+    op.create_table(
+        'vip_client_credit_balance',
+        sa.Column('vip_client_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('balance', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        *foreign_keys,
+        sa.PrimaryKeyConstraint('vip_client_id'),
+    )
+
+    if not inspector.has_table('client_credit_entry'):
+        return
+
+    # existing ledgers start from their current sum
+    op.execute(
+        """
+        INSERT INTO vip_client_credit_balance (vip_client_id, balance, updated_at)
+        SELECT vip_client_id, SUM(quantity), now()
+        FROM client_credit_entry
+        GROUP BY vip_client_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('vip_client_credit_balance')
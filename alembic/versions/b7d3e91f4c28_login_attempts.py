@@ -0,0 +1,43 @@
+"""login attempts
+
+Revision ID: b7d3e91f4c28
+Revises: 8e41b07c5d2a
+Create Date: 2026-10-18 16:12:40.208117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e91f4c28'
+down_revision: Union[str, Sequence[str], None] = '8e41b07c5d2a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'login_attempts',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('key', sa.String(length=320), nullable=False),
+        sa.Column('attempted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_login_attempts_attempted_at'), 'login_attempts', ['attempted_at'], unique=False
+    )
+    op.create_index(
+        'ix_login_attempts_key_attempted_at', 'login_attempts', ['key', 'attempted_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_login_attempts_key_attempted_at', table_name='login_attempts')
+    op.drop_index(op.f('ix_login_attempts_attempted_at'), table_name='login_attempts')
+    op.drop_table('login_attempts')
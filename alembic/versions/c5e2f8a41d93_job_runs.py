@@ -0,0 +1,34 @@
+"""job runs
+
+Revision ID: c5e2f8a41d93
+Revises: a91c5e07d3b6
+Create Date: 2026-10-18 23:04:51.276310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e2f8a41d93'
+down_revision: Union[str, Sequence[str], None] = 'a91c5e07d3b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'job_runs',
+        sa.Column('job', sa.String(length=100), nullable=False),
+        sa.Column('window_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('ran_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('job'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_runs')
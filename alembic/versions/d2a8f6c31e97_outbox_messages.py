@@ -0,0 +1,55 @@
+"""outbox messages
+
+Revision ID: d2a8f6c31e97
+Revises: b7d3e91f4c28
+Create Date: 2026-10-18 17:03:55.481226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a8f6c31e97'
+down_revision: Union[str, Sequence[str], None] = 'b7d3e91f4c28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'outbox_messages',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('event_type', sa.String(length=200), nullable=False),
+        sa.Column('handler_name', sa.String(length=200), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('PENDING', 'DISPATCHED', 'FAILED', name='outboxstatus'),
+            nullable=False,
+        ),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('available_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_outbox_messages_pending_available_at',
+        'outbox_messages',
+        ['available_at'],
+        unique=False,
+        postgresql_where="status = 'PENDING'",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_messages_pending_available_at', table_name='outbox_messages')
+    op.drop_table('outbox_messages')
+    sa.Enum(name='outboxstatus').drop(op.get_bind(), checkfirst=True)
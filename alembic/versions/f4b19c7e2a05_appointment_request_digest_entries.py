@@ -0,0 +1,61 @@
+"""appointment request digest entries
+
+Revision ID: f4b19c7e2a05
+Revises: d2a8f6c31e97
+Create Date: 2026-10-18 19:12:40.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b19c7e2a05'
+down_revision: Union[str, Sequence[str], None] = 'd2a8f6c31e97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+appointment_type_enum = postgresql.ENUM(
+    'TATTOO', 'PIERCING', name='appointment_type_enum', create_type=False
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the type belongs to appointments, which is not part of the migration chain yet;
+    # databases that create appointments from the models already have it.
+    appointment_type_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        'appointment_request_digest_entries',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('appointment_type', appointment_type_enum, nullable=False),
+        sa.Column('start_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('end_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('sessions_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_appointment_request_digest_entries_user_id_created_at',
+        'appointment_request_digest_entries',
+        ['user_id', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_appointment_request_digest_entries_user_id_created_at',
+        table_name='appointment_request_digest_entries',
+    )
+    op.drop_table('appointment_request_digest_entries')
+
+    if not sa.inspect(op.get_bind()).has_table('appointments'):
+        appointment_type_enum.drop(op.get_bind(), checkfirst=True)
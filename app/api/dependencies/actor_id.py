@@ -3,7 +3,8 @@ from typing import Annotated
 from fastapi import Depends, Header, HTTPException, status
 
 from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
-from app.api.dependencies.security import get_access_token_service
+from app.api.dependencies.security import get_access_token_cache, get_access_token_service
+from app.application.studio.services.access_token_cache import AccessTokenCache
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
 from app.application.studio.use_cases.DTO.login_dto import VerifyInput
 from app.application.studio.use_cases.users_use_cases.verify_user import VerifyUserUseCase
@@ -15,11 +16,12 @@ def get_optional_actor_id(
     authorization: Annotated[str | None, Header()] = None,
     uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
     access_tokens: VersionedTokenService = Depends(get_access_token_service),
+    access_token_cache: AccessTokenCache | None = Depends(get_access_token_cache),
 ):
     if authorization is None:
         return None
 
-    use_case = VerifyUserUseCase(uow, access_tokens)
+    use_case = VerifyUserUseCase(uow, access_tokens, access_token_cache)
 
     try:
         result = use_case.execute(VerifyInput(authorization=authorization))
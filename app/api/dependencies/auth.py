@@ -1,7 +1,8 @@
 from fastapi import Depends, Header, HTTPException, status
 
 from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
-from app.api.dependencies.security import get_access_token_service
+from app.api.dependencies.security import get_access_token_cache, get_access_token_service
+from app.application.studio.services.access_token_cache import AccessTokenCache
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
 from app.application.studio.use_cases.DTO.login_dto import VerifyInput
 from app.application.studio.use_cases.users_use_cases.verify_user import (
@@ -15,8 +16,9 @@ def get_current_user(
     authorization: str = Header(...),
     uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
     access_tokens: VersionedTokenService = Depends(get_access_token_service),
+    access_token_cache: AccessTokenCache | None = Depends(get_access_token_cache),
 ):
-    use_case = VerifyUserUseCase(uow, access_tokens)
+    use_case = VerifyUserUseCase(uow, access_tokens, access_token_cache)
 
     try:
         result = use_case.execute(VerifyInput(authorization=authorization))
@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from app.application.studio.services.login_rate_limiter import (
+    InMemoryLoginRateLimiter,
+    LoginRateLimiter,
+)
+from app.core.config import settings
+from app.infrastructure.sqlalchemy.login_rate_limiter import SqlAlchemyLoginRateLimiter
+
+
+def _build_login_rate_limiter() -> LoginRateLimiter:
+    window = timedelta(seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS)
+
+    if settings.LOGIN_RATE_LIMIT_BACKEND == "postgres":
+        return SqlAlchemyLoginRateLimiter(window=window)
+
+    return InMemoryLoginRateLimiter(window=window)
+
+
+login_rate_limiter = _build_login_rate_limiter()
+
+
+def get_login_rate_limiter() -> LoginRateLimiter:
+    return login_rate_limiter
@@ -1,6 +1,7 @@
+from fastapi import Request
+
 from app.application.notifications.ports.email_service import EmailService
-from app.infrastructure.email.brevo_email_service import BrevoEmailService
 
 
-def get_email_service() -> EmailService:
-    return BrevoEmailService()
+def get_email_service(request: Request) -> EmailService:
+    return request.app.state.email_service
@@ -4,6 +4,7 @@ from app.domain.studio.appointments.policies.appointment_authorization_policy im
 from app.domain.studio.appointments.policies.calendar_availability_policy import (
     CalendarAvailabilityPolicy,
 )
+from app.infrastructure.sqlalchemy.calendar_changes import calendar_index
 
 
 def get_calendar_policy():
@@ -12,3 +13,7 @@ def get_calendar_policy():
 
 def get_appointment_authorization_policy():
     return AppointmentAuthorizationPolicy()
+
+
+def get_calendar_index():
+    return calendar_index
@@ -1,14 +1,14 @@
-from typing import Generator
+from fastapi import Depends
 
+from app.api.dependencies.request_session import get_request_session
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from app.infrastructure.sqlalchemy.session import RequestSession
 from app.infrastructure.sqlalchemy.unit_of_work.read_unit_of_work import (
     SqlAlchemyReadUnitOfWork,
 )
 
 
-def get_read_unit_of_work() -> Generator[ReadUnitOfWork, None, None]:
-    uow = SqlAlchemyReadUnitOfWork()
-    try:
-        yield uow
-    finally:
-        uow.session.close()
+def get_read_unit_of_work(
+    request_session: RequestSession = Depends(get_request_session),
+) -> ReadUnitOfWork:
+    return SqlAlchemyReadUnitOfWork(session_factory=request_session)
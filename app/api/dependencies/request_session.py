@@ -0,0 +1,11 @@
+from typing import Generator
+
+from app.infrastructure.sqlalchemy.session import RequestSession
+
+
+def get_request_session() -> Generator[RequestSession, None, None]:
+    request_session = RequestSession()
+    try:
+        yield request_session
+    finally:
+        request_session.close()
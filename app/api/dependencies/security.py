@@ -1,7 +1,9 @@
 from fastapi import Depends
+from app.application.studio.services.access_token_cache import AccessTokenCache
 from app.core.config import settings
 from app.core.security.versioned_token_service import VersionedTokenService
 from app.core.security.jwt_service import JWTService
+from app.infrastructure.sqlalchemy.access_changes import access_token_cache
 
 
 def get_jwt_service() -> JWTService:
@@ -42,3 +44,7 @@ def get_refresh_token_service(
         token_type="refresh",
         ttl_minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES,
     )
+
+
+def get_access_token_cache() -> AccessTokenCache | None:
+    return access_token_cache
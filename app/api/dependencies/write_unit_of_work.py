@@ -1,13 +1,13 @@
-from typing import Generator
+from fastapi import Depends
 
+from app.api.dependencies.request_session import get_request_session
+from app.infrastructure.sqlalchemy.session import RequestSession
 from app.infrastructure.sqlalchemy.unit_of_work.write_unit_of_work import (
     SqlAlchemyWriteUnitOfWork,
 )
 
 
-def get_write_unit_of_work() -> Generator[SqlAlchemyWriteUnitOfWork, None, None]:
-    uow = SqlAlchemyWriteUnitOfWork()
-    try:
-        yield uow
-    finally:
-        uow.session.close()
+def get_write_unit_of_work(
+    request_session: RequestSession = Depends(get_request_session),
+) -> SqlAlchemyWriteUnitOfWork:
+    return SqlAlchemyWriteUnitOfWork(session_factory=request_session)
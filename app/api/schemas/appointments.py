@@ -25,6 +25,28 @@ class CreateAppointmentRequest(BaseModel):
     referral_code: str | None = None
 
 
+class AppointmentSessionRequest(BaseModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class CreateAppointmentSeriesRequest(BaseModel):
+    appointment_type: AppointmentType
+    user_id: UUID
+    sessions: list[AppointmentSessionRequest] = Field(min_length=1)
+    placement: str
+    details: str
+    size: str | None
+    color: bool
+
+    vip_client_id: UUID | None = None
+    name: str | None = None
+    email: str | None = None
+    phone: str | None = None
+
+    referral_code: str | None = None
+
+
 class QuoteAppointmentRequest(BaseModel):
     price: Decimal = Field(gt=0, max_digits=10, decimal_places=2)
 
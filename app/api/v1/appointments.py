@@ -1,23 +1,34 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import (
     APIRouter,
     Depends,
     HTTPException,
+    Query,
     status,
 )
 
 from app.api.dependencies.actor_id import get_optional_actor_id
 from app.api.dependencies.auth import get_current_active_user
 from app.api.dependencies.events import get_integration_event_bus, get_transactional_event_bus
-from app.api.dependencies.policies import get_appointment_authorization_policy, get_calendar_policy
+from app.api.dependencies.policies import (
+    get_appointment_authorization_policy,
+    get_calendar_index,
+    get_calendar_policy,
+)
 from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
 from app.api.dependencies.write_unit_of_work import (
     get_write_unit_of_work,
 )
-from app.api.schemas.appointments import CreateAppointmentRequest, QuoteAppointmentRequest
+from app.api.schemas.appointments import (
+    CreateAppointmentRequest,
+    CreateAppointmentSeriesRequest,
+    QuoteAppointmentRequest,
+)
 from app.application.event_bus.integration_event_bus import IntegrationEventBus
 from app.application.event_bus.transactional_event_bus import TransactionalEventBus
+from app.application.studio.services.calendar_index import CalendarIndex
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
 from app.application.studio.unit_of_work.write_unit_of_work import (
     WriteUnitOfWork,
@@ -25,23 +36,53 @@ from app.application.studio.unit_of_work.write_unit_of_work import (
 from app.application.studio.use_cases.appointments_use_cases.complete_paid_appointment_use_case import (
     CompletePaidAppointmentUseCase,
 )
+from app.application.studio.use_cases.appointments_use_cases.create_appointment_series_use_case import (
+    CreateAppointmentSeriesUseCase,
+)
 from app.application.studio.use_cases.appointments_use_cases.create_appointment_use_case import (
     CreateAppointmentUseCase,
 )
+from app.application.studio.use_cases.appointments_use_cases.find_free_artists_use_case import (
+    FindFreeArtistsUseCase,
+)
+from app.application.studio.use_cases.appointments_use_cases.list_appointments_use_case import (
+    ListAppointmentsUseCase,
+)
+from app.application.studio.use_cases.appointments_use_cases.list_available_slots_use_case import (
+    ListAvailableSlotsUseCase,
+)
 from app.application.studio.use_cases.appointments_use_cases.quote_appointment_use_case import (
     QuoteAppointmentUseCase,
 )
+from app.application.studio.use_cases.DTO.commun import Direction
 from app.application.studio.use_cases.DTO.complete_paid_appointment_dto import (
     CompletePaidAppointmentInput,
 )
 from app.application.studio.use_cases.DTO.create_appointment_dto import CreateAppointmentInput
+from app.application.studio.use_cases.DTO.create_appointment_series_dto import (
+    CreateAppointmentSeriesInput,
+)
+from app.application.studio.use_cases.DTO.find_free_artists_dto import (
+    FindFreeArtistsInput,
+    FindFreeArtistsOutput,
+)
+from app.application.studio.use_cases.DTO.list_appointments_dto import (
+    ListAppointmentsInput,
+    ListAppointmentsOutput,
+)
+from app.application.studio.use_cases.DTO.list_available_slots_dto import (
+    ListAvailableSlotsInput,
+    ListAvailableSlotsOutput,
+)
 from app.application.studio.use_cases.DTO.quote_appointement_dto import QuoteAppointmentInput
+from app.core.config import settings
 from app.core.exceptions.appointments import (
     AppointmentClientContactInfoCorruptedError,
     AppointmentMustBeInCorrectPreviousStatusError,
     AppointmentMustBeScheduledError,
     AppointmentNotFoundError,
     AppointmentWasNotFullyPaidError,
+    InvalidAppointmentSeriesError,
     OnlyAdminOrOwnerOfAppointmentError,
     PriceMustBeDefinedError,
     PriceMustBePositiveError,
@@ -49,12 +90,17 @@ from app.core.exceptions.appointments import (
     SlotIsNotAvailableError,
 )
 from app.core.exceptions.calendar import (
+    AppointmentCannotLastOvernightError,
     CannotFindWorkingPeriodsForThisUserError,
+    InvalidAvailabilitySearchRangeError,
     UserIsNotWorkingInDesignatedTimeframeError,
 )
 from app.core.exceptions.clients import ClientInfoModelError
 from app.core.exceptions.users import UserInactiveError, UserNotFoundError
+from app.core.exceptions.validation import InvalidPageCursorError
+from app.core.types.appointment_enums import AppointmentStatus, AppointmentType
 from app.domain.studio.appointments.entities.value_objects.client_info import ClientInfo
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
 from app.domain.studio.appointments.policies.appointment_authorization_policy import (
     AppointmentAuthorizationPolicy,
 )
@@ -70,7 +116,6 @@ router = APIRouter(prefix="/appointments")
 async def create_appointment(
     data: CreateAppointmentRequest,
     write_uow: WriteUnitOfWork = Depends(get_write_unit_of_work),
-    read_uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
     integration_bus: IntegrationEventBus = Depends(get_integration_event_bus),
     actor_id: UUID | None = Depends(get_optional_actor_id),
     calendar_policy: CalendarAvailabilityPolicy = Depends(get_calendar_policy),
@@ -87,8 +132,8 @@ async def create_appointment(
         use_case = CreateAppointmentUseCase(
             integration_bus=integration_bus,
             write_uow=write_uow,
-            read_uow=read_uow,
             calendar_policy=calendar_policy,
+            digest_artist_requests=settings.APPOINTMENT_REQUEST_DIGEST_ENABLED,
         )
         dto = CreateAppointmentInput(
             appointment_type=data.appointment_type,
@@ -138,19 +183,212 @@ async def create_appointment(
         )
 
 
+@router.post("/series", status_code=status.HTTP_201_CREATED)
+async def create_appointment_series(
+    data: CreateAppointmentSeriesRequest,
+    write_uow: WriteUnitOfWork = Depends(get_write_unit_of_work),
+    integration_bus: IntegrationEventBus = Depends(get_integration_event_bus),
+    actor_id: UUID | None = Depends(get_optional_actor_id),
+    calendar_policy: CalendarAvailabilityPolicy = Depends(get_calendar_policy),
+):
+    try:
+        client_info = ClientInfo(
+            vip_client_id=data.vip_client_id,
+            name=data.name,
+            email=data.email,
+            phone=data.phone,
+        )
+        referral_code = ClientCode(data.referral_code) if data.referral_code else None
+
+        use_case = CreateAppointmentSeriesUseCase(
+            integration_bus=integration_bus,
+            write_uow=write_uow,
+            calendar_policy=calendar_policy,
+            digest_artist_requests=settings.APPOINTMENT_REQUEST_DIGEST_ENABLED,
+        )
+        dto = CreateAppointmentSeriesInput(
+            appointment_type=data.appointment_type,
+            user_id=data.user_id,
+            sessions=[
+                TimeSlot(start_at=session.start_at, end_at=session.end_at) for session in data.sessions
+            ],
+            client_info=client_info,
+            placement=data.placement,
+            color=data.color,
+            details=data.details,
+            size=data.size,
+            referral_code=referral_code,
+            actor_id=actor_id,
+        )
+
+        await use_case.execute(dto)
+
+    except InvalidAppointmentSeriesError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="invalid_appointment_series",
+        )
+    except (
+        CannotFindWorkingPeriodsForThisUserError,
+        UserIsNotWorkingInDesignatedTimeframeError,
+        SlotIsNotAvailableError,
+        AppointmentCannotLastOvernightError,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="the_time_slot_required_is_not_available",
+        )
+    except (UserInactiveError, UserNotFoundError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="user_does_not_exists_or_is_inactive",
+        )
+    except SlotIsAlreadyOccupiedError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="the_time_slot_required_is_occupied",
+        )
+    except ClientInfoModelError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc),
+        )
+    except AppointmentClientContactInfoCorruptedError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="appointment_is_broken"
+        )
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=ListAppointmentsOutput,
+)
+def list_appointments(
+    user_id: UUID | None = Query(None),
+    appointment_status: AppointmentStatus | None = Query(None, alias="status"),
+    appointment_type: AppointmentType | None = Query(None),
+    start_date: datetime | None = Query(None),
+    end_date: datetime | None = Query(None),
+    cursor: str | None = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    direction: Direction = Direction.desc,
+    current_user=Depends(get_current_active_user),
+    uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
+):
+    use_case = ListAppointmentsUseCase(uow)
+    dto = ListAppointmentsInput(
+        actor=current_user,
+        user_id=user_id,
+        status=appointment_status,
+        appointment_type=appointment_type,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        limit=limit,
+        direction=direction,
+    )
+
+    try:
+        return use_case.execute(dto)
+    except InvalidPageCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid_cursor")
+    except OnlyAdminOrOwnerOfAppointmentError:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="unauthorized_user")
+
+
+@router.get(
+    "/available-slots",
+    status_code=status.HTTP_200_OK,
+    response_model=ListAvailableSlotsOutput,
+)
+def list_available_slots(
+    user_id: UUID,
+    start_at: datetime,
+    end_at: datetime,
+    duration_minutes: int = Query(ge=1, le=24 * 60),
+    step_minutes: int = Query(30, ge=5, le=24 * 60),
+    uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
+    actor_id: UUID | None = Depends(get_optional_actor_id),
+    calendar_policy: CalendarAvailabilityPolicy = Depends(get_calendar_policy),
+    calendar_index: CalendarIndex = Depends(get_calendar_index),
+):
+    use_case = ListAvailableSlotsUseCase(
+        uow=uow, calendar_policy=calendar_policy, calendar_index=calendar_index
+    )
+    dto = ListAvailableSlotsInput(
+        user_id=user_id,
+        start_at=start_at,
+        end_at=end_at,
+        duration_minutes=duration_minutes,
+        step_minutes=step_minutes,
+        actor_id=actor_id,
+    )
+
+    try:
+        return use_case.execute(dto)
+    except InvalidAvailabilitySearchRangeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="invalid_search_range",
+        )
+    except CannotFindWorkingPeriodsForThisUserError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="calendar_not_found_for_this_user",
+        )
+    except (UserInactiveError, UserNotFoundError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="user_does_not_exists_or_is_inactive",
+        )
+
+
+@router.get(
+    "/free-artists",
+    status_code=status.HTTP_200_OK,
+    response_model=FindFreeArtistsOutput,
+)
+def find_free_artists(
+    start_at: datetime,
+    end_at: datetime,
+    appointment_type: AppointmentType,
+    duration_minutes: int = Query(ge=1, le=24 * 60),
+    step_minutes: int = Query(30, ge=5, le=24 * 60),
+    uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
+    actor_id: UUID | None = Depends(get_optional_actor_id),
+    calendar_policy: CalendarAvailabilityPolicy = Depends(get_calendar_policy),
+):
+    use_case = FindFreeArtistsUseCase(uow=uow, calendar_policy=calendar_policy)
+    dto = FindFreeArtistsInput(
+        start_at=start_at,
+        end_at=end_at,
+        appointment_type=appointment_type,
+        duration_minutes=duration_minutes,
+        step_minutes=step_minutes,
+        actor_id=actor_id,
+    )
+
+    try:
+        return use_case.execute(dto)
+    except InvalidAvailabilitySearchRangeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="invalid_search_range",
+        )
+
+
 @router.patch("/{appointment_id}/quote", status_code=status.HTTP_204_NO_CONTENT)
 async def quote_appointment(
     appointment_id: UUID,
     data: QuoteAppointmentRequest,
     current_user=Depends(get_current_active_user),
     write_uow: WriteUnitOfWork = Depends(get_write_unit_of_work),
-    read_uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
     integration_bus: IntegrationEventBus = Depends(get_integration_event_bus),
     authorization_policy: AppointmentAuthorizationPolicy = Depends(get_appointment_authorization_policy),
 ):
     try:
         use_case = QuoteAppointmentUseCase(
-            read_uow=read_uow,
             write_uow=write_uow,
             integration_bus=integration_bus,
             appointment_authorization_policy=authorization_policy,
@@ -1,11 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import math
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.login_rate_limiter import get_login_rate_limiter
 from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
 from app.api.dependencies.security import (
     get_access_token_service,
     get_refresh_token_service,
 )
 from app.api.schemas.auth import LoginRequest, RefreshRequest, TokenPair
+from app.application.studio.services.login_rate_limiter import (
+    LoginRateLimit,
+    LoginRateLimiter,
+)
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
 from app.application.studio.use_cases.DTO.login_dto import (
     LoginInput,
@@ -19,6 +26,7 @@ from app.application.studio.use_cases.users_use_cases.logout_user import (
 from app.application.studio.use_cases.users_use_cases.refresh_user import (
     RefreshUserUseCase,
 )
+from app.core.config import settings
 from app.core.exceptions.security import TokenError
 from app.core.exceptions.users import (
     AuthenticationFailedError,
@@ -31,16 +39,43 @@ router = APIRouter(prefix="/auth")
 
 
 @router.post("/login", status_code=status.HTTP_200_OK, response_model=TokenPair)
-def login(
+async def login(
     data: LoginRequest,
+    request: Request,
     uow: ReadUnitOfWork = Depends(get_read_unit_of_work),
     access_tokens: VersionedTokenService = Depends(get_access_token_service),
     refresh_tokens: VersionedTokenService = Depends(get_refresh_token_service),
+    login_rate_limiter: LoginRateLimiter = Depends(get_login_rate_limiter),
 ) -> TokenPair:
+    """
+    Attempts are counted per identifier and per client IP before the user lookup and
+    the bcrypt verify run, so an over budget burst costs neither. A successful login
+    clears the identifier budget, the IP one only expires with its window.
+    """
+    identifier_key = f"identifier:{data.identifier.strip().lower()}"
+    client_host = request.client.host if request.client else "unknown"
+
+    retry_after = await login_rate_limiter.acquire(
+        [
+            LoginRateLimit(
+                key=identifier_key, max_attempts=settings.LOGIN_MAX_ATTEMPTS_PER_IDENTIFIER
+            ),
+            LoginRateLimit(
+                key=f"ip:{client_host}", max_attempts=settings.LOGIN_MAX_ATTEMPTS_PER_IP
+            ),
+        ]
+    )
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="too_many_login_attempts",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
     use_case = LoginUserUseCase(uow, access_tokens, refresh_tokens)
     use_case_input = LoginInput(identifier=data.identifier, password=data.password)
     try:
-        result = use_case.execute(use_case_input)
+        result = await use_case.execute(use_case_input)
     except UserInactiveError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="inactive_user"
@@ -50,6 +85,8 @@ def login(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_credentials"
         )
 
+    await login_rate_limiter.reset(identifier_key)
+
     return TokenPair(
         access_token=result.access_token, refresh_token=result.refresh_token
     )
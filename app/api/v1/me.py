@@ -75,7 +75,7 @@ router = APIRouter(prefix="/me")
 @router.post(
     "/first-activation", status_code=status.HTTP_200_OK, response_model=TokenPair
 )
-def first_activation(
+async def first_activation(
     data: FirstActivationRequest,
     current_activation_context: ActivationContext = Depends(
         get_current_activation_context
@@ -106,7 +106,7 @@ def first_activation(
     )
 
     try:
-        use_case.execute(dto)
+        await use_case.execute(dto)
     except UserNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="user_not_found"
@@ -134,14 +134,14 @@ def first_activation(
     login_use_case = LoginUserUseCase(
         access_tokens=access_tokens, refresh_tokens=refresh_tokens, uow=read_uow
     )
-    tokens = login_use_case.execute(login_dto)
+    tokens = await login_use_case.execute(login_dto)
     return TokenPair(
         access_token=tokens.access_token, refresh_token=tokens.refresh_token
     )
 
 
 @router.patch("/change-password", status_code=status.HTTP_204_NO_CONTENT)
-def change_password(
+async def change_password(
     data: ChangePasswordRequest,
     current_user=Depends(get_current_active_user),
     uow: WriteUnitOfWork = Depends(get_write_unit_of_work),
@@ -159,7 +159,7 @@ def change_password(
     """
 
     try:
-        use_case.execute(dto)
+        await use_case.execute(dto)
     except UserNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_credentials"
@@ -171,7 +171,7 @@ def change_password(
 
 
 @router.patch("/change-email", status_code=status.HTTP_204_NO_CONTENT)
-def change_email(
+async def change_email(
     data: ChangeEmailRequest,
     current_user=Depends(get_current_active_user),
     uow: WriteUnitOfWork = Depends(get_write_unit_of_work),
@@ -187,7 +187,7 @@ def change_email(
     """
 
     try:
-        use_case.execute(dto)
+        await use_case.execute(dto)
     except UserNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="invalid_credentials"
@@ -230,7 +230,7 @@ async def send_reset_password(
 
 
 @router.post("/reset-password", status_code=status.HTTP_204_NO_CONTENT)
-def reset_password(
+async def reset_password(
     data: ResetPasswordRequest,
     current_password_context: PasswordContext = Depends(
         get_current_reset_password_context
@@ -245,7 +245,7 @@ def reset_password(
     )
 
     try:
-        use_case.execute(dto)
+        await use_case.execute(dto)
     except UserNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="user_not_found"
@@ -0,0 +1,101 @@
+import dataclasses
+import importlib
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Type
+from uuid import UUID
+
+"""
+Events are plain objects, this turns their attributes into JSON and back for the
+outbox. Values that JSON cannot tell apart from a string (a UUID in a `str | UUID`
+field, a Decimal price) are tagged with their type so they come back as they left.
+"""
+
+TYPE_KEY = "__type__"
+
+
+def encode_event(event: object) -> dict:
+    return {name: _encode(value) for name, value in vars(event).items()}
+
+
+def decode_event(event_type: Type, payload: dict) -> Any:
+    event = event_type.__new__(event_type)
+    event.__dict__.update({name: _decode(value) for name, value in payload.items()})
+
+    return event
+
+
+def _encode(value: Any) -> Any:
+    # str based enums are str too, they are tagged before plain values pass through
+    if isinstance(value, Enum):
+        return {TYPE_KEY: "enum", "class": _class_path(type(value)), "value": value.value}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, UUID):
+        return {TYPE_KEY: "uuid", "value": str(value)}
+    if isinstance(value, Decimal):
+        return {TYPE_KEY: "decimal", "value": str(value)}
+    if isinstance(value, datetime):
+        return {TYPE_KEY: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {TYPE_KEY: "date", "value": value.isoformat()}
+    if isinstance(value, time):
+        return {TYPE_KEY: "time", "value": value.isoformat()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {TYPE_KEY: "dict", "items": {key: _encode(item) for key, item in value.items()}}
+    if dataclasses.is_dataclass(value):
+        return {
+            TYPE_KEY: "dataclass",
+            "class": _class_path(type(value)),
+            "fields": {
+                field.name: _encode(getattr(value, field.name)) for field in dataclasses.fields(value)
+            },
+        }
+
+    return {TYPE_KEY: "object", "class": _class_path(type(value)), "fields": encode_event(value)}
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    kind = value[TYPE_KEY]
+
+    if kind == "enum":
+        return _load_class(value["class"])(value["value"])
+    if kind == "uuid":
+        return UUID(value["value"])
+    if kind == "decimal":
+        return Decimal(value["value"])
+    if kind == "datetime":
+        return datetime.fromisoformat(value["value"])
+    if kind == "date":
+        return date.fromisoformat(value["value"])
+    if kind == "time":
+        return time.fromisoformat(value["value"])
+    if kind == "dict":
+        return {key: _decode(item) for key, item in value["items"].items()}
+    if kind == "dataclass":
+        fields = {name: _decode(item) for name, item in value["fields"].items()}
+        return _load_class(value["class"])(**fields)
+
+    return decode_event(_load_class(value["class"]), value["fields"])
+
+
+def _class_path(cls: Type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load_class(path: str) -> Type:
+    module_name, qualname = path.split(":")
+    target: Any = importlib.import_module(module_name)
+
+    for name in qualname.split("."):
+        target = getattr(target, name)
+
+    return target
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from app.core.exceptions.events import (
+    IntegrationHandlerExecutorClosedError,
+    IntegrationHandlerQueueFullError,
+)
+from app.core.types.event_bus_enums import HandlerOverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HandlerLatency:
+    count: int
+    total_seconds: float
+    max_seconds: float
+
+
+@dataclass(frozen=True)
+class HandlerExecutorStats:
+    workers: int
+    queued: int
+    running: int
+    completed: int
+    failed: int
+    dropped: int
+    latency_by_event_type: dict[str, HandlerLatency]
+    closed: bool
+    # set once close() returns: how long the drain took and how many jobs it cancelled
+    drain_seconds: Optional[float]
+    abandoned: int
+
+
+class HandlerExecutor:
+    """
+    Runs integration handlers with at most `workers` of them at once, and at most
+    the limit of their event type when it has one. Jobs waiting for a slot count
+    against `max_queue_size`; when it is full the overflow policy decides whether
+    `submit` waits for room, raises IntegrationHandlerQueueFullError or drops the job.
+
+    `close` stops taking jobs, with IntegrationHandlerExecutorClosedError, and gives
+    the ones already submitted until its timeout before cancelling them.
+
+    Semaphores belong to the loop they were first used on, so they are built again
+    when the executor is used from another loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 8,
+        max_queue_size: int = 1000,
+        overflow_policy: HandlerOverflowPolicy = HandlerOverflowPolicy.WAIT,
+        limits_per_event_type: Optional[dict[str, int]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.limits_per_event_type = dict(limits_per_event_type or {})
+        self._clock = clock
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+        self._latency: dict[str, HandlerLatency] = {}
+        self._closed = False
+        self._drain_seconds: Optional[float] = None
+        self._abandoned = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def submit(
+        self,
+        job: Callable[[], Awaitable[None]],
+        *,
+        event_type: str,
+        wait_for_room: bool = False,
+    ) -> Optional[asyncio.Task]:
+        if self._closed:
+            raise IntegrationHandlerExecutorClosedError()
+
+        self._bind_loop()
+
+        if wait_for_room or self.overflow_policy == HandlerOverflowPolicy.WAIT:
+            await self._slots.acquire()
+        elif self._slots.locked():
+            if self.overflow_policy == HandlerOverflowPolicy.REJECT:
+                raise IntegrationHandlerQueueFullError()
+
+            self._dropped += 1
+            logger.warning("integration handler dropped", extra={"event_type": event_type})
+            return None
+        else:
+            await self._slots.acquire()
+
+        self._queued += 1
+        task = asyncio.create_task(self._run(job, event_type))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return task
+
+    def stats(self) -> HandlerExecutorStats:
+        return HandlerExecutorStats(
+            workers=self.workers,
+            queued=self._queued,
+            running=self._running,
+            completed=self._completed,
+            failed=self._failed,
+            dropped=self._dropped,
+            latency_by_event_type=dict(self._latency),
+            closed=self._closed,
+            drain_seconds=self._drain_seconds,
+            abandoned=self._abandoned,
+        )
+
+    async def close(self, timeout: float = 10.0) -> None:
+        self._closed = True
+        started = self._clock()
+        pending: set[asyncio.Task] = set()
+
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        self._drain_seconds = self._clock() - started
+        self._abandoned += len(pending)
+
+    async def _run(self, job: Callable[[], Awaitable[None]], event_type: str) -> None:
+        queued = True
+
+        try:
+            async with self._limit(event_type), self._workers:
+                queued = False
+                self._queued -= 1
+                self._slots.release()
+                await self._track(job, event_type)
+        finally:
+            # cancelled before a worker picked it up
+            if queued:
+                self._queued -= 1
+                self._slots.release()
+
+    async def _track(self, job: Callable[[], Awaitable[None]], event_type: str) -> None:
+        self._running += 1
+        started = self._clock()
+
+        try:
+            await job()
+        except Exception:
+            self._failed += 1
+            raise
+        else:
+            self._completed += 1
+        finally:
+            self._running -= 1
+            self._record_latency(event_type, self._clock() - started)
+
+    def _limit(self, event_type: str) -> asyncio.Semaphore:
+        limit = self._limits.get(event_type)
+        if limit is None:
+            limit = asyncio.Semaphore(self.limits_per_event_type.get(event_type, self.workers))
+            self._limits[event_type] = limit
+
+        return limit
+
+    def _record_latency(self, event_type: str, seconds: float) -> None:
+        latency = self._latency.get(event_type, HandlerLatency(0, 0.0, 0.0))
+        self._latency[event_type] = HandlerLatency(
+            count=latency.count + 1,
+            total_seconds=latency.total_seconds + seconds,
+            max_seconds=max(latency.max_seconds, seconds),
+        )
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+
+        # tasks of a closed loop never finish, their counts go with them
+        self._loop = loop
+        self._tasks = set()
+        self._queued = 0
+        self._running = 0
+        self._slots = asyncio.Semaphore(self.max_queue_size)
+        self._workers = asyncio.Semaphore(self.workers)
+        self._limits: dict[str, asyncio.Semaphore] = {}
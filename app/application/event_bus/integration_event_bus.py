@@ -1,18 +1,169 @@
 import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+from uuid import uuid4
 
 from app.application.event_bus.event_bus import EventBus
-from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from app.application.event_bus.event_codec import encode_event
+from app.application.event_bus.handler_executor import HandlerExecutor, HandlerExecutorStats
+from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWorkFactory
+from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
+from app.application.studio.use_cases.DTO.outbox_dto import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IntegrationEventBusStats:
+    executor: HandlerExecutorStats
+    # in-process handlers left unfinished at shutdown, written to the outbox or lost
+    persisted: int
+    lost: int
 
 
 class IntegrationEventBus(EventBus):
-    async def publish(self, event, *, uow: ReadUnitOfWork | None = None):
+    """
+    Publishing inside a WriteUnitOfWork writes one outbox message per handler in the
+    same transaction, and the OutboxDispatcher delivers them once it commits. Without
+    a write unit of work the handlers run right away on the executor, and are lost if
+    the process stops first.
+
+    Handlers never get the publisher's unit of work, which may be closed by the time
+    they run. Those declaring `uow_factory` get `read_uow_factory` and open a short
+    read session of their own for their lookups.
+
+    `close` drains the in-process handlers at shutdown. Whatever does not finish in
+    time, or is published after, is written to the outbox through `write_uow_factory`
+    for the next process to deliver, and only logged as lost without one.
+    """
+
+    def __init__(
+        self,
+        executor: HandlerExecutor | None = None,
+        read_uow_factory: ReadUnitOfWorkFactory | None = None,
+        write_uow_factory: Callable[[], WriteUnitOfWork] | None = None,
+    ):
+        super().__init__()
+        self.executor = executor or HandlerExecutor()
+        self.read_uow_factory = read_uow_factory
+        self.write_uow_factory = write_uow_factory
+        self._in_flight: dict[asyncio.Task, tuple[object, object]] = {}
+        self._persisted = 0
+        self._lost = 0
+
+    async def publish(self, event, *, uow: WriteUnitOfWork | None = None):
         handlers = self._handlers[type(event)]
 
+        if isinstance(uow, WriteUnitOfWork):
+            if handlers:
+                await uow.run_sync(uow.outbox.add_many, self._outbox_messages(event, handlers))
+            return
+
         for handler in handlers:
-            asyncio.create_task(self._safe_call(handler, event, uow))
+            if self.executor.closed:
+                await self._set_aside([(event, handler)])
+                continue
 
-    async def _safe_call(self, handler, event, uow):
-        try:
-            await handler.handle(event, uow=uow)
-        except TypeError:
+            task = await self.executor.submit(
+                lambda handler=handler: self._safe_call(handler, event, self.read_uow_factory),
+                event_type=type(event).__name__,
+            )
+            if task is not None:
+                self._in_flight[task] = (event, handler)
+                task.add_done_callback(self._forget)
+
+    async def close(self, timeout: float = 10.0) -> None:
+        in_flight = dict(self._in_flight)
+
+        await self.executor.close(timeout=timeout)
+
+        left = [pending for task, pending in in_flight.items() if task.cancelled()]
+        if left:
+            await self._set_aside(left)
+
+        stats = self.stats()
+        logger.info(
+            "integration event bus drained",
+            extra={
+                "drain_seconds": stats.executor.drain_seconds,
+                "abandoned": stats.executor.abandoned,
+                "persisted": stats.persisted,
+                "lost": stats.lost,
+            },
+        )
+
+    def stats(self) -> IntegrationEventBusStats:
+        return IntegrationEventBusStats(
+            executor=self.executor.stats(), persisted=self._persisted, lost=self._lost
+        )
+
+    def find_handler(self, event_type: str, handler_name: str):
+        for registered_type, handlers in self._handlers.items():
+            if registered_type.__name__ != event_type:
+                continue
+
+            for handler in handlers:
+                if type(handler).__name__ == handler_name:
+                    return registered_type, handler
+
+        return None
+
+    async def call(self, handler, event, uow_factory: ReadUnitOfWorkFactory | None) -> None:
+        if "uow_factory" in inspect.signature(handler.handle).parameters:
+            await handler.handle(event, uow_factory=uow_factory)
+        else:
             await handler.handle(event)
+
+    async def _safe_call(self, handler, event, uow_factory):
+        try:
+            await self.call(handler, event, uow_factory)
+        except Exception:
+            logger.exception(
+                "integration handler failed",
+                extra={"event_type": type(event).__name__, "handler": type(handler).__name__},
+            )
+
+    def _forget(self, task: asyncio.Task) -> None:
+        self._in_flight.pop(task, None)
+
+    async def _set_aside(self, pending: list[tuple[object, object]]) -> None:
+        if self.write_uow_factory is not None:
+            try:
+                uow = self.write_uow_factory()
+                async with uow:
+                    for event, handler in pending:
+                        await uow.run_sync(uow.outbox.add_many, self._outbox_messages(event, [handler]))
+            except Exception:
+                logger.exception("could not write unfinished integration handlers to the outbox")
+            else:
+                self._persisted += len(pending)
+                return
+
+        self._lost += len(pending)
+        logger.error(
+            "integration handlers lost at shutdown",
+            extra={
+                "handlers": [
+                    f"{type(event).__name__}:{type(handler).__name__}" for event, handler in pending
+                ]
+            },
+        )
+
+    def _outbox_messages(self, event, handlers) -> list[OutboxMessage]:
+        now = datetime.now(timezone.utc)
+        payload = encode_event(event)
+
+        return [
+            OutboxMessage(
+                id=uuid4(),
+                event_type=type(event).__name__,
+                handler_name=type(handler).__name__,
+                payload=payload,
+                created_at=now,
+                available_at=now,
+            )
+            for handler in handlers
+        ]
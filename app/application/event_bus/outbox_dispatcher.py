@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from app.application.event_bus.event_codec import decode_event
+from app.application.event_bus.integration_event_bus import IntegrationEventBus
+from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWorkFactory
+from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
+from app.application.studio.use_cases.DTO.outbox_dto import OutboxMessage
+from app.core.exceptions.events import DeliveryDeferredError
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """
+    Delivers the outbox messages written by IntegrationEventBus.publish. A batch is
+    claimed and committed first, then every message runs its handler and records the
+    outcome in a short transaction, so no row lock is held while an email is sent.
+    Handlers get `read_uow_factory` and hold a read session only for their lookups.
+    The batch runs on the bus executor, so it shares its worker and per event type
+    limits with the in-process handlers.
+
+    A failed message is retried with exponential backoff until `max_attempts`, then
+    left as FAILED with its last error. A handler raising DeliveryDeferredError did
+    not get to try, its message comes back after `retry_after` with the attempt given
+    back.
+    """
+
+    def __init__(
+        self,
+        *,
+        integration_bus: IntegrationEventBus,
+        write_uow_factory: Callable[[], WriteUnitOfWork],
+        read_uow_factory: ReadUnitOfWorkFactory,
+        batch_size: int = 50,
+        poll_interval: timedelta = timedelta(seconds=1),
+        lease: timedelta = timedelta(minutes=5),
+        max_attempts: int = 5,
+        retry_backoff: timedelta = timedelta(seconds=30),
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.integration_bus = integration_bus
+        self.write_uow_factory = write_uow_factory
+        self.read_uow_factory = read_uow_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._clock = clock
+
+    async def run(self) -> None:
+        while True:
+            try:
+                dispatched = await self.dispatch_once()
+            except Exception:
+                logger.exception("outbox dispatch failed")
+                dispatched = 0
+
+            # a full batch means more are probably waiting
+            if dispatched < self.batch_size:
+                await asyncio.sleep(self.poll_interval.total_seconds())
+
+    async def dispatch_once(self) -> int:
+        messages = await self._claim()
+
+        # claimed messages are never dropped, they wait for room whatever the policy
+        tasks = [
+            await self.integration_bus.executor.submit(
+                lambda message=message: self._dispatch(message),
+                event_type=message.event_type,
+                wait_for_room=True,
+            )
+            for message in messages
+        ]
+        await asyncio.gather(*tasks)
+
+        return len(messages)
+
+    async def _claim(self) -> list[OutboxMessage]:
+        uow = self.write_uow_factory()
+
+        async with uow:
+            return await uow.run_sync(self._claim_batch, uow)
+
+    def _claim_batch(self, uow: WriteUnitOfWork) -> list[OutboxMessage]:
+        return uow.outbox.claim_batch(limit=self.batch_size, now=self._clock(), lease=self.lease)
+
+    async def _dispatch(self, message: OutboxMessage) -> None:
+        try:
+            await self._handle(message)
+        except DeliveryDeferredError as exc:
+            logger.warning("outbox message deferred", extra={"message_id": str(message.id)})
+            await self._record(self._mark_deferred, message, exc)
+        except Exception as exc:
+            logger.exception(
+                "outbox message failed",
+                extra={"message_id": str(message.id), "attempts": message.attempts},
+            )
+            await self._record(self._mark_failed, message, f"{type(exc).__name__}: {exc}")
+        else:
+            await self._record(self._mark_dispatched, message)
+
+    async def _handle(self, message: OutboxMessage) -> None:
+        found = self.integration_bus.find_handler(message.event_type, message.handler_name)
+        if found is None:
+            raise LookupError(f"no handler {message.handler_name} for {message.event_type}")
+
+        event_type, handler = found
+        event = decode_event(event_type, message.payload)
+
+        await self.integration_bus.call(handler, event, self.read_uow_factory)
+
+    async def _record(self, mark: Callable, *args) -> None:
+        uow = self.write_uow_factory()
+
+        async with uow:
+            await uow.run_sync(mark, uow, *args)
+
+    def _mark_dispatched(self, uow: WriteUnitOfWork, message: OutboxMessage) -> None:
+        uow.outbox.mark_dispatched(message.id, dispatched_at=self._clock())
+
+    def _mark_failed(self, uow: WriteUnitOfWork, message: OutboxMessage, error: str) -> None:
+        if message.attempts >= self.max_attempts:
+            retry_at = None
+        else:
+            retry_at = self._clock() + self.retry_backoff * 2 ** (message.attempts - 1)
+
+        uow.outbox.mark_failed(message.id, error=error, retry_at=retry_at)
+
+    def _mark_deferred(
+        self, uow: WriteUnitOfWork, message: OutboxMessage, exc: DeliveryDeferredError
+    ) -> None:
+        uow.outbox.mark_deferred(
+            message.id,
+            error=f"{type(exc).__name__}: {exc}",
+            retry_at=self._clock() + timedelta(seconds=exc.retry_after),
+        )
@@ -1,3 +1,6 @@
+from typing import Callable
+
+from app.application.event_bus.handler_executor import HandlerExecutor
 from app.application.event_bus.integration_event_bus import IntegrationEventBus
 from app.application.event_bus.transactional_event_bus import TransactionalEventBus
 from app.application.notifications.handlers.notificate_booking_window_update import (
@@ -6,9 +9,15 @@ from app.application.notifications.handlers.notificate_booking_window_update imp
 from app.application.notifications.handlers.send_activation_confirmation_email import (
     SendActivationConfirmationEmailHandler,
 )
+from app.application.notifications.handlers.send_appointment_request_digest_email import (
+    SendAppointmentRequestDigestEmailHandler,
+)
 from app.application.notifications.handlers.send_create_appointment_email import (
     SendCreateAppointmentEmailHandler,
 )
+from app.application.notifications.handlers.send_create_appointment_series_email import (
+    SendCreateAppointmentSeriesEmailHandler,
+)
 from app.application.notifications.handlers.send_password_reset_email import (
     SendPasswordResetEmailHandler,
 )
@@ -24,14 +33,24 @@ from app.application.notifications.handlers.send_vip_client_creation_notificatio
 from app.application.studio.handlers.add_credits_from_completed_appointment import (
     AddCreditsFromCompletedAppointmentHandler,
 )
+from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWorkFactory
+from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
+from app.core.config import settings
 from app.core.security.versioned_token_service import VersionedTokenService
+from app.core.types.event_bus_enums import HandlerOverflowPolicy
 from app.domain.studio.appointments.events.appointment_completed import (
     AppointmentCompleted,
 )
+from app.domain.studio.appointments.events.appointment_request_digest_requested import (
+    AppointmentRequestDigestRequested,
+)
 from app.domain.studio.appointments.events.booking_window_updated import BookingWindowUpdated
 from app.domain.studio.appointments.events.create_appointment_request import (
     CreateAppointmentEmailRequested,
 )
+from app.domain.studio.appointments.events.create_appointment_series_request import (
+    CreateAppointmentSeriesEmailRequested,
+)
 from app.domain.studio.appointments.events.notify_of_appointment_quoted import NotifyOfAppointmentQuoted
 from app.domain.studio.users.events.activation_email_requested import (
     ActivationEmailRequested,
@@ -50,6 +69,8 @@ from app.domain.studio.users.events.send_action_made_email_requested import (
 def setup_event_bus(
     email_service,
     token_service,
+    read_uow_factory: ReadUnitOfWorkFactory | None = None,
+    write_uow_factory: Callable[[], WriteUnitOfWork] | None = None,
 ):
 
     activation_token_service = VersionedTokenService(
@@ -61,7 +82,16 @@ def setup_event_bus(
     )
 
     transactional_bus = TransactionalEventBus()
-    integration_bus = IntegrationEventBus()
+    integration_bus = IntegrationEventBus(
+        executor=HandlerExecutor(
+            workers=settings.INTEGRATION_HANDLER_WORKERS,
+            max_queue_size=settings.INTEGRATION_HANDLER_QUEUE_SIZE,
+            overflow_policy=HandlerOverflowPolicy(settings.INTEGRATION_HANDLER_OVERFLOW),
+            limits_per_event_type=settings.INTEGRATION_HANDLER_LIMITS,
+        ),
+        read_uow_factory=read_uow_factory,
+        write_uow_factory=write_uow_factory,
+    )
 
     integration_bus.register(
         ActivationEmailRequested,
@@ -89,9 +119,17 @@ def setup_event_bus(
     integration_bus.register(
         CreateAppointmentEmailRequested, SendCreateAppointmentEmailHandler(email_service=email_service)
     )
+    integration_bus.register(
+        CreateAppointmentSeriesEmailRequested,
+        SendCreateAppointmentSeriesEmailHandler(email_service=email_service),
+    )
     integration_bus.register(
         NotifyOfAppointmentQuoted, SendQuoteAppointmentEmailHandler(email_service=email_service)
     )
+    integration_bus.register(
+        AppointmentRequestDigestRequested,
+        SendAppointmentRequestDigestEmailHandler(email_service=email_service),
+    )
 
     transactional_bus.register(
         AppointmentCompleted,
@@ -2,7 +2,10 @@ from app.application.notifications.handlers.utils.render_booking_window_email im
     render_booking_window_email,
 )
 from app.application.notifications.ports.email_service import EmailService
-from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from app.application.studio.unit_of_work.read_unit_of_work import (
+    ReadUnitOfWorkFactory,
+    open_read_unit_of_work,
+)
 from app.domain.studio.appointments.events.booking_window_updated import BookingWindowUpdated
 
 """
@@ -18,15 +21,16 @@ class NotificateBookingWindowUpdateHandler:
     def __init__(self, email_service: EmailService):
         self.email_service = email_service
 
-    async def handle(self, event: BookingWindowUpdated, *, uow: ReadUnitOfWork) -> None:
-        with uow:
+    async def handle(self, event: BookingWindowUpdated, *, uow_factory: ReadUnitOfWorkFactory) -> None:
+        with open_read_unit_of_work(uow_factory) as uow:
             user = uow.users.find_by_id(event.user_id)
-            if user is None:
-                return
 
-            user_email = user.email
+        if user is None:
+            return
+
+        user_email = user.email
 
-            html = render_booking_window_email(new_booking_window=event.new_booking_window)
+        html = render_booking_window_email(new_booking_window=event.new_booking_window)
 
         await self.email_service.send_email(
             to=user_email, html_content=html, subject="Um novo periodo de disponibilidade foi aberto."
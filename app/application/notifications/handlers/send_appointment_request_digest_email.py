@@ -0,0 +1,39 @@
+from app.application.notifications.handlers.utils.render_appointment_request_digest_email import (
+    render_appointment_request_digest_email,
+    requests_count_label,
+)
+from app.application.notifications.ports.email_service import EmailService
+from app.application.studio.unit_of_work.read_unit_of_work import (
+    ReadUnitOfWorkFactory,
+    open_read_unit_of_work,
+)
+from app.domain.studio.appointments.events.appointment_request_digest_requested import (
+    AppointmentRequestDigestRequested,
+)
+
+"""
+Same silent return as SendCreateAppointmentEmailHandler: the requests are already
+booked, an artist removed since only skips the summary.
+"""
+
+
+class SendAppointmentRequestDigestEmailHandler:
+    def __init__(self, email_service: EmailService):
+        self.email_service = email_service
+
+    async def handle(
+        self, event: AppointmentRequestDigestRequested, *, uow_factory: ReadUnitOfWorkFactory
+    ) -> None:
+        with open_read_unit_of_work(uow_factory) as uow:
+            user = uow.users.find_by_id(event.user_id)
+
+        if user is None:
+            return
+
+        html = render_appointment_request_digest_email(event.requests)
+
+        await self.email_service.send_email(
+            to=user.email,
+            subject=f"Resumo: {requests_count_label(len(event.requests))} de agendamento",
+            html_content=html,
+        )
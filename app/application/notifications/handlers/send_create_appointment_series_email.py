@@ -0,0 +1,85 @@
+from app.application.notifications.handlers.utils.render_create_appointment_series_client_email import (
+    render_create_appointment_series_client_email,
+)
+from app.application.notifications.handlers.utils.render_create_appointment_series_user_email import (
+    render_create_appointment_series_user_email,
+)
+from app.application.notifications.ports.email_service import EmailMessage, EmailService
+from app.application.studio.unit_of_work.read_unit_of_work import (
+    ReadUnitOfWork,
+    ReadUnitOfWorkFactory,
+    open_read_unit_of_work,
+)
+from app.domain.studio.appointments.events.create_appointment_series_request import (
+    CreateAppointmentSeriesEmailRequested,
+)
+
+"""
+Same silent returns as SendCreateAppointmentEmailHandler: the series is already
+booked when this runs, a missing user or VIP client only skips the notification.
+"""
+
+
+class SendCreateAppointmentSeriesEmailHandler:
+    def __init__(self, email_service: EmailService):
+        self.email_service = email_service
+
+    async def handle(
+        self, event: CreateAppointmentSeriesEmailRequested, *, uow_factory: ReadUnitOfWorkFactory
+    ) -> None:
+        with open_read_unit_of_work(uow_factory) as uow:
+            recipients = self._find_recipients(event, uow)
+
+        if recipients is None:
+            return
+        client_email, user_email = recipients
+
+        appointment_type = event.appointment_type.value
+
+        messages: list[EmailMessage] = []
+
+        if user_email is not None:
+            html_user = render_create_appointment_series_user_email(
+                sessions=event.sessions, appointment_type=appointment_type
+            )
+            messages.append(
+                EmailMessage(
+                    to=user_email,
+                    subject=f"Novo agendamento solicitado ({len(event.sessions)} sessões)",
+                    html_content=html_user,
+                )
+            )
+
+        html_client = render_create_appointment_series_client_email(
+            sessions=event.sessions, appointment_type=appointment_type
+        )
+        messages.append(
+            EmailMessage(
+                to=client_email,
+                subject="Recebemos sua solicitação de agendamento",
+                html_content=html_client,
+            )
+        )
+
+        await self.email_service.send_batch(messages)
+
+    def _find_recipients(
+        self, event: CreateAppointmentSeriesEmailRequested, uow: ReadUnitOfWork
+    ) -> tuple[str, str | None] | None:
+        if isinstance(event.client_email_or_vip_id, str):
+            client_email = event.client_email_or_vip_id
+        else:
+            vip_client = uow.vip_clients.find_by_id(event.client_email_or_vip_id)
+            if vip_client is None:
+                return None
+            client_email = vip_client.email
+
+        # in digest mode the artist hears about it in the AppointmentRequestDigestJob summary
+        if not event.notify_artist:
+            return client_email, None
+
+        user = uow.users.find_by_id(event.user_id)
+        if user is None:
+            return None
+
+        return client_email, user.email
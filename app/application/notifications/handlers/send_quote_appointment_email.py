@@ -2,7 +2,10 @@ from app.application.notifications.handlers.utils.render_quote_appointment_email
     render_quote_appointment_client_email,
 )
 from app.application.notifications.ports.email_service import EmailService
-from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from app.application.studio.unit_of_work.read_unit_of_work import (
+    ReadUnitOfWorkFactory,
+    open_read_unit_of_work,
+)
 from app.domain.studio.appointments.events.notify_of_appointment_quoted import NotifyOfAppointmentQuoted
 
 """
@@ -15,20 +18,23 @@ class SendQuoteAppointmentEmailHandler:
     def __init__(self, email_service: EmailService):
         self.email_service = email_service
 
-    async def handle(self, event: NotifyOfAppointmentQuoted, *, uow: ReadUnitOfWork) -> None:
-        with uow:
-            if isinstance(event.client_email_or_vip_id, str):
-                client_email = event.client_email_or_vip_id
-            else:
+    async def handle(
+        self, event: NotifyOfAppointmentQuoted, *, uow_factory: ReadUnitOfWorkFactory
+    ) -> None:
+        if isinstance(event.client_email_or_vip_id, str):
+            client_email = event.client_email_or_vip_id
+        else:
+            with open_read_unit_of_work(uow_factory) as uow:
                 vip_client = uow.vip_clients.find_by_id(event.client_email_or_vip_id)
-                if vip_client is None:
-                    return
 
-                client_email = vip_client.email
+            if vip_client is None:
+                return
+
+            client_email = vip_client.email
 
-            html = render_quote_appointment_client_email(
-                price=event.price, appointment_type=event.appointment_type
-            )
+        html = render_quote_appointment_client_email(
+            price=event.price, appointment_type=event.appointment_type
+        )
 
         await self.email_service.send_email(
             to=client_email,
@@ -0,0 +1,31 @@
+from string import Formatter
+from typing import Iterable, Mapping
+
+
+class EmailTemplate:
+    """
+    HTML with `{name}` placeholders, split once at import into its static chunks and
+    the slots between them, so rendering only drops the values in and joins.
+    """
+
+    def __init__(self, source: str):
+        self._chunks: list[str] = []
+        self._slots: list[tuple[int, str]] = []
+
+        for literal, field, _, _ in Formatter().parse(source):
+            self._chunks.append(literal)
+            if field is not None:
+                self._slots.append((len(self._chunks), field))
+                self._chunks.append("")
+
+        self.fields = frozenset(field for _, field in self._slots)
+
+    def render(self, **values: object) -> str:
+        chunks = self._chunks.copy()
+        for index, field in self._slots:
+            chunks[index] = str(values[field])
+
+        return "".join(chunks)
+
+    def render_many(self, values: Iterable[Mapping[str, object]]) -> list[str]:
+        return [self.render(**item) for item in values]
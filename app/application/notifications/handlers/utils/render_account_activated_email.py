@@ -1,5 +1,9 @@
-def render_account_activated_email() -> str:
-    return """
+from functools import lru_cache
+
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
+
+_TEMPLATE = EmailTemplate(
+    """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -59,3 +63,9 @@ def render_account_activated_email() -> str:
 </body>
 </html>
 """.strip()
+)
+
+
+@lru_cache(maxsize=1)
+def render_account_activated_email() -> str:
+    return _TEMPLATE.render()
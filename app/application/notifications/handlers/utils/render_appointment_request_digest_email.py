@@ -0,0 +1,126 @@
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
+from app.domain.studio.appointments.events.appointment_request_digest_requested import (
+    DigestedAppointmentRequest,
+)
+
+_TEMPLATE = EmailTemplate(
+    """
+<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+  <meta charset="UTF-8" />
+  <title>Resumo das solicitações de agendamento</title>
+</head>
+
+<body style="margin:0;padding:0;font-family:Arial,Helvetica,sans-serif;background-color:#f5f5f5;">
+  <table width="100%" cellpadding="0" cellspacing="0">
+    <tr>
+      <td align="center" style="padding:40px 16px;">
+
+        <table width="100%" cellpadding="0" cellspacing="0"
+               style="max-width:520px;background:#ffffff;border-radius:8px;padding:32px;">
+
+          <tr>
+            <td align="center">
+              <h2 style="margin:0;color:#222;">
+                📅 Resumo das solicitações de agendamento
+              </h2>
+            </td>
+          </tr>
+
+          <tr>
+            <td style="padding-top:24px;color:#444;font-size:15px;line-height:1.7;">
+
+              <p style="margin-top:0;">
+                Sua agenda no <strong>Sereia Tattoo Studio</strong> recebeu
+                <strong>{requests_count}</strong> desde o último resumo. 🎉
+              </p>
+
+              <p>
+                Confira os detalhes abaixo:
+              </p>
+
+              <div style="background:#f8f8f8;border-radius:6px;padding:16px;margin:20px 0;">
+{requests_html}
+              </div>
+
+              <p>
+                Agora basta acessar o sistema para revisar as solicitações,
+                informar o valor dos procedimentos e entrar em contato com os clientes
+                para prosseguir com a confirmação dos agendamentos e o pagamento da caução.
+              </p>
+
+              <p>
+                Quanto mais rápido o atendimento, maior a chance de converter essas
+                solicitações em agendamentos confirmados. 🚀
+              </p>
+
+            </td>
+          </tr>
+
+          <tr>
+            <td style="padding-top:28px;color:#999;font-size:12px;text-align:center;line-height:1.6;">
+
+              <p style="margin:0;">
+                Este é um e-mail enviado automaticamente pelo sistema do
+                <strong>Sereia Tattoo Studio</strong>.
+              </p>
+
+              <p style="margin-top:12px;">
+                Caso precise de ajuda, nossa equipe de suporte estará à disposição.
+              </p>
+
+            </td>
+          </tr>
+
+        </table>
+
+      </td>
+    </tr>
+  </table>
+</body>
+</html>
+""".strip()
+)
+
+_REQUEST_TEMPLATE = EmailTemplate(
+    """
+                <p style="margin:0 0 8px 0;">
+                  <strong>{appointment_name}:</strong> {date},
+                  {start_time} às {end_time}{sessions}
+                </p>"""
+)
+
+
+def render_appointment_request_digest_email(requests: list[DigestedAppointmentRequest]) -> str:
+    requests_html = "".join(
+        _REQUEST_TEMPLATE.render_many(_request_values(request) for request in requests)
+    )
+
+    return _TEMPLATE.render(
+        requests_count=requests_count_label(len(requests)), requests_html=requests_html
+    )
+
+
+def requests_count_label(count: int) -> str:
+    if count == 1:
+        return "1 nova solicitação"
+
+    return f"{count} novas solicitações"
+
+
+def _request_values(request: DigestedAppointmentRequest) -> dict[str, object]:
+    appointment_name = "Piercing" if request.appointment_type.value == "piercing" else "Tattoo"
+
+    # a series shows its first session
+    sessions = ""
+    if request.sessions_count > 1:
+        sessions = f" (1ª de {request.sessions_count} sessões)"
+
+    return {
+        "appointment_name": appointment_name,
+        "date": request.start_at.strftime("%d/%m/%Y"),
+        "start_time": request.start_at.strftime("%H:%M"),
+        "end_time": request.end_at.strftime("%H:%M"),
+        "sessions": sessions,
+    }
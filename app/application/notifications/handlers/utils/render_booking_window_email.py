@@ -1,8 +1,10 @@
 from datetime import date
+from functools import lru_cache
 
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
 
-def render_booking_window_email(new_booking_window: date) -> str:
-    return f"""
+_TEMPLATE = EmailTemplate(
+    """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -64,3 +66,9 @@ def render_booking_window_email(new_booking_window: date) -> str:
 </body>
 </html>
 """.strip()
+)
+
+
+@lru_cache(maxsize=32)
+def render_booking_window_email(new_booking_window: date) -> str:
+    return _TEMPLATE.render(new_booking_window=new_booking_window)
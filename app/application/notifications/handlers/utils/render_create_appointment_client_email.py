@@ -1,21 +1,10 @@
 from datetime import datetime
+from functools import lru_cache
 
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
 
-def render_create_appointment_client_email(
-    *, start_at: datetime, end_at: datetime, appointment_type: str
-) -> str:
-    if appointment_type == "piercing":
-        title = "✨ Seu novo piercing está mais perto do que nunca!"
-        appointment_name = "Piercing"
-    else:
-        title = "🎨 Sua próxima tattoo já começou a sair do papel!"
-        appointment_name = "Tattoo"
-
-    appointment_date = start_at.strftime("%d/%m/%Y")
-    start_time = start_at.strftime("%H:%M")
-    end_time = end_at.strftime("%H:%M")
-
-    return f"""
+_TEMPLATE = EmailTemplate(
+    """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -117,3 +106,28 @@ def render_create_appointment_client_email(
 </body>
 </html>
 """.strip()
+)
+
+
+@lru_cache(maxsize=256)
+def render_create_appointment_client_email(
+    *, start_at: datetime, end_at: datetime, appointment_type: str
+) -> str:
+    if appointment_type == "piercing":
+        title = "✨ Seu novo piercing está mais perto do que nunca!"
+        appointment_name = "Piercing"
+    else:
+        title = "🎨 Sua próxima tattoo já começou a sair do papel!"
+        appointment_name = "Tattoo"
+
+    appointment_date = start_at.strftime("%d/%m/%Y")
+    start_time = start_at.strftime("%H:%M")
+    end_time = end_at.strftime("%H:%M")
+
+    return _TEMPLATE.render(
+        appointment_date=appointment_date,
+        appointment_name=appointment_name,
+        end_time=end_time,
+        start_time=start_time,
+        title=title,
+    )
@@ -0,0 +1,133 @@
+from functools import lru_cache
+
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
+from app.application.notifications.handlers.utils.render_sessions_html import render_sessions_html
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+_TEMPLATE = EmailTemplate(
+    """
+<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+  <meta charset="UTF-8" />
+  <title>Solicitação de agendamento recebida</title>
+</head>
+
+<body style="margin:0;padding:0;font-family:Arial,Helvetica,sans-serif;background-color:#f5f5f5;">
+  <table width="100%" cellpadding="0" cellspacing="0">
+    <tr>
+      <td align="center" style="padding:40px 16px;">
+
+        <table width="100%" cellpadding="0" cellspacing="0"
+               style="max-width:520px;background:#ffffff;border-radius:8px;padding:32px;">
+
+          <tr>
+            <td align="center">
+              <h2 style="margin:0;color:#222;">
+                ✅ Solicitação recebida com sucesso!
+              </h2>
+            </td>
+          </tr>
+
+          <tr>
+            <td style="padding-top:24px;color:#444;font-size:15px;line-height:1.7;">
+
+              <p style="margin-top:0;">
+                {title}
+              </p>
+
+              <p>
+                Recebemos a solicitação de todas as sessões do seu projeto no
+                <strong>Sereia Tattoo Studio</strong>. 💙🧜‍♀️
+              </p>
+
+              <p>
+                Confira os dados enviados:
+              </p>
+
+              <div style="background:#f8f8f8;border-radius:6px;padding:16px;margin:20px 0;">
+                <p style="margin:0 0 8px 0;">
+                  <strong>Procedimento:</strong> {appointment_name}
+                </p>
+
+                <p style="margin:0 0 8px 0;">
+                  <strong>Sessões:</strong> {sessions_count}
+                </p>
+{sessions_html}
+              </div>
+
+              <p>
+                Nossa equipe vai analisar sua solicitação e entrar em contato em breve
+                para confirmar os detalhes, informar o valor final do procedimento e
+                finalizar a reserva do seu horário.
+              </p>
+
+              <p>
+                <strong>⚠️ Importante:</strong> este horário ainda depende da confirmação
+                da nossa equipe. Assim que tudo estiver certo, entraremos em contato.
+              </p>
+
+              <p>
+                Caso tenha informado algum dado incorretamente ou precise alterar a
+                solicitação, entre em contato conosco o quanto antes. Teremos o maior
+                prazer em ajudar. 😊
+              </p>
+
+              <p>
+                Agradecemos por escolher o
+                <strong>Sereia Tattoo Studio</strong>.
+                Estamos ansiosos para receber você! 💙
+              </p>
+
+            </td>
+          </tr>
+
+          <tr>
+            <td style="padding-top:28px;color:#999;font-size:12px;text-align:center;line-height:1.6;">
+              <p style="margin:0;">
+                Este é um e-mail enviado automaticamente pelo sistema do
+                <strong>Sereia Tattoo Studio</strong>.
+              </p>
+
+              <p style="margin-top:12px;">
+                Se você não realizou esta solicitação, basta ignorar esta mensagem.
+                Caso o agendamento não seja confirmado, ele será cancelado automaticamente.
+              </p>
+            </td>
+          </tr>
+
+        </table>
+
+      </td>
+    </tr>
+  </table>
+</body>
+</html>
+""".strip()
+)
+
+
+def render_create_appointment_series_client_email(
+    *, sessions: list[TimeSlot], appointment_type: str
+) -> str:
+    return _render(tuple(sessions), appointment_type)
+
+
+# sessions come as a tuple to be hashable for the cache
+@lru_cache(maxsize=256)
+def _render(sessions: tuple[TimeSlot, ...], appointment_type: str) -> str:
+    if appointment_type == "piercing":
+        title = "✨ Seu novo piercing está mais perto do que nunca!"
+        appointment_name = "Piercing"
+    else:
+        title = "🎨 Sua próxima tattoo já começou a sair do papel!"
+        appointment_name = "Tattoo"
+
+    sessions_html = render_sessions_html(sessions)
+
+    return _TEMPLATE.render(
+        appointment_name=appointment_name,
+        sessions_count=len(sessions),
+        sessions_html=sessions_html,
+        title=title,
+    )
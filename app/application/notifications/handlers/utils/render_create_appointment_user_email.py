@@ -1,16 +1,10 @@
 from datetime import datetime
+from functools import lru_cache
 
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
 
-def render_create_appointment_user_email(
-    *, start_at: datetime, end_at: datetime, appointment_type: str
-) -> str:
-    appointment_name = "Piercing" if appointment_type == "piercing" else "Tattoo"
-
-    appointment_date = start_at.strftime("%d/%m/%Y")
-    start_time = start_at.strftime("%H:%M")
-    end_time = end_at.strftime("%H:%M")
-
-    return f"""
+_TEMPLATE = EmailTemplate(
+    """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -101,3 +95,22 @@ def render_create_appointment_user_email(
 </body>
 </html>
 """.strip()
+)
+
+
+@lru_cache(maxsize=256)
+def render_create_appointment_user_email(
+    *, start_at: datetime, end_at: datetime, appointment_type: str
+) -> str:
+    appointment_name = "Piercing" if appointment_type == "piercing" else "Tattoo"
+
+    appointment_date = start_at.strftime("%d/%m/%Y")
+    start_time = start_at.strftime("%H:%M")
+    end_time = end_at.strftime("%H:%M")
+
+    return _TEMPLATE.render(
+        appointment_date=appointment_date,
+        appointment_name=appointment_name,
+        end_time=end_time,
+        start_time=start_time,
+    )
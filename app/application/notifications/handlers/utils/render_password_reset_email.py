@@ -1,5 +1,7 @@
-def render_password_reset_email(reset_link: str) -> str:
-    return f"""
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
+
+_TEMPLATE = EmailTemplate(
+    """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -82,3 +84,8 @@ def render_password_reset_email(reset_link: str) -> str:
 </body>
 </html>
 """.strip()
+)
+
+
+def render_password_reset_email(reset_link: str) -> str:
+    return _TEMPLATE.render(reset_link=reset_link)
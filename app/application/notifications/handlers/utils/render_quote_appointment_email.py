@@ -1,22 +1,10 @@
 from decimal import Decimal
+from functools import lru_cache
 
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
 
-def render_quote_appointment_client_email(price: Decimal, appointment_type: str) -> str:
-    if appointment_type == "piercing":
-        finisher = "Estamos ansiosos para brilharmos seu dia com um piercing incrivel! 🧜‍♀️🌊"
-        appointment_name = "seu Piercing"
-    else:
-        finisher = "Estamos ansiosos para transformar sua ideia em uma tatuagem incrível! 🧜‍♀️🌊"
-        appointment_name = "sua Tattoo"
-
-    formatted_price = f"{price:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-
-    if formatted_price.endswith(",00"):
-        formatted_price = formatted_price[:-3]
-
-    formatted_price = f"R$ {formatted_price}"
-
-    return f"""
+_TEMPLATE = EmailTemplate(
+    """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -106,3 +94,25 @@ def render_quote_appointment_client_email(price: Decimal, appointment_type: str)
 </body>
 </html>
 """.strip()
+)
+
+
+@lru_cache(maxsize=256)
+def render_quote_appointment_client_email(price: Decimal, appointment_type: str) -> str:
+    if appointment_type == "piercing":
+        finisher = "Estamos ansiosos para brilharmos seu dia com um piercing incrivel! 🧜‍♀️🌊"
+        appointment_name = "seu Piercing"
+    else:
+        finisher = "Estamos ansiosos para transformar sua ideia em uma tatuagem incrível! 🧜‍♀️🌊"
+        appointment_name = "sua Tattoo"
+
+    formatted_price = f"{price:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+    if formatted_price.endswith(",00"):
+        formatted_price = formatted_price[:-3]
+
+    formatted_price = f"R$ {formatted_price}"
+
+    return _TEMPLATE.render(
+        appointment_name=appointment_name, finisher=finisher, formatted_price=formatted_price
+    )
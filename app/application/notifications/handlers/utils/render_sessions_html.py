@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+_SESSION_TEMPLATE = EmailTemplate(
+    """
+                <p style="margin:0 0 8px 0;">
+                  <strong>Sessão {number}:</strong> {date},
+                  {start_time} às {end_time}
+                </p>"""
+)
+
+
+def render_sessions_html(sessions: Sequence[TimeSlot]) -> str:
+    return "".join(
+        _SESSION_TEMPLATE.render_many(
+            {
+                "number": number,
+                "date": session.start_at.strftime("%d/%m/%Y"),
+                "start_time": session.start_at.strftime("%H:%M"),
+                "end_time": session.end_at.strftime("%H:%M"),
+            }
+            for number, session in enumerate(sessions, start=1)
+        )
+    )
@@ -1,5 +1,7 @@
-def render_vip_account_created_email(client_code: str) -> str:
-    return f"""
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
+
+_TEMPLATE = EmailTemplate(
+    """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -76,3 +78,8 @@ def render_vip_account_created_email(client_code: str) -> str:
 </body>
 </html>
 """.strip()
+)
+
+
+def render_vip_account_created_email(client_code: str) -> str:
+    return _TEMPLATE.render(client_code=client_code)
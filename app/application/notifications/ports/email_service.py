@@ -1,6 +1,29 @@
+import asyncio
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    to: str
+    subject: str
+    html_content: str
 
 
 class EmailService(ABC):
     @abstractmethod
     async def send_email(self, to: str, subject: str, html_content: str) -> None: ...
+
+    async def send_batch(self, messages: list[EmailMessage]) -> None:
+        """
+        Providers with a multi-recipient API override this to send the whole batch in
+        one request, the default sends the messages one by one.
+        """
+        await asyncio.gather(
+            *(
+                self.send_email(
+                    to=message.to, subject=message.subject, html_content=message.html_content
+                )
+                for message in messages
+            )
+        )
@@ -0,0 +1,96 @@
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from app.core.types.circuit_breaker_enums import CircuitState
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    state: CircuitState
+    consecutive_failures: int
+    times_opened: int
+    rejected: int
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` failures in a row and rejects calls until
+    `reset_timeout` has passed. Then a single trial call is let through: its success
+    closes the circuit, its failure opens it for another `reset_timeout`.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: timedelta = timedelta(seconds=30),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self.retry_after() == 0:
+            return CircuitState.HALF_OPEN
+
+        return self._state
+
+    def allow(self) -> bool:
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return True
+
+        if state == CircuitState.HALF_OPEN and not self._trial_running:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_running = True
+            return True
+
+        self._rejected += 1
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial call through."""
+        elapsed = self._clock() - self._opened_at
+        return max(self.reset_timeout.total_seconds() - elapsed, 0.0)
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        self._trial_running = False
+
+        if self._state == CircuitState.HALF_OPEN or (
+            self._consecutive_failures >= self.failure_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """For a call let through that ended without a verdict, like a cancelled one."""
+        self._trial_running = False
+
+    def stats(self) -> CircuitBreakerStats:
+        return CircuitBreakerStats(
+            state=self.state,
+            consecutive_failures=self._consecutive_failures,
+            times_opened=self._times_opened,
+            rejected=self._rejected,
+        )
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._times_opened += 1
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import timedelta
+
+from app.application.notifications.ports.email_service import EmailMessage, EmailService
+from app.application.notifications.services.resilient_email_service import RETRYABLE_ERRORS
+from app.core.exceptions.services import EmailSentFailedError
+
+
+class CoalescingEmailService(EmailService):
+    """
+    Holds `send_email` calls for up to `window` and hands them to the wrapped
+    service's `send_batch` together, so handlers running side by side share one
+    request to the provider. Each caller still waits for its own email. When the
+    provider is unreachable, failing or rate limiting, every caller gets the batch's
+    error; when it refuses the request, the messages are sent again one by one so only
+    the ones it refuses fail.
+    """
+
+    def __init__(
+        self,
+        email_service: EmailService,
+        *,
+        window: timedelta = timedelta(milliseconds=50),
+        max_batch_size: int = 100,
+    ):
+        self.email_service = email_service
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: list[tuple[EmailMessage, asyncio.Future]] = []
+        self._timer: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def send_email(self, to: str, subject: str, html_content: str) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((EmailMessage(to=to, subject=subject, html_content=html_content), future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._cancel_timer()
+            self._spawn(self._send(self._take()))
+        elif self._timer is None:
+            self._timer = self._spawn(self._send_after_window())
+
+        await future
+
+    async def send_batch(self, messages: list[EmailMessage]) -> None:
+        await self.email_service.send_batch(messages)
+
+    async def flush(self) -> None:
+        self._cancel_timer()
+        await self._send(self._take())
+
+    async def _send_after_window(self) -> None:
+        await asyncio.sleep(self.window.total_seconds())
+        self._timer = None
+        await self._send(self._take())
+
+    async def _send(self, pending: list[tuple[EmailMessage, asyncio.Future]]) -> None:
+        if not pending:
+            return
+
+        try:
+            await self.email_service.send_batch([message for message, _ in pending])
+        except EmailSentFailedError as exc:
+            # a refused request may be down to a single message of the batch
+            if isinstance(exc, RETRYABLE_ERRORS) or len(pending) == 1:
+                self._settle(pending, exc)
+            else:
+                await asyncio.gather(*(self._send_alone(message, future) for message, future in pending))
+        except Exception as exc:
+            self._settle(pending, exc)
+        else:
+            self._settle(pending)
+
+    async def _send_alone(self, message: EmailMessage, future: asyncio.Future) -> None:
+        try:
+            await self.email_service.send_email(
+                to=message.to, subject=message.subject, html_content=message.html_content
+            )
+        except Exception as exc:
+            self._settle([(message, future)], exc)
+        else:
+            self._settle([(message, future)])
+
+    @staticmethod
+    def _settle(
+        pending: list[tuple[EmailMessage, asyncio.Future]], exc: Exception | None = None
+    ) -> None:
+        for _, future in pending:
+            if future.done():
+                continue
+
+            if exc is None:
+                future.set_result(None)
+            else:
+                future.set_exception(exc)
+
+    def _take(self) -> list[tuple[EmailMessage, asyncio.Future]]:
+        pending, self._pending = self._pending, []
+        return pending
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+
+from app.application.notifications.ports.email_service import EmailMessage, EmailService
+from app.application.notifications.services.circuit_breaker import CircuitBreaker, CircuitBreakerStats
+from app.core.exceptions.services import (
+    EmailCircuitOpenError,
+    EmailProviderServerError,
+    EmailRateLimitedError,
+    EmailSentFailedError,
+    EmailServiceUnavailableError,
+)
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_ERRORS = (EmailServiceUnavailableError, EmailProviderServerError, EmailRateLimitedError)
+
+
+@dataclass(frozen=True)
+class EmailDeliveryStats:
+    circuit: CircuitBreakerStats
+    retries: int
+    gave_up: int
+
+
+class ResilientEmailService(EmailService):
+    """
+    Retries the wrapped service when the provider is unreachable, failing or rate
+    limiting, with jittered exponential backoff, or after the `Retry-After` it asked
+    for when that is no longer than `max_delay`.
+
+    Unreachable and failing providers also count on the circuit breaker. While it is
+    open sends fail fast with EmailCircuitOpenError, which the outbox dispatcher
+    takes as a cue to put the message back until the circuit lets calls through.
+    """
+
+    def __init__(
+        self,
+        email_service: EmailService,
+        *,
+        breaker: Optional[CircuitBreaker] = None,
+        max_attempts: int = 3,
+        base_delay: timedelta = timedelta(milliseconds=500),
+        max_delay: timedelta = timedelta(seconds=10),
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+    ):
+        self.email_service = email_service
+        self.breaker = breaker or CircuitBreaker()
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._jitter = jitter
+        self._retries = 0
+        self._gave_up = 0
+
+    async def send_email(self, to: str, subject: str, html_content: str) -> None:
+        await self._call(
+            lambda: self.email_service.send_email(to=to, subject=subject, html_content=html_content)
+        )
+
+    async def send_batch(self, messages: list[EmailMessage]) -> None:
+        await self._call(lambda: self.email_service.send_batch(messages))
+
+    def stats(self) -> EmailDeliveryStats:
+        return EmailDeliveryStats(
+            circuit=self.breaker.stats(), retries=self._retries, gave_up=self._gave_up
+        )
+
+    async def _call(self, send: Callable[[], Awaitable[None]]) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            if not self.breaker.allow():
+                raise EmailCircuitOpenError(self.breaker.retry_after())
+
+            try:
+                await send()
+            except RETRYABLE_ERRORS as exc:
+                # a rate limit says nothing about the provider's health
+                if isinstance(exc, EmailRateLimitedError):
+                    self.breaker.release()
+                else:
+                    self.breaker.record_failure()
+
+                delay = self._delay(attempt, exc)
+                if attempt == self.max_attempts or delay is None:
+                    self._gave_up += 1
+                    raise
+
+                self._retries += 1
+                logger.warning(
+                    "email send failed, retrying",
+                    extra={"attempt": attempt, "delay": delay, "error": type(exc).__name__},
+                )
+                await self._sleep(delay)
+            except EmailSentFailedError:
+                # the provider answered, the request itself was refused
+                self.breaker.record_success()
+                raise
+            except BaseException:
+                self.breaker.release()
+                raise
+            else:
+                self.breaker.record_success()
+                return
+
+    def _delay(self, attempt: int, exc: Exception) -> Optional[float]:
+        max_delay = self.max_delay.total_seconds()
+        base_delay = self.base_delay.total_seconds()
+
+        if isinstance(exc, EmailRateLimitedError) and exc.retry_after is not None:
+            if exc.retry_after > max_delay:
+                return None
+
+            return exc.retry_after + self._jitter() * base_delay
+
+        return self._jitter() * min(max_delay, base_delay * 2 ** (attempt - 1))
@@ -25,7 +25,10 @@ of the financial consistency of the system. Hence the UoW in context.
 
 class AddCreditsFromCompletedAppointmentHandler:
     async def handle(self, event: AppointmentCompleted, *, uow: WriteUnitOfWork) -> None:
+        # the balance lock can be held by another credit write, wait for it off the loop
+        await uow.run_sync(self._add_credits, event, uow)
 
+    def _add_credits(self, event: AppointmentCompleted, uow: WriteUnitOfWork) -> None:
         vip_client = uow.vip_clients.find_by_client_code(event.referral_code.value)
         if vip_client is None:
             return
@@ -41,7 +44,9 @@ class AddCreditsFromCompletedAppointmentHandler:
             ):
                 return
 
-        total_credits_before = uow.client_credit_entries.get_balance(vip_client_id=vip_client.id)
+        total_credits_before = uow.client_credit_entries.get_balance_for_update(
+            vip_client_id=vip_client.id
+        )
 
         payments = uow.payments.find_many_by_appointment_id(appointment_id=event.appointment_id)
         payments_in_money = [
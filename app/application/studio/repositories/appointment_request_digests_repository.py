@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
+
+
+class AppointmentRequestDigestsRepository(ABC):
+    @abstractmethod
+    def add(self, entry: AppointmentRequestDigestEntry) -> None: ...
+
+    @abstractmethod
+    def take_due(self, *, until: datetime) -> List[AppointmentRequestDigestEntry]:
+        """
+        Remove and return the entries created up to `until`, ordered by artist and then
+        creation, so they can be grouped in one pass. Entries another transaction is
+        already taking are waited for, so an artist's entries are never split between
+        two takes.
+        """
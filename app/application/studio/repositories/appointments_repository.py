@@ -4,7 +4,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.application.studio.use_cases.DTO.client_filters import ClientInfoFilter
-from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.commun import Direction, PageCursor
 from app.core.types.appointment_enums import (
     AppointmentStatus,
     AppointmentType,
@@ -17,6 +17,9 @@ class AppointmentsRepository(ABC):
     @abstractmethod
     def create(self, appointment: Appointment) -> None: ...
 
+    @abstractmethod
+    def create_many(self, appointments: List[Appointment]) -> None: ...
+
     @abstractmethod
     def update(self, appointment: Appointment) -> None: ...
 
@@ -40,6 +43,7 @@ class AppointmentsRepository(ABC):
         limit: int = 100,
         offset: int = 0,
         direction: Direction = Direction.desc,
+        cursor: PageCursor | None = None,
     ) -> List[Appointment]: ...
 
     @abstractmethod
@@ -66,3 +70,12 @@ class AppointmentsRepository(ABC):
         end_date: datetime | None = None,
         user_id: UUID | None = None,
     ) -> List[Appointment]: ...
+
+    @abstractmethod
+    def exists_overlap(
+        self,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        user_id: UUID,
+    ) -> bool: ...
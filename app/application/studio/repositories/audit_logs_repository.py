@@ -9,6 +9,9 @@ class AuditLogsRepository(ABC):
     @abstractmethod
     def create(self, audit_log: AuditLogEntry) -> None: ...
 
+    @abstractmethod
+    def create_many(self, audit_logs: List[AuditLogEntry]) -> None: ...
+
     @abstractmethod
     def find_many_by_entity_name(
         self,
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
+from app.application.studio.use_cases.DTO.credit_balance_drift_dto import CreditBalanceDrift
 from app.application.studio.use_cases.DTO.list_client_credit_entries import Direction
 from app.core.types.client_credit_source_type import (
     ClientCreditSourceType,
@@ -11,11 +12,27 @@ from app.domain.studio.finances.entities.client_credit_entry import ClientCredit
 
 class ClientCreditEntriesRepository(ABC):
     @abstractmethod
-    def create(self, client_credit_entry: ClientCreditEntry) -> None: ...
+    def create(self, client_credit_entry: ClientCreditEntry) -> None:
+        """Add the entry and its quantity to the client's balance, in one transaction."""
 
     @abstractmethod
     def get_balance(self, *, vip_client_id: UUID) -> int: ...
 
+    @abstractmethod
+    def get_balance_for_update(self, *, vip_client_id: UUID) -> int:
+        """
+        Read the balance and lock it until the transaction ends, so no other entry for
+        the client lands between this read and the caller's own.
+        """
+
+    @abstractmethod
+    def find_balance_drift(self) -> List[CreditBalanceDrift]:
+        """Re-sum every ledger and return the clients whose balance does not match."""
+
+    @abstractmethod
+    def rebuild_balance(self, *, vip_client_id: UUID) -> int:
+        """Set the client's balance to the sum of its ledger, under the balance lock."""
+
     @abstractmethod
     def find_by_id(self, credit_id: UUID) -> Optional[ClientCreditEntry]: ...
 
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class JobRunsRepository(ABC):
+    @abstractmethod
+    def try_claim(self, job: str, *, window_start: datetime) -> bool:
+        """
+        Take the run of `job` for the window starting at `window_start`. False when the
+        job already ran in that window, or another worker is running it right now. The
+        claim holds until the transaction ends and is recorded when it commits, so a
+        window runs once across workers and restarts.
+        """
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import List
+from uuid import UUID
+
+from app.application.studio.use_cases.DTO.outbox_dto import OutboxMessage
+
+
+class OutboxRepository(ABC):
+    @abstractmethod
+    def add_many(self, messages: List[OutboxMessage]) -> None: ...
+
+    @abstractmethod
+    def claim_batch(self, *, limit: int, now: datetime, lease: timedelta) -> List[OutboxMessage]:
+        """
+        Take up to `limit` pending messages that are available at `now`, count one more
+        attempt on each, and hide them from other claims until `now + lease`. A worker
+        that dies mid batch leaves its messages to be claimed again once the lease ends.
+        """
+
+    @abstractmethod
+    def mark_dispatched(self, message_id: UUID, *, dispatched_at: datetime) -> None: ...
+
+    @abstractmethod
+    def mark_failed(self, message_id: UUID, *, error: str, retry_at: datetime | None) -> None:
+        """
+        Record the error. The message is claimed again at `retry_at`, or never when it
+        is None.
+        """
+
+    @abstractmethod
+    def mark_deferred(self, message_id: UUID, *, error: str, retry_at: datetime) -> None:
+        """
+        Put the message back for `retry_at` without counting the attempt, for a handler
+        that could not even try, like one whose email provider circuit is open.
+        """
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.application.studio.use_cases.DTO.find_free_artists_dto import ArtistCalendar
+from app.application.studio.use_cases.DTO.scheduling_admission_dto import SchedulingAdmission
+
+
+class SchedulingAdmissionRepository(ABC):
+    @abstractmethod
+    def find_admission(
+        self,
+        *,
+        user_id: UUID,
+        start_at: datetime,
+        end_at: datetime,
+        actor_id: UUID | None = None,
+    ) -> Optional[SchedulingAdmission]: ...
+
+    @abstractmethod
+    def find_artist_calendars(self, *, start_at: datetime, end_at: datetime) -> List[ArtistCalendar]: ...
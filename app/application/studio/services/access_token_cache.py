@@ -0,0 +1,105 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class UserAccess:
+    access_token_version: int
+    is_active: bool
+    is_admin: bool
+
+
+class AccessTokenCache:
+    """
+    Process local cache for access token verification. Decoded payloads are kept by
+    token hash until the token expires, so the signature is checked once per token.
+    The user fields the verification depends on are kept for `user_ttl`, and dropped
+    as soon as a unit of work commits a change to that user.
+
+    `clock` must be wall clock time, payloads expire on their `exp` claim.
+    """
+
+    def __init__(
+        self,
+        *,
+        user_ttl: timedelta,
+        max_entries: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.user_ttl = user_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._payloads: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._users: OrderedDict[UUID, tuple[float, UserAccess]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_payload(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self._token_key(token)
+
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is None:
+                return None
+
+            if payload["exp"] <= self._clock():
+                del self._payloads[key]
+                return None
+
+            self._payloads.move_to_end(key)
+            return payload
+
+    def put_payload(self, token: str, payload: Dict[str, Any]) -> None:
+        if "exp" not in payload:
+            return
+
+        key = self._token_key(token)
+
+        with self._lock:
+            self._payloads[key] = payload
+            self._payloads.move_to_end(key)
+            self._evict(self._payloads)
+
+    def get_user(self, user_id: UUID) -> Optional[UserAccess]:
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is None:
+                return None
+
+            loaded_at, access = entry
+
+            if self._clock() - loaded_at >= self.user_ttl.total_seconds():
+                del self._users[user_id]
+                return None
+
+            self._users.move_to_end(user_id)
+            return access
+
+    def put_user(self, user_id: UUID, access: UserAccess) -> None:
+        with self._lock:
+            self._users[user_id] = (self._clock(), access)
+            self._users.move_to_end(user_id)
+            self._evict(self._users)
+
+    def invalidate_users(self, user_ids: Iterable[UUID]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+            self._users.clear()
+
+    def _evict(self, entries: OrderedDict) -> None:
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
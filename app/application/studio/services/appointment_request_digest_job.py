@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import Callable
+
+from app.application.event_bus.integration_event_bus import IntegrationEventBus
+from app.application.studio.services.job_windows import window_start
+from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
+from app.domain.studio.appointments.events.appointment_request_digest_requested import (
+    AppointmentRequestDigestRequested,
+    DigestedAppointmentRequest,
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "appointment_request_digest"
+
+
+class AppointmentRequestDigestJob:
+    """
+    Summarizes the booking requests of every `interval` window, counted on the wall
+    clock so a restart does not push the next digest back. Every `poll_interval` each
+    worker tries to claim the window that just closed; the one that gets it takes the
+    window's entries in one query and publishes one AppointmentRequestDigestRequested
+    per artist. Claiming, taking the entries and writing the outbox messages share a
+    transaction, so a request is either still waiting in the table or on its way in
+    a single summary.
+    """
+
+    def __init__(
+        self,
+        *,
+        integration_bus: IntegrationEventBus,
+        write_uow_factory: Callable[[], WriteUnitOfWork],
+        interval: timedelta = timedelta(days=1),
+        poll_interval: timedelta = timedelta(minutes=1),
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.integration_bus = integration_bus
+        self.write_uow_factory = write_uow_factory
+        self.interval = interval
+        self.poll_interval = poll_interval
+        self._clock = clock
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("appointment request digest failed")
+
+            await asyncio.sleep(self.poll_interval.total_seconds())
+
+    async def run_once(self) -> int:
+        uow = self.write_uow_factory()
+
+        async with uow:
+            entries = await uow.run_sync(self._take_due, uow)
+
+            for event in self._digests(entries):
+                await self.integration_bus.publish(event, uow=uow)
+
+        return len(entries)
+
+    def _take_due(self, uow: WriteUnitOfWork) -> list[AppointmentRequestDigestEntry]:
+        until = window_start(self._clock(), self.interval)
+
+        if not uow.job_runs.try_claim(JOB_NAME, window_start=until):
+            return []
+
+        return uow.appointment_request_digests.take_due(until=until)
+
+    @staticmethod
+    def _digests(
+        entries: list[AppointmentRequestDigestEntry],
+    ) -> list[AppointmentRequestDigestRequested]:
+        # take_due hands the entries over ordered by artist
+        return [
+            AppointmentRequestDigestRequested(
+                user_id=user_id,
+                requests=[
+                    DigestedAppointmentRequest(
+                        appointment_type=entry.appointment_type,
+                        start_at=entry.start_at,
+                        end_at=entry.end_at,
+                        sessions_count=entry.sessions_count,
+                    )
+                    for entry in user_entries
+                ],
+            )
+            for user_id, user_entries in groupby(entries, key=lambda entry: entry.user_id)
+        ]
@@ -0,0 +1,137 @@
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+from uuid import UUID
+
+from app.domain.studio.appointments.entities.calendar_exception import CalendarException
+from app.domain.studio.appointments.entities.calendar_settings import CalendarSettings
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+T = TypeVar("T", CalendarException, TimeSlot)
+
+
+class SortedIntervals(Generic[T]):
+    """
+    Intervals kept ordered by start. Since no interval is longer than the longest one,
+    every interval overlapping [start_at, end_at) starts inside
+    (start_at - longest, end_at), so both ends of the lookup are a bisect away.
+    """
+
+    def __init__(self, intervals: Iterable[T]):
+        self._intervals = sorted(intervals, key=lambda interval: (interval.start_at, interval.end_at))
+        self._starts = [interval.start_at for interval in self._intervals]
+        self._longest = max(
+            (interval.end_at - interval.start_at for interval in self._intervals),
+            default=timedelta(0),
+        )
+
+    def overlapping(self, *, start_at: datetime, end_at: datetime) -> list[T]:
+        low = bisect_right(self._starts, start_at - self._longest)
+        high = bisect_left(self._starts, end_at)
+
+        return [interval for interval in self._intervals[low:high] if interval.end_at > start_at]
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+
+@dataclass
+class CalendarSnapshot:
+    user_id: UUID
+    user_is_active: bool
+    calendar_settings: Optional[CalendarSettings]
+    horizon_start: datetime
+    horizon_end: datetime
+    calendar_exceptions: SortedIntervals[CalendarException] = field(
+        default_factory=lambda: SortedIntervals([])
+    )
+    booked_slots: SortedIntervals[TimeSlot] = field(default_factory=lambda: SortedIntervals([]))
+
+    def covers(self, *, start_at: datetime, end_at: datetime) -> bool:
+        return self.horizon_start <= start_at and end_at <= self.horizon_end
+
+    def exceptions_overlapping(self, *, start_at: datetime, end_at: datetime) -> list[CalendarException]:
+        return self.calendar_exceptions.overlapping(start_at=start_at, end_at=end_at)
+
+    def booked_overlapping(self, *, start_at: datetime, end_at: datetime) -> list[TimeSlot]:
+        return self.booked_slots.overlapping(start_at=start_at, end_at=end_at)
+
+    def is_booked(self, *, start_at: datetime, end_at: datetime) -> bool:
+        return bool(self.booked_overlapping(start_at=start_at, end_at=end_at))
+
+
+class CalendarIndex:
+    """
+    Process local cache of calendar snapshots, one per user. Snapshots are dropped
+    when a write unit of work commits a change to that calendar, and expire after
+    `ttl` so writes made by other processes are picked up too.
+
+    Dropping a snapshot bumps the user's generation. A reader takes the generation
+    before loading and hands it to `put`, which refuses the snapshot if a commit
+    invalidated the calendar meanwhile, so a load that raced a write is not served
+    until the ttl.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: timedelta,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[UUID, tuple[float, CalendarSnapshot]] = OrderedDict()
+        self._generations: dict[UUID, int] = {}
+        self._clears = 0
+        self._lock = threading.Lock()
+
+    def generation(self, user_id: UUID) -> int:
+        with self._lock:
+            return self._clears + self._generations.get(user_id, 0)
+
+    def get(self, user_id: UUID, *, start_at: datetime, end_at: datetime) -> Optional[CalendarSnapshot]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+
+            loaded_at, snapshot = entry
+
+            if self._clock() - loaded_at >= self.ttl.total_seconds():
+                del self._entries[user_id]
+                return None
+
+            if not snapshot.covers(start_at=start_at, end_at=end_at):
+                return None
+
+            self._entries.move_to_end(user_id)
+            return snapshot
+
+    def put(self, snapshot: CalendarSnapshot, *, generation: Optional[int] = None) -> None:
+        with self._lock:
+            current = self._clears + self._generations.get(snapshot.user_id, 0)
+            if generation is not None and generation != current:
+                return
+
+            self._entries[snapshot.user_id] = (self._clock(), snapshot)
+            self._entries.move_to_end(snapshot.user_id)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[UUID]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._clears += 1
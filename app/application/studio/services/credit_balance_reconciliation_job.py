@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from app.application.studio.services.job_windows import window_start
+from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
+from app.application.studio.use_cases.DTO.credit_balance_drift_dto import CreditBalanceDrift
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "credit_balance_reconciliation"
+
+
+class CreditBalanceReconciliationJob:
+    """
+    Once every `interval` window, counted on the wall clock so restarts do not push
+    it back, re-sums each client's credit ledger and logs the clients whose
+    materialized balance no longer matches it. Every `poll_interval` each worker
+    tries to claim the window; only the one that gets it looks for drift.
+
+    With `repair` the drifted balances are also rebuilt from the ledger, each in a
+    transaction of its own so no client's balance stays locked for the whole run;
+    otherwise the drift is only reported, for someone to look into what wrote it.
+    """
+
+    def __init__(
+        self,
+        *,
+        write_uow_factory: Callable[[], WriteUnitOfWork],
+        interval: timedelta = timedelta(days=1),
+        poll_interval: timedelta = timedelta(minutes=1),
+        repair: bool = False,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.write_uow_factory = write_uow_factory
+        self.interval = interval
+        self.poll_interval = poll_interval
+        self.repair = repair
+        self._clock = clock
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("credit balance reconciliation failed")
+
+            await asyncio.sleep(self.poll_interval.total_seconds())
+
+    async def run_once(self) -> list[CreditBalanceDrift]:
+        uow = self.write_uow_factory()
+
+        async with uow:
+            drifts = await uow.run_sync(self._find_drift, uow)
+
+        for drift in drifts:
+            logger.warning(
+                "credit balance drifted from ledger",
+                extra={
+                    "vip_client_id": str(drift.vip_client_id),
+                    "recorded": drift.recorded,
+                    "ledger": drift.ledger,
+                    "repaired": self.repair,
+                },
+            )
+
+            if self.repair:
+                await self._rebuild(drift)
+
+        return drifts
+
+    def _find_drift(self, uow: WriteUnitOfWork) -> list[CreditBalanceDrift]:
+        if not uow.job_runs.try_claim(JOB_NAME, window_start=window_start(self._clock(), self.interval)):
+            return []
+
+        return uow.client_credit_entries.find_balance_drift()
+
+    async def _rebuild(self, drift: CreditBalanceDrift) -> None:
+        uow = self.write_uow_factory()
+
+        async with uow:
+            await uow.run_sync(self._rebuild_balance, uow, drift)
+
+    @staticmethod
+    def _rebuild_balance(uow: WriteUnitOfWork, drift: CreditBalanceDrift) -> None:
+        uow.client_credit_entries.rebuild_balance(vip_client_id=drift.vip_client_id)
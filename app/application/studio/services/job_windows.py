@@ -0,0 +1,11 @@
+from datetime import datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def window_start(moment: datetime, interval: timedelta) -> datetime:
+    """
+    Start of the `interval` long window `moment` falls in. Windows are counted from
+    the Unix epoch in UTC, so every worker and every restart agrees on them.
+    """
+    return moment - (moment - EPOCH) % interval
@@ -0,0 +1,93 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class LoginRateLimit:
+    key: str
+    max_attempts: int
+
+
+class LoginRateLimiter(ABC):
+    """
+    Sliding window of login attempts per key. `acquire` records one attempt against
+    every limit, or none of them when a limit is already spent, and then returns the
+    seconds until the oldest attempt of the spent window expires.
+    """
+
+    def __init__(self, *, window: timedelta):
+        self.window = window
+
+    @abstractmethod
+    async def acquire(self, limits: list[LoginRateLimit]) -> Optional[float]: ...
+
+    @abstractmethod
+    async def reset(self, key: str) -> None: ...
+
+
+class InMemoryLoginRateLimiter(LoginRateLimiter):
+    """
+    Attempts kept per process. With several workers each one counts on its own, so
+    the effective budget is multiplied by the number of workers.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: timedelta,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(window=window)
+        self.max_keys = max_keys
+        self._clock = clock
+        self._attempts: OrderedDict[str, deque[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def acquire(self, limits: list[LoginRateLimit]) -> Optional[float]:
+        window = self.window.total_seconds()
+
+        with self._lock:
+            now = self._clock()
+            retry_after: Optional[float] = None
+
+            for limit in limits:
+                attempts = self._recent_attempts(limit.key, now - window)
+
+                if len(attempts) >= limit.max_attempts:
+                    wait = attempts[-limit.max_attempts] + window - now
+                    retry_after = max(retry_after or 0.0, wait)
+
+            if retry_after is not None:
+                return retry_after
+
+            for limit in limits:
+                self._attempts.setdefault(limit.key, deque()).append(now)
+                self._attempts.move_to_end(limit.key)
+
+            while len(self._attempts) > self.max_keys:
+                self._attempts.popitem(last=False)
+
+            return None
+
+    async def reset(self, key: str) -> None:
+        with self._lock:
+            self._attempts.pop(key, None)
+
+    def _recent_attempts(self, key: str, window_start: float) -> deque[float]:
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            return deque()
+
+        while attempts and attempts[0] <= window_start:
+            attempts.popleft()
+
+        if not attempts:
+            del self._attempts[key]
+
+        return attempts
@@ -1,5 +1,11 @@
 from abc import ABC
+from typing import Callable, TypeVar
 
+import anyio
+
+from app.application.studio.repositories.appointment_request_digests_repository import (
+    AppointmentRequestDigestsRepository,
+)
 from app.application.studio.repositories.appointments_repository import (
     AppointmentsRepository,
 )
@@ -11,13 +17,20 @@ from app.application.studio.repositories.calendar_settings_repository import Cal
 from app.application.studio.repositories.client_credit_entries_repository import (
     ClientCreditEntriesRepository,
 )
+from app.application.studio.repositories.job_runs_repository import JobRunsRepository
+from app.application.studio.repositories.outbox_repository import OutboxRepository
 from app.application.studio.repositories.payments_repository import PaymentsRepository
 from app.application.studio.repositories.refunds_repository import RefundsRepository
+from app.application.studio.repositories.scheduling_admission_repository import (
+    SchedulingAdmissionRepository,
+)
 from app.application.studio.repositories.users_repository import UsersRepository
 from app.application.studio.repositories.vip_clients_repository import (
     VipClientsRepository,
 )
 
+T = TypeVar("T")
+
 
 class BaseUnitOfWork(ABC):
     users: UsersRepository
@@ -29,3 +42,20 @@ class BaseUnitOfWork(ABC):
     refunds: RefundsRepository
     calendar_settings: CalendarSettingsRepository
     calendar_exceptions: CalendarExceptionsRepository
+    scheduling_admission: SchedulingAdmissionRepository
+    outbox: OutboxRepository
+    appointment_request_digests: AppointmentRequestDigestsRepository
+    job_runs: JobRunsRepository
+
+    async def run_sync(self, function: Callable[..., T], *args) -> T:
+        """
+        Run blocking repository work on a worker thread, so async routes waiting on a
+        slow query do not stall every other request served by the event loop.
+        """
+        return await anyio.to_thread.run_sync(function, *args)
+
+    def close(self) -> None:
+        """
+        Release the session a unit of work opened on its own. Units of work without
+        one have nothing to release.
+        """
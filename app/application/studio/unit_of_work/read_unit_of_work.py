@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
 from app.application.studio.unit_of_work.base_unit_of_work import BaseUnitOfWork
 
 
@@ -7,3 +10,20 @@ class ReadUnitOfWork(BaseUnitOfWork):
 
     def __exit__(self, exc_type, exc, tb):
         pass
+
+
+ReadUnitOfWorkFactory = Callable[[], ReadUnitOfWork]
+
+
+@contextmanager
+def open_read_unit_of_work(uow_factory: ReadUnitOfWorkFactory) -> Iterator[ReadUnitOfWork]:
+    """
+    A read unit of work of its own for an integration handler, closed on the way out
+    so its pool connection is back before the handler goes on to slow network calls.
+    """
+    uow = uow_factory()
+    try:
+        with uow:
+            yield uow
+    finally:
+        uow.close()
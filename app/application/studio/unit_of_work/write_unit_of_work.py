@@ -1,5 +1,7 @@
 from abc import abstractmethod
 
+import anyio
+
 from app.application.studio.unit_of_work.base_unit_of_work import BaseUnitOfWork
 
 
@@ -15,3 +17,10 @@ class WriteUnitOfWork(BaseUnitOfWork):
 
     @abstractmethod
     def __exit__(self, exc_type, exc, tb): ...
+
+    async def __aenter__(self) -> "WriteUnitOfWork":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # commit and rollback are round trips too, they leave the event loop as well
+        return await anyio.to_thread.run_sync(self.__exit__, exc_type, exc, tb)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.core.types.appointment_enums import AppointmentType
+
+
+@dataclass
+class AppointmentRequestDigestEntry:
+    id: UUID
+    user_id: UUID
+    appointment_type: AppointmentType
+    # a series is a single entry, `start_at` and `end_at` are its first session
+    start_at: datetime
+    end_at: datetime
+    created_at: datetime
+    sessions_count: int = 1
+
@@ -1,6 +1,47 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
+from uuid import UUID
+
+from app.core.exceptions.validation import InvalidPageCursorError
 
 
 class Direction(str, Enum):
     asc = "asc"
     desc = "desc"
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Position of a keyset page on the (created_at, id) ordering.
+    backward=True asks for the rows before that position instead of after it.
+    """
+
+    created_at: datetime
+    id: UUID
+    backward: bool = False
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {"c": self.created_at.isoformat(), "i": str(self.id), "b": self.backward},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+            created_at = datetime.fromisoformat(payload["c"])
+            if created_at.tzinfo is None:
+                raise InvalidPageCursorError()
+
+            return cls(created_at=created_at, id=UUID(payload["i"]), backward=bool(payload["b"]))
+        except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as exc:
+            raise InvalidPageCursorError() from exc
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class CreditBalanceDrift:
+    vip_client_id: UUID
+    recorded: int
+    ledger: int
+
+    @property
+    def difference(self) -> int:
+        return self.recorded - self.ledger
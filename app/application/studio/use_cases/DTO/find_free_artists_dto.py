@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.application.studio.use_cases.DTO.list_available_slots_dto import AvailableSlotOutput
+from app.core.types.appointment_enums import AppointmentType
+from app.domain.studio.appointments.entities.calendar_exception import CalendarException
+from app.domain.studio.appointments.entities.calendar_settings import CalendarSettings
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+
+@dataclass(frozen=True)
+class ArtistCalendar:
+    """
+    The calendar of one active artist restricted to a searched range. It is a read
+    model for availability searches and must not be saved back.
+    """
+
+    user_id: UUID
+    username: str
+    calendar_settings: CalendarSettings
+    calendar_exceptions: list[CalendarException] = field(default_factory=list)
+    booked_slots: list[TimeSlot] = field(default_factory=list)
+
+
+class FindFreeArtistsInput(BaseModel):
+    start_at: datetime
+    end_at: datetime
+    appointment_type: AppointmentType
+    duration_minutes: int = Field(ge=1, le=24 * 60)
+    step_minutes: int = Field(default=30, ge=5, le=24 * 60)
+    actor_id: UUID | None = None
+
+
+class FreeArtistOutput(BaseModel):
+    user_id: UUID
+    username: str
+    earliest_openings: list[AvailableSlotOutput]
+
+
+class FindFreeArtistsOutput(BaseModel):
+    appointment_type: AppointmentType
+    duration_minutes: int
+    artists: list[FreeArtistOutput]
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.application.studio.use_cases.DTO.commun import Direction
+from app.core.types.appointment_enums import AppointmentStatus, AppointmentType
+from app.domain.studio.appointments.entities.appointment import Appointment
+from app.domain.studio.users.entities.user import User
+
+
+@dataclass
+class ListAppointmentsInput:
+    actor: User
+    user_id: UUID | None = None
+    status: AppointmentStatus | None = None
+    appointment_type: AppointmentType | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    cursor: str | None = None
+    limit: int = 20
+    direction: Direction = Direction.desc
+
+
+class AppointmentOutput(BaseModel):
+    id: UUID
+    status: AppointmentStatus
+    appointment_type: AppointmentType
+    user_id: UUID
+    start_at: datetime
+    end_at: datetime
+    placement: str
+    details: str
+    size: str | None
+    color: bool
+    price: Decimal | None
+    current_session: int | None
+    total_sessions: int | None
+    vip_client_id: UUID | None
+    client_name: str | None
+    created_at: datetime
+
+    @classmethod
+    def from_entity(cls, appointment: Appointment):
+        return cls(
+            id=appointment.id,
+            status=appointment.status,
+            appointment_type=appointment.appointment_type,
+            user_id=appointment.user_id,
+            start_at=appointment.start_at,
+            end_at=appointment.end_at,
+            placement=appointment.placement,
+            details=appointment.details,
+            size=appointment.size,
+            color=appointment.color,
+            price=appointment.price,
+            current_session=appointment.current_session,
+            total_sessions=appointment.total_sessions,
+            vip_client_id=appointment.client_info.vip_client_id,
+            client_name=appointment.client_info.name,
+            created_at=appointment.created_at,
+        )
+
+
+class ListAppointmentsOutput(BaseModel):
+    appointments: list[AppointmentOutput]
+    next_cursor: str | None
+    prev_cursor: str | None
+    limit: int
@@ -0,0 +1,30 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+
+class ListAvailableSlotsInput(BaseModel):
+    user_id: UUID
+    start_at: datetime
+    end_at: datetime
+    duration_minutes: int = Field(ge=1, le=24 * 60)
+    step_minutes: int = Field(default=30, ge=5, le=24 * 60)
+    actor_id: UUID | None = None
+
+
+class AvailableSlotOutput(BaseModel):
+    start_at: datetime
+    end_at: datetime
+
+    @classmethod
+    def from_value_object(cls, slot: TimeSlot):
+        return cls(start_at=slot.start_at, end_at=slot.end_at)
+
+
+class ListAvailableSlotsOutput(BaseModel):
+    user_id: UUID
+    duration_minutes: int
+    slots: list[AvailableSlotOutput]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.core.types.outbox_enums import OutboxStatus
+
+
+@dataclass
+class OutboxMessage:
+    id: UUID
+    event_type: str
+    handler_name: str
+    payload: dict
+    created_at: datetime
+    available_at: datetime
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    last_error: str | None = None
+    dispatched_at: datetime | None = None
+
+
+# One message is written per registered handler, so a handler that keeps failing
+# is retried on its own without sending again what the other handlers delivered.
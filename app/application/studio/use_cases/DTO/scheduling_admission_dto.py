@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+
+from app.domain.studio.appointments.entities.calendar_exception import CalendarException
+from app.domain.studio.appointments.entities.calendar_settings import CalendarSettings
+
+
+@dataclass(frozen=True)
+class SchedulingAdmission:
+    """
+    Everything CreateAppointmentUseCase needs to accept or refuse a booking.
+
+    calendar_settings only carries the working periods that can contain the
+    requested range, it must not be saved back.
+    """
+
+    user_is_active: bool
+    calendar_settings: CalendarSettings | None
+    slot_is_occupied: bool
+    actor_is_admin: bool = False
+    calendar_exceptions: list[CalendarException] = field(default_factory=list)
@@ -17,44 +17,8 @@ class CompletePaidAppointmentUseCase:
         self.transactional_bus = transactional_bus
 
     async def execute(self, data: CompletePaidAppointmentInput) -> None:
-        with self.uow:
-            appointment = self.uow.appointments.find_by_id(appointment_id=data.appointment_id)
-
-            if appointment is None:
-                raise AppointmentNotFoundError()
-
-            previous_status = appointment.status
-
-            total_paid = self.uow.payments.sum_by_appointment_id(appointment_id=appointment.id)
-
-            refundFilter = RefundFilters.by_appointment(appointment.id)
-            total_refund = self.uow.refunds.sum_amount(filters=refundFilter)
-
-            net_paid_amount = total_paid - total_refund
-
-            event = appointment.complete(total_paid=net_paid_amount)
-
-            self.uow.appointments.update(appointment=appointment)
-
-            log = AuditLogEntry(
-                entity_name="appointments",
-                entity_id=appointment.id,
-                action="mark appointment as completed and paid",
-                actor_id=data.actor_id,
-                actor_type=AuditActorType.USER,
-                changes={
-                    "status": {
-                        "from": previous_status.value,
-                        "to": appointment.status.value,
-                    },
-                    "payment": {
-                        "total_paid": net_paid_amount,
-                    },
-                },
-                performed_at=datetime.now(timezone.utc),
-            )
-
-            self.uow.audit_logs.create(log)
+        async with self.uow:
+            event = await self.uow.run_sync(self._complete_appointment, data)
 
             if event is not None:
                 await self.transactional_bus.publish(event, uow=self.uow)
@@ -67,3 +31,44 @@ class CompletePaidAppointmentUseCase:
             their creation should happen in the same transaction
             as the appointment completion.
             """
+
+    def _complete_appointment(self, data: CompletePaidAppointmentInput):
+        appointment = self.uow.appointments.find_by_id(appointment_id=data.appointment_id)
+
+        if appointment is None:
+            raise AppointmentNotFoundError()
+
+        previous_status = appointment.status
+
+        total_paid = self.uow.payments.sum_by_appointment_id(appointment_id=appointment.id)
+
+        refundFilter = RefundFilters.by_appointment(appointment.id)
+        total_refund = self.uow.refunds.sum_amount(filters=refundFilter)
+
+        net_paid_amount = total_paid - total_refund
+
+        event = appointment.complete(total_paid=net_paid_amount)
+
+        self.uow.appointments.update(appointment=appointment)
+
+        log = AuditLogEntry(
+            entity_name="appointments",
+            entity_id=appointment.id,
+            action="mark appointment as completed and paid",
+            actor_id=data.actor_id,
+            actor_type=AuditActorType.USER,
+            changes={
+                "status": {
+                    "from": previous_status.value,
+                    "to": appointment.status.value,
+                },
+                "payment": {
+                    "total_paid": net_paid_amount,
+                },
+            },
+            performed_at=datetime.now(timezone.utc),
+        )
+
+        self.uow.audit_logs.create(log)
+
+        return event
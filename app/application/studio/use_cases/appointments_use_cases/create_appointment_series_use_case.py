@@ -0,0 +1,224 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.application.event_bus.integration_event_bus import IntegrationEventBus
+from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
+from app.application.studio.use_cases.DTO.audit_logs import AuditLogEntry
+from app.application.studio.use_cases.DTO.create_appointment_series_dto import (
+    CreateAppointmentSeriesInput,
+)
+from app.core.exceptions.appointments import (
+    InvalidAppointmentSeriesError,
+    SlotIsAlreadyOccupiedError,
+    SlotIsNotAvailableError,
+)
+from app.core.exceptions.calendar import (
+    AppointmentCannotLastOvernightError,
+    CannotFindWorkingPeriodsForThisUserError,
+    UserIsNotWorkingInDesignatedTimeframeError,
+)
+from app.core.exceptions.users import UserInactiveError, UserNotFoundError
+from app.core.types.audit_actor_type import AuditActorType
+from app.core.types.calendar_enums import SlotVerdictReason
+from app.domain.studio.appointments.entities.appointment import Appointment
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+from app.domain.studio.appointments.policies.calendar_availability_policy import (
+    CalendarAvailabilityPolicy,
+)
+
+MAX_SERIES_SESSIONS = 12
+
+
+class CreateAppointmentSeriesUseCase:
+    """
+    Book every session of a multi-session piece at once: either all of them are
+    created in the same transaction or none is.
+
+    Like CreateAppointmentUseCase, `digest_artist_requests` leaves the artist's email
+    to the digest, where the whole series counts as one request.
+    """
+
+    def __init__(
+        self,
+        write_uow: WriteUnitOfWork,
+        integration_bus: IntegrationEventBus,
+        calendar_policy: CalendarAvailabilityPolicy,
+        digest_artist_requests: bool = False,
+    ):
+        self.write_uow = write_uow
+        self.integration_bus = integration_bus
+        self.calendar_policy = calendar_policy
+        self.digest_artist_requests = digest_artist_requests
+
+    async def execute(self, data: CreateAppointmentSeriesInput) -> None:
+        sessions = self._sorted_sessions(data.sessions)
+
+        async with self.write_uow:
+            appointments = await self.write_uow.run_sync(self._book_series, data, sessions)
+
+            await self.integration_bus.publish(
+                appointments[0].create_appointment_series_request(
+                    sessions, notify_artist=not self.digest_artist_requests
+                ),
+                uow=self.write_uow,
+            )
+
+    def _book_series(
+        self, data: CreateAppointmentSeriesInput, sessions: list[TimeSlot]
+    ) -> list[Appointment]:
+        user = self.write_uow.users.find_by_id(data.user_id)
+        if not user:
+            raise UserNotFoundError()
+        if user.is_active is False:
+            raise UserInactiveError()
+
+        calendar_of_user = self.write_uow.calendar_settings.find_by_user_id(data.user_id)
+        if not calendar_of_user:
+            raise CannotFindWorkingPeriodsForThisUserError()
+
+        series_start = sessions[0].start_at
+        series_end = max(session.end_at for session in sessions)
+
+        calendar_exceptions = self.write_uow.calendar_exceptions.find_overlap(
+            user_id=data.user_id, start_at=series_start, end_at=series_end
+        )
+
+        verdicts = self.calendar_policy.evaluate_many(
+            calendar_settings=calendar_of_user,
+            calendar_exceptions=calendar_exceptions,
+            candidates=sessions,
+            can_ignore_booking_window=self._can_ignore_booking_window(data),
+        )
+        for verdict in verdicts:
+            self._raise_if_refused(verdict.reason)
+
+        booked_appointments = self.write_uow.appointments.find_overlap(
+            user_id=data.user_id, start_date=series_start, end_date=series_end
+        )
+        for session in sessions:
+            if any(
+                session.overlaps(start_at=booked.start_at, end_at=booked.end_at)
+                for booked in booked_appointments
+            ):
+                raise SlotIsAlreadyOccupiedError()
+
+        return self._save_series(data, sessions)
+
+    def _sorted_sessions(self, sessions: list[TimeSlot]) -> list[TimeSlot]:
+        if not sessions or len(sessions) > MAX_SERIES_SESSIONS:
+            raise InvalidAppointmentSeriesError()
+
+        sorted_sessions = sorted(sessions, key=lambda session: session.start_at)
+
+        for session in sorted_sessions:
+            if session.end_at <= session.start_at:
+                raise InvalidAppointmentSeriesError()
+
+        for previous, current in zip(sorted_sessions, sorted_sessions[1:]):
+            if previous.end_at > current.start_at:
+                raise InvalidAppointmentSeriesError()
+
+        return sorted_sessions
+
+    def _can_ignore_booking_window(self, data: CreateAppointmentSeriesInput) -> bool:
+        if data.actor_id is None:
+            return False
+
+        if data.actor_id == data.user_id:
+            return True
+
+        actor = self.write_uow.users.find_by_id(data.actor_id)
+
+        return actor is not None and actor.is_admin
+
+    @staticmethod
+    def _raise_if_refused(reason: SlotVerdictReason) -> None:
+        if reason == SlotVerdictReason.OUTSIDE_BOOKING_WINDOW:
+            raise SlotIsNotAvailableError()
+
+        if reason == SlotVerdictReason.LASTS_OVERNIGHT:
+            raise AppointmentCannotLastOvernightError()
+
+        if reason in (
+            SlotVerdictReason.BLOCKED_BY_EXCEPTION,
+            SlotVerdictReason.OUTSIDE_WORKING_PERIOD,
+        ):
+            raise UserIsNotWorkingInDesignatedTimeframeError()
+
+    def _make_series(self, data: CreateAppointmentSeriesInput, sessions: list[TimeSlot]):
+        if data.actor_id is not None:
+            actor_type = AuditActorType.USER
+        else:
+            actor_type = AuditActorType.CLIENT
+
+        performed_at = datetime.now(timezone.utc)
+        appointments: list[Appointment] = []
+        logs: list[AuditLogEntry] = []
+
+        for session_number, session in enumerate(sessions, start=1):
+            appointment = Appointment.create(
+                user_id=data.user_id,
+                appointment_type=data.appointment_type,
+                client_info=data.client_info,
+                color=data.color,
+                start_at=session.start_at,
+                end_at=session.end_at,
+                details=data.details,
+                placement=data.placement,
+                referral_code=data.referral_code,
+                size=data.size,
+            )
+            appointment.set_sessions_total(len(sessions))
+            appointment.set_current_session(session_number)
+
+            appointments.append(appointment)
+            logs.append(
+                AuditLogEntry(
+                    entity_name="appointments",
+                    entity_id=appointment.id,
+                    action="create appointment",
+                    actor_id=data.actor_id,
+                    actor_type=actor_type,
+                    changes={
+                        "initial_state_must_important_info": {
+                            "appointment_on_calendar_of": data.user_id,
+                            "appointment_type": data.appointment_type,
+                            "client_info": data.client_info,
+                            "start_at": session.start_at,
+                            "end_at": session.end_at,
+                            "referral_code": data.referral_code,
+                            "current_session": session_number,
+                            "total_sessions": len(sessions),
+                        }
+                    },
+                    performed_at=performed_at,
+                )
+            )
+
+        return appointments, logs
+
+    def _save_series(
+        self, data: CreateAppointmentSeriesInput, sessions: list[TimeSlot]
+    ) -> list[Appointment]:
+        appointments, logs = self._make_series(data, sessions)
+
+        self.write_uow.appointments.create_many(appointments)
+        self.write_uow.audit_logs.create_many(logs)
+
+        if self.digest_artist_requests:
+            self.write_uow.appointment_request_digests.add(
+                AppointmentRequestDigestEntry(
+                    id=uuid4(),
+                    user_id=data.user_id,
+                    appointment_type=data.appointment_type,
+                    start_at=sessions[0].start_at,
+                    end_at=sessions[0].end_at,
+                    created_at=logs[0].performed_at,
+                    sessions_count=len(sessions),
+                )
+            )
+
+        return appointments
@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import uuid4
 
 from app.application.event_bus.integration_event_bus import IntegrationEventBus
-from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
 from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
 from app.application.studio.use_cases.DTO.audit_logs import AuditLogEntry
 from app.application.studio.use_cases.DTO.create_appointment_dto import CreateAppointmentInput
 from app.core.exceptions.appointments import SlotIsAlreadyOccupiedError
@@ -19,54 +21,64 @@ from app.domain.studio.appointments.policies.calendar_availability_policy import
 
 
 class CreateAppointmentUseCase:
+    """
+    With `digest_artist_requests` the artist is not emailed about the request, it is
+    kept for the AppointmentRequestDigestJob summary instead. The client still gets
+    their confirmation right away.
+    """
+
     def __init__(
         self,
         write_uow: WriteUnitOfWork,
-        read_uow: ReadUnitOfWork,
         integration_bus: IntegrationEventBus,
         calendar_policy: CalendarAvailabilityPolicy,
+        digest_artist_requests: bool = False,
     ):
         self.write_uow = write_uow
-        self.read_uow = read_uow
         self.integration_bus = integration_bus
         self.calendar_policy = calendar_policy
+        self.digest_artist_requests = digest_artist_requests
 
     async def execute(self, data: CreateAppointmentInput) -> None:
-        with self.write_uow:
-            user = self.write_uow.users.find_by_id(data.user_id)
-            if not user:
-                raise UserNotFoundError()
-            if user.is_active is False:
-                raise UserInactiveError()
-
-            calendar_of_user = self.write_uow.calendar_settings.find_by_user_id(data.user_id)
-            if not calendar_of_user:
-                raise CannotFindWorkingPeriodsForThisUserError()
-
-            can_ignore_booking_window = self.__can_ignore_booking_window(
-                user_id=data.actor_id, calendar_user=data.user_id
+        async with self.write_uow:
+            appointment = await self.write_uow.run_sync(self._book_appointment, data)
+
+            await self.integration_bus.publish(
+                appointment.create_appointment_request(
+                    notify_artist=not self.digest_artist_requests
+                ),
+                uow=self.write_uow,
             )
 
-            calendar_exceptions_overlap = self.write_uow.calendar_exceptions.find_overlap(
-                user_id=data.user_id, start_at=data.start_at, end_at=data.end_at
-            )
+    def _book_appointment(self, data: CreateAppointmentInput) -> Appointment:
+        admission = self.write_uow.scheduling_admission.find_admission(
+            user_id=data.user_id,
+            start_at=data.start_at,
+            end_at=data.end_at,
+            actor_id=data.actor_id,
+        )
+        if not admission:
+            raise UserNotFoundError()
+        if admission.user_is_active is False:
+            raise UserInactiveError()
 
-            self.calendar_policy.can_schedule(
-                calendar_settings=calendar_of_user,
-                calendar_exceptions=calendar_exceptions_overlap,
-                can_ignore_booking_window=can_ignore_booking_window,
-                start_at=data.start_at,
-                end_at=data.end_at,
-            )
+        if not admission.calendar_settings:
+            raise CannotFindWorkingPeriodsForThisUserError()
 
-            occupied_slot = self.write_uow.appointments.find_overlap(
-                start_date=data.start_at, end_date=data.end_at, user_id=data.user_id
-            )
+        can_ignore_booking_window = admission.actor_is_admin or data.actor_id == data.user_id
 
-            if occupied_slot:
-                raise SlotIsAlreadyOccupiedError()
+        self.calendar_policy.can_schedule(
+            calendar_settings=admission.calendar_settings,
+            calendar_exceptions=admission.calendar_exceptions,
+            can_ignore_booking_window=can_ignore_booking_window,
+            start_at=data.start_at,
+            end_at=data.end_at,
+        )
 
-            await self._save_appointment(data)
+        if admission.slot_is_occupied:
+            raise SlotIsAlreadyOccupiedError()
+
+        return self._save_appointment(data)
 
     def _make_appointment(self, data: CreateAppointmentInput):
         if data.actor_id is not None:
@@ -107,27 +119,22 @@ class CreateAppointmentUseCase:
 
         return appointment, log
 
-    async def _save_appointment(self, data: CreateAppointmentInput):
+    def _save_appointment(self, data: CreateAppointmentInput) -> Appointment:
         appointment, log = self._make_appointment(data)
 
         self.write_uow.appointments.create(appointment)
         self.write_uow.audit_logs.create(log)
 
-        await self.integration_bus.publish(
-            appointment.create_appointment_request(),
-            uow=self.read_uow,
-        )
-
-    def __can_ignore_booking_window(self, *, user_id: UUID | None, calendar_user: UUID) -> bool:
-        if user_id is None:
-            return False
-
-        user = self.read_uow.users.find_by_id(user_id)
-
-        if user is None:
-            return False
-
-        if user.is_admin:
-            return True
+        if self.digest_artist_requests:
+            self.write_uow.appointment_request_digests.add(
+                AppointmentRequestDigestEntry(
+                    id=uuid4(),
+                    user_id=appointment.user_id,
+                    appointment_type=appointment.appointment_type,
+                    start_at=appointment.start_at,
+                    end_at=appointment.end_at,
+                    created_at=log.performed_at,
+                )
+            )
 
-        return user.id == calendar_user
+        return appointment
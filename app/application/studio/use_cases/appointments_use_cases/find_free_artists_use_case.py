@@ -0,0 +1,85 @@
+from datetime import timedelta, timezone
+from uuid import UUID
+
+from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from app.application.studio.use_cases.DTO.find_free_artists_dto import (
+    FindFreeArtistsInput,
+    FindFreeArtistsOutput,
+    FreeArtistOutput,
+)
+from app.application.studio.use_cases.DTO.list_available_slots_dto import AvailableSlotOutput
+from app.core.exceptions.calendar import InvalidAvailabilitySearchRangeError
+from app.domain.studio.appointments.policies.calendar_availability_policy import (
+    CalendarAvailabilityPolicy,
+)
+
+MAX_SEARCH_RANGE = timedelta(days=7)
+MAX_OPENINGS_PER_ARTIST = 3
+
+
+class FindFreeArtistsUseCase:
+    """
+    Answer "who is free?" for the whole studio from one load of every active
+    calendar instead of checking artists one by one.
+    """
+
+    def __init__(self, uow: ReadUnitOfWork, calendar_policy: CalendarAvailabilityPolicy):
+        self.uow = uow
+        self.calendar_policy = calendar_policy
+
+    def execute(self, data: FindFreeArtistsInput) -> FindFreeArtistsOutput:
+        start_at = data.start_at.astimezone(timezone.utc)
+        end_at = data.end_at.astimezone(timezone.utc)
+
+        if end_at <= start_at or end_at - start_at > MAX_SEARCH_RANGE:
+            raise InvalidAvailabilitySearchRangeError()
+
+        with self.uow:
+            artist_calendars = self.uow.scheduling_admission.find_artist_calendars(
+                start_at=start_at, end_at=end_at
+            )
+            can_ignore_booking_window = self._actor_is_admin(data.actor_id)
+
+        free_artists: list[FreeArtistOutput] = []
+
+        for artist_calendar in artist_calendars:
+            slots = self.calendar_policy.find_available_slots(
+                calendar_settings=artist_calendar.calendar_settings,
+                calendar_exceptions=artist_calendar.calendar_exceptions,
+                booked_slots=artist_calendar.booked_slots,
+                start_at=start_at,
+                end_at=end_at,
+                duration=timedelta(minutes=data.duration_minutes),
+                step=timedelta(minutes=data.step_minutes),
+                can_ignore_booking_window=can_ignore_booking_window,
+            )
+
+            if not slots:
+                continue
+
+            free_artists.append(
+                FreeArtistOutput(
+                    user_id=artist_calendar.user_id,
+                    username=artist_calendar.username,
+                    earliest_openings=[
+                        AvailableSlotOutput.from_value_object(slot)
+                        for slot in slots[:MAX_OPENINGS_PER_ARTIST]
+                    ],
+                )
+            )
+
+        free_artists.sort(key=lambda artist: (artist.earliest_openings[0].start_at, artist.username))
+
+        return FindFreeArtistsOutput(
+            appointment_type=data.appointment_type,
+            duration_minutes=data.duration_minutes,
+            artists=free_artists,
+        )
+
+    def _actor_is_admin(self, actor_id: UUID | None) -> bool:
+        if actor_id is None:
+            return False
+
+        actor = self.uow.users.find_by_id(actor_id)
+
+        return actor is not None and actor.is_admin
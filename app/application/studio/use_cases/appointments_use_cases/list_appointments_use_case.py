@@ -0,0 +1,71 @@
+from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from app.application.studio.use_cases.DTO.commun import PageCursor
+from app.application.studio.use_cases.DTO.list_appointments_dto import (
+    AppointmentOutput,
+    ListAppointmentsInput,
+    ListAppointmentsOutput,
+)
+from app.core.exceptions.appointments import OnlyAdminOrOwnerOfAppointmentError
+
+
+class ListAppointmentsUseCase:
+    """
+    Keyset paginated listing: every page is a seek on the (created_at, id) index,
+    so deep pages cost the same as the first one and no count query is issued.
+    """
+
+    MAX_LIMIT = 100
+
+    def __init__(self, uow: ReadUnitOfWork):
+        self.uow = uow
+
+    def execute(self, data: ListAppointmentsInput) -> ListAppointmentsOutput:
+        user_id = data.user_id
+
+        if not data.actor.is_admin:
+            if user_id is not None and user_id != data.actor.id:
+                raise OnlyAdminOrOwnerOfAppointmentError()
+            user_id = data.actor.id
+
+        limit = min(data.limit, self.MAX_LIMIT)
+        cursor = PageCursor.decode(data.cursor) if data.cursor else None
+
+        with self.uow:
+            # one extra row tells whether there is another page in the walking direction
+            appointments = self.uow.appointments.find_many(
+                user_id=user_id,
+                status=data.status,
+                appointment_type=data.appointment_type,
+                start_date=data.start_date,
+                end_date=data.end_date,
+                limit=limit + 1,
+                direction=data.direction,
+                cursor=cursor,
+            )
+
+        has_more = len(appointments) > limit
+        backward = cursor is not None and cursor.backward
+
+        if has_more:
+            appointments = appointments[1:] if backward else appointments[:limit]
+
+        has_next = (has_more and not backward) or backward
+        has_prev = (has_more and backward) or (cursor is not None and not backward)
+
+        next_cursor = None
+        prev_cursor = None
+
+        if appointments and has_next:
+            last = appointments[-1]
+            next_cursor = PageCursor(created_at=last.created_at, id=last.id).encode()
+
+        if appointments and has_prev:
+            first = appointments[0]
+            prev_cursor = PageCursor(created_at=first.created_at, id=first.id, backward=True).encode()
+
+        return ListAppointmentsOutput(
+            appointments=[AppointmentOutput.from_entity(appointment) for appointment in appointments],
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            limit=limit,
+        )
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from app.application.studio.services.calendar_index import (
+    CalendarIndex,
+    CalendarSnapshot,
+    SortedIntervals,
+)
+from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from app.application.studio.use_cases.DTO.list_available_slots_dto import (
+    AvailableSlotOutput,
+    ListAvailableSlotsInput,
+    ListAvailableSlotsOutput,
+)
+from app.core.exceptions.calendar import (
+    CannotFindWorkingPeriodsForThisUserError,
+    InvalidAvailabilitySearchRangeError,
+)
+from app.core.exceptions.users import UserInactiveError, UserNotFoundError
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+from app.domain.studio.appointments.policies.calendar_availability_policy import (
+    CalendarAvailabilityPolicy,
+)
+
+MAX_SEARCH_RANGE = timedelta(days=31)
+SNAPSHOT_HORIZON = timedelta(days=62)
+
+
+class ListAvailableSlotsUseCase:
+    """
+    Answer a whole calendar view with one range read per table instead of
+    letting clients probe POST /appointments slot by slot.
+    """
+
+    def __init__(
+        self,
+        uow: ReadUnitOfWork,
+        calendar_policy: CalendarAvailabilityPolicy,
+        calendar_index: CalendarIndex | None = None,
+    ):
+        self.uow = uow
+        self.calendar_policy = calendar_policy
+        self.calendar_index = calendar_index
+
+    def execute(self, data: ListAvailableSlotsInput) -> ListAvailableSlotsOutput:
+        start_at = data.start_at.astimezone(timezone.utc)
+        end_at = data.end_at.astimezone(timezone.utc)
+
+        if end_at <= start_at or end_at - start_at > MAX_SEARCH_RANGE:
+            raise InvalidAvailabilitySearchRangeError()
+
+        with self.uow:
+            snapshot = self._get_snapshot(user_id=data.user_id, start_at=start_at, end_at=end_at)
+
+            can_ignore_booking_window = self._can_ignore_booking_window(
+                user_id=data.actor_id, calendar_user=data.user_id
+            )
+
+        if snapshot.user_is_active is False:
+            raise UserInactiveError()
+
+        if snapshot.calendar_settings is None:
+            raise CannotFindWorkingPeriodsForThisUserError()
+
+        slots = self.calendar_policy.find_available_slots(
+            calendar_settings=snapshot.calendar_settings,
+            calendar_exceptions=snapshot.exceptions_overlapping(start_at=start_at, end_at=end_at),
+            booked_slots=snapshot.booked_overlapping(start_at=start_at, end_at=end_at),
+            start_at=start_at,
+            end_at=end_at,
+            duration=timedelta(minutes=data.duration_minutes),
+            step=timedelta(minutes=data.step_minutes),
+            can_ignore_booking_window=can_ignore_booking_window,
+        )
+
+        return ListAvailableSlotsOutput(
+            user_id=data.user_id,
+            duration_minutes=data.duration_minutes,
+            slots=[AvailableSlotOutput.from_value_object(slot) for slot in slots],
+        )
+
+    def _get_snapshot(self, *, user_id: UUID, start_at: datetime, end_at: datetime) -> CalendarSnapshot:
+        if self.calendar_index is None:
+            return self._load_snapshot(user_id=user_id, start_at=start_at, end_at=end_at)
+
+        snapshot = self.calendar_index.get(user_id, start_at=start_at, end_at=end_at)
+        if snapshot is not None:
+            return snapshot
+
+        # the upcoming weeks are what clients browse, anything past them is cached as asked
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        if end_at <= today + SNAPSHOT_HORIZON:
+            start_at, end_at = min(start_at, today), today + SNAPSHOT_HORIZON
+
+        # taken before the load, so a write committed while loading drops the snapshot
+        generation = self.calendar_index.generation(user_id)
+        snapshot = self._load_snapshot(user_id=user_id, start_at=start_at, end_at=end_at)
+        self.calendar_index.put(snapshot, generation=generation)
+
+        return snapshot
+
+    def _load_snapshot(self, *, user_id: UUID, start_at: datetime, end_at: datetime) -> CalendarSnapshot:
+        user = self.uow.users.find_by_id(user_id)
+        if not user:
+            raise UserNotFoundError()
+
+        calendar_exceptions = self.uow.calendar_exceptions.find_overlap(
+            user_id=user_id, start_at=start_at, end_at=end_at
+        )
+        appointments = self.uow.appointments.find_overlap(
+            user_id=user_id, start_date=start_at, end_date=end_at
+        )
+
+        return CalendarSnapshot(
+            user_id=user_id,
+            user_is_active=user.is_active,
+            calendar_settings=self.uow.calendar_settings.find_by_user_id(user_id),
+            horizon_start=start_at,
+            horizon_end=end_at,
+            calendar_exceptions=SortedIntervals(calendar_exceptions),
+            booked_slots=SortedIntervals(
+                TimeSlot(start_at=appointment.start_at, end_at=appointment.end_at)
+                for appointment in appointments
+            ),
+        )
+
+    def _can_ignore_booking_window(self, *, user_id: UUID | None, calendar_user: UUID) -> bool:
+        if user_id is None:
+            return False
+
+        user = self.uow.users.find_by_id(user_id)
+
+        if user is None:
+            return False
+
+        if user.is_admin:
+            return True
+
+        return user.id == calendar_user
@@ -25,7 +25,7 @@ class AddClientCreditByAdminUseCase:
             if not vip_client:
                 raise VipClientNotFoundError()
 
-            total_credits_before = self.uow.client_credit_entries.get_balance(
+            total_credits_before = self.uow.client_credit_entries.get_balance_for_update(
                 vip_client_id=vip_client.id
             )
 
@@ -28,7 +28,7 @@ class ReverseClientCreditByAdminUseCase:
             if not vip_client:
                 raise VipClientNotFoundError()
 
-            total_credits_before = self.uow.client_credit_entries.get_balance(
+            total_credits_before = self.uow.client_credit_entries.get_balance_for_update(
                 vip_client_id=data.vip_client_id
             )
 
@@ -4,44 +4,48 @@ from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWo
 from app.application.studio.use_cases.DTO.audit_logs import AuditLogEntry
 from app.application.studio.use_cases.DTO.password_dto import ChangePasswordInput
 from app.core.exceptions.users import AuthenticationFailedError, UserNotFoundError
-from app.core.security.passwords import hash_password, verify_password
+from app.core.security.passwords import hash_password_async, verify_password_async
 from app.core.types.audit_actor_type import AuditActorType
 from app.core.validations.password import validate_password
+from app.domain.studio.users.entities.user import User
 
 
 class ChangePasswordUseCase:
     def __init__(self, uow: WriteUnitOfWork):
         self.uow = uow
 
-    def execute(self, data: ChangePasswordInput) -> None:
-        with self.uow:
-            current_user = self.uow.users.find_by_id(data.user_id)
+    async def execute(self, data: ChangePasswordInput) -> None:
+        async with self.uow:
+            current_user = await self.uow.run_sync(self.uow.users.find_by_id, data.user_id)
             if not current_user:
                 raise UserNotFoundError()
 
-            if not verify_password(data.old_password, current_user.hashed_password):
+            if not await verify_password_async(data.old_password, current_user.hashed_password):
                 raise AuthenticationFailedError()
 
             validate_password(data.new_password)
 
-            hashed_password = hash_password(data.new_password)
+            hashed_password = await hash_password_async(data.new_password)
 
             current_user.change_password(hashed_password)
 
-            self.uow.users.update(current_user)
-
-            log = AuditLogEntry(
-                entity_name="users",
-                entity_id=current_user.id,
-                action="change user password",
-                actor_id=current_user.id,
-                actor_type=AuditActorType.USER,
-                changes={
-                    "password": {
-                        "change": True,
-                    }
-                },
-                performed_at=datetime.now(timezone.utc),
-            )
-
-            self.uow.audit_logs.create(log)
+            await self.uow.run_sync(self._save_password_change, current_user)
+
+    def _save_password_change(self, current_user: User) -> None:
+        self.uow.users.update(current_user)
+
+        log = AuditLogEntry(
+            entity_name="users",
+            entity_id=current_user.id,
+            action="change user password",
+            actor_id=current_user.id,
+            actor_type=AuditActorType.USER,
+            changes={
+                "password": {
+                    "change": True,
+                }
+            },
+            performed_at=datetime.now(timezone.utc),
+        )
+
+        self.uow.audit_logs.create(log)
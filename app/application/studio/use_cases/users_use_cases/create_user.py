@@ -46,4 +46,4 @@ class CreateUserUseCase:
 
             self.uow.audit_logs.create(log)
 
-        await self.integration_bus.publish(event)
+            await self.integration_bus.publish(event, uow=self.uow)
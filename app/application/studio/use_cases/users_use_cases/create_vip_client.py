@@ -79,4 +79,4 @@ class CreateVipClientUseCase:
 
             event = vip_client.create_vip_client_email_request()
 
-        await self.integration_bus.publish(event)
+            await self.integration_bus.publish(event, uow=self.uow)
@@ -11,19 +11,20 @@ from app.core.exceptions.users import (
     UsernameAlreadyTakenError,
     UserNotFoundError,
 )
-from app.core.security.passwords import hash_password
+from app.core.security.passwords import hash_password_async
 from app.core.types.audit_actor_type import AuditActorType
 from app.core.validations.password import validate_password
 from app.core.validations.username import validate_username
+from app.domain.studio.users.entities.user import User
 
 
 class FirstActivationUserUseCase:
     def __init__(self, uow: WriteUnitOfWork):
         self.uow = uow
 
-    def execute(self, data: FirstActivationInput):
-        with self.uow:
-            user = self.uow.users.find_by_id(data.user_id)
+    async def execute(self, data: FirstActivationInput):
+        async with self.uow:
+            user = await self.uow.run_sync(self.uow.users.find_by_id, data.user_id)
             if not user:
                 raise UserNotFoundError()
             if user.has_activated_once:
@@ -32,7 +33,9 @@ class FirstActivationUserUseCase:
                 raise InvalidActivationTokenError()
 
             validate_username(data.username)
-            username_already_in_db = self.uow.users.find_by_username(data.username)
+            username_already_in_db = await self.uow.run_sync(
+                self.uow.users.find_by_username, data.username
+            )
 
             if username_already_in_db:
                 raise UsernameAlreadyTakenError()
@@ -40,27 +43,30 @@ class FirstActivationUserUseCase:
             validate_password(data.password)
 
             user.username = data.username
-            user.hashed_password = hash_password(data.password)
+            user.hashed_password = await hash_password_async(data.password)
             user.activate()
 
-            self.uow.users.update(user)
+            await self.uow.run_sync(self._save_activation, user)
 
-            log = AuditLogEntry(
-                entity_name="users",
-                entity_id=user.id,
-                action="first activation of user",
-                actor_id=user.id,
-                actor_type=AuditActorType.USER,
-                changes={
-                    "first_activation_state": {
-                        "email": user.email,
-                        "username": user.username,
-                        "is_admin": user.is_admin,
-                        "is_active": user.is_active,
-                    }
-                },
-                performed_at=datetime.now(timezone.utc),
-                reason="the first activation is self-performed",
-            )
+    def _save_activation(self, user: User) -> None:
+        self.uow.users.update(user)
+
+        log = AuditLogEntry(
+            entity_name="users",
+            entity_id=user.id,
+            action="first activation of user",
+            actor_id=user.id,
+            actor_type=AuditActorType.USER,
+            changes={
+                "first_activation_state": {
+                    "email": user.email,
+                    "username": user.username,
+                    "is_admin": user.is_admin,
+                    "is_active": user.is_active,
+                }
+            },
+            performed_at=datetime.now(timezone.utc),
+            reason="the first activation is self-performed",
+        )
 
-            self.uow.audit_logs.create(log)
+        self.uow.audit_logs.create(log)
@@ -1,9 +1,12 @@
+from typing import Optional
+
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
 from app.application.studio.use_cases.DTO.login_dto import LoginInput, TokenOutput
 from app.core.exceptions.users import AuthenticationFailedError, UserInactiveError
 from app.core.normalize.normalize_email import normalize_email
-from app.core.security.passwords import verify_password
+from app.core.security.passwords import verify_password_async
 from app.core.security.versioned_token_service import VersionedTokenService
+from app.domain.studio.users.entities.user import User
 
 
 class LoginUserUseCase:
@@ -17,13 +20,8 @@ class LoginUserUseCase:
         self.access_tokens = access_tokens
         self.refresh_tokens = refresh_tokens
 
-    def execute(self, data: LoginInput) -> TokenOutput:
-        with self.uow:
-            if "@" in data.identifier:
-                email = normalize_email(data.identifier)
-                user = self.uow.users.find_by_email(email)
-            else:
-                user = self.uow.users.find_by_username(data.identifier)
+    async def execute(self, data: LoginInput) -> TokenOutput:
+        user = await self.uow.run_sync(self._find_user, data.identifier)
 
         if not user:
             raise AuthenticationFailedError()
@@ -31,7 +29,7 @@ class LoginUserUseCase:
         if user.is_active is False:
             raise UserInactiveError()
 
-        if not verify_password(data.password, user.hashed_password):
+        if not await verify_password_async(data.password, user.hashed_password):
             raise AuthenticationFailedError()
 
         access_version = user.access_token_version
@@ -46,3 +44,11 @@ class LoginUserUseCase:
         )
 
         return TokenOutput(access_token=access_token, refresh_token=refresh_token)
+
+    def _find_user(self, identifier: str) -> Optional[User]:
+        with self.uow:
+            if "@" in identifier:
+                email = normalize_email(identifier)
+                return self.uow.users.find_by_email(email)
+
+            return self.uow.users.find_by_username(identifier)
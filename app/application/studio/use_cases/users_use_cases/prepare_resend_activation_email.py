@@ -26,4 +26,4 @@ class PrepareResendActivationEmailUseCase:
 
             event = user.request_activation_email()
 
-        await self.integration_bus.publish(event)
+            await self.integration_bus.publish(event, uow=self.uow)
@@ -25,4 +25,4 @@ class PrepareSendForgotPasswordEmailUseCase:
 
             event = user.request_password_reset_email()
 
-        await self.integration_bus.publish(event)
+            await self.integration_bus.publish(event, uow=self.uow)
@@ -8,18 +8,19 @@ from app.core.exceptions.users import (
     UserInactiveError,
     UserNotFoundError,
 )
-from app.core.security.passwords import hash_password
+from app.core.security.passwords import hash_password_async
 from app.core.types.audit_actor_type import AuditActorType
 from app.core.validations.password import validate_password
+from app.domain.studio.users.entities.user import User
 
 
 class ResetPasswordUseCase:
     def __init__(self, uow: WriteUnitOfWork):
         self.uow = uow
 
-    def execute(self, data: ResetPasswordInput):
-        with self.uow:
-            user = self.uow.users.find_by_id(data.user_id)
+    async def execute(self, data: ResetPasswordInput):
+        async with self.uow:
+            user = await self.uow.run_sync(self.uow.users.find_by_id, data.user_id)
             if not user:
                 raise UserNotFoundError()
             if user.password_token_version != data.password_token_version:
@@ -29,23 +30,26 @@ class ResetPasswordUseCase:
 
             validate_password(data.password)
 
-            new_hashed_password = hash_password(data.password)
+            new_hashed_password = await hash_password_async(data.password)
             user.change_password(new_hashed_password)
 
-            self.uow.users.update(user)
-
-            log = AuditLogEntry(
-                entity_name="users",
-                entity_id=user.id,
-                action="reset user password",
-                actor_id=user.id,
-                actor_type=AuditActorType.USER,
-                changes={
-                    "password": {
-                        "reset": True,
-                    }
-                },
-                performed_at=datetime.now(timezone.utc),
-            )
-
-            self.uow.audit_logs.create(log)
+            await self.uow.run_sync(self._save_password_reset, user)
+
+    def _save_password_reset(self, user: User) -> None:
+        self.uow.users.update(user)
+
+        log = AuditLogEntry(
+            entity_name="users",
+            entity_id=user.id,
+            action="reset user password",
+            actor_id=user.id,
+            actor_type=AuditActorType.USER,
+            changes={
+                "password": {
+                    "reset": True,
+                }
+            },
+            performed_at=datetime.now(timezone.utc),
+        )
+
+        self.uow.audit_logs.create(log)
@@ -1,4 +1,7 @@
+from typing import Dict, Optional
 from uuid import UUID
+
+from app.application.studio.services.access_token_cache import AccessTokenCache, UserAccess
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
 from app.application.studio.use_cases.DTO.login_dto import VerifyInput, VerifyOutput
 from app.application.studio.use_cases.DTO.user_output_dto import UserVerifyDTO
@@ -7,9 +10,15 @@ from app.core.security.versioned_token_service import VersionedTokenService
 
 
 class VerifyUserUseCase:
-    def __init__(self, uow: ReadUnitOfWork, access_tokens: VersionedTokenService):
+    def __init__(
+        self,
+        uow: ReadUnitOfWork,
+        access_tokens: VersionedTokenService,
+        access_token_cache: AccessTokenCache | None = None,
+    ):
         self.uow = uow
         self.access_tokens = access_tokens
+        self.access_token_cache = access_token_cache
 
     def execute(self, data: VerifyInput) -> VerifyOutput:
         auth = data.authorization
@@ -18,30 +27,64 @@ class VerifyUserUseCase:
 
         token = auth.split(" ", 1)[1]
 
-        try:
-            payload = self.access_tokens.verify(token)
-        except Exception:
-            raise TokenError("invalid_token")
+        payload = self._verify_token(token)
 
         try:
             user_id = UUID(payload["sub"])
         except Exception:
             raise TokenError("invalid_token")
 
-        user = self.uow.users.find_by_id(user_id)
-        if not user:
+        access = self._find_user_access(user_id)
+        if not access:
             raise TokenError("invalid_token")
 
         token_version = payload["ver"]
-        if user.access_token_version != token_version:
+        if access.access_token_version != token_version:
             raise TokenError("token_revoked")
 
         user_verified = UserVerifyDTO(
-            id=user.id,
-            is_active=user.is_active,
-            is_admin=user.is_admin,
+            id=user_id,
+            is_active=access.is_active,
+            is_admin=access.is_admin,
         )
 
         return VerifyOutput(
             valid=True, sub=payload["sub"], type=payload["type"], user=user_verified
         )
+
+    def _verify_token(self, token: str) -> Dict:
+        if self.access_token_cache is not None:
+            payload = self.access_token_cache.get_payload(token)
+            if payload is not None:
+                return payload
+
+        try:
+            payload = self.access_tokens.verify(token)
+        except Exception:
+            raise TokenError("invalid_token")
+
+        if self.access_token_cache is not None:
+            self.access_token_cache.put_payload(token, payload)
+
+        return payload
+
+    def _find_user_access(self, user_id: UUID) -> Optional[UserAccess]:
+        if self.access_token_cache is not None:
+            access = self.access_token_cache.get_user(user_id)
+            if access is not None:
+                return access
+
+        user = self.uow.users.find_by_id(user_id)
+        if not user:
+            return None
+
+        access = UserAccess(
+            access_token_version=user.access_token_version,
+            is_active=user.is_active,
+            is_admin=user.is_admin,
+        )
+
+        if self.access_token_cache is not None:
+            self.access_token_cache.put_user(user_id, access)
+
+        return access
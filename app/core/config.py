@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import SecretStr
 
@@ -13,10 +15,64 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24
 
+    # calendar index
+    CALENDAR_INDEX_TTL_SECONDS: int = 60
+
+    # access token verification cache
+    ACCESS_CACHE_TTL_SECONDS: int = 30
+
+    # bcrypt runs on its own executor, sized for the cores it may use
+    PASSWORD_HASHING_WORKERS: int = 2
+
+    # login throttling, "postgres" shares the attempts between workers
+    LOGIN_RATE_LIMIT_BACKEND: Literal["memory", "postgres"] = "memory"
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 15 * 60
+    LOGIN_MAX_ATTEMPTS_PER_IDENTIFIER: int = 5
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = 30
+
+    # integration events outbox
+    OUTBOX_DISPATCHER_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 50
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 5
+
+    # integration handlers, limits are keyed by event class name
+    INTEGRATION_HANDLER_WORKERS: int = 8
+    INTEGRATION_HANDLER_QUEUE_SIZE: int = 1000
+    INTEGRATION_HANDLER_OVERFLOW: Literal["wait", "reject", "drop"] = "wait"
+    INTEGRATION_HANDLER_LIMITS: dict[str, int] = {}
+    # handlers still running at shutdown get this long before going to the outbox
+    INTEGRATION_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0
+
     # email Brevo
     BREVO_API_KEY: str
     BREVO_SENDER_EMAIL: str
     BREVO_SENDER_NAME: str
+    BREVO_HTTP_MAX_CONNECTIONS: int = 20
+    BREVO_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    BREVO_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    BREVO_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    BREVO_HTTP_TIMEOUT_SECONDS: float = 15.0
+    # emails sent within the window go out as one batch request
+    EMAIL_COALESCE_WINDOW_SECONDS: float = 0.05
+    EMAIL_COALESCE_MAX_BATCH_SIZE: int = 100
+    # retries and circuit breaker around the provider
+    EMAIL_RETRY_MAX_ATTEMPTS: int = 3
+    EMAIL_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    EMAIL_RETRY_MAX_DELAY_SECONDS: float = 10.0
+    EMAIL_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    EMAIL_CIRCUIT_RESET_SECONDS: float = 30.0
+
+    # artists get one summary of their booking requests per interval instead of an
+    # email for each
+    APPOINTMENT_REQUEST_DIGEST_ENABLED: bool = False
+    APPOINTMENT_REQUEST_DIGEST_INTERVAL_SECONDS: int = 24 * 60 * 60
+
+    # compares every client's credit balance with the sum of its ledger, repairing
+    # the ones that drifted only when asked to
+    CREDIT_BALANCE_RECONCILIATION_ENABLED: bool = True
+    CREDIT_BALANCE_RECONCILIATION_INTERVAL_SECONDS: int = 24 * 60 * 60
+    CREDIT_BALANCE_RECONCILIATION_REPAIR: bool = False
 
     model_config = SettingsConfigDict(
         env_file=".env",
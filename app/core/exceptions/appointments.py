@@ -68,3 +68,7 @@ class OnlyAdminOrOwnerOfAppointmentError(Exception):
 
 class AppointmentClientContactInfoCorruptedError(Exception):
     pass
+
+
+class InvalidAppointmentSeriesError(Exception):
+    pass
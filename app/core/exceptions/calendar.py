@@ -36,3 +36,7 @@ class WorkingPeriodsNotFoundError(Exception):
 
 class InvalidReasonError(Exception):
     pass
+
+
+class InvalidAvailabilitySearchRangeError(Exception):
+    pass
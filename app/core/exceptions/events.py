@@ -0,0 +1,14 @@
+class IntegrationHandlerQueueFullError(Exception):
+    pass
+
+
+class IntegrationHandlerExecutorClosedError(Exception):
+    pass
+
+
+class DeliveryDeferredError(Exception):
+    retry_after: float
+
+    def __init__(self, retry_after: float):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
@@ -12,3 +12,11 @@ class DuplicateExternalReferenceError(Exception):
 
 class PaymentWithoutAppointmentRequireDescriptionError(Exception):
     pass
+
+
+class PaymentLinkToAppointmentIsCorruptedError(Exception):
+    pass
+
+
+class PaymentMustHaveDepositPurposeError(Exception):
+    pass
@@ -1,6 +1,25 @@
+from app.core.exceptions.events import DeliveryDeferredError
+
+
 class EmailServiceUnavailableError(Exception):
     pass
 
 
 class EmailSentFailedError(Exception):
     pass
+
+
+class EmailProviderServerError(EmailSentFailedError):
+    pass
+
+
+class EmailRateLimitedError(EmailSentFailedError):
+    retry_after: float | None
+
+    def __init__(self, retry_after: float | None = None):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
+class EmailCircuitOpenError(DeliveryDeferredError, EmailServiceUnavailableError):
+    pass
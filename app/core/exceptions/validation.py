@@ -6,3 +6,7 @@ class ValidationError(Exception):
 
 class InvalidClientCode(Exception):
     pass
+
+
+class InvalidPageCursorError(Exception):
+    pass
@@ -1,7 +1,17 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
 pwd_context = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -9,3 +19,76 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
+
+
+@dataclass(frozen=True)
+class PasswordHashingStats:
+    max_workers: int
+    running: int
+    queued: int
+    completed: int
+
+
+class PasswordHashingPool:
+    """
+    Dedicated executor for bcrypt. Each hash or verify burns a few hundred ms of CPU,
+    so running them on the shared anyio thread pool lets a burst of logins take every
+    slot sync routes and dependencies need. Here a burst only queues behind
+    `max_workers` threads, and the queue depth can be read from `stats()`.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hashing"
+        )
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._running = 0
+        self._completed = 0
+
+    async def run(self, function: Callable[..., T], *args) -> T:
+        with self._lock:
+            self._submitted += 1
+
+        future = self._executor.submit(self._track, function, *args)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # a request dropped while queued never reaches _track
+            if future.cancel():
+                with self._lock:
+                    self._submitted -= 1
+            raise
+
+    def stats(self) -> PasswordHashingStats:
+        with self._lock:
+            return PasswordHashingStats(
+                max_workers=self.max_workers,
+                running=self._running,
+                queued=self._submitted - self._running - self._completed,
+                completed=self._completed,
+            )
+
+    def _track(self, function: Callable[..., T], *args) -> T:
+        with self._lock:
+            self._running += 1
+
+        try:
+            return function(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+
+password_hashing_pool = PasswordHashingPool(max_workers=settings.PASSWORD_HASHING_WORKERS)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hashing_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await password_hashing_pool.run(verify_password, plain, hashed)
@@ -4,3 +4,12 @@ from enum import Enum
 class CalendarExceptionType(Enum):
     ALLOW = "ALLOW"
     BLOCK = "BLOCK"
+
+
+class SlotVerdictReason(Enum):
+    INSIDE_WORKING_PERIOD = "INSIDE_WORKING_PERIOD"
+    ALLOWED_BY_EXCEPTION = "ALLOWED_BY_EXCEPTION"
+    BLOCKED_BY_EXCEPTION = "BLOCKED_BY_EXCEPTION"
+    OUTSIDE_BOOKING_WINDOW = "OUTSIDE_BOOKING_WINDOW"
+    OUTSIDE_WORKING_PERIOD = "OUTSIDE_WORKING_PERIOD"
+    LASTS_OVERNIGHT = "LASTS_OVERNIGHT"
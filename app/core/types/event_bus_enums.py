@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class HandlerOverflowPolicy(str, Enum):
+    WAIT = "wait"
+    REJECT = "reject"
+    DROP = "drop"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    DISPATCHED = "dispatched"
+    FAILED = "failed"
@@ -23,12 +23,16 @@ from app.core.types.appointment_enums import (
     AppointmentType,
 )
 from app.domain.studio.appointments.entities.value_objects.client_info import ClientInfo
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
 from app.domain.studio.appointments.events.appointment_completed import (
     AppointmentCompleted,
 )
 from app.domain.studio.appointments.events.create_appointment_request import (
     CreateAppointmentEmailRequested,
 )
+from app.domain.studio.appointments.events.create_appointment_series_request import (
+    CreateAppointmentSeriesEmailRequested,
+)
 from app.domain.studio.appointments.events.notify_of_appointment_quoted import (
     NotifyOfAppointmentQuoted,
 )
@@ -214,7 +218,7 @@ class Appointment:
         self._touch()
 
     def create_appointment_request(
-        self,
+        self, *, notify_artist: bool = True
     ) -> CreateAppointmentEmailRequested:
 
         if self.client_info.email is not None:
@@ -230,6 +234,26 @@ class Appointment:
             appointment_type=self.appointment_type,
             user_id=self.user_id,
             client_email_or_vip_id=recipient,
+            notify_artist=notify_artist,
+        )
+
+    def create_appointment_series_request(
+        self, sessions: list[TimeSlot], *, notify_artist: bool = True
+    ) -> CreateAppointmentSeriesEmailRequested:
+
+        if self.client_info.email is not None:
+            recipient = self.client_info.email
+        elif self.client_info.vip_client_id is not None:
+            recipient = self.client_info.vip_client_id
+        else:
+            raise AppointmentClientContactInfoCorruptedError()
+
+        return CreateAppointmentSeriesEmailRequested(
+            sessions=sessions,
+            appointment_type=self.appointment_type,
+            user_id=self.user_id,
+            client_email_or_vip_id=recipient,
+            notify_artist=notify_artist,
         )
 
     def notify_of_appointment_quoted(
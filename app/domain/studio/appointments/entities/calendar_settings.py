@@ -1,8 +1,10 @@
+from array import array
 from datetime import date, datetime, time, timezone
 from typing import List
 from uuid import UUID
 
 from app.core.exceptions.calendar import (
+    AppointmentCannotLastOvernightError,
     BookingWindowMustBeInTheFutureError,
     WorkingPeriodsNotFoundError,
     WorkingPeriodsOverlapError,
@@ -10,6 +12,9 @@ from app.core.exceptions.calendar import (
 from app.domain.studio.appointments.entities.working_period import WorkingPeriod
 from app.domain.studio.appointments.events.booking_window_updated import BookingWindowUpdated
 
+MINUTES_IN_A_DAY = 24 * 60
+MINUTES_IN_A_WEEK = 7 * MINUTES_IN_A_DAY
+
 
 class CalendarSettings:
     def __init__(
@@ -30,6 +35,15 @@ class CalendarSettings:
         self.created_at = created_at or now
         self.updated_at = updated_at or now
 
+    @property
+    def working_periods(self) -> List[WorkingPeriod]:
+        return self._working_periods
+
+    @working_periods.setter
+    def working_periods(self, working_periods: List[WorkingPeriod]):
+        self._working_periods = working_periods
+        self._weekly_availability: array | None = None
+
     @classmethod
     def create(
         cls,
@@ -63,6 +77,7 @@ class CalendarSettings:
         self.validate_working_periods(self.working_periods + [period])
 
         self.working_periods.append(period)
+        self._weekly_availability = None
         self._touch()
 
     def update_working_period(
@@ -90,6 +105,7 @@ class CalendarSettings:
 
         period.update_period(start_at=start_at, end_at=end_at)
 
+        self._weekly_availability = None
         self._touch()
 
     def replace_working_periods(self, working_periods: List[WorkingPeriod]):
@@ -104,14 +120,32 @@ class CalendarSettings:
         self._touch()
 
     def is_inside_working_period(self, *, start: datetime, end: datetime) -> bool:
+        if not self.working_periods:
+            return False
 
-        return any(
-            working_period.is_available_for(start=start, end=end)
-            for working_period in self.working_periods
-        )
+        if start.weekday() != end.weekday():
+            raise AppointmentCannotLastOvernightError()
+
+        weekly_availability = self._get_weekly_availability()
+
+        if weekly_availability is None:
+            return any(
+                working_period.is_available_for(start=start, end=end)
+                for working_period in self.working_periods
+            )
+
+        start_minute = start.weekday() * MINUTES_IN_A_DAY + start.hour * 60 + start.minute
+        period_end = weekly_availability[start_minute]
+
+        if period_end == 0:
+            return False
+
+        end_seconds = end.hour * 3600 + end.minute * 60 + end.second
 
-    def is_inside_booking_window(self, *, start: datetime) -> bool:
-        return start >= self._utc_now() and start.date() <= self.booking_window_until
+        return (end_seconds, end.microsecond) <= (period_end * 60, 0)
+
+    def is_inside_booking_window(self, *, start: datetime, now: datetime | None = None) -> bool:
+        return start >= (now or self._utc_now()) and start.date() <= self.booking_window_until
 
     @staticmethod
     def validate_working_periods(
@@ -126,6 +160,37 @@ class CalendarSettings:
             if current.weekday == next_period.weekday and current.end_at > next_period.start_at:
                 raise WorkingPeriodsOverlapError()
 
+    def _get_weekly_availability(self) -> array | None:
+        """
+        Lazily build one slot per minute of the week holding the latest end, in minutes
+        since midnight, of the working periods covering that minute, or 0 when nobody works.
+        Containment is then a single lookup at the start minute. Periods that are not
+        aligned to the minute keep the linear check, signalled by None.
+        """
+        if self._weekly_availability is not None:
+            return self._weekly_availability
+
+        if any(
+            time_of_day.second or time_of_day.microsecond
+            for period in self.working_periods
+            for time_of_day in (period.start_at, period.end_at)
+        ):
+            return None
+
+        weekly_availability = array("H", [0]) * MINUTES_IN_A_WEEK
+
+        for period in self.working_periods:
+            day_offset = period.weekday * MINUTES_IN_A_DAY
+            start_minute = period.start_at.hour * 60 + period.start_at.minute
+            end_minute = period.end_at.hour * 60 + period.end_at.minute
+
+            for minute in range(day_offset + start_minute, day_offset + end_minute):
+                weekly_availability[minute] = max(weekly_availability[minute], end_minute)
+
+        self._weekly_availability = weekly_availability
+
+        return weekly_availability
+
     def _touch(self):
         self.updated_at = self._utc_now()
 
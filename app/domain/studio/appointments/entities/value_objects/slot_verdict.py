@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from app.core.types.calendar_enums import SlotVerdictReason
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+AVAILABLE_REASONS = (SlotVerdictReason.INSIDE_WORKING_PERIOD, SlotVerdictReason.ALLOWED_BY_EXCEPTION)
+
+
+@dataclass(frozen=True)
+class SlotVerdict:
+    slot: TimeSlot
+    reason: SlotVerdictReason
+
+    @property
+    def is_available(self) -> bool:
+        return self.reason in AVAILABLE_REASONS
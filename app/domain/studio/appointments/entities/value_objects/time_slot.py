@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TimeSlot:
+    start_at: datetime
+    end_at: datetime
+
+    def overlaps(self, *, start_at: datetime, end_at: datetime) -> bool:
+        return self.start_at < end_at and self.end_at > start_at
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.core.types.appointment_enums import AppointmentType
+
+
+@dataclass(frozen=True)
+class DigestedAppointmentRequest:
+    appointment_type: AppointmentType
+    start_at: datetime
+    end_at: datetime
+    sessions_count: int = 1
+
+
+class AppointmentRequestDigestRequested:
+    def __init__(self, *, user_id: UUID, requests: list[DigestedAppointmentRequest]):
+        self.user_id = user_id
+        self.requests = requests
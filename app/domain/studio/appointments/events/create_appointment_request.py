@@ -5,6 +5,9 @@ from app.core.types.appointment_enums import AppointmentType
 
 
 class CreateAppointmentEmailRequested:
+    # class default for outbox payloads written before the field existed
+    notify_artist = True
+
     def __init__(
         self,
         *,
@@ -13,9 +16,11 @@ class CreateAppointmentEmailRequested:
         appointment_type: AppointmentType,
         user_id: UUID,
         client_email_or_vip_id: str | UUID,
+        notify_artist: bool = True,
     ):
         self.start_at = start_at
         self.end_at = end_at
         self.appointment_type = appointment_type
         self.user_id = user_id
         self.client_email_or_vip_id = client_email_or_vip_id
+        self.notify_artist = notify_artist
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from app.core.types.appointment_enums import AppointmentType
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+
+class CreateAppointmentSeriesEmailRequested:
+    # class default for outbox payloads written before the field existed
+    notify_artist = True
+
+    def __init__(
+        self,
+        *,
+        sessions: list[TimeSlot],
+        appointment_type: AppointmentType,
+        user_id: UUID,
+        client_email_or_vip_id: str | UUID,
+        notify_artist: bool = True,
+    ):
+        self.sessions = sessions
+        self.appointment_type = appointment_type
+        self.user_id = user_id
+        self.client_email_or_vip_id = client_email_or_vip_id
+        self.notify_artist = notify_artist
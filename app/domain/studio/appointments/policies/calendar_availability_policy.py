@@ -1,12 +1,20 @@
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta, timezone
 
 from app.core.exceptions.appointments import (
     SlotIsNotAvailableError,
 )
-from app.core.exceptions.calendar import UserIsNotWorkingInDesignatedTimeframeError
-from app.core.types.calendar_enums import CalendarExceptionType
+from app.core.exceptions.calendar import (
+    AppointmentCannotLastOvernightError,
+    UserIsNotWorkingInDesignatedTimeframeError,
+)
+from app.core.types.calendar_enums import CalendarExceptionType, SlotVerdictReason
 from app.domain.studio.appointments.entities.calendar_exception import CalendarException
 from app.domain.studio.appointments.entities.calendar_settings import CalendarSettings
+from app.domain.studio.appointments.entities.value_objects.slot_verdict import SlotVerdict
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+ALLOWED_BY_EXCEPTION = "allowed_by_exception"
 
 
 class CalendarAvailabilityPolicy:
@@ -20,21 +28,213 @@ class CalendarAvailabilityPolicy:
         can_ignore_booking_window: bool,
     ) -> None:
 
-        effective_exception = self._find_effective_exception(calendar_exceptions)
+        reason = self._evaluate(
+            calendar_settings=calendar_settings,
+            effective_exception=self._find_effective_exception(calendar_exceptions),
+            start_at=start_at,
+            end_at=end_at,
+            can_ignore_booking_window=can_ignore_booking_window,
+            now=self._utc_now(),
+        )
+
+        if reason == SlotVerdictReason.OUTSIDE_BOOKING_WINDOW:
+            raise SlotIsNotAvailableError()
+
+        if reason in (
+            SlotVerdictReason.BLOCKED_BY_EXCEPTION,
+            SlotVerdictReason.OUTSIDE_WORKING_PERIOD,
+        ):
+            raise UserIsNotWorkingInDesignatedTimeframeError()
+
+    def evaluate_many(
+        self,
+        *,
+        calendar_settings: CalendarSettings,
+        calendar_exceptions: list[CalendarException],
+        candidates: list[TimeSlot],
+        can_ignore_booking_window: bool,
+    ) -> list[SlotVerdict]:
+        """
+        Apply the can_schedule rules to every candidate and return one verdict per
+        candidate, in the same order, instead of raising on the first refusal.
+
+        `calendar_exceptions` may cover the whole searched range. They are sorted once,
+        and since no exception is longer than the longest one, the exceptions overlapping
+        a candidate are found between two bisects on their start.
+        """
+        sorted_exceptions = sorted(
+            calendar_exceptions, key=lambda exception: (exception.start_at, exception.end_at)
+        )
+        exception_starts = [exception.start_at for exception in sorted_exceptions]
+        longest_exception = max(
+            (exception.end_at - exception.start_at for exception in sorted_exceptions),
+            default=timedelta(0),
+        )
+        now = self._utc_now()
+
+        verdicts: list[SlotVerdict] = []
+
+        for candidate in candidates:
+            low = bisect_right(exception_starts, candidate.start_at - longest_exception)
+            high = bisect_left(exception_starts, candidate.end_at)
+
+            overlapping_exceptions = [
+                exception
+                for exception in sorted_exceptions[low:high]
+                if exception.end_at > candidate.start_at
+            ]
+
+            try:
+                reason = self._evaluate(
+                    calendar_settings=calendar_settings,
+                    effective_exception=self._find_effective_exception(overlapping_exceptions),
+                    start_at=candidate.start_at,
+                    end_at=candidate.end_at,
+                    can_ignore_booking_window=can_ignore_booking_window,
+                    now=now,
+                )
+            except AppointmentCannotLastOvernightError:
+                reason = SlotVerdictReason.LASTS_OVERNIGHT
+
+            verdicts.append(SlotVerdict(slot=candidate, reason=reason))
+
+        return verdicts
+
+    def find_available_slots(
+        self,
+        *,
+        calendar_settings: CalendarSettings,
+        calendar_exceptions: list[CalendarException],
+        booked_slots: list[TimeSlot],
+        start_at: datetime,
+        end_at: datetime,
+        duration: timedelta,
+        step: timedelta,
+        can_ignore_booking_window: bool,
+    ) -> list[TimeSlot]:
+        """
+        Sweep the working periods, calendar exceptions and booked slots of the range
+        in a single ordered pass and return every slot of `duration` that can_schedule
+        would accept and that is not already occupied.
+
+        Every boundary of those intervals splits the range into elementary segments whose
+        state does not change. A segment is open when nothing is booked on it and its
+        effective exception is ALLOW or, without exceptions, it is inside a working period.
+        Adjacent open segments are merged into windows, except two working periods that
+        only touch each other, because can_schedule requires a single period to contain
+        the whole appointment.
+        """
+        search_start = max(start_at, self._utc_now())
+        if search_start >= end_at:
+            return []
+
+        working_windows = self._working_windows(
+            calendar_settings=calendar_settings,
+            start_at=search_start,
+            end_at=end_at,
+            can_ignore_booking_window=can_ignore_booking_window,
+        )
+
+        events: list[tuple[datetime, int, str, object]] = []
+
+        for index, window in enumerate(working_windows):
+            events.append((window.start_at, 1, "working", index))
+            events.append((window.end_at, 0, "working", index))
+
+        for exception in calendar_exceptions:
+            events.append((exception.start_at, 1, "exception", exception))
+            events.append((exception.end_at, 0, "exception", exception))
+
+        for booked in booked_slots:
+            events.append((booked.start_at, 1, "booked", booked))
+            events.append((booked.end_at, 0, "booked", booked))
+
+        # closing events come first so touching intervals never count as overlapping
+        events.sort(key=lambda event: (event[0], event[1]))
+
+        open_windows: list[tuple[datetime, datetime]] = []
+        current_window_start: datetime | None = None
+        current_key: object = None
+        previous_point = search_start
+
+        working_index: int | None = None
+        active_exceptions: list[CalendarException] = []
+        booked_count = 0
+
+        for point, is_opening, kind, payload in events:
+            segment_start = max(previous_point, search_start)
+            segment_end = min(point, end_at)
+
+            if segment_start < segment_end:
+                key = self._segment_key(
+                    working_index=working_index,
+                    active_exceptions=active_exceptions,
+                    booked_count=booked_count,
+                )
 
+                if key is None:
+                    if current_window_start is not None:
+                        open_windows.append((current_window_start, segment_start))
+                        current_window_start = None
+                elif current_window_start is None:
+                    current_window_start = segment_start
+                    current_key = key
+                elif self._can_merge(current_key, key):
+                    current_key = key
+                else:
+                    open_windows.append((current_window_start, segment_start))
+                    current_window_start = segment_start
+                    current_key = key
+
+            previous_point = max(previous_point, point)
+
+            if kind == "working":
+                working_index = payload if is_opening else None  # type: ignore[assignment]
+            elif kind == "exception":
+                if is_opening:
+                    active_exceptions.append(payload)  # type: ignore[arg-type]
+                else:
+                    active_exceptions.remove(payload)  # type: ignore[arg-type]
+            else:
+                booked_count += 1 if is_opening else -1
+
+        if current_window_start is not None:
+            open_windows.append((current_window_start, min(previous_point, end_at)))
+
+        slots: list[TimeSlot] = []
+
+        for window_start, window_end in open_windows:
+            slot_start = self._align_to_step(window_start, step)
+
+            while slot_start + duration <= window_end:
+                slots.append(TimeSlot(start_at=slot_start, end_at=slot_start + duration))
+                slot_start += step
+
+        return slots
+
+    def _evaluate(
+        self,
+        *,
+        calendar_settings: CalendarSettings,
+        effective_exception: CalendarException | None,
+        start_at: datetime,
+        end_at: datetime,
+        can_ignore_booking_window: bool,
+        now: datetime,
+    ) -> SlotVerdictReason:
         if effective_exception is not None:
             if effective_exception.exception_type == CalendarExceptionType.BLOCK:
-                raise UserIsNotWorkingInDesignatedTimeframeError()
-            return
+                return SlotVerdictReason.BLOCKED_BY_EXCEPTION
+            return SlotVerdictReason.ALLOWED_BY_EXCEPTION
 
-        inside_booking_window = calendar_settings.is_inside_booking_window(start=start_at)
+        inside_booking_window = calendar_settings.is_inside_booking_window(start=start_at, now=now)
         if not inside_booking_window and not can_ignore_booking_window:
-            raise SlotIsNotAvailableError()
+            return SlotVerdictReason.OUTSIDE_BOOKING_WINDOW
 
-        inside_working_period = calendar_settings.is_inside_working_period(start=start_at, end=end_at)
+        if not calendar_settings.is_inside_working_period(start=start_at, end=end_at):
+            return SlotVerdictReason.OUTSIDE_WORKING_PERIOD
 
-        if not inside_working_period:
-            raise UserIsNotWorkingInDesignatedTimeframeError()
+        return SlotVerdictReason.INSIDE_WORKING_PERIOD
 
     def _find_effective_exception(
         self,
@@ -51,3 +251,68 @@ class CalendarAvailabilityPolicy:
                 exception.exception_type != CalendarExceptionType.BLOCK,
             ),
         )
+
+    def _segment_key(
+        self,
+        *,
+        working_index: int | None,
+        active_exceptions: list[CalendarException],
+        booked_count: int,
+    ) -> object:
+        if booked_count > 0:
+            return None
+
+        effective_exception = self._find_effective_exception(active_exceptions)
+
+        if effective_exception is not None:
+            if effective_exception.exception_type == CalendarExceptionType.BLOCK:
+                return None
+            return ALLOWED_BY_EXCEPTION
+
+        return working_index
+
+    @staticmethod
+    def _can_merge(current_key: object, key: object) -> bool:
+        return current_key == key or ALLOWED_BY_EXCEPTION in (current_key, key)
+
+    def _working_windows(
+        self,
+        *,
+        calendar_settings: CalendarSettings,
+        start_at: datetime,
+        end_at: datetime,
+        can_ignore_booking_window: bool,
+    ) -> list[TimeSlot]:
+        last_day = end_at.date()
+        if not can_ignore_booking_window:
+            last_day = min(last_day, calendar_settings.booking_window_until)
+
+        periods_by_weekday: dict[int, list] = {}
+        for period in calendar_settings.working_periods:
+            periods_by_weekday.setdefault(period.weekday, []).append(period)
+
+        windows: list[TimeSlot] = []
+        day: date = start_at.date()
+
+        while day <= last_day:
+            for period in sorted(periods_by_weekday.get(day.weekday(), []), key=lambda p: p.start_at):
+                window_start = datetime.combine(day, period.start_at, tzinfo=timezone.utc)
+                window_end = datetime.combine(day, period.end_at, tzinfo=timezone.utc)
+
+                if window_end > start_at and window_start < end_at:
+                    windows.append(TimeSlot(start_at=window_start, end_at=window_end))
+
+            day += timedelta(days=1)
+
+        return windows
+
+    @staticmethod
+    def _align_to_step(moment: datetime, step: timedelta) -> datetime:
+        midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        steps_since_midnight = -((midnight - moment) // step)
+
+        return midnight + steps_since_midnight * step
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        return datetime.now(timezone.utc)
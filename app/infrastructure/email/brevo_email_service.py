@@ -1,46 +1,111 @@
 import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
 import httpx
-from app.application.notifications.ports.email_service import EmailService
+
+from app.application.notifications.ports.email_service import EmailMessage, EmailService
 from app.core.config import settings
 from app.core.exceptions.services import (
+    EmailProviderServerError,
+    EmailRateLimitedError,
     EmailSentFailedError,
     EmailServiceUnavailableError,
 )
 
 logger = logging.getLogger(__name__)
 
+BREVO_SEND_URL = "https://api.brevo.com/v3/smtp/email"
+
+# Brevo accepts at most this many message versions in one request
+MAX_MESSAGE_VERSIONS = 1000
+
+
+def create_brevo_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=settings.BREVO_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.BREVO_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.BREVO_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(
+            settings.BREVO_HTTP_TIMEOUT_SECONDS,
+            connect=settings.BREVO_HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+    )
+
 
 class BrevoEmailService(EmailService):
+    """
+    Keeps one pooled HTTP/2 client for its whole life, so emails reuse the open
+    connection to Brevo instead of paying a TCP and TLS handshake each. The owner
+    creates it once and calls `aclose` on shutdown.
+    """
 
-    async def send_email(self, to: str, subject: str, html_content: str) -> None:
-        url = "https://api.brevo.com/v3/smtp/email"
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        self.client = client or create_brevo_http_client()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
 
+    async def send_email(self, to: str, subject: str, html_content: str) -> None:
         payload = {
-            "sender": {
-                "email": settings.BREVO_SENDER_EMAIL,
-                "name": settings.BREVO_SENDER_NAME,
-            },
+            "sender": self._sender(),
             "to": [{"email": to}],
             "subject": subject,
             "htmlContent": html_content,
         }
 
+        await self._post(payload, {"recipient": to})
+
+    async def send_batch(self, messages: list[EmailMessage]) -> None:
+        """
+        Sends each message as a message version of one request, the top level subject
+        and content are the first message's and only act as defaults.
+        """
+        for start in range(0, len(messages), MAX_MESSAGE_VERSIONS):
+            chunk = messages[start : start + MAX_MESSAGE_VERSIONS]
+
+            payload = {
+                "sender": self._sender(),
+                "subject": chunk[0].subject,
+                "htmlContent": chunk[0].html_content,
+                "messageVersions": [
+                    {
+                        "to": [{"email": message.to}],
+                        "subject": message.subject,
+                        "htmlContent": message.html_content,
+                    }
+                    for message in chunk
+                ],
+            }
+
+            await self._post(payload, {"recipients": [message.to for message in chunk]})
+
+    def _sender(self) -> dict:
+        return {
+            "email": settings.BREVO_SENDER_EMAIL,
+            "name": settings.BREVO_SENDER_NAME,
+        }
+
+    async def _post(self, payload: dict, log_extra: dict) -> None:
         headers = {
             "api-key": settings.BREVO_API_KEY,
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-            except httpx.RequestError:
-                raise EmailServiceUnavailableError()
+        try:
+            response = await self.client.post(BREVO_SEND_URL, json=payload, headers=headers)
+        except httpx.RequestError:
+            raise EmailServiceUnavailableError()
 
         if response.status_code < 400:
             logger.info(
                 "Brevo email sent successfully",
                 extra={
-                    "recipient": to,
+                    **log_extra,
                     "status_code": response.status_code,
                     "response": response.text[:500],
                 },
@@ -50,9 +115,29 @@ class BrevoEmailService(EmailService):
             logger.error(
                 "Brevo email send failed",
                 extra={
-                    "recipient": to,
+                    **log_extra,
                     "status_code": response.status_code,
                     "response": response.text[:500],
                 },
             )
+            if response.status_code == 429:
+                raise EmailRateLimitedError(_retry_after(response))
+            if response.status_code >= 500:
+                raise EmailProviderServerError()
             raise EmailSentFailedError()
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    if value.strip().isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,21 @@
+from datetime import timedelta
+from uuid import UUID
+
+from app.application.studio.services.access_token_cache import AccessTokenCache
+from app.core.config import settings
+from sqlalchemy.orm import Session
+
+ACCESS_CHANGES_KEY = "changed_accesses"
+
+access_token_cache = AccessTokenCache(user_ttl=timedelta(seconds=settings.ACCESS_CACHE_TTL_SECONDS))
+
+
+def mark_access_changed(session: Session, user_id: UUID) -> None:
+    # drop it right away so this process stops trusting the old state, and again on
+    # commit in case a verification reloaded the row before the change was committed
+    access_token_cache.invalidate_users([user_id])
+    session.info.setdefault(ACCESS_CHANGES_KEY, set()).add(user_id)
+
+
+def pop_access_changes(session: Session) -> set[UUID]:
+    return session.info.pop(ACCESS_CHANGES_KEY, set())
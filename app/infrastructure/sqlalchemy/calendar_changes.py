@@ -0,0 +1,19 @@
+from datetime import timedelta
+from uuid import UUID
+
+from app.application.studio.services.calendar_index import CalendarIndex
+from app.core.config import settings
+from sqlalchemy.orm import Session
+
+CALENDAR_CHANGES_KEY = "changed_calendars"
+
+calendar_index = CalendarIndex(ttl=timedelta(seconds=settings.CALENDAR_INDEX_TTL_SECONDS))
+
+
+def mark_calendar_changed(session: Session, *user_ids: UUID | None) -> None:
+    changed = session.info.setdefault(CALENDAR_CHANGES_KEY, set())
+    changed.update(user_id for user_id in user_ids if user_id is not None)
+
+
+def pop_calendar_changes(session: Session) -> set[UUID]:
+    return session.info.pop(CALENDAR_CHANGES_KEY, set())
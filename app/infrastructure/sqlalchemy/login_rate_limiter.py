@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+import anyio
+
+from app.application.studio.services.login_rate_limiter import LoginRateLimit, LoginRateLimiter
+from app.infrastructure.sqlalchemy.models.login_attempts import LoginAttemptModel
+from app.infrastructure.sqlalchemy.session import SessionLocal
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class SqlAlchemyLoginRateLimiter(LoginRateLimiter):
+    """
+    Attempts kept in the login_attempts table, so every worker shares one budget.
+    On Postgres a transaction scoped advisory lock per key serializes the count and
+    the insert of concurrent attempts against the same key. A login only prunes the
+    expired attempts of the keys it locked; `run` sweeps the rest of the table every
+    window, so keys that stop trying do not stay behind.
+
+    It uses its own short session: the attempt is recorded before the login runs,
+    whatever happens to the request unit of work afterwards.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: timedelta,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        super().__init__(window=window)
+        self._session_factory = session_factory
+
+    async def acquire(self, limits: list[LoginRateLimit]) -> Optional[float]:
+        return await anyio.to_thread.run_sync(self._acquire, limits)
+
+    async def reset(self, key: str) -> None:
+        await anyio.to_thread.run_sync(self._reset, key)
+
+    async def prune_expired(self) -> int:
+        return await anyio.to_thread.run_sync(self._prune_expired)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.window.total_seconds())
+
+            try:
+                await self.prune_expired()
+            except Exception:
+                logger.exception("login attempts pruning failed")
+
+    def _acquire(self, limits: list[LoginRateLimit]) -> Optional[float]:
+        now = datetime.now(timezone.utc)
+        window_start = now - self.window
+        keys = sorted({limit.key for limit in limits})
+
+        with self._session_factory() as session, session.begin():
+            if session.get_bind().dialect.name == "postgresql":
+                for key in keys:
+                    session.execute(select(func.pg_advisory_xact_lock(func.hashtext(key))))
+
+            session.execute(
+                delete(LoginAttemptModel).where(
+                    LoginAttemptModel.key.in_(keys), LoginAttemptModel.attempted_at <= window_start
+                )
+            )
+
+            attempts_by_key: dict[str, list[datetime]] = {}
+            for key, attempted_at in session.execute(
+                select(LoginAttemptModel.key, LoginAttemptModel.attempted_at)
+                .where(LoginAttemptModel.key.in_(keys))
+                .order_by(LoginAttemptModel.attempted_at.asc())
+            ):
+                attempts_by_key.setdefault(key, []).append(self._as_utc(attempted_at))
+
+            retry_after: Optional[float] = None
+
+            for limit in limits:
+                attempts = attempts_by_key.get(limit.key, [])
+
+                if len(attempts) >= limit.max_attempts:
+                    expires_at = attempts[-limit.max_attempts] + self.window
+                    retry_after = max(retry_after or 0.0, (expires_at - now).total_seconds())
+
+            if retry_after is not None:
+                return retry_after
+
+            session.add_all(LoginAttemptModel(key=key, attempted_at=now) for key in keys)
+
+        return None
+
+    def _reset(self, key: str) -> None:
+        with self._session_factory() as session, session.begin():
+            session.execute(delete(LoginAttemptModel).where(LoginAttemptModel.key == key))
+
+    def _prune_expired(self) -> int:
+        window_start = datetime.now(timezone.utc) - self.window
+
+        with self._session_factory() as session, session.begin():
+            pruned = session.execute(
+                delete(LoginAttemptModel).where(LoginAttemptModel.attempted_at <= window_start)
+            )
+
+        return pruned.rowcount
+
+    @staticmethod
+    def _as_utc(moment: datetime) -> datetime:
+        # sqlite hands timezone aware columns back as naive UTC
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+
+        return moment
@@ -0,0 +1,36 @@
+from datetime import datetime
+from uuid import UUID as pyUUID
+from uuid import uuid4
+
+from app.core.types.appointment_enums import AppointmentType
+from app.infrastructure.sqlalchemy.base_class import Base
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class AppointmentRequestDigestEntryModel(Base):
+    __tablename__ = "appointment_request_digest_entries"
+
+    __table_args__ = (
+        # the digest job takes everything due, grouped by artist
+        Index("ix_appointment_request_digest_entries_user_id_created_at", "user_id", "created_at"),
+    )
+
+    id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    user_id: Mapped[pyUUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    appointment_type: Mapped[AppointmentType] = mapped_column(
+        Enum(AppointmentType, name="appointment_type_enum"), nullable=False
+    )
+
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    end_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    sessions_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
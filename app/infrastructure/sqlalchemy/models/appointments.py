@@ -9,20 +9,27 @@ from app.core.types.appointment_enums import (
 )
 from app.infrastructure.sqlalchemy.base_class import Base
 from sqlalchemy import (
+    DDL,
     Boolean,
     CheckConstraint,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    event,
+    func,
+    literal,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
+APPOINTMENTS_NO_OVERLAP_CONSTRAINT = "appointments_no_overlap_per_user"
+
 
 class AppointmentModel(Base):
     __tablename__ = "appointments"
@@ -39,6 +46,17 @@ class AppointmentModel(Base):
             """,
             name="check_client_info_valid",
         ),
+        # Postgres only: two active appointments of the same artist can never overlap.
+        # The GiST index behind it also serves the overlap lookups of the repository.
+        ExcludeConstraint(
+            ("user_id", "="),
+            (func.tstzrange(text("start_at"), text("end_at"), literal("[)")), "&&"),
+            name=APPOINTMENTS_NO_OVERLAP_CONSTRAINT,
+            using="gist",
+            where=text("status <> 'CANCELED'"),
+        ).ddl_if(dialect="postgresql"),
+        # matches the (created_at, id) keyset ordering of find_many
+        Index("ix_appointments_created_at_id", "created_at", "id"),
     )
 
     id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -107,3 +125,11 @@ class AppointmentModel(Base):
         DateTime(timezone=True),
         nullable=False,
     )
+
+
+# btree_gist is what lets the exclusion constraint compare user_id with "=" inside a GiST index
+event.listen(
+    AppointmentModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from app.infrastructure.sqlalchemy.base_class import Base
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class JobRunModel(Base):
+    """Last window each scheduled job ran for."""
+
+    __tablename__ = "job_runs"
+
+    job: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    window_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    ran_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
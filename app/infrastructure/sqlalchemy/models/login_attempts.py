@@ -0,0 +1,24 @@
+from datetime import datetime
+from uuid import UUID as pyUUID
+from uuid import uuid4
+
+from app.infrastructure.sqlalchemy.base_class import Base
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class LoginAttemptModel(Base):
+    __tablename__ = "login_attempts"
+
+    __table_args__ = (Index("ix_login_attempts_key_attempted_at", "key", "attempted_at"),)
+
+    id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    key: Mapped[str] = mapped_column(String(320), nullable=False)
+
+    attempted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
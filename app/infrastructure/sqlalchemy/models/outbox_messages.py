@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Dict
+from uuid import UUID as pyUUID
+from uuid import uuid4
+
+from app.core.types.outbox_enums import OutboxStatus
+from app.infrastructure.sqlalchemy.base_class import Base
+from sqlalchemy import JSON, DateTime, Enum, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class OutboxMessageModel(Base):
+    __tablename__ = "outbox_messages"
+
+    __table_args__ = (
+        # the dispatcher only ever scans pending messages in availability order
+        Index(
+            "ix_outbox_messages_pending_available_at",
+            "available_at",
+            postgresql_where="status = 'PENDING'",
+        ),
+    )
+
+    id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    event_type: Mapped[str] = mapped_column(String(200), nullable=False)
+
+    handler_name: Mapped[str] = mapped_column(String(200), nullable=False)
+
+    payload: Mapped[Dict] = mapped_column(JSON, nullable=False)
+
+    status: Mapped[OutboxStatus] = mapped_column(
+        Enum(OutboxStatus),
+        nullable=False,
+        default=OutboxStatus.PENDING,
+    )
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    dispatched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
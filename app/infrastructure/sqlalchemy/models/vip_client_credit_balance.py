@@ -0,0 +1,21 @@
+from datetime import datetime
+from uuid import UUID as pyUUID
+
+from app.infrastructure.sqlalchemy.base_class import Base
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class VipClientCreditBalanceModel(Base):
+    """Running sum of a client's client_credit_entry rows, kept in step on every insert."""
+
+    __tablename__ = "vip_client_credit_balance"
+
+    vip_client_id: Mapped[pyUUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("vip_client.id"), primary_key=True
+    )
+
+    balance: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import List
+
+from app.application.studio.repositories.appointment_request_digests_repository import (
+    AppointmentRequestDigestsRepository,
+)
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
+from app.infrastructure.sqlalchemy.models.appointment_request_digest_entries import (
+    AppointmentRequestDigestEntryModel,
+)
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+
+class SQLAlchemyAppointmentRequestDigestsRepository(AppointmentRequestDigestsRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add(self, entry: AppointmentRequestDigestEntry) -> None:
+        self.session.add(self._to_model(entry))
+        self.session.flush()
+
+    def take_due(self, *, until: datetime) -> List[AppointmentRequestDigestEntry]:
+        orm_entries = self.session.scalars(
+            select(AppointmentRequestDigestEntryModel)
+            .where(AppointmentRequestDigestEntryModel.created_at <= until)
+            .order_by(
+                AppointmentRequestDigestEntryModel.user_id,
+                AppointmentRequestDigestEntryModel.created_at,
+            )
+            .with_for_update()
+        ).all()
+
+        entries = [self._to_dto(orm_entry) for orm_entry in orm_entries]
+
+        if entries:
+            self.session.execute(
+                delete(AppointmentRequestDigestEntryModel).where(
+                    AppointmentRequestDigestEntryModel.id.in_([entry.id for entry in entries])
+                )
+            )
+
+        return entries
+
+    def _to_dto(self, orm_entry: AppointmentRequestDigestEntryModel) -> AppointmentRequestDigestEntry:
+        return AppointmentRequestDigestEntry(
+            id=orm_entry.id,
+            user_id=orm_entry.user_id,
+            appointment_type=orm_entry.appointment_type,
+            start_at=orm_entry.start_at,
+            end_at=orm_entry.end_at,
+            created_at=orm_entry.created_at,
+            sessions_count=orm_entry.sessions_count,
+        )
+
+    def _to_model(self, entry: AppointmentRequestDigestEntry) -> AppointmentRequestDigestEntryModel:
+        return AppointmentRequestDigestEntryModel(
+            id=entry.id,
+            user_id=entry.user_id,
+            appointment_type=entry.appointment_type,
+            start_at=entry.start_at,
+            end_at=entry.end_at,
+            created_at=entry.created_at,
+            sessions_count=entry.sessions_count,
+        )
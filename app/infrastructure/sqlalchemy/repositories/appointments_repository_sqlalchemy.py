@@ -6,7 +6,8 @@ from app.application.studio.repositories.appointments_repository import (
     AppointmentsRepository,
 )
 from app.application.studio.use_cases.DTO.client_filters import ClientInfoFilter
-from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.commun import Direction, PageCursor
+from app.core.exceptions.appointments import SlotIsAlreadyOccupiedError
 from app.core.types.appointment_enums import (
     AppointmentStatus,
     AppointmentType,
@@ -14,11 +15,44 @@ from app.core.types.appointment_enums import (
 from app.domain.studio.appointments.entities.appointment import Appointment
 from app.domain.studio.appointments.entities.value_objects.client_info import ClientInfo
 from app.domain.studio.value_objects.client_code import ClientCode
-from app.infrastructure.sqlalchemy.models.appointments import AppointmentModel
-from sqlalchemy import func, select
+from app.infrastructure.sqlalchemy.calendar_changes import mark_calendar_changed
+from app.infrastructure.sqlalchemy.models.appointments import (
+    APPOINTMENTS_NO_OVERLAP_CONSTRAINT,
+    AppointmentModel,
+)
+from sqlalchemy import exists, func, literal, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 
+def active_overlap_filters(
+    *,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    user_id: UUID | None,
+    is_postgres: bool,
+) -> list:
+    filters = [AppointmentModel.status != AppointmentStatus.CANCELED]
+
+    if start_date is not None and end_date is not None and is_postgres:
+        # same expression as the exclusion constraint, so the lookup is served by its GiST index
+        filters.append(
+            func.tstzrange(AppointmentModel.start_at, AppointmentModel.end_at, literal("[)")).op("&&")(
+                func.tstzrange(start_date, end_date, literal("[)"))
+            )
+        )
+    else:
+        if start_date is not None:
+            filters.append(AppointmentModel.end_at > start_date)
+        if end_date is not None:
+            filters.append(AppointmentModel.start_at < end_date)
+
+    if user_id is not None:
+        filters.append(AppointmentModel.user_id == user_id)
+
+    return filters
+
+
 class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
     def __init__(self, session: Session):
         self.session = session
@@ -27,7 +61,14 @@ class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
         orm_appointment = self._to_model(appointment)
 
         self.session.add(orm_appointment)
-        self.session.flush()
+        self._flush()
+        mark_calendar_changed(self.session, appointment.user_id)
+
+    def create_many(self, appointments: List[Appointment]) -> None:
+        # a single flush lets SQLAlchemy send the rows as one multi-row INSERT
+        self.session.add_all([self._to_model(appointment) for appointment in appointments])
+        self._flush()
+        mark_calendar_changed(self.session, *{appointment.user_id for appointment in appointments})
 
     def find_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
         appointment_in_question = select(AppointmentModel).where(AppointmentModel.id == appointment_id)
@@ -62,6 +103,7 @@ class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
 
         orm_appointment.status = appointment.status
         orm_appointment.appointment_type = appointment.appointment_type
+        mark_calendar_changed(self.session, orm_appointment.user_id, appointment.user_id)
         orm_appointment.user_id = appointment.user_id
         orm_appointment.start_at = appointment.start_at
         orm_appointment.end_at = appointment.end_at
@@ -77,7 +119,7 @@ class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
         orm_appointment.observations = appointment.observations
         orm_appointment.updated_at = appointment.updated_at
 
-        self.session.flush()
+        self._flush()
 
     def find_many(
         self,
@@ -95,6 +137,7 @@ class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
         limit: int = 100,
         offset: int = 0,
         direction: Direction = Direction.desc,
+        cursor: PageCursor | None = None,
     ) -> List[Appointment]:
 
         MAX_LIMIT = 5000
@@ -113,16 +156,29 @@ class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
             referral_code=referral_code,
         )
 
+        if cursor is not None:
+            # keyset pagination: walk the (created_at, id) index from the cursor, no offset to skip
+            scan_direction = self._reverse(direction) if cursor.backward else direction
+            filters.append(self._after_cursor(cursor, direction=scan_direction))
+            offset = 0
+        else:
+            scan_direction = direction
+
         appointments_in_question = select(AppointmentModel).where(*filters)
 
-        appointments_in_question = self._apply_order(appointments_in_question, direction=direction)
+        appointments_in_question = self._apply_order(appointments_in_question, direction=scan_direction)
         appointments_in_question = appointments_in_question.limit(limit).offset(offset)
 
-        return [
+        appointments = [
             self._to_entity(orm_appointment)
             for orm_appointment in self.session.scalars(appointments_in_question)
         ]
 
+        if scan_direction != direction:
+            appointments.reverse()
+
+        return appointments
+
     def count_many(
         self,
         *,
@@ -160,7 +216,50 @@ class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
         end_date: datetime | None = None,
         user_id: UUID | None = None,
     ) -> list[Appointment]:
-        return self.find_many(start_date=start_date, end_date=end_date, user_id=user_id)
+        filters = active_overlap_filters(
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            is_postgres=self._is_postgres(),
+        )
+
+        appointments_in_question = (
+            select(AppointmentModel)
+            .where(*filters)
+            .order_by(AppointmentModel.start_at.asc(), AppointmentModel.id.asc())
+        )
+
+        return [
+            self._to_entity(orm_appointment)
+            for orm_appointment in self.session.scalars(appointments_in_question)
+        ]
+
+    def exists_overlap(
+        self,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        user_id: UUID,
+    ) -> bool:
+        filters = active_overlap_filters(
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            is_postgres=self._is_postgres(),
+        )
+
+        return self.session.scalar(select(exists().where(*filters))) or False
+
+    def _flush(self) -> None:
+        try:
+            self.session.flush()
+        except IntegrityError as exc:
+            if APPOINTMENTS_NO_OVERLAP_CONSTRAINT in str(exc.orig):
+                raise SlotIsAlreadyOccupiedError() from exc
+            raise
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
 
     def _build_filters(
         self,
@@ -312,3 +411,18 @@ class SQLAlchemyAppointmentsRepository(AppointmentsRepository):
             AppointmentModel.created_at.desc(),
             AppointmentModel.id.desc(),
         )
+
+    def _after_cursor(self, cursor: PageCursor, direction: Direction):
+        position = tuple_(AppointmentModel.created_at, AppointmentModel.id)
+        cursor_position = tuple_(
+            literal(cursor.created_at, AppointmentModel.created_at.type),
+            literal(cursor.id, AppointmentModel.id.type),
+        )
+
+        if direction == Direction.asc:
+            return position > cursor_position
+        return position < cursor_position
+
+    @staticmethod
+    def _reverse(direction: Direction) -> Direction:
+        return Direction.asc if direction == Direction.desc else Direction.desc
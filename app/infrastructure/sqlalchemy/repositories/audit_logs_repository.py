@@ -17,20 +17,15 @@ class SQLAlchemyAuditLogsRepository(AuditLogsRepository):
 
     def create(self, audit_log: AuditLogEntry) -> None:
 
-        orm_audit_log = AuditLogsModel(
-            entity_name=audit_log.entity_name,
-            entity_id=audit_log.entity_id,
-            action=audit_log.action,
-            actor_id=audit_log.actor_id,
-            actor_type=audit_log.actor_type,
-            performed_at=audit_log.performed_at,
-            changes=audit_log.changes,
-            reason=audit_log.reason,
-        )
+        orm_audit_log = self._to_model(audit_log)
 
         self.session.add(orm_audit_log)
         self.session.flush()
 
+    def create_many(self, audit_logs: List[AuditLogEntry]) -> None:
+        self.session.add_all([self._to_model(audit_log) for audit_log in audit_logs])
+        self.session.flush()
+
     def find_many_by_entity_name(
         self, *, entity_name: str, limit: int = 100, offset: int = 0
     ) -> List[AuditLogEntry]:
@@ -81,3 +76,15 @@ class SQLAlchemyAuditLogsRepository(AuditLogsRepository):
             changes=audit_log.changes,
             reason=audit_log.reason,
         )
+
+    def _to_model(self, audit_log: AuditLogEntry) -> AuditLogsModel:
+        return AuditLogsModel(
+            entity_name=audit_log.entity_name,
+            entity_id=audit_log.entity_id,
+            action=audit_log.action,
+            actor_id=audit_log.actor_id,
+            actor_type=audit_log.actor_type,
+            performed_at=audit_log.performed_at,
+            changes=audit_log.changes,
+            reason=audit_log.reason,
+        )
@@ -6,11 +6,26 @@ from app.application.studio.repositories.calendar_exceptions_repository import (
     CalendarExceptionsRepository,
 )
 from app.domain.studio.appointments.entities.calendar_exception import CalendarException
+from app.infrastructure.sqlalchemy.calendar_changes import mark_calendar_changed
 from app.infrastructure.sqlalchemy.models.calendar_exceptions import CalendarExceptionsModel
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 
+def calendar_exception_to_entity(orm_calendar_exception: CalendarExceptionsModel) -> CalendarException:
+    return CalendarException(
+        id=orm_calendar_exception.id,
+        calendar_of_user=orm_calendar_exception.calendar_of_user,
+        start_at=orm_calendar_exception.start_at,
+        end_at=orm_calendar_exception.end_at,
+        exception_type=orm_calendar_exception.exception_type,
+        reason=orm_calendar_exception.reason,
+        created_by=orm_calendar_exception.created_by,
+        created_at=orm_calendar_exception.created_at,
+        updated_at=orm_calendar_exception.updated_at,
+    )
+
+
 class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
     def __init__(self, session: Session):
         self.session = session
@@ -20,6 +35,7 @@ class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
 
         self.session.add(orm_calendar_exception)
         self.session.flush()
+        mark_calendar_changed(self.session, calendar_exception.calendar_of_user)
 
     def update(self, calendar_exception: CalendarException) -> None:
         calendar_exception_in_question = select(CalendarExceptionsModel).where(
@@ -38,6 +54,7 @@ class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
         orm_calendar_exception.updated_at = calendar_exception.updated_at
 
         self.session.flush()
+        mark_calendar_changed(self.session, orm_calendar_exception.calendar_of_user)
 
     def find_by_id(self, calendar_exception_id: UUID) -> Optional[CalendarException]:
         calendar_exception_in_question = select(CalendarExceptionsModel).where(
@@ -49,7 +66,7 @@ class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
         if orm_calendar_exception is None:
             return
 
-        return self._to_entity(orm_calendar_exception)
+        return calendar_exception_to_entity(orm_calendar_exception)
 
     def find_between(
         self, *, user_id: UUID, start_at: datetime, end_at: datetime
@@ -65,7 +82,7 @@ class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
         )
         orm_calendar_exception = self.session.scalars(calendar_exceptions_in_question)
 
-        return [self._to_entity(exception) for exception in orm_calendar_exception]
+        return [calendar_exception_to_entity(exception) for exception in orm_calendar_exception]
 
     def find_overlap(
         self, *, user_id: UUID, start_at: datetime, end_at: datetime
@@ -81,7 +98,7 @@ class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
         )
         orm_calendar_exception = self.session.scalars(calendar_exceptions_in_question)
 
-        return [self._to_entity(exception) for exception in orm_calendar_exception]
+        return [calendar_exception_to_entity(exception) for exception in orm_calendar_exception]
 
     def delete(self, calendar_exception_id: UUID) -> None:
         calendar_exception_in_question = select(CalendarExceptionsModel).where(
@@ -96,6 +113,7 @@ class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
         self.session.delete(orm_calendar_exception)
 
         self.session.flush()
+        mark_calendar_changed(self.session, orm_calendar_exception.calendar_of_user)
 
     def _to_model(self, calendar_exception: CalendarException) -> CalendarExceptionsModel:
 
@@ -110,17 +128,3 @@ class SQLAlchemyCalendarExceptionsRepository(CalendarExceptionsRepository):
             created_at=calendar_exception.created_at,
             updated_at=calendar_exception.updated_at,
         )
-
-    def _to_entity(self, orm_calendar_exception: CalendarExceptionsModel) -> CalendarException:
-
-        return CalendarException(
-            id=orm_calendar_exception.id,
-            calendar_of_user=orm_calendar_exception.calendar_of_user,
-            start_at=orm_calendar_exception.start_at,
-            end_at=orm_calendar_exception.end_at,
-            exception_type=orm_calendar_exception.exception_type,
-            reason=orm_calendar_exception.reason,
-            created_by=orm_calendar_exception.created_by,
-            created_at=orm_calendar_exception.created_at,
-            updated_at=orm_calendar_exception.updated_at,
-        )
@@ -4,6 +4,7 @@ from uuid import UUID
 from app.application.studio.repositories.calendar_settings_repository import CalendarSettingsRepository
 from app.domain.studio.appointments.entities.calendar_settings import CalendarSettings
 from app.domain.studio.appointments.entities.working_period import WorkingPeriod
+from app.infrastructure.sqlalchemy.calendar_changes import mark_calendar_changed
 from app.infrastructure.sqlalchemy.models.calendar_settings import CalendarSettingsModel
 from app.infrastructure.sqlalchemy.models.working_period import WorkingPeriodModel
 from sqlalchemy import exists, select
@@ -19,6 +20,7 @@ class SQLAlchemyCalendarSettingsRepository(CalendarSettingsRepository):
 
         self.session.add(orm_calendar_settings)
         self.session.flush()
+        mark_calendar_changed(self.session, calendar_settings.user_id)
 
     def find_by_user_id(self, user_id: UUID) -> Optional[CalendarSettings]:
         calendar_in_question = select(CalendarSettingsModel).where(
@@ -52,6 +54,7 @@ class SQLAlchemyCalendarSettingsRepository(CalendarSettingsRepository):
         orm_calendar_settings.updated_at = calendar_settings.updated_at
 
         self.session.flush()
+        mark_calendar_changed(self.session, calendar_settings.user_id)
 
     def exists_by_user_id(self, user_id: UUID) -> bool:
         calendar = select(exists().where(CalendarSettingsModel.user_id == user_id))
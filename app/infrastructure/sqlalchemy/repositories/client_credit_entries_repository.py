@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 
@@ -5,6 +6,7 @@ from app.application.studio.repositories.client_credit_entries_repository import
     ClientCreditEntriesRepository,
 )
 from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.credit_balance_drift_dto import CreditBalanceDrift
 from app.core.types.client_credit_source_type import (
     ClientCreditSourceType,
 )
@@ -12,7 +14,12 @@ from app.domain.studio.finances.entities.client_credit_entry import ClientCredit
 from app.infrastructure.sqlalchemy.models.client_credit_entry import (
     ClientCreditEntryModel,
 )
+from app.infrastructure.sqlalchemy.models.vip_client import VipClientModel
+from app.infrastructure.sqlalchemy.models.vip_client_credit_balance import (
+    VipClientCreditBalanceModel,
+)
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 
@@ -34,15 +41,66 @@ class SQLAlchemyClientCreditEntriesRepository(ClientCreditEntriesRepository):
         self.session.add(orm_client_credit_entry)
         self.session.flush()
 
+        balance_row = self._locked_balance_row(client_credit_entry.vip_client_id)
+        balance_row.balance += client_credit_entry.quantity
+        balance_row.updated_at = datetime.now(timezone.utc)
+        self.session.flush()
+
     def get_balance(self, *, vip_client_id: UUID) -> int:
-        credits_to_sum = select(func.coalesce(func.sum(ClientCreditEntryModel.quantity), 0)).where(
-            ClientCreditEntryModel.vip_client_id == vip_client_id
+        balance = self.session.scalar(
+            select(VipClientCreditBalanceModel.balance).where(
+                VipClientCreditBalanceModel.vip_client_id == vip_client_id
+            )
         )
 
-        balance = self.session.scalar(credits_to_sum)
-
         return balance or 0
 
+    def get_balance_for_update(self, *, vip_client_id: UUID) -> int:
+        return self._locked_balance_row(vip_client_id).balance
+
+    def find_balance_drift(self) -> List[CreditBalanceDrift]:
+        ledger_sums = (
+            select(
+                ClientCreditEntryModel.vip_client_id,
+                func.sum(ClientCreditEntryModel.quantity).label("ledger"),
+            )
+            .group_by(ClientCreditEntryModel.vip_client_id)
+            .subquery()
+        )
+        recorded = func.coalesce(VipClientCreditBalanceModel.balance, 0)
+        ledger = func.coalesce(ledger_sums.c.ledger, 0)
+
+        # one statement, so the balances and the sums come from the same snapshot and
+        # an entry committed halfway through is not taken for drift
+        drifted = (
+            select(VipClientModel.id, recorded, ledger)
+            .outerjoin(
+                VipClientCreditBalanceModel,
+                VipClientCreditBalanceModel.vip_client_id == VipClientModel.id,
+            )
+            .outerjoin(ledger_sums, ledger_sums.c.vip_client_id == VipClientModel.id)
+            .where(recorded != ledger)
+            .order_by(VipClientModel.id)
+        )
+
+        return [
+            CreditBalanceDrift(vip_client_id=UUID(str(client_id)), recorded=recorded, ledger=ledger)
+            for client_id, recorded, ledger in self.session.execute(drifted)
+        ]
+
+    def rebuild_balance(self, *, vip_client_id: UUID) -> int:
+        balance_row = self._locked_balance_row(vip_client_id)
+
+        # summed after the lock, so no entry for the client can land in between
+        ledger_sum = select(func.coalesce(func.sum(ClientCreditEntryModel.quantity), 0)).where(
+            ClientCreditEntryModel.vip_client_id == vip_client_id
+        )
+        balance_row.balance = self.session.scalar(ledger_sum) or 0
+        balance_row.updated_at = datetime.now(timezone.utc)
+        self.session.flush()
+
+        return balance_row.balance
+
     def find_by_id(self, credit_id: UUID) -> Optional[ClientCreditEntry]:
         credit_in_question = select(ClientCreditEntryModel).where(ClientCreditEntryModel.id == credit_id)
         orm_client_credit_entry = self.session.scalar(credit_in_question)
@@ -149,6 +207,36 @@ class SQLAlchemyClientCreditEntriesRepository(ClientCreditEntriesRepository):
 
         return self._to_entity(orm_client_credit_entry)
 
+    def _locked_balance_row(self, vip_client_id: UUID) -> VipClientCreditBalanceModel:
+        """
+        The client's balance row, locked until the transaction ends. A client without
+        one gets it here; the savepoint lets a concurrent insert of the same row win
+        without aborting the caller's transaction.
+        """
+        row_in_question = (
+            select(VipClientCreditBalanceModel)
+            .where(VipClientCreditBalanceModel.vip_client_id == vip_client_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        balance_row = self.session.scalar(row_in_question)
+        if balance_row is not None:
+            return balance_row
+
+        try:
+            with self.session.begin_nested():
+                self.session.add(
+                    VipClientCreditBalanceModel(
+                        vip_client_id=vip_client_id,
+                        balance=0,
+                        updated_at=datetime.now(timezone.utc),
+                    )
+                )
+        except IntegrityError:
+            pass
+
+        return self.session.scalar(row_in_question)
+
     def _to_entity(self, orm_client_credit_entry: ClientCreditEntryModel) -> ClientCreditEntry:
 
         return ClientCreditEntry(
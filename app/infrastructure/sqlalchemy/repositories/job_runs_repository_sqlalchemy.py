@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+from app.application.studio.repositories.job_runs_repository import JobRunsRepository
+from app.infrastructure.sqlalchemy.models.job_runs import JobRunModel
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+
+class SQLAlchemyJobRunsRepository(JobRunsRepository):
+    """
+    On Postgres a transaction scoped advisory lock per job keeps a second worker out
+    while the first one runs; it gives up right away instead of waiting. SQLite runs
+    one writer at a time anyway.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def try_claim(self, job: str, *, window_start: datetime) -> bool:
+        if self._is_postgres():
+            locked = self.session.scalar(
+                select(func.pg_try_advisory_xact_lock(func.hashtext(f"job:{job}")))
+            )
+            if not locked:
+                return False
+
+        job_run = self.session.get(JobRunModel, job)
+
+        if job_run is None:
+            job_run = JobRunModel(job=job, window_start=window_start)
+            self.session.add(job_run)
+        elif self._as_utc(job_run.window_start) >= window_start:
+            return False
+
+        job_run.window_start = window_start
+        job_run.ran_at = datetime.now(timezone.utc)
+        self.session.flush()
+
+        return True
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    @staticmethod
+    def _as_utc(moment: datetime) -> datetime:
+        # sqlite hands timezone aware columns back as naive UTC
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+
+        return moment
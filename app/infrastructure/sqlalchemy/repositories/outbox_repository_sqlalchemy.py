@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from typing import List
+from uuid import UUID
+
+from app.application.studio.repositories.outbox_repository import OutboxRepository
+from app.application.studio.use_cases.DTO.outbox_dto import OutboxMessage
+from app.core.types.outbox_enums import OutboxStatus
+from app.infrastructure.sqlalchemy.models.outbox_messages import OutboxMessageModel
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+
+class SQLAlchemyOutboxRepository(OutboxRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add_many(self, messages: List[OutboxMessage]) -> None:
+        self.session.add_all([self._to_model(message) for message in messages])
+        self.session.flush()
+
+    def claim_batch(self, *, limit: int, now: datetime, lease: timedelta) -> List[OutboxMessage]:
+        # SKIP LOCKED lets several dispatchers claim disjoint batches without waiting
+        # on each other, sqlite has no row locks and ignores it
+        orm_messages = self.session.scalars(
+            select(OutboxMessageModel)
+            .where(
+                OutboxMessageModel.status == OutboxStatus.PENDING,
+                OutboxMessageModel.available_at <= now,
+            )
+            .order_by(OutboxMessageModel.available_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        for orm_message in orm_messages:
+            orm_message.attempts += 1
+            orm_message.available_at = now + lease
+
+        self.session.flush()
+
+        return [self._to_dto(orm_message) for orm_message in orm_messages]
+
+    def mark_dispatched(self, message_id: UUID, *, dispatched_at: datetime) -> None:
+        self.session.execute(
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id == message_id)
+            .values(status=OutboxStatus.DISPATCHED, dispatched_at=dispatched_at, last_error=None)
+        )
+
+    def mark_failed(self, message_id: UUID, *, error: str, retry_at: datetime | None) -> None:
+        if retry_at is None:
+            values = {"status": OutboxStatus.FAILED, "last_error": error}
+        else:
+            values = {"available_at": retry_at, "last_error": error}
+
+        self.session.execute(
+            update(OutboxMessageModel).where(OutboxMessageModel.id == message_id).values(**values)
+        )
+
+    def mark_deferred(self, message_id: UUID, *, error: str, retry_at: datetime) -> None:
+        self.session.execute(
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id == message_id)
+            .values(
+                available_at=retry_at,
+                last_error=error,
+                attempts=OutboxMessageModel.attempts - 1,
+            )
+        )
+
+    def _to_dto(self, orm_message: OutboxMessageModel) -> OutboxMessage:
+        return OutboxMessage(
+            id=orm_message.id,
+            event_type=orm_message.event_type,
+            handler_name=orm_message.handler_name,
+            payload=orm_message.payload,
+            created_at=orm_message.created_at,
+            available_at=orm_message.available_at,
+            status=orm_message.status,
+            attempts=orm_message.attempts,
+            last_error=orm_message.last_error,
+            dispatched_at=orm_message.dispatched_at,
+        )
+
+    def _to_model(self, message: OutboxMessage) -> OutboxMessageModel:
+        return OutboxMessageModel(
+            id=message.id,
+            event_type=message.event_type,
+            handler_name=message.handler_name,
+            payload=message.payload,
+            created_at=message.created_at,
+            available_at=message.available_at,
+            status=message.status,
+            attempts=message.attempts,
+            last_error=message.last_error,
+            dispatched_at=message.dispatched_at,
+        )
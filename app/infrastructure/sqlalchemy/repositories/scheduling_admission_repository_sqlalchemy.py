@@ -0,0 +1,239 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.application.studio.repositories.scheduling_admission_repository import (
+    SchedulingAdmissionRepository,
+)
+from app.application.studio.use_cases.DTO.find_free_artists_dto import ArtistCalendar
+from app.application.studio.use_cases.DTO.scheduling_admission_dto import SchedulingAdmission
+from app.domain.studio.appointments.entities.calendar_settings import CalendarSettings
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+from app.domain.studio.appointments.entities.working_period import WorkingPeriod
+from app.infrastructure.sqlalchemy.models.appointments import AppointmentModel
+from app.infrastructure.sqlalchemy.models.calendar_exceptions import CalendarExceptionsModel
+from app.infrastructure.sqlalchemy.models.calendar_settings import CalendarSettingsModel
+from app.infrastructure.sqlalchemy.models.users import UserModel
+from app.infrastructure.sqlalchemy.models.working_period import WorkingPeriodModel
+from app.infrastructure.sqlalchemy.repositories.appointments_repository_sqlalchemy import (
+    active_overlap_filters,
+)
+from app.infrastructure.sqlalchemy.repositories.calendar_exceptions_repository_sqlalchemy import (
+    SQLAlchemyCalendarExceptionsRepository,
+    calendar_exception_to_entity,
+)
+from sqlalchemy import and_, exists, false, select
+from sqlalchemy.orm import Session, aliased
+
+
+class SQLAlchemySchedulingAdmissionRepository(SchedulingAdmissionRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_admission(
+        self,
+        *,
+        user_id: UUID,
+        start_at: datetime,
+        end_at: datetime,
+        actor_id: UUID | None = None,
+    ) -> Optional[SchedulingAdmission]:
+        """
+        Collect the user, the calendar with the working periods that can hold the range,
+        the overlap check and the actor role in one statement. Calendar exceptions are
+        only read in a second round trip when the user has a calendar.
+        """
+        rows = self.session.execute(
+            self._admission_statement(
+                user_id=user_id, start_at=start_at, end_at=end_at, actor_id=actor_id
+            )
+        ).all()
+
+        if not rows:
+            return None
+
+        first_row = rows[0]
+
+        if first_row.calendar_user_id is None:
+            return SchedulingAdmission(
+                user_is_active=first_row.user_is_active,
+                calendar_settings=None,
+                slot_is_occupied=first_row.slot_is_occupied,
+                actor_is_admin=bool(first_row.actor_is_admin),
+            )
+
+        calendar_settings = self._calendar_settings_from_rows(rows)
+
+        calendar_exceptions = SQLAlchemyCalendarExceptionsRepository(self.session).find_overlap(
+            user_id=user_id, start_at=start_at, end_at=end_at
+        )
+
+        return SchedulingAdmission(
+            user_is_active=first_row.user_is_active,
+            calendar_settings=calendar_settings,
+            slot_is_occupied=first_row.slot_is_occupied,
+            actor_is_admin=bool(first_row.actor_is_admin),
+            calendar_exceptions=calendar_exceptions,
+        )
+
+    def find_artist_calendars(self, *, start_at: datetime, end_at: datetime) -> List[ArtistCalendar]:
+        """
+        Load the calendars of every active artist with three set-based statements,
+        whatever the number of artists: calendars with their working periods, the
+        exceptions of the range and the active appointments of the range. Joining the
+        last two to the first would multiply their rows by the working periods.
+        """
+        open_calendars = (
+            select(CalendarSettingsModel.user_id)
+            .join(UserModel, UserModel.id == CalendarSettingsModel.user_id)
+            .where(UserModel.is_active.is_(True))
+        )
+
+        calendar_rows = self.session.execute(
+            select(
+                UserModel.username,
+                CalendarSettingsModel.user_id.label("calendar_user_id"),
+                CalendarSettingsModel.booking_window_until,
+                CalendarSettingsModel.created_at.label("calendar_created_at"),
+                CalendarSettingsModel.updated_at.label("calendar_updated_at"),
+                WorkingPeriodModel.id.label("period_id"),
+                WorkingPeriodModel.weekday.label("period_weekday"),
+                WorkingPeriodModel.start_at.label("period_start_at"),
+                WorkingPeriodModel.end_at.label("period_end_at"),
+                WorkingPeriodModel.created_at.label("period_created_at"),
+                WorkingPeriodModel.updated_at.label("period_updated_at"),
+            )
+            .select_from(CalendarSettingsModel)
+            .join(UserModel, UserModel.id == CalendarSettingsModel.user_id)
+            .outerjoin(
+                WorkingPeriodModel,
+                WorkingPeriodModel.calendar_settings_user_id == CalendarSettingsModel.user_id,
+            )
+            .where(UserModel.is_active.is_(True))
+            .order_by(UserModel.username.asc(), WorkingPeriodModel.start_at.asc())
+        ).all()
+
+        exceptions_by_user: dict[UUID, list] = {}
+
+        for orm_exception in self.session.scalars(
+            select(CalendarExceptionsModel)
+            .where(
+                CalendarExceptionsModel.calendar_of_user.in_(open_calendars),
+                CalendarExceptionsModel.start_at < end_at,
+                CalendarExceptionsModel.end_at > start_at,
+            )
+            .order_by(CalendarExceptionsModel.start_at.asc(), CalendarExceptionsModel.end_at.asc())
+        ):
+            exceptions_by_user.setdefault(orm_exception.calendar_of_user, []).append(
+                calendar_exception_to_entity(orm_exception)
+            )
+
+        booked_by_user: dict[UUID, list[TimeSlot]] = {}
+
+        for appointment_row in self.session.execute(
+            select(AppointmentModel.user_id, AppointmentModel.start_at, AppointmentModel.end_at)
+            .where(
+                AppointmentModel.user_id.in_(open_calendars),
+                *active_overlap_filters(
+                    start_date=start_at,
+                    end_date=end_at,
+                    user_id=None,
+                    is_postgres=self.session.get_bind().dialect.name == "postgresql",
+                ),
+            )
+            .order_by(AppointmentModel.start_at.asc())
+        ):
+            booked_by_user.setdefault(appointment_row.user_id, []).append(
+                TimeSlot(start_at=appointment_row.start_at, end_at=appointment_row.end_at)
+            )
+
+        rows_by_user: dict[UUID, list] = {}
+        for row in calendar_rows:
+            rows_by_user.setdefault(row.calendar_user_id, []).append(row)
+
+        return [
+            ArtistCalendar(
+                user_id=user_id,
+                username=rows[0].username,
+                calendar_settings=self._calendar_settings_from_rows(rows),
+                calendar_exceptions=exceptions_by_user.get(user_id, []),
+                booked_slots=booked_by_user.get(user_id, []),
+            )
+            for user_id, rows in rows_by_user.items()
+        ]
+
+    @staticmethod
+    def _calendar_settings_from_rows(rows) -> CalendarSettings:
+        first_row = rows[0]
+
+        return CalendarSettings(
+            user_id=first_row.calendar_user_id,
+            booking_window_until=first_row.booking_window_until,
+            working_periods=[
+                WorkingPeriod(
+                    id=row.period_id,
+                    weekday=row.period_weekday,
+                    start_at=row.period_start_at,
+                    end_at=row.period_end_at,
+                    created_at=row.period_created_at,
+                    updated_at=row.period_updated_at,
+                )
+                for row in rows
+                if row.period_id is not None
+            ],
+            created_at=first_row.calendar_created_at,
+            updated_at=first_row.calendar_updated_at,
+        )
+
+    def _admission_statement(
+        self,
+        *,
+        user_id: UUID,
+        start_at: datetime,
+        end_at: datetime,
+        actor_id: UUID | None,
+    ):
+        actor = aliased(UserModel)
+
+        if actor_id is not None:
+            actor_is_admin = select(actor.is_admin).where(actor.id == actor_id).scalar_subquery()
+        else:
+            actor_is_admin = false()
+
+        slot_is_occupied = exists().where(
+            *active_overlap_filters(
+                start_date=start_at,
+                end_date=end_at,
+                user_id=user_id,
+                is_postgres=self.session.get_bind().dialect.name == "postgresql",
+            )
+        )
+
+        period_filters = [WorkingPeriodModel.calendar_settings_user_id == CalendarSettingsModel.user_id]
+
+        # an overnight range is refused by WorkingPeriod itself, it needs every period to do so
+        if start_at.weekday() == end_at.weekday():
+            period_filters.append(WorkingPeriodModel.weekday == start_at.weekday())
+
+        return (
+            select(
+                UserModel.is_active.label("user_is_active"),
+                actor_is_admin.label("actor_is_admin"),
+                slot_is_occupied.label("slot_is_occupied"),
+                CalendarSettingsModel.user_id.label("calendar_user_id"),
+                CalendarSettingsModel.booking_window_until,
+                CalendarSettingsModel.created_at.label("calendar_created_at"),
+                CalendarSettingsModel.updated_at.label("calendar_updated_at"),
+                WorkingPeriodModel.id.label("period_id"),
+                WorkingPeriodModel.weekday.label("period_weekday"),
+                WorkingPeriodModel.start_at.label("period_start_at"),
+                WorkingPeriodModel.end_at.label("period_end_at"),
+                WorkingPeriodModel.created_at.label("period_created_at"),
+                WorkingPeriodModel.updated_at.label("period_updated_at"),
+            )
+            .select_from(UserModel)
+            .outerjoin(CalendarSettingsModel, CalendarSettingsModel.user_id == UserModel.id)
+            .outerjoin(WorkingPeriodModel, and_(*period_filters))
+            .where(UserModel.id == user_id)
+            .order_by(WorkingPeriodModel.start_at.asc())
+        )
@@ -1,10 +1,13 @@
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+
 from app.application.studio.repositories.users_repository import UsersRepository
 from app.domain.studio.users.entities.user import User
+from app.infrastructure.sqlalchemy.access_changes import mark_access_changed
+from app.infrastructure.sqlalchemy.calendar_changes import mark_calendar_changed
 from app.infrastructure.sqlalchemy.models.users import UserModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 
 class SQLAlchemyUsersRepository(UsersRepository):
@@ -28,9 +31,7 @@ class SQLAlchemyUsersRepository(UsersRepository):
         self.session.flush()
 
     def update(self, user: User) -> None:
-        user_in_question = select(UserModel).where(UserModel.id == user.id)
-
-        orm_user = self.session.scalar(user_in_question)
+        orm_user = self.session.get(UserModel, user.id)
         if orm_user is None:
             return
 
@@ -44,10 +45,12 @@ class SQLAlchemyUsersRepository(UsersRepository):
         orm_user.updated_at = user.updated_at
 
         self.session.flush()
+        mark_calendar_changed(self.session, user.id)
+        mark_access_changed(self.session, user.id)
 
     def find_by_id(self, userId: UUID) -> Optional[User]:
-        user_in_question = select(UserModel).where(UserModel.id == userId)
-        orm_user = self.session.scalar(user_in_question)
+        # served from the identity map when the request already loaded this user
+        orm_user = self.session.get(UserModel, userId)
 
         return self._to_entity(orm_user)
 
@@ -1,6 +1,8 @@
+from typing import Callable
+
 from app.core.config import settings
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 
 if settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
@@ -12,3 +14,49 @@ engine = create_engine(
 )
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def _hold_instance(session: Session, instance) -> None:
+    session.info.setdefault("held_instances", set()).add(instance)
+
+
+def _release_instance(session: Session, instance) -> None:
+    session.info.get("held_instances", set()).discard(instance)
+
+
+def hold_identity_map(target) -> None:
+    """
+    The identity map only keeps weak references, so a row loaded by one repository
+    call is gone by the next one. Keep the loaded and flushed instances alive until
+    they leave the session, which close() does at the end of the request.
+    """
+    event.listen(target, "loaded_as_persistent", _hold_instance)
+    event.listen(target, "pending_to_persistent", _hold_instance)
+    event.listen(target, "persistent_to_detached", _release_instance)
+    event.listen(target, "persistent_to_deleted", _release_instance)
+    event.listen(target, "persistent_to_transient", _release_instance)
+
+
+hold_identity_map(SessionLocal)
+
+
+class RequestSession:
+    """
+    One session shared by every unit of work of a request, opened the first time one
+    of them needs it. Reads then go through the same identity map as the writes, so a
+    row loaded by the auth dependency is not fetched again by the use case.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self._session_factory = session_factory
+        self._session: Session | None = None
+
+    def __call__(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
@@ -1,49 +1,8 @@
-from sqlalchemy.orm import Session
-
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
-from app.infrastructure.sqlalchemy.repositories.appointments_repository_sqlalchemy import (
-    SQLAlchemyAppointmentsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.audit_logs_repository import (
-    SQLAlchemyAuditLogsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.calendar_exceptions_repository_sqlalchemy import (
-    SQLAlchemyCalendarExceptionsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.calendar_settings_repository_sqlalchemy import (
-    SQLAlchemyCalendarSettingsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.client_credit_entries_repository import (
-    SQLAlchemyClientCreditEntriesRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.payments_repository_sqlalchemy import (
-    SQLAlchemyPaymentsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.refunds_repository_sqlalchemy import (
-    SQLAlchemyRefundsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.users_repository_sqlalchemy import (
-    SQLAlchemyUsersRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.vip_clients_repository_sqlalchemy import (
-    SQLAlchemyVipClientsRepository,
-)
-from app.infrastructure.sqlalchemy.session import SessionLocal
-
+from app.infrastructure.sqlalchemy.unit_of_work.sqlalchemy_repositories import SqlAlchemyRepositories
 
-class SqlAlchemyReadUnitOfWork(ReadUnitOfWork):
-    def __init__(self, session: Session | None = None):
-        self.session: Session = session or SessionLocal()
-        self.users = SQLAlchemyUsersRepository(self.session)
-        self.vip_clients = SQLAlchemyVipClientsRepository(self.session)
-        self.client_credit_entries = SQLAlchemyClientCreditEntriesRepository(self.session)
-        self.payments = SQLAlchemyPaymentsRepository(self.session)
-        self.appointments = SQLAlchemyAppointmentsRepository(self.session)
-        self.audit_logs = SQLAlchemyAuditLogsRepository(self.session)
-        self.refunds = SQLAlchemyRefundsRepository(self.session)
-        self.calendar_settings = SQLAlchemyCalendarSettingsRepository(self.session)
-        self.calendar_exceptions = SQLAlchemyCalendarExceptionsRepository(self.session)
 
+class SqlAlchemyReadUnitOfWork(SqlAlchemyRepositories, ReadUnitOfWork):
     def __enter__(self):
         return self
 
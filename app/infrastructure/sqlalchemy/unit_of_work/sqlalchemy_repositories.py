@@ -0,0 +1,132 @@
+from functools import cached_property
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.sqlalchemy.repositories.appointment_digests_repository_sqlalchemy import (
+    SQLAlchemyAppointmentRequestDigestsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.appointments_repository_sqlalchemy import (
+    SQLAlchemyAppointmentsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.audit_logs_repository import (
+    SQLAlchemyAuditLogsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.calendar_exceptions_repository_sqlalchemy import (
+    SQLAlchemyCalendarExceptionsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.calendar_settings_repository_sqlalchemy import (
+    SQLAlchemyCalendarSettingsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.client_credit_entries_repository import (
+    SQLAlchemyClientCreditEntriesRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.job_runs_repository_sqlalchemy import (
+    SQLAlchemyJobRunsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.outbox_repository_sqlalchemy import (
+    SQLAlchemyOutboxRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.payments_repository_sqlalchemy import (
+    SQLAlchemyPaymentsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.refunds_repository_sqlalchemy import (
+    SQLAlchemyRefundsRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.scheduling_admission_repository_sqlalchemy import (
+    SQLAlchemySchedulingAdmissionRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.users_repository_sqlalchemy import (
+    SQLAlchemyUsersRepository,
+)
+from app.infrastructure.sqlalchemy.repositories.vip_clients_repository_sqlalchemy import (
+    SQLAlchemyVipClientsRepository,
+)
+from app.infrastructure.sqlalchemy.session import SessionLocal
+
+
+class SqlAlchemyRepositories:
+    """
+    Session and repositories shared by the SQLAlchemy units of work. Nothing is built
+    until it is used: a route that never queries never opens a session, and a route
+    that reads one table only builds that repository. The session itself only checks
+    out a pool connection when its first statement runs.
+
+    `session_factory` lets several units of work share a RequestSession.
+    """
+
+    def __init__(
+        self,
+        session: Session | None = None,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self._session = session
+        self._session_factory = session_factory
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+
+        return self._session
+
+    @property
+    def has_session(self) -> bool:
+        return self._session is not None
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    @cached_property
+    def users(self) -> SQLAlchemyUsersRepository:
+        return SQLAlchemyUsersRepository(self.session)
+
+    @cached_property
+    def vip_clients(self) -> SQLAlchemyVipClientsRepository:
+        return SQLAlchemyVipClientsRepository(self.session)
+
+    @cached_property
+    def client_credit_entries(self) -> SQLAlchemyClientCreditEntriesRepository:
+        return SQLAlchemyClientCreditEntriesRepository(self.session)
+
+    @cached_property
+    def payments(self) -> SQLAlchemyPaymentsRepository:
+        return SQLAlchemyPaymentsRepository(self.session)
+
+    @cached_property
+    def appointments(self) -> SQLAlchemyAppointmentsRepository:
+        return SQLAlchemyAppointmentsRepository(self.session)
+
+    @cached_property
+    def audit_logs(self) -> SQLAlchemyAuditLogsRepository:
+        return SQLAlchemyAuditLogsRepository(self.session)
+
+    @cached_property
+    def refunds(self) -> SQLAlchemyRefundsRepository:
+        return SQLAlchemyRefundsRepository(self.session)
+
+    @cached_property
+    def calendar_settings(self) -> SQLAlchemyCalendarSettingsRepository:
+        return SQLAlchemyCalendarSettingsRepository(self.session)
+
+    @cached_property
+    def calendar_exceptions(self) -> SQLAlchemyCalendarExceptionsRepository:
+        return SQLAlchemyCalendarExceptionsRepository(self.session)
+
+    @cached_property
+    def scheduling_admission(self) -> SQLAlchemySchedulingAdmissionRepository:
+        return SQLAlchemySchedulingAdmissionRepository(self.session)
+
+    @cached_property
+    def outbox(self) -> SQLAlchemyOutboxRepository:
+        return SQLAlchemyOutboxRepository(self.session)
+
+    @cached_property
+    def appointment_request_digests(self) -> SQLAlchemyAppointmentRequestDigestsRepository:
+        return SQLAlchemyAppointmentRequestDigestsRepository(self.session)
+
+    @cached_property
+    def job_runs(self) -> SQLAlchemyJobRunsRepository:
+        return SQLAlchemyJobRunsRepository(self.session)
@@ -1,48 +1,32 @@
+from typing import Callable
+
 from sqlalchemy.orm import Session
 
+from app.application.studio.services.access_token_cache import AccessTokenCache
+from app.application.studio.services.calendar_index import CalendarIndex
 from app.application.studio.unit_of_work.write_unit_of_work import WriteUnitOfWork
-from app.infrastructure.sqlalchemy.repositories.appointments_repository_sqlalchemy import (
-    SQLAlchemyAppointmentsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.audit_logs_repository import (
-    SQLAlchemyAuditLogsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.calendar_exceptions_repository_sqlalchemy import (
-    SQLAlchemyCalendarExceptionsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.calendar_settings_repository_sqlalchemy import (
-    SQLAlchemyCalendarSettingsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.client_credit_entries_repository import (
-    SQLAlchemyClientCreditEntriesRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.payments_repository_sqlalchemy import (
-    SQLAlchemyPaymentsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.refunds_repository_sqlalchemy import (
-    SQLAlchemyRefundsRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.users_repository_sqlalchemy import (
-    SQLAlchemyUsersRepository,
-)
-from app.infrastructure.sqlalchemy.repositories.vip_clients_repository_sqlalchemy import (
-    SQLAlchemyVipClientsRepository,
+from app.infrastructure.sqlalchemy.access_changes import (
+    access_token_cache as default_access_token_cache,
 )
+from app.infrastructure.sqlalchemy.access_changes import pop_access_changes
+from app.infrastructure.sqlalchemy.calendar_changes import calendar_index as default_calendar_index
+from app.infrastructure.sqlalchemy.calendar_changes import pop_calendar_changes
 from app.infrastructure.sqlalchemy.session import SessionLocal
+from app.infrastructure.sqlalchemy.unit_of_work.sqlalchemy_repositories import SqlAlchemyRepositories
 
 
-class SqlAlchemyWriteUnitOfWork(WriteUnitOfWork):
-    def __init__(self, session: Session | None = None):
-        self.session: Session = session or SessionLocal()
-        self.users = SQLAlchemyUsersRepository(self.session)
-        self.vip_clients = SQLAlchemyVipClientsRepository(self.session)
-        self.client_credit_entries = SQLAlchemyClientCreditEntriesRepository(self.session)
-        self.payments = SQLAlchemyPaymentsRepository(self.session)
-        self.appointments = SQLAlchemyAppointmentsRepository(self.session)
-        self.audit_logs = SQLAlchemyAuditLogsRepository(self.session)
-        self.refunds = SQLAlchemyRefundsRepository(self.session)
-        self.calendar_settings = SQLAlchemyCalendarSettingsRepository(self.session)
-        self.calendar_exceptions = SQLAlchemyCalendarExceptionsRepository(self.session)
+class SqlAlchemyWriteUnitOfWork(SqlAlchemyRepositories, WriteUnitOfWork):
+    def __init__(
+        self,
+        session: Session | None = None,
+        calendar_index: CalendarIndex | None = None,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+        access_token_cache: AccessTokenCache | None = None,
+    ):
+        super().__init__(session, session_factory=session_factory)
+        self.calendar_index = calendar_index or default_calendar_index
+        self.access_token_cache = access_token_cache or default_access_token_cache
 
     def __enter__(self):
         return self
@@ -54,10 +38,21 @@ class SqlAlchemyWriteUnitOfWork(WriteUnitOfWork):
             else:
                 self.commit()
         finally:
-            self.session.close()
+            self.close()
 
     def commit(self):
+        # nothing was read or written, there is no transaction to end
+        if not self.has_session:
+            return
+
         self.session.commit()
+        self.calendar_index.invalidate(pop_calendar_changes(self.session))
+        self.access_token_cache.invalidate_users(pop_access_changes(self.session))
 
     def rollback(self):
+        if not self.has_session:
+            return
+
         self.session.rollback()
+        pop_calendar_changes(self.session)
+        pop_access_changes(self.session)
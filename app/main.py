@@ -1,27 +1,106 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import router as api_router
+from app.api.dependencies.login_rate_limiter import login_rate_limiter
+from app.application.event_bus.outbox_dispatcher import OutboxDispatcher
 from app.application.event_bus.setup import setup_event_bus
+from app.application.notifications.services.circuit_breaker import CircuitBreaker
+from app.application.notifications.services.coalescing_email_service import CoalescingEmailService
+from app.application.notifications.services.resilient_email_service import ResilientEmailService
+from app.application.studio.services.appointment_request_digest_job import AppointmentRequestDigestJob
+from app.application.studio.services.credit_balance_reconciliation_job import (
+    CreditBalanceReconciliationJob,
+)
+from app.core.config import settings
 from app.core.security import jwt_service
 from app.infrastructure.email.brevo_email_service import BrevoEmailService
+from app.infrastructure.sqlalchemy.login_rate_limiter import SqlAlchemyLoginRateLimiter
+from app.infrastructure.sqlalchemy.unit_of_work.read_unit_of_work import SqlAlchemyReadUnitOfWork
+from app.infrastructure.sqlalchemy.unit_of_work.write_unit_of_work import SqlAlchemyWriteUnitOfWork
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    email_service = BrevoEmailService()
+    brevo_email_service = BrevoEmailService()
+    email_service = CoalescingEmailService(
+        ResilientEmailService(
+            brevo_email_service,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.EMAIL_CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=timedelta(seconds=settings.EMAIL_CIRCUIT_RESET_SECONDS),
+            ),
+            max_attempts=settings.EMAIL_RETRY_MAX_ATTEMPTS,
+            base_delay=timedelta(seconds=settings.EMAIL_RETRY_BASE_DELAY_SECONDS),
+            max_delay=timedelta(seconds=settings.EMAIL_RETRY_MAX_DELAY_SECONDS),
+        ),
+        window=timedelta(seconds=settings.EMAIL_COALESCE_WINDOW_SECONDS),
+        max_batch_size=settings.EMAIL_COALESCE_MAX_BATCH_SIZE,
+    )
     token_service = jwt_service
 
     transactional_bus, integration_bus = setup_event_bus(
-        email_service=email_service, token_service=token_service
+        email_service=email_service,
+        token_service=token_service,
+        read_uow_factory=SqlAlchemyReadUnitOfWork,
+        write_uow_factory=SqlAlchemyWriteUnitOfWork,
     )
 
+    app.state.email_service = email_service
     app.state.transactional_bus = transactional_bus
     app.state.integration_bus = integration_bus
 
+    dispatcher_task = None
+    if settings.OUTBOX_DISPATCHER_ENABLED:
+        dispatcher = OutboxDispatcher(
+            integration_bus=integration_bus,
+            write_uow_factory=SqlAlchemyWriteUnitOfWork,
+            read_uow_factory=SqlAlchemyReadUnitOfWork,
+            batch_size=settings.OUTBOX_BATCH_SIZE,
+            poll_interval=timedelta(seconds=settings.OUTBOX_POLL_INTERVAL_SECONDS),
+            max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+        )
+        dispatcher_task = asyncio.create_task(dispatcher.run())
+
+    digest_task = None
+    if settings.APPOINTMENT_REQUEST_DIGEST_ENABLED:
+        digest_job = AppointmentRequestDigestJob(
+            integration_bus=integration_bus,
+            write_uow_factory=SqlAlchemyWriteUnitOfWork,
+            interval=timedelta(seconds=settings.APPOINTMENT_REQUEST_DIGEST_INTERVAL_SECONDS),
+        )
+        digest_task = asyncio.create_task(digest_job.run())
+
+    reconciliation_task = None
+    if settings.CREDIT_BALANCE_RECONCILIATION_ENABLED:
+        reconciliation_job = CreditBalanceReconciliationJob(
+            write_uow_factory=SqlAlchemyWriteUnitOfWork,
+            interval=timedelta(seconds=settings.CREDIT_BALANCE_RECONCILIATION_INTERVAL_SECONDS),
+            repair=settings.CREDIT_BALANCE_RECONCILIATION_REPAIR,
+        )
+        reconciliation_task = asyncio.create_task(reconciliation_job.run())
+
+    login_attempts_task = None
+    if isinstance(login_rate_limiter, SqlAlchemyLoginRateLimiter):
+        login_attempts_task = asyncio.create_task(login_rate_limiter.run())
+
     yield
 
+    # claimed messages left unfinished are claimed again once their lease ends, a
+    # cancelled digest run rolls back and leaves its entries for the next one
+    for task in (dispatcher_task, digest_task, reconciliation_task, login_attempts_task):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    await integration_bus.close(timeout=settings.INTEGRATION_SHUTDOWN_TIMEOUT_SECONDS)
+    await email_service.flush()
+    await brevo_email_service.aclose()
+
 
 app = FastAPI(title="sereia-tattoo-api", lifespan=lifespan)
 
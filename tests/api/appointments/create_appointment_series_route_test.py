@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies.events import get_integration_event_bus
+from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
+from app.api.dependencies.write_unit_of_work import get_write_unit_of_work
+from app.main import app
+
+client = TestClient(app)
+
+
+def _payload(user_id, sessions) -> dict:
+    return {
+        "appointment_type": "tattoo",
+        "user_id": f"{user_id}",
+        "sessions": [
+            {"start_at": f"{start_at}", "end_at": f"{end_at}"} for start_at, end_at in sessions
+        ],
+        "placement": "costas",
+        "details": "Fechamento de costas",
+        "size": "60cm",
+        "color": True,
+        "name": "Jane Doe",
+        "email": "jane@doe.com",
+        "phone": "71988888888",
+    }
+
+
+def _next_day() -> datetime:
+    base_now = datetime.now(timezone.utc).replace(hour=8, minute=0, second=0, microsecond=0)
+
+    return base_now + timedelta(days=1)
+
+
+def test_create_appointment_series_route_success(
+    make_user,
+    write_uow,
+    read_uow,
+    fake_integration_event_bus,
+    make_calendar_settings,
+):
+    user = make_user()
+    write_uow.users.create(user)
+
+    next_day = _next_day()
+    booking_window_until = (next_day + timedelta(days=30)).date()
+    write_uow.calendar_settings.create(
+        make_calendar_settings(user_id=user.id, booking_window_until=booking_window_until)
+    )
+
+    sessions = [
+        (next_day + timedelta(weeks=week, hours=1), next_day + timedelta(weeks=week, hours=3))
+        for week in range(3)
+    ]
+
+    app.dependency_overrides[get_integration_event_bus] = lambda: fake_integration_event_bus
+    app.dependency_overrides[get_write_unit_of_work] = lambda: write_uow
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.post("/appointments/series", json=_payload(user.id, sessions))
+
+    assert response.status_code == 201
+
+    found = read_uow.appointments.find_overlap(
+        user_id=user.id, start_date=sessions[0][0], end_date=sessions[-1][1]
+    )
+    logs = read_uow.audit_logs.find_many_by_entity_name(entity_name="appointments")
+
+    assert [appointment.start_at for appointment in found] == [start_at for start_at, _ in sessions]
+    assert [appointment.current_session for appointment in found] == [1, 2, 3]
+    assert len(logs) == 3
+    assert len(fake_integration_event_bus.events) == 1
+
+
+def test_create_appointment_series_with_overlapping_sessions(
+    make_user,
+    write_uow,
+    read_uow,
+    fake_integration_event_bus,
+    make_calendar_settings,
+):
+    user = make_user()
+    write_uow.users.create(user)
+
+    next_day = _next_day()
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    sessions = [
+        (next_day + timedelta(hours=1), next_day + timedelta(hours=3)),
+        (next_day + timedelta(hours=2), next_day + timedelta(hours=4)),
+    ]
+
+    app.dependency_overrides[get_integration_event_bus] = lambda: fake_integration_event_bus
+    app.dependency_overrides[get_write_unit_of_work] = lambda: write_uow
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.post("/appointments/series", json=_payload(user.id, sessions))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "invalid_appointment_series"
+
+
+def test_create_appointment_series_with_one_occupied_session(
+    make_user,
+    write_uow,
+    read_uow,
+    fake_integration_event_bus,
+    make_appointment_base,
+    make_calendar_settings,
+):
+    user = make_user()
+    write_uow.users.create(user)
+
+    next_day = _next_day()
+    booking_window_until = (next_day + timedelta(days=30)).date()
+    write_uow.calendar_settings.create(
+        make_calendar_settings(user_id=user.id, booking_window_until=booking_window_until)
+    )
+
+    sessions = [
+        (next_day + timedelta(weeks=week, hours=1), next_day + timedelta(weeks=week, hours=3))
+        for week in range(2)
+    ]
+    write_uow.appointments.create(
+        make_appointment_base(user_id=user.id, start_at=sessions[1][0], end_at=sessions[1][1])
+    )
+
+    app.dependency_overrides[get_integration_event_bus] = lambda: fake_integration_event_bus
+    app.dependency_overrides[get_write_unit_of_work] = lambda: write_uow
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.post("/appointments/series", json=_payload(user.id, sessions))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "the_time_slot_required_is_occupied"
+    assert fake_integration_event_bus.events == []
+
+
+def test_create_appointment_series_without_sessions(
+    make_user,
+    write_uow,
+    read_uow,
+    fake_integration_event_bus,
+):
+    user = make_user()
+    write_uow.users.create(user)
+
+    app.dependency_overrides[get_integration_event_bus] = lambda: fake_integration_event_bus
+    app.dependency_overrides[get_write_unit_of_work] = lambda: write_uow
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.post("/appointments/series", json=_payload(user.id, []))
+
+    assert response.status_code == 422
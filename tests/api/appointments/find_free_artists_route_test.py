@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
+from app.main import app
+
+client = TestClient(app)
+
+
+def _next_day() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+
+
+def test_find_free_artists_route_success(make_user, read_uow, write_uow, make_calendar_settings):
+    artist = make_user()
+    write_uow.users.create(artist)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=artist.id))
+
+    next_day = _next_day()
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments/free-artists",
+        params={
+            "start_at": (next_day + timedelta(hours=8)).isoformat(),
+            "end_at": (next_day + timedelta(hours=12)).isoformat(),
+            "appointment_type": "tattoo",
+            "duration_minutes": 120,
+            "step_minutes": 60,
+        },
+    )
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["appointment_type"] == "tattoo"
+    assert body["duration_minutes"] == 120
+    assert len(body["artists"]) == 1
+    assert body["artists"][0]["user_id"] == str(artist.id)
+    assert len(body["artists"][0]["earliest_openings"]) == 3
+
+
+def test_find_free_artists_route_invalid_range(read_uow):
+    next_day = _next_day()
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments/free-artists",
+        params={
+            "start_at": next_day.isoformat(),
+            "end_at": (next_day - timedelta(hours=1)).isoformat(),
+            "appointment_type": "tattoo",
+            "duration_minutes": 60,
+        },
+    )
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "invalid_search_range"
+
+
+def test_find_free_artists_route_requires_appointment_type(read_uow):
+    next_day = _next_day()
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments/free-artists",
+        params={
+            "start_at": next_day.isoformat(),
+            "end_at": (next_day + timedelta(hours=4)).isoformat(),
+            "duration_minutes": 60,
+        },
+    )
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 422
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_list_appointments_route_success(
+    make_user, make_token, write_uow, read_uow, make_quoted_appointment
+):
+    admin = make_user(is_admin=True)
+    write_uow.users.create(admin)
+    token = make_token(admin)
+
+    base_time = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+    for i in range(3):
+        appointment = make_quoted_appointment(
+            user_id=admin.id,
+            start_at=base_time + timedelta(days=i),
+            end_at=base_time + timedelta(days=i, hours=1),
+        )
+        appointment.created_at = base_time + timedelta(minutes=i)
+        write_uow.appointments.create(appointment)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    first = client.get(
+        "/appointments",
+        params={"limit": 2},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    second = client.get(
+        "/appointments",
+        params={"limit": 2, "cursor": first.json()["next_cursor"]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    app.dependency_overrides = {}
+
+    assert first.status_code == 200
+    assert len(first.json()["appointments"]) == 2
+    assert first.json()["prev_cursor"] is None
+    assert first.json()["next_cursor"] is not None
+
+    assert second.status_code == 200
+    assert len(second.json()["appointments"]) == 1
+    assert second.json()["next_cursor"] is None
+    assert second.json()["prev_cursor"] is not None
+
+
+def test_list_appointments_route_invalid_cursor(make_user, make_token, write_uow, read_uow):
+    admin = make_user(is_admin=True)
+    write_uow.users.create(admin)
+    token = make_token(admin)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments",
+        params={"cursor": "garbage"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    app.dependency_overrides = {}
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "invalid_cursor"
+
+
+def test_list_appointments_route_other_user_calendar(make_user, make_token, write_uow, read_uow):
+    artist = make_user()
+    other_artist = make_user()
+    write_uow.users.create(artist)
+    write_uow.users.create(other_artist)
+    token = make_token(artist)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments",
+        params={"user_id": str(other_artist.id)},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    app.dependency_overrides = {}
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "unauthorized_user"
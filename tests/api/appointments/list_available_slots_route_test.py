@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_list_available_slots_route_success(make_user, read_uow, write_uow, make_calendar_settings):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    next_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments/available-slots",
+        params={
+            "user_id": str(user.id),
+            "start_at": next_day.isoformat(),
+            "end_at": (next_day + timedelta(days=1)).isoformat(),
+            "duration_minutes": 120,
+            "step_minutes": 60,
+        },
+    )
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["user_id"] == str(user.id)
+    assert body["duration_minutes"] == 120
+    assert len(body["slots"]) == 3
+
+
+def test_list_available_slots_route_invalid_range(read_uow):
+    next_day = datetime.now(timezone.utc) + timedelta(days=1)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments/available-slots",
+        params={
+            "user_id": str(uuid4()),
+            "start_at": next_day.isoformat(),
+            "end_at": (next_day + timedelta(days=60)).isoformat(),
+            "duration_minutes": 60,
+        },
+    )
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "invalid_search_range"
+
+
+def test_list_available_slots_route_user_not_found(read_uow):
+    next_day = datetime.now(timezone.utc) + timedelta(days=1)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments/available-slots",
+        params={
+            "user_id": str(uuid4()),
+            "start_at": next_day.isoformat(),
+            "end_at": (next_day + timedelta(days=1)).isoformat(),
+            "duration_minutes": 60,
+        },
+    )
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "user_does_not_exists_or_is_inactive"
+
+
+def test_list_available_slots_route_requires_duration(read_uow):
+    next_day = datetime.now(timezone.utc) + timedelta(days=1)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+
+    response = client.get(
+        "/appointments/available-slots",
+        params={
+            "user_id": str(uuid4()),
+            "start_at": next_day.isoformat(),
+            "end_at": (next_day + timedelta(days=1)).isoformat(),
+        },
+    )
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 422
@@ -1,5 +1,6 @@
 from fastapi.testclient import TestClient
 from app.api.dependencies.read_unit_of_work import get_read_unit_of_work
+from app.core.config import settings
 from app.core.security import jwt_service
 from app.main import app
 
@@ -176,3 +177,66 @@ def test_login_invalid_payload_types(read_uow):
 
     response = client.post("/auth/login", json=payload)
     assert response.status_code == 422
+
+
+def test_login_is_refused_over_identifier_budget(write_uow, read_uow, make_user, mocker):
+    user = make_user()
+    write_uow.users.create(user)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+    mocker.patch.object(settings, "LOGIN_MAX_ATTEMPTS_PER_IDENTIFIER", 2)
+
+    payload = {"identifier": user.username, "password": "wrong_password"}
+
+    assert client.post("/auth/login", json=payload).status_code == 401
+    assert client.post("/auth/login", json=payload).status_code == 401
+
+    find_by_username = mocker.spy(read_uow.users, "find_by_username")
+
+    response = client.post(
+        "/auth/login", json={"identifier": user.username.upper(), "password": "123456"}
+    )
+
+    assert response.status_code == 429
+    assert response.json()["detail"] == "too_many_login_attempts"
+    assert 0 < int(response.headers["Retry-After"]) <= settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS
+    find_by_username.assert_not_called()
+
+    app.dependency_overrides = {}
+
+
+def test_login_is_refused_over_ip_budget(write_uow, read_uow, make_user, mocker):
+    user = make_user()
+    write_uow.users.create(user)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+    mocker.patch.object(settings, "LOGIN_MAX_ATTEMPTS_PER_IP", 2)
+
+    for identifier in ("someone", "someone_else"):
+        payload = {"identifier": identifier, "password": "123456"}
+        assert client.post("/auth/login", json=payload).status_code == 401
+
+    response = client.post("/auth/login", json={"identifier": user.username, "password": "123456"})
+
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+
+    app.dependency_overrides = {}
+
+
+def test_successful_login_clears_identifier_budget(write_uow, read_uow, make_user, mocker):
+    user = make_user()
+    write_uow.users.create(user)
+
+    app.dependency_overrides[get_read_unit_of_work] = lambda: read_uow
+    mocker.patch.object(settings, "LOGIN_MAX_ATTEMPTS_PER_IDENTIFIER", 2)
+
+    wrong_payload = {"identifier": user.username, "password": "wrong_password"}
+    right_payload = {"identifier": user.username, "password": "123456"}
+
+    assert client.post("/auth/login", json=wrong_payload).status_code == 401
+    assert client.post("/auth/login", json=right_payload).status_code == 200
+    assert client.post("/auth/login", json=wrong_payload).status_code == 401
+    assert client.post("/auth/login", json=right_payload).status_code == 200
+
+    app.dependency_overrides = {}
@@ -48,3 +48,108 @@ async def test_transactional_event_bus_dispatch():
     await bus.publish(TestEvent(), uow={})
 
     assert handled
+
+
+@pytest.mark.asyncio
+async def test_integration_event_bus_writes_one_outbox_message_per_handler(write_uow):
+    bus = IntegrationEventBus()
+
+    handled = False
+
+    class FirstHandler:
+        async def handle(self, event):
+            nonlocal handled
+            handled = True
+
+    class SecondHandler(FirstHandler):
+        pass
+
+    class TestEvent:
+        def __init__(self, email: str):
+            self.email = email
+
+    bus.register(TestEvent, FirstHandler())
+    bus.register(TestEvent, SecondHandler())
+
+    await bus.publish(TestEvent(email="jhon@doe.com"), uow=write_uow)
+
+    await asyncio.sleep(0)
+
+    messages = list(write_uow.outbox.messages.values())
+
+    assert handled is False
+    assert {message.handler_name for message in messages} == {"FirstHandler", "SecondHandler"}
+    assert all(message.event_type == "TestEvent" for message in messages)
+    assert all(message.payload == {"email": "jhon@doe.com"} for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_integration_event_bus_gives_handlers_its_read_uow_factory(read_uow):
+    bus = IntegrationEventBus(read_uow_factory=lambda: read_uow)
+
+    received = []
+
+    class TestHandler:
+        async def handle(self, event, *, uow_factory):
+            received.append(uow_factory())
+
+    class TestEvent:
+        pass
+
+    bus.register(TestEvent, TestHandler())
+
+    await bus.publish(TestEvent())
+
+    await asyncio.sleep(0)
+
+    assert received == [read_uow]
+
+
+@pytest.mark.asyncio
+async def test_integration_event_bus_close_writes_unfinished_handlers_to_outbox(write_uow):
+    bus = IntegrationEventBus(write_uow_factory=lambda: write_uow)
+    release = asyncio.Event()
+
+    class SlowHandler:
+        async def handle(self, event):
+            await release.wait()
+
+    class TestEvent:
+        def __init__(self, email: str):
+            self.email = email
+
+    bus.register(TestEvent, SlowHandler())
+
+    await bus.publish(TestEvent(email="jhon@doe.com"))
+    await bus.close(timeout=0.01)
+    await bus.publish(TestEvent(email="jane@doe.com"))
+
+    messages = list(write_uow.outbox.messages.values())
+
+    assert sorted(message.payload["email"] for message in messages) == ["jane@doe.com", "jhon@doe.com"]
+    assert all(message.handler_name == "SlowHandler" for message in messages)
+
+    stats = bus.stats()
+    assert stats.executor.abandoned == 1
+    assert stats.persisted == 2
+    assert stats.lost == 0
+
+
+@pytest.mark.asyncio
+async def test_integration_event_bus_close_without_outbox_counts_lost_handlers():
+    bus = IntegrationEventBus()
+    release = asyncio.Event()
+
+    class SlowHandler:
+        async def handle(self, event):
+            await release.wait()
+
+    class TestEvent:
+        pass
+
+    bus.register(TestEvent, SlowHandler())
+
+    await bus.publish(TestEvent())
+    await bus.close(timeout=0.01)
+
+    assert bus.stats().lost == 1
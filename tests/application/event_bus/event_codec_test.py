@@ -0,0 +1,71 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from app.application.event_bus.event_codec import decode_event, encode_event
+from app.core.types.appointment_enums import AppointmentType
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+from app.domain.studio.appointments.events.booking_window_updated import BookingWindowUpdated
+from app.domain.studio.appointments.events.create_appointment_series_request import (
+    CreateAppointmentSeriesEmailRequested,
+)
+from app.domain.studio.appointments.events.notify_of_appointment_quoted import NotifyOfAppointmentQuoted
+
+
+def _round_trip(event):
+    return decode_event(type(event), encode_event(event))
+
+
+def test_series_event_round_trip():
+    start_at = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+    end_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    event = CreateAppointmentSeriesEmailRequested(
+        sessions=[TimeSlot(start_at=start_at, end_at=end_at)],
+        appointment_type=AppointmentType.TATTOO,
+        user_id=uuid4(),
+        client_email_or_vip_id="jane@doe.com",
+    )
+
+    decoded = _round_trip(event)
+
+    assert isinstance(decoded, CreateAppointmentSeriesEmailRequested)
+    assert decoded.sessions == [TimeSlot(start_at=start_at, end_at=end_at)]
+    assert decoded.appointment_type is AppointmentType.TATTOO
+    assert decoded.user_id == event.user_id
+    assert decoded.client_email_or_vip_id == "jane@doe.com"
+
+
+def test_series_event_written_before_notify_artist_decodes_with_default():
+    event = CreateAppointmentSeriesEmailRequested(
+        sessions=[],
+        appointment_type=AppointmentType.TATTOO,
+        user_id=uuid4(),
+        client_email_or_vip_id="jane@doe.com",
+    )
+    payload = encode_event(event)
+    del payload["notify_artist"]
+
+    assert decode_event(CreateAppointmentSeriesEmailRequested, payload).notify_artist is True
+
+
+def test_uuid_and_decimal_keep_their_type():
+    vip_id = uuid4()
+    event = NotifyOfAppointmentQuoted(
+        appointment_type=AppointmentType.TATTOO,
+        client_email_or_vip_id=vip_id,
+        price=Decimal("350.50"),
+    )
+
+    decoded = _round_trip(event)
+
+    assert decoded.client_email_or_vip_id == vip_id
+    assert decoded.price == Decimal("350.50")
+
+
+def test_payload_is_plain_json():
+    event = BookingWindowUpdated(user_id=uuid4(), new_booking_window=date(2026, 3, 1))
+
+    payload = encode_event(event)
+
+    assert payload["new_booking_window"] == {"__type__": "date", "value": "2026-03-01"}
+    assert _round_trip(event).new_booking_window == date(2026, 3, 1)
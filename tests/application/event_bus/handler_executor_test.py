@@ -0,0 +1,193 @@
+import asyncio
+
+import pytest
+
+from app.application.event_bus.handler_executor import HandlerExecutor
+from app.core.exceptions.events import (
+    IntegrationHandlerExecutorClosedError,
+    IntegrationHandlerQueueFullError,
+)
+from app.core.types.event_bus_enums import HandlerOverflowPolicy
+
+
+def blocked_job(release: asyncio.Event, started: list | None = None):
+    async def job():
+        if started is not None:
+            started.append(True)
+        await release.wait()
+
+    return job
+
+
+@pytest.mark.asyncio
+async def test_runs_at_most_workers_jobs_at_once():
+    executor = HandlerExecutor(workers=2)
+    release = asyncio.Event()
+    started = []
+
+    tasks = [
+        await executor.submit(blocked_job(release, started), event_type="TestEvent") for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    stats = executor.stats()
+    assert len(started) == 2
+    assert stats.running == 2
+    assert stats.queued == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    stats = executor.stats()
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.completed == 3
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrency_per_event_type():
+    executor = HandlerExecutor(workers=4, limits_per_event_type={"SlowEvent": 1})
+    release = asyncio.Event()
+    slow_started = []
+    other_started = []
+
+    tasks = [
+        await executor.submit(blocked_job(release, slow_started), event_type="SlowEvent"),
+        await executor.submit(blocked_job(release, slow_started), event_type="SlowEvent"),
+        await executor.submit(blocked_job(release, other_started), event_type="OtherEvent"),
+        await executor.submit(blocked_job(release, other_started), event_type="OtherEvent"),
+    ]
+    await asyncio.sleep(0)
+
+    assert len(slow_started) == 1
+    assert len(other_started) == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert len(slow_started) == 2
+
+
+@pytest.mark.asyncio
+async def test_reject_policy_raises_when_queue_is_full():
+    executor = HandlerExecutor(workers=1, max_queue_size=1, overflow_policy=HandlerOverflowPolicy.REJECT)
+    release = asyncio.Event()
+
+    running = await executor.submit(blocked_job(release), event_type="TestEvent")
+    await asyncio.sleep(0)
+    queued = await executor.submit(blocked_job(release), event_type="TestEvent")
+
+    with pytest.raises(IntegrationHandlerQueueFullError):
+        await executor.submit(blocked_job(release), event_type="TestEvent")
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_counts_dropped_jobs():
+    executor = HandlerExecutor(workers=1, max_queue_size=1, overflow_policy=HandlerOverflowPolicy.DROP)
+    release = asyncio.Event()
+
+    running = await executor.submit(blocked_job(release), event_type="TestEvent")
+    await asyncio.sleep(0)
+    queued = await executor.submit(blocked_job(release), event_type="TestEvent")
+
+    dropped = await executor.submit(blocked_job(release), event_type="TestEvent")
+
+    assert dropped is None
+    assert executor.stats().dropped == 1
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_room_ignores_drop_policy():
+    executor = HandlerExecutor(workers=1, max_queue_size=1, overflow_policy=HandlerOverflowPolicy.DROP)
+    release = asyncio.Event()
+
+    running = await executor.submit(blocked_job(release), event_type="TestEvent")
+    await asyncio.sleep(0)
+    queued = await executor.submit(blocked_job(release), event_type="TestEvent")
+
+    waiting = asyncio.ensure_future(
+        executor.submit(blocked_job(release), event_type="TestEvent", wait_for_room=True)
+    )
+    await asyncio.sleep(0)
+
+    assert waiting.done() is False
+
+    release.set()
+    await asyncio.gather(running, queued, await waiting)
+
+    stats = executor.stats()
+    assert stats.dropped == 0
+    assert stats.completed == 3
+
+
+@pytest.mark.asyncio
+async def test_records_latency_and_failures_per_event_type():
+    ticks = iter([10.0, 10.5, 20.0, 22.0])
+    executor = HandlerExecutor(clock=lambda: next(ticks))
+
+    async def failing_job():
+        raise RuntimeError("boom")
+
+    async def job():
+        pass
+
+    await (await executor.submit(job, event_type="TestEvent"))
+    with pytest.raises(RuntimeError):
+        await (await executor.submit(failing_job, event_type="TestEvent"))
+
+    stats = executor.stats()
+    latency = stats.latency_by_event_type["TestEvent"]
+
+    assert stats.completed == 1
+    assert stats.failed == 1
+    assert latency.count == 2
+    assert latency.total_seconds == 2.5
+    assert latency.max_seconds == 2.0
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_jobs_still_running_after_timeout():
+    executor = HandlerExecutor(workers=1)
+    release = asyncio.Event()
+
+    running = await executor.submit(blocked_job(release), event_type="TestEvent")
+    queued = await executor.submit(blocked_job(release), event_type="TestEvent")
+
+    await executor.close(timeout=0.01)
+
+    assert running.cancelled()
+    assert queued.cancelled()
+
+    stats = executor.stats()
+    assert stats.queued == 0
+    assert stats.closed is True
+    assert stats.abandoned == 2
+    assert stats.drain_seconds is not None
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_jobs_and_refuses_new_ones():
+    ticks = iter([0.0, 0.0, 1.5, 1.5])
+    executor = HandlerExecutor(clock=lambda: next(ticks))
+    done = []
+
+    async def job():
+        await asyncio.sleep(0)
+        done.append(True)
+
+    await executor.submit(job, event_type="TestEvent")
+    await executor.close(timeout=1)
+
+    assert done == [True]
+    with pytest.raises(IntegrationHandlerExecutorClosedError):
+        await executor.submit(job, event_type="TestEvent")
+
+    stats = executor.stats()
+    assert stats.abandoned == 0
+    assert stats.drain_seconds == 1.5
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.event_bus.integration_event_bus import IntegrationEventBus
+from app.application.event_bus.outbox_dispatcher import OutboxDispatcher
+from app.core.exceptions.events import DeliveryDeferredError
+from app.core.types.outbox_enums import OutboxStatus
+
+
+class FakeClock:
+    # ahead of the messages the bus stamps with the real time
+    def __init__(self):
+        self.now = datetime.now(timezone.utc) + timedelta(seconds=1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class EmailRequested:
+    def __init__(self, email: str):
+        self.email = email
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.received = []
+
+    async def handle(self, event, *, uow_factory):
+        self.received.append((event, uow_factory()))
+
+
+class FailingHandler:
+    async def handle(self, event):
+        raise ConnectionError("email provider unavailable")
+
+
+class DeferringHandler:
+    async def handle(self, event):
+        raise DeliveryDeferredError(retry_after=120)
+
+
+def _dispatcher(bus, write_uow, read_uow, clock, **kwargs) -> OutboxDispatcher:
+    return OutboxDispatcher(
+        integration_bus=bus,
+        write_uow_factory=lambda: write_uow,
+        read_uow_factory=lambda: read_uow,
+        retry_backoff=timedelta(seconds=30),
+        clock=clock,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_runs_handler_with_its_own_unit_of_work(write_uow, read_uow):
+    bus = IntegrationEventBus()
+    handler = RecordingHandler()
+    bus.register(EmailRequested, handler)
+    clock = FakeClock()
+
+    await bus.publish(EmailRequested(email="jhon@doe.com"), uow=write_uow)
+
+    dispatched = await _dispatcher(bus, write_uow, read_uow, clock).dispatch_once()
+
+    assert dispatched == 1
+    event, uow = handler.received[0]
+    assert isinstance(event, EmailRequested)
+    assert event.email == "jhon@doe.com"
+    assert uow is read_uow
+
+    [message] = write_uow.outbox.messages.values()
+    assert message.status == OutboxStatus.DISPATCHED
+    assert message.attempts == 1
+    assert message.dispatched_at == clock.now
+
+
+@pytest.mark.asyncio
+async def test_failed_message_is_retried_with_backoff(write_uow, read_uow):
+    bus = IntegrationEventBus()
+    bus.register(EmailRequested, FailingHandler())
+    clock = FakeClock()
+    dispatcher = _dispatcher(bus, write_uow, read_uow, clock)
+
+    await bus.publish(EmailRequested(email="jhon@doe.com"), uow=write_uow)
+    await dispatcher.dispatch_once()
+
+    [message] = write_uow.outbox.messages.values()
+    assert message.status == OutboxStatus.PENDING
+    assert message.last_error == "ConnectionError: email provider unavailable"
+    assert message.available_at == clock.now + timedelta(seconds=30)
+
+    assert await dispatcher.dispatch_once() == 0
+
+    clock.now += timedelta(seconds=30)
+    await dispatcher.dispatch_once()
+
+    assert message.attempts == 2
+    assert message.available_at == clock.now + timedelta(seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_message_fails_for_good_after_max_attempts(write_uow, read_uow):
+    bus = IntegrationEventBus()
+    bus.register(EmailRequested, FailingHandler())
+    clock = FakeClock()
+    dispatcher = _dispatcher(bus, write_uow, read_uow, clock, max_attempts=2)
+
+    await bus.publish(EmailRequested(email="jhon@doe.com"), uow=write_uow)
+
+    await dispatcher.dispatch_once()
+    clock.now += timedelta(minutes=1)
+    await dispatcher.dispatch_once()
+    clock.now += timedelta(hours=1)
+
+    assert await dispatcher.dispatch_once() == 0
+
+    [message] = write_uow.outbox.messages.values()
+    assert message.status == OutboxStatus.FAILED
+    assert message.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_one_failing_handler_does_not_resend_the_others(write_uow, read_uow):
+    bus = IntegrationEventBus()
+    recording = RecordingHandler()
+    bus.register(EmailRequested, recording)
+    bus.register(EmailRequested, FailingHandler())
+    clock = FakeClock()
+    dispatcher = _dispatcher(bus, write_uow, read_uow, clock)
+
+    await bus.publish(EmailRequested(email="jhon@doe.com"), uow=write_uow)
+
+    await dispatcher.dispatch_once()
+    clock.now += timedelta(minutes=1)
+    await dispatcher.dispatch_once()
+
+    assert len(recording.received) == 1
+
+
+@pytest.mark.asyncio
+async def test_deferred_message_comes_back_without_spending_an_attempt(write_uow, read_uow):
+    bus = IntegrationEventBus()
+    bus.register(EmailRequested, DeferringHandler())
+    clock = FakeClock()
+    dispatcher = _dispatcher(bus, write_uow, read_uow, clock, max_attempts=1)
+
+    await bus.publish(EmailRequested(email="jhon@doe.com"), uow=write_uow)
+    await dispatcher.dispatch_once()
+
+    [message] = write_uow.outbox.messages.values()
+    assert message.status == OutboxStatus.PENDING
+    assert message.attempts == 0
+    assert message.available_at == clock.now + timedelta(seconds=120)
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+
+from app.application.notifications.handlers.utils.email_template import EmailTemplate
+from app.application.notifications.handlers.utils.render_create_appointment_client_email import (
+    render_create_appointment_client_email,
+)
+from app.application.notifications.handlers.utils.render_sessions_html import render_sessions_html
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+
+def test_render_fills_placeholders():
+    template = EmailTemplate("<p>Olá {name}, seu horário é {time}.</p>")
+
+    assert template.fields == {"name", "time"}
+    assert template.render(name="Jhon", time="10:00") == "<p>Olá Jhon, seu horário é 10:00.</p>"
+
+
+def test_render_requires_every_placeholder():
+    template = EmailTemplate("<p>{name}</p>")
+
+    with pytest.raises(KeyError):
+        template.render()
+
+
+def test_render_many_renders_one_email_per_values():
+    template = EmailTemplate("<p>{name}</p>")
+
+    assert template.render_many([{"name": "Jhon"}, {"name": "Jane"}]) == ["<p>Jhon</p>", "<p>Jane</p>"]
+
+
+def test_renderer_reuses_email_rendered_for_the_same_inputs():
+    start_at = datetime(2026, 3, 4, 10, 0)
+    end_at = datetime(2026, 3, 4, 12, 0)
+
+    first = render_create_appointment_client_email(
+        start_at=start_at, end_at=end_at, appointment_type="tattoo"
+    )
+    second = render_create_appointment_client_email(
+        start_at=start_at, end_at=end_at, appointment_type="tattoo"
+    )
+
+    assert first is second
+
+
+def test_render_sessions_html_numbers_each_session():
+    sessions = [
+        TimeSlot(start_at=datetime(2026, 3, 4, 10, 0), end_at=datetime(2026, 3, 4, 12, 0)),
+        TimeSlot(start_at=datetime(2026, 3, 11, 9, 0), end_at=datetime(2026, 3, 11, 11, 30)),
+    ]
+
+    html = render_sessions_html(sessions)
+
+    assert "<strong>Sessão 1:</strong> 04/03/2026" in html
+    assert "<strong>Sessão 2:</strong> 11/03/2026,\n                  09:00 às 11:30" in html
@@ -19,7 +19,7 @@ async def test_notificate_booking_window_handler_sends_email(make_user, write_uo
 
     handler = NotificateBookingWindowUpdateHandler(email_service=email_service)
 
-    await handler.handle(event=event, uow=read_uow)
+    await handler.handle(event=event, uow_factory=lambda: read_uow)
 
     assert email_service.sent is True
     assert email_service.last_payload is not None
@@ -43,6 +43,6 @@ async def test_notificate_booking_window_handler_user_not_found(make_user, write
 
     handler = NotificateBookingWindowUpdateHandler(email_service=email_service)
 
-    await handler.handle(event=event, uow=read_uow)
+    await handler.handle(event=event, uow_factory=lambda: read_uow)
 
     assert email_service.sent is False
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.application.notifications.handlers.send_appointment_request_digest_email import (
+    SendAppointmentRequestDigestEmailHandler,
+)
+from app.core.types.appointment_enums import AppointmentType
+from app.domain.studio.appointments.events.appointment_request_digest_requested import (
+    AppointmentRequestDigestRequested,
+    DigestedAppointmentRequest,
+)
+from tests.fakes.fake_email_service import FakeEmailService
+
+START_AT = datetime(2026, 3, 4, 10, 0)
+
+
+def _request(appointment_type: AppointmentType, sessions_count: int = 1) -> DigestedAppointmentRequest:
+    return DigestedAppointmentRequest(
+        appointment_type=appointment_type,
+        start_at=START_AT,
+        end_at=START_AT + timedelta(hours=2),
+        sessions_count=sessions_count,
+    )
+
+
+async def test_send_appointment_request_digest_sends_one_summary(make_user, read_uow, write_uow):
+    user = make_user(email="jhon@doe.com")
+    write_uow.users.create(user)
+
+    event = AppointmentRequestDigestRequested(
+        user_id=user.id,
+        requests=[
+            _request(AppointmentType.TATTOO),
+            _request(AppointmentType.PIERCING, sessions_count=3),
+        ],
+    )
+
+    email_service = FakeEmailService()
+
+    await SendAppointmentRequestDigestEmailHandler(email_service=email_service).handle(
+        event, uow_factory=lambda: read_uow
+    )
+
+    assert len(email_service.sent_emails) == 1
+    email = email_service.last_payload
+    assert email["to"] == "jhon@doe.com"
+    assert email["subject"] == "Resumo: 2 novas solicitações de agendamento"
+    assert "<strong>Tattoo:</strong> 04/03/2026" in email["html"]
+    assert "<strong>Piercing:</strong> 04/03/2026" in email["html"]
+    assert "(1ª de 3 sessões)" in email["html"]
+
+
+async def test_send_appointment_request_digest_user_not_found_does_not_send_email(read_uow):
+    event = AppointmentRequestDigestRequested(
+        user_id=uuid4(), requests=[_request(AppointmentType.TATTOO)]
+    )
+
+    email_service = FakeEmailService()
+
+    await SendAppointmentRequestDigestEmailHandler(email_service=email_service).handle(
+        event, uow_factory=lambda: read_uow
+    )
+
+    assert email_service.sent is False
@@ -28,8 +28,9 @@ async def test_send_create_appointment_sends_email(make_user, read_uow, write_uo
 
     handler = SendCreateAppointmentEmailHandler(email_service=email_service)
 
-    await handler.handle(event, read_uow)
+    await handler.handle(event, uow_factory=lambda: read_uow)
 
+    assert len(email_service.batches) == 1
     assert len(email_service.sent_emails) == 2
 
     user_email = next(email for email in email_service.sent_emails if email["to"] == "jhon@doe.com")
@@ -64,7 +65,7 @@ async def test_send_create_appointment_sends_email_with_vip_id(
 
     handler = SendCreateAppointmentEmailHandler(email_service=email_service)
 
-    await handler.handle(event, read_uow)
+    await handler.handle(event, uow_factory=lambda: read_uow)
 
     assert len(email_service.sent_emails) == 2
 
@@ -98,7 +99,7 @@ async def test_send_create_appointment_vip_client_not_found_does_not_sends_email
 
     handler = SendCreateAppointmentEmailHandler(email_service=email_service)
 
-    await handler.handle(event, read_uow)
+    await handler.handle(event, uow_factory=lambda: read_uow)
 
     assert len(email_service.sent_emails) == 0
 
@@ -127,8 +128,63 @@ async def test_send_create_appointment_user_not_found_does_not_sends_email(
 
     handler = SendCreateAppointmentEmailHandler(email_service=email_service)
 
-    await handler.handle(event, read_uow)
+    await handler.handle(event, uow_factory=lambda: read_uow)
 
     assert len(email_service.sent_emails) == 0
 
     assert email_service.sent is False
+
+
+async def test_send_create_appointment_in_digest_mode_only_emails_client(make_user, read_uow, write_uow):
+    start_at = datetime.now() + timedelta(days=1)
+    user = make_user(email="jhon@doe.com")
+    write_uow.users.create(user)
+
+    event = CreateAppointmentEmailRequested(
+        appointment_type=AppointmentType.TATTOO,
+        user_id=user.id,
+        start_at=start_at,
+        end_at=start_at + timedelta(hours=2),
+        client_email_or_vip_id="jane@doe.com",
+        notify_artist=False,
+    )
+
+    email_service = FakeEmailService()
+
+    await SendCreateAppointmentEmailHandler(email_service=email_service).handle(
+        event, uow_factory=lambda: read_uow
+    )
+
+    assert [email["to"] for email in email_service.sent_emails] == ["jane@doe.com"]
+
+
+async def test_send_create_appointment_releases_read_session_before_sending(
+    make_user, read_uow, write_uow
+):
+    start_at = datetime.now() + timedelta(days=1)
+    user = make_user(email="jhon@doe.com")
+    write_uow.users.create(user)
+
+    closed = []
+    read_uow.close = lambda: closed.append(True)
+
+    class SessionCheckingEmailService(FakeEmailService):
+        async def send_batch(self, messages):
+            assert closed == [True]
+            await super().send_batch(messages)
+
+    event = CreateAppointmentEmailRequested(
+        appointment_type=AppointmentType.TATTOO,
+        user_id=user.id,
+        start_at=start_at,
+        end_at=start_at + timedelta(hours=2),
+        client_email_or_vip_id="jane@doe.com",
+    )
+
+    email_service = SessionCheckingEmailService()
+
+    await SendCreateAppointmentEmailHandler(email_service=email_service).handle(
+        event, uow_factory=lambda: read_uow
+    )
+
+    assert len(email_service.sent_emails) == 2
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+
+from app.application.notifications.handlers.send_create_appointment_series_email import (
+    SendCreateAppointmentSeriesEmailHandler,
+)
+from app.core.types.appointment_enums import AppointmentType
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+from app.domain.studio.appointments.events.create_appointment_series_request import (
+    CreateAppointmentSeriesEmailRequested,
+)
+from tests.fakes.fake_email_service import FakeEmailService
+
+
+def _sessions(count: int) -> list[TimeSlot]:
+    first_start = datetime.now() + timedelta(days=1)
+
+    return [
+        TimeSlot(
+            start_at=first_start + timedelta(weeks=week),
+            end_at=first_start + timedelta(weeks=week, hours=2),
+        )
+        for week in range(count)
+    ]
+
+
+async def test_send_create_appointment_series_sends_one_email_per_recipient(
+    make_user, read_uow, write_uow
+):
+    user = make_user(email="jhon@doe.com")
+    write_uow.users.create(user)
+
+    event = CreateAppointmentSeriesEmailRequested(
+        sessions=_sessions(3),
+        appointment_type=AppointmentType.TATTOO,
+        user_id=user.id,
+        client_email_or_vip_id="jane@doe.com",
+    )
+
+    email_service = FakeEmailService()
+
+    handler = SendCreateAppointmentSeriesEmailHandler(email_service=email_service)
+
+    await handler.handle(event, uow_factory=lambda: read_uow)
+
+    assert len(email_service.sent_emails) == 2
+
+    user_email = next(email for email in email_service.sent_emails if email["to"] == "jhon@doe.com")
+
+    client_email = next(email for email in email_service.sent_emails if email["to"] == "jane@doe.com")
+
+    assert user_email["subject"] == "Novo agendamento solicitado (3 sessões)"
+    assert "Sessão 3" in user_email["html"]
+    assert client_email["subject"] == "Recebemos sua solicitação de agendamento"
+    assert "Sessão 3" in client_email["html"]
+
+
+async def test_send_create_appointment_series_sends_email_with_vip_id(
+    make_user, read_uow, write_uow, make_vip_client
+):
+    user = make_user(email="jhon@doe.com")
+    write_uow.users.create(user)
+    vip_client = make_vip_client(email="jane@doe.com")
+    write_uow.vip_clients.create(vip_client)
+
+    event = CreateAppointmentSeriesEmailRequested(
+        sessions=_sessions(2),
+        appointment_type=AppointmentType.TATTOO,
+        user_id=user.id,
+        client_email_or_vip_id=vip_client.id,
+    )
+
+    email_service = FakeEmailService()
+
+    handler = SendCreateAppointmentSeriesEmailHandler(email_service=email_service)
+
+    await handler.handle(event, uow_factory=lambda: read_uow)
+
+    assert sorted(email["to"] for email in email_service.sent_emails) == ["jane@doe.com", "jhon@doe.com"]
+
+
+async def test_send_create_appointment_series_user_not_found_does_not_send_email(make_user, read_uow):
+    user = make_user(email="jhon@doe.com")
+
+    event = CreateAppointmentSeriesEmailRequested(
+        sessions=_sessions(2),
+        appointment_type=AppointmentType.TATTOO,
+        user_id=user.id,
+        client_email_or_vip_id="jane@doe.com",
+    )
+
+    email_service = FakeEmailService()
+
+    handler = SendCreateAppointmentSeriesEmailHandler(email_service=email_service)
+
+    await handler.handle(event, uow_factory=lambda: read_uow)
+
+    assert email_service.sent_emails == []
+
+
+async def test_send_create_appointment_series_in_digest_mode_only_emails_client(
+    make_user, read_uow, write_uow
+):
+    user = make_user(email="jhon@doe.com")
+    write_uow.users.create(user)
+
+    event = CreateAppointmentSeriesEmailRequested(
+        sessions=_sessions(2),
+        appointment_type=AppointmentType.TATTOO,
+        user_id=user.id,
+        client_email_or_vip_id="jane@doe.com",
+        notify_artist=False,
+    )
+
+    email_service = FakeEmailService()
+
+    await SendCreateAppointmentSeriesEmailHandler(email_service=email_service).handle(
+        event, uow_factory=lambda: read_uow
+    )
+
+    assert [email["to"] for email in email_service.sent_emails] == ["jane@doe.com"]
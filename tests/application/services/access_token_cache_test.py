@@ -0,0 +1,77 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from app.application.studio.services.access_token_cache import AccessTokenCache, UserAccess
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _access(version: int = 0) -> UserAccess:
+    return UserAccess(access_token_version=version, is_active=True, is_admin=False)
+
+
+def test_payload_is_kept_until_the_token_expires():
+    clock = FakeClock()
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30), clock=clock)
+    payload = {"sub": str(uuid4()), "ver": 0, "exp": clock.now + 60}
+
+    cache.put_payload("token", payload)
+
+    assert cache.get_payload("token") == payload
+    assert cache.get_payload("other token") is None
+
+    clock.now += 60
+    assert cache.get_payload("token") is None
+
+
+def test_payload_without_expiration_is_not_cached():
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30), clock=FakeClock())
+
+    cache.put_payload("token", {"sub": str(uuid4()), "ver": 0})
+
+    assert cache.get_payload("token") is None
+
+
+def test_user_access_expires_after_ttl():
+    clock = FakeClock()
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30), clock=clock)
+    user_id = uuid4()
+
+    cache.put_user(user_id, _access())
+    clock.now += 29
+    assert cache.get_user(user_id) == _access()
+
+    clock.now += 1
+    assert cache.get_user(user_id) is None
+
+
+def test_invalidate_users_only_drops_those_users():
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30), clock=FakeClock())
+    changed_user, other_user = uuid4(), uuid4()
+
+    cache.put_user(changed_user, _access())
+    cache.put_user(other_user, _access())
+    cache.invalidate_users([changed_user])
+
+    assert cache.get_user(changed_user) is None
+    assert cache.get_user(other_user) == _access()
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30), max_entries=2, clock=FakeClock())
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    cache.put_user(first, _access())
+    cache.put_user(second, _access())
+    cache.get_user(first)
+    cache.put_user(third, _access())
+
+    assert cache.get_user(first) is not None
+    assert cache.get_user(second) is None
+    assert cache.get_user(third) is not None
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.studio.services.appointment_request_digest_job import AppointmentRequestDigestJob
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
+from app.core.types.appointment_enums import AppointmentType
+from app.domain.studio.appointments.events.appointment_request_digest_requested import (
+    AppointmentRequestDigestRequested,
+)
+from tests.fakes.fake_event_bus import FakeIntegrationEventBus
+
+# a few minutes into a daily window, the one before it has just closed
+WINDOW_START = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
+NOW = WINDOW_START + timedelta(minutes=5)
+
+
+def _entry(user_id, created_at=WINDOW_START - timedelta(hours=1), sessions_count=1):
+    return AppointmentRequestDigestEntry(
+        id=uuid4(),
+        user_id=user_id,
+        appointment_type=AppointmentType.TATTOO,
+        start_at=NOW + timedelta(days=2),
+        end_at=NOW + timedelta(days=2, hours=2),
+        created_at=created_at,
+        sessions_count=sessions_count,
+    )
+
+
+def _job(write_uow, integration_bus, now=NOW) -> AppointmentRequestDigestJob:
+    return AppointmentRequestDigestJob(
+        integration_bus=integration_bus, write_uow_factory=lambda: write_uow, clock=lambda: now
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_once_publishes_one_digest_per_artist(write_uow):
+    first_artist, second_artist = uuid4(), uuid4()
+    for entry in [
+        _entry(first_artist),
+        _entry(second_artist),
+        _entry(first_artist, sessions_count=4),
+    ]:
+        write_uow.appointment_request_digests.add(entry)
+    integration_bus = FakeIntegrationEventBus()
+
+    taken = await _job(write_uow, integration_bus).run_once()
+
+    assert taken == 3
+    assert all(isinstance(event, AppointmentRequestDigestRequested) for event in integration_bus.events)
+    requests_by_artist = {
+        event.user_id: [request.sessions_count for request in event.requests]
+        for event in integration_bus.events
+    }
+    assert requests_by_artist == {first_artist: [1, 4], second_artist: [1]}
+    assert write_uow.appointment_request_digests.entries == {}
+    assert write_uow.committed is True
+
+
+@pytest.mark.asyncio
+async def test_run_once_keeps_entries_of_the_open_window(write_uow):
+    later = _entry(uuid4(), created_at=WINDOW_START + timedelta(seconds=1))
+    write_uow.appointment_request_digests.add(later)
+    integration_bus = FakeIntegrationEventBus()
+
+    taken = await _job(write_uow, integration_bus).run_once()
+
+    assert taken == 0
+    assert integration_bus.events == []
+    assert list(write_uow.appointment_request_digests.entries) == [later.id]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_send_one_digest_per_artist(write_uow):
+    first_artist, second_artist = uuid4(), uuid4()
+    for entry in [_entry(first_artist), _entry(second_artist), _entry(first_artist)]:
+        write_uow.appointment_request_digests.add(entry)
+    integration_bus = FakeIntegrationEventBus()
+
+    taken = await asyncio.gather(
+        _job(write_uow, integration_bus).run_once(),
+        _job(write_uow, integration_bus).run_once(),
+    )
+
+    assert sorted(taken) == [0, 3]
+    assert sorted(event.user_id for event in integration_bus.events) == sorted(
+        [first_artist, second_artist]
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_once_runs_each_window_once(write_uow):
+    artist = uuid4()
+    integration_bus = FakeIntegrationEventBus()
+
+    write_uow.appointment_request_digests.add(_entry(artist))
+    assert await _job(write_uow, integration_bus).run_once() == 1
+
+    # a restart within the same window does not send the requests made since
+    during_window = _entry(artist, created_at=NOW + timedelta(minutes=1))
+    write_uow.appointment_request_digests.add(during_window)
+    assert await _job(write_uow, integration_bus, now=NOW + timedelta(hours=1)).run_once() == 0
+
+    next_window = WINDOW_START + timedelta(days=1, minutes=1)
+    assert await _job(write_uow, integration_bus, now=next_window).run_once() == 1
+    assert len(integration_bus.events) == 2
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.application.studio.services.calendar_index import (
+    CalendarIndex,
+    CalendarSnapshot,
+    SortedIntervals,
+)
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+DAY = datetime(2026, 3, 2, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _slot(start_hour: int, end_hour: int) -> TimeSlot:
+    return TimeSlot(start_at=DAY + timedelta(hours=start_hour), end_at=DAY + timedelta(hours=end_hour))
+
+
+def _snapshot(user_id=None, booked=()) -> CalendarSnapshot:
+    return CalendarSnapshot(
+        user_id=user_id or uuid4(),
+        user_is_active=True,
+        calendar_settings=None,
+        horizon_start=DAY,
+        horizon_end=DAY + timedelta(days=7),
+        booked_slots=SortedIntervals(booked),
+    )
+
+
+def test_sorted_intervals_overlapping():
+    long_slot = _slot(0, 10)
+    intervals = SortedIntervals([_slot(14, 15), long_slot, _slot(11, 12), _slot(12, 13)])
+
+    overlapping = intervals.overlapping(
+        start_at=DAY + timedelta(hours=9), end_at=DAY + timedelta(hours=12)
+    )
+
+    assert overlapping == [long_slot, _slot(11, 12)]
+
+
+def test_sorted_intervals_touching_is_not_overlapping():
+    intervals = SortedIntervals([_slot(9, 10), _slot(11, 12)])
+
+    assert (
+        intervals.overlapping(start_at=DAY + timedelta(hours=10), end_at=DAY + timedelta(hours=11)) == []
+    )
+
+
+def test_sorted_intervals_empty():
+    assert SortedIntervals([]).overlapping(start_at=DAY, end_at=DAY + timedelta(days=1)) == []
+
+
+def test_snapshot_is_booked():
+    snapshot = _snapshot(booked=[_slot(9, 10)])
+
+    assert snapshot.is_booked(
+        start_at=DAY + timedelta(hours=9, minutes=30), end_at=DAY + timedelta(hours=11)
+    )
+    assert not snapshot.is_booked(start_at=DAY + timedelta(hours=10), end_at=DAY + timedelta(hours=11))
+
+
+def test_index_returns_snapshot_covering_range():
+    index = CalendarIndex(ttl=timedelta(seconds=60))
+    snapshot = _snapshot()
+    index.put(snapshot)
+
+    assert index.get(snapshot.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is snapshot
+    assert index.get(snapshot.user_id, start_at=DAY, end_at=DAY + timedelta(days=8)) is None
+    assert index.get(uuid4(), start_at=DAY, end_at=DAY + timedelta(days=1)) is None
+
+
+def test_index_snapshot_expires_after_ttl():
+    clock = FakeClock()
+    index = CalendarIndex(ttl=timedelta(seconds=60), clock=clock)
+    snapshot = _snapshot()
+    index.put(snapshot)
+
+    clock.now = 59
+    assert index.get(snapshot.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is snapshot
+
+    clock.now = 60
+    assert index.get(snapshot.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is None
+
+
+def test_index_invalidate_only_drops_given_users():
+    index = CalendarIndex(ttl=timedelta(seconds=60))
+    first = _snapshot()
+    second = _snapshot()
+    index.put(first)
+    index.put(second)
+
+    index.invalidate([first.user_id])
+
+    assert index.get(first.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is None
+    assert index.get(second.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is second
+
+
+def test_index_refuses_snapshot_loaded_before_an_invalidation():
+    index = CalendarIndex(ttl=timedelta(seconds=60))
+    snapshot = _snapshot()
+
+    generation = index.generation(snapshot.user_id)
+    index.invalidate([snapshot.user_id])
+    index.put(snapshot, generation=generation)
+
+    assert index.get(snapshot.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is None
+
+    index.put(snapshot, generation=index.generation(snapshot.user_id))
+
+    assert index.get(snapshot.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is snapshot
+
+
+def test_index_evicts_least_recently_used():
+    index = CalendarIndex(ttl=timedelta(seconds=60), max_entries=2)
+    first, second, third = _snapshot(), _snapshot(), _snapshot()
+    index.put(first)
+    index.put(second)
+
+    index.get(first.user_id, start_at=DAY, end_at=DAY + timedelta(days=1))
+    index.put(third)
+
+    assert index.get(second.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is None
+    assert index.get(first.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is first
+    assert index.get(third.user_id, start_at=DAY, end_at=DAY + timedelta(days=1)) is third
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+from app.application.notifications.services.circuit_breaker import CircuitBreaker
+from app.core.types.circuit_breaker_enums import CircuitState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=2, reset_timeout=timedelta(seconds=30), clock=clock)
+
+
+def test_opens_after_consecutive_failures_and_rejects_calls():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow() is False
+    assert breaker.retry_after() == 30
+
+    stats = breaker.stats()
+    assert stats.times_opened == 1
+    assert stats.rejected == 1
+
+
+def test_success_resets_the_failure_count():
+    breaker = make_breaker(FakeClock())
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_lets_one_trial_call_through_after_reset_timeout():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now = 30
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow() is True
+
+
+def test_failed_trial_opens_the_circuit_again():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now = 30
+    breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.retry_after() == 30
+    assert breaker.stats().times_opened == 2
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import timedelta
+
+from app.application.notifications.services.coalescing_email_service import CoalescingEmailService
+from app.core.exceptions.services import EmailSentFailedError, EmailServiceUnavailableError
+from tests.fakes.fake_email_service import FakeEmailService
+
+
+async def test_sends_emails_within_the_window_as_one_batch():
+    email_service = FakeEmailService()
+    coalescing = CoalescingEmailService(email_service, window=timedelta(milliseconds=10))
+
+    await asyncio.gather(
+        coalescing.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>1</p>"),
+        coalescing.send_email(to="jane@doe.com", subject="Teste", html_content="<p>2</p>"),
+        coalescing.send_email(to="joe@doe.com", subject="Teste", html_content="<p>3</p>"),
+    )
+
+    assert len(email_service.batches) == 1
+    assert [message.to for message in email_service.batches[0]] == [
+        "jhon@doe.com",
+        "jane@doe.com",
+        "joe@doe.com",
+    ]
+
+
+async def test_sends_a_full_batch_without_waiting_for_the_window():
+    email_service = FakeEmailService()
+    coalescing = CoalescingEmailService(email_service, window=timedelta(seconds=60), max_batch_size=2)
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            coalescing.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>1</p>"),
+            coalescing.send_email(to="jane@doe.com", subject="Teste", html_content="<p>2</p>"),
+        ),
+        timeout=1,
+    )
+
+    assert len(email_service.batches) == 1
+    assert len(email_service.sent_emails) == 2
+
+
+async def test_every_caller_gets_the_batch_error():
+    email_service = FakeEmailService(fail_with="email_service_unavailable")
+    coalescing = CoalescingEmailService(email_service, window=timedelta(milliseconds=10))
+
+    results = await asyncio.gather(
+        coalescing.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>1</p>"),
+        coalescing.send_email(to="jane@doe.com", subject="Teste", html_content="<p>2</p>"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, EmailServiceUnavailableError) for result in results)
+
+
+async def test_a_refused_recipient_does_not_fail_the_rest_of_the_batch():
+    email_service = FakeEmailService(refused_recipients={"not-an-email"})
+    coalescing = CoalescingEmailService(email_service, window=timedelta(milliseconds=10))
+
+    results = await asyncio.gather(
+        coalescing.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>1</p>"),
+        coalescing.send_email(to="not-an-email", subject="Teste", html_content="<p>2</p>"),
+        coalescing.send_email(to="jane@doe.com", subject="Teste", html_content="<p>3</p>"),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], EmailSentFailedError)
+    assert results[2] is None
+    assert [email["to"] for email in email_service.sent_emails] == ["jhon@doe.com", "jane@doe.com"]
+
+
+async def test_flush_sends_pending_emails_right_away():
+    email_service = FakeEmailService()
+    coalescing = CoalescingEmailService(email_service, window=timedelta(seconds=60))
+
+    pending = asyncio.ensure_future(
+        coalescing.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>1</p>")
+    )
+    await asyncio.sleep(0)
+
+    await coalescing.flush()
+    await pending
+
+    assert email_service.last_payload["to"] == "jhon@doe.com"
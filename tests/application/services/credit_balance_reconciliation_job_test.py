@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.studio.services.credit_balance_reconciliation_job import (
+    CreditBalanceReconciliationJob,
+)
+from app.application.studio.use_cases.DTO.credit_balance_drift_dto import CreditBalanceDrift
+
+
+@pytest.mark.asyncio
+async def test_run_once_reports_drift_without_touching_the_balance(
+    write_uow, make_client_credit_entry, caplog
+):
+    entry = make_client_credit_entry(quantity=10)
+    write_uow.client_credit_entries.create(entry)
+    write_uow.client_credit_entries.balances[entry.vip_client_id] = 25
+
+    job = CreditBalanceReconciliationJob(write_uow_factory=lambda: write_uow)
+    drifts = await job.run_once()
+
+    assert drifts == [CreditBalanceDrift(vip_client_id=entry.vip_client_id, recorded=25, ledger=10)]
+    assert write_uow.client_credit_entries.get_balance(vip_client_id=entry.vip_client_id) == 25
+    assert "credit balance drifted from ledger" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_run_once_repairs_drift_when_asked(write_uow, make_client_credit_entry):
+    entry = make_client_credit_entry(quantity=10)
+    write_uow.client_credit_entries.create(entry)
+    write_uow.client_credit_entries.balances[entry.vip_client_id] = 25
+
+    job = CreditBalanceReconciliationJob(write_uow_factory=lambda: write_uow, repair=True)
+    await job.run_once()
+
+    assert write_uow.client_credit_entries.get_balance(vip_client_id=entry.vip_client_id) == 10
+    assert write_uow.client_credit_entries.find_balance_drift() == []
+    assert write_uow.committed is True
+
+
+@pytest.mark.asyncio
+async def test_run_once_repairs_each_client_in_a_transaction_of_its_own(
+    write_uow, make_client_credit_entry
+):
+    for _ in range(2):
+        entry = make_client_credit_entry(quantity=10)
+        write_uow.client_credit_entries.create(entry)
+        write_uow.client_credit_entries.balances[entry.vip_client_id] = 25
+    opened = []
+
+    def write_uow_factory():
+        opened.append(write_uow)
+        return write_uow
+
+    job = CreditBalanceReconciliationJob(write_uow_factory=write_uow_factory, repair=True)
+    await job.run_once()
+
+    # one to look for drift, one per repair
+    assert len(opened) == 3
+    assert write_uow.client_credit_entries.find_balance_drift() == []
+
+
+@pytest.mark.asyncio
+async def test_run_once_reconciles_each_window_once(write_uow, make_client_credit_entry):
+    entry = make_client_credit_entry(quantity=10)
+    write_uow.client_credit_entries.create(entry)
+    write_uow.client_credit_entries.balances[entry.vip_client_id] = 25
+    now = datetime(2026, 1, 1, 3, 0, tzinfo=timezone.utc)
+
+    def job(moment):
+        return CreditBalanceReconciliationJob(write_uow_factory=lambda: write_uow, clock=lambda: moment)
+
+    assert len(await job(now).run_once()) == 1
+    # another worker, or a restart, in the same window
+    assert await job(now + timedelta(hours=6)).run_once() == []
+    assert len(await job(now + timedelta(days=1)).run_once()) == 1
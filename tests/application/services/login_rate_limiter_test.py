@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+
+from app.application.studio.services.login_rate_limiter import (
+    InMemoryLoginRateLimiter,
+    LoginRateLimit,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_attempts_over_the_limit_are_refused_until_the_window_slides():
+    clock = FakeClock()
+    limiter = InMemoryLoginRateLimiter(window=timedelta(seconds=60), clock=clock)
+    limits = [LoginRateLimit(key="identifier:jhon", max_attempts=2)]
+
+    assert await limiter.acquire(limits) is None
+    clock.now += 10
+    assert await limiter.acquire(limits) is None
+
+    clock.now += 10
+    assert await limiter.acquire(limits) == 40
+
+    clock.now += 40
+    assert await limiter.acquire(limits) is None
+    assert await limiter.acquire(limits) == 10
+
+
+@pytest.mark.asyncio
+async def test_refused_attempt_is_not_recorded_against_any_key():
+    clock = FakeClock()
+    limiter = InMemoryLoginRateLimiter(window=timedelta(seconds=60), clock=clock)
+    ip_limit = LoginRateLimit(key="ip:10.0.0.1", max_attempts=3)
+
+    await limiter.acquire([LoginRateLimit(key="identifier:jhon", max_attempts=1), ip_limit])
+    refused = await limiter.acquire([LoginRateLimit(key="identifier:jhon", max_attempts=1), ip_limit])
+
+    assert refused == 60
+    assert (
+        await limiter.acquire([LoginRateLimit(key="identifier:mary", max_attempts=1), ip_limit]) is None
+    )
+    assert await limiter.acquire([ip_limit]) is None
+    assert await limiter.acquire([ip_limit]) is not None
+
+
+@pytest.mark.asyncio
+async def test_reset_clears_the_key():
+    limiter = InMemoryLoginRateLimiter(window=timedelta(seconds=60), clock=FakeClock())
+    limits = [LoginRateLimit(key="identifier:jhon", max_attempts=1)]
+
+    await limiter.acquire(limits)
+    await limiter.reset("identifier:jhon")
+
+    assert await limiter.acquire(limits) is None
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_keys_are_dropped_over_max_keys():
+    limiter = InMemoryLoginRateLimiter(window=timedelta(seconds=60), max_keys=2, clock=FakeClock())
+
+    for name in ("a", "b", "c"):
+        await limiter.acquire([LoginRateLimit(key=name, max_attempts=1)])
+
+    assert await limiter.acquire([LoginRateLimit(key="a", max_attempts=1)]) is None
+    assert await limiter.acquire([LoginRateLimit(key="c", max_attempts=1)]) is not None
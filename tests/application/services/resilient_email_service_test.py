@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+import pytest
+
+from app.application.notifications.ports.email_service import EmailService
+from app.application.notifications.services.circuit_breaker import CircuitBreaker
+from app.application.notifications.services.resilient_email_service import ResilientEmailService
+from app.core.exceptions.services import (
+    EmailCircuitOpenError,
+    EmailProviderServerError,
+    EmailRateLimitedError,
+    EmailSentFailedError,
+    EmailServiceUnavailableError,
+)
+from app.core.types.circuit_breaker_enums import CircuitState
+
+
+class ScriptedEmailService(EmailService):
+    def __init__(self, *outcomes: Exception | None):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def send_email(self, to, subject, html_content):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if outcome is not None:
+            raise outcome
+
+
+def make_service(email_service: EmailService, **kwargs) -> tuple[ResilientEmailService, list[float]]:
+    sleeps: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    service = ResilientEmailService(
+        email_service,
+        base_delay=timedelta(seconds=1),
+        max_delay=timedelta(seconds=10),
+        sleep=sleep,
+        jitter=lambda: 1.0,
+        **kwargs,
+    )
+    return service, sleeps
+
+
+async def send(service: ResilientEmailService) -> None:
+    await service.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>Hello</p>")
+
+
+async def test_retries_with_exponential_backoff_until_it_succeeds():
+    email_service = ScriptedEmailService(
+        EmailServiceUnavailableError(), EmailProviderServerError(), None
+    )
+    service, sleeps = make_service(email_service)
+
+    await send(service)
+
+    assert email_service.calls == 3
+    assert sleeps == [1.0, 2.0]
+    assert service.stats().retries == 2
+
+
+async def test_gives_up_after_max_attempts():
+    email_service = ScriptedEmailService(*[EmailServiceUnavailableError()] * 3)
+    service, _ = make_service(email_service, max_attempts=3)
+
+    with pytest.raises(EmailServiceUnavailableError):
+        await send(service)
+
+    assert email_service.calls == 3
+    assert service.stats().gave_up == 1
+
+
+async def test_honours_retry_after_of_rate_limits():
+    email_service = ScriptedEmailService(EmailRateLimitedError(retry_after=4), None)
+    service, sleeps = make_service(email_service)
+
+    await send(service)
+
+    assert sleeps == [5.0]
+    assert service.stats().circuit.consecutive_failures == 0
+
+
+async def test_does_not_wait_for_a_retry_after_longer_than_max_delay():
+    email_service = ScriptedEmailService(EmailRateLimitedError(retry_after=60), None)
+    service, sleeps = make_service(email_service)
+
+    with pytest.raises(EmailRateLimitedError):
+        await send(service)
+
+    assert sleeps == []
+
+
+async def test_does_not_retry_refused_requests():
+    email_service = ScriptedEmailService(EmailSentFailedError())
+    service, _ = make_service(email_service)
+
+    with pytest.raises(EmailSentFailedError):
+        await send(service)
+
+    assert email_service.calls == 1
+
+
+async def test_fails_fast_while_the_circuit_is_open():
+    email_service = ScriptedEmailService(EmailServiceUnavailableError(), EmailServiceUnavailableError())
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=timedelta(seconds=30))
+    service, _ = make_service(email_service, breaker=breaker, max_attempts=2)
+
+    with pytest.raises(EmailServiceUnavailableError):
+        await send(service)
+
+    with pytest.raises(EmailCircuitOpenError) as exc_info:
+        await send(service)
+
+    assert email_service.calls == 2
+    assert exc_info.value.retry_after > 0
+    assert service.stats().circuit.state == CircuitState.OPEN
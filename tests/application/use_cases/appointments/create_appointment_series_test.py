@@ -0,0 +1,228 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.studio.use_cases.appointments_use_cases.create_appointment_series_use_case import (
+    MAX_SERIES_SESSIONS,
+    CreateAppointmentSeriesUseCase,
+)
+from app.application.studio.use_cases.DTO.create_appointment_series_dto import (
+    CreateAppointmentSeriesInput,
+)
+from app.core.exceptions.appointments import (
+    InvalidAppointmentSeriesError,
+    SlotIsAlreadyOccupiedError,
+    SlotIsNotAvailableError,
+)
+from app.core.exceptions.calendar import UserIsNotWorkingInDesignatedTimeframeError
+from app.core.exceptions.users import UserInactiveError
+from app.core.types.appointment_enums import AppointmentType
+from app.domain.studio.appointments.entities.value_objects.client_info import ClientInfo
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+from app.domain.studio.appointments.events.create_appointment_series_request import (
+    CreateAppointmentSeriesEmailRequested,
+)
+from app.domain.studio.appointments.policies.calendar_availability_policy import (
+    CalendarAvailabilityPolicy,
+)
+from tests.fakes.fake_event_bus import FakeIntegrationEventBus
+
+
+def _next_day() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+
+
+def _weekly_sessions(first_day: datetime, count: int) -> list[TimeSlot]:
+    return [
+        TimeSlot(
+            start_at=first_day + timedelta(weeks=week, hours=9),
+            end_at=first_day + timedelta(weeks=week, hours=11),
+        )
+        for week in range(count)
+    ]
+
+
+def _series_input(user_id, sessions, **kwargs) -> CreateAppointmentSeriesInput:
+    return CreateAppointmentSeriesInput(
+        appointment_type=AppointmentType.TATTOO,
+        user_id=user_id,
+        sessions=sessions,
+        placement="Costas",
+        details="Fechamento de costas",
+        size="60cm",
+        color=True,
+        client_info=ClientInfo(name="Jane Doe", email="jane@doe.com", phone="11999999999"),
+        actor_id=kwargs.get("actor_id"),
+    )
+
+
+def _use_case(write_uow, integration_bus=None, **kwargs) -> CreateAppointmentSeriesUseCase:
+    return CreateAppointmentSeriesUseCase(
+        write_uow=write_uow,
+        integration_bus=integration_bus or FakeIntegrationEventBus(),
+        calendar_policy=CalendarAvailabilityPolicy(),
+        **kwargs,
+    )
+
+
+def _setup_artist(write_uow, make_user, make_calendar_settings, booking_window_days: int = 60):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(
+        make_calendar_settings(
+            user_id=user.id,
+            booking_window_until=(_next_day() + timedelta(days=booking_window_days)).date(),
+        )
+    )
+
+    return user
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_series_successful(
+    make_user, write_uow, read_uow, make_calendar_settings
+):
+    user = _setup_artist(write_uow, make_user, make_calendar_settings)
+    sessions = _weekly_sessions(_next_day(), 4)
+    integration_bus = FakeIntegrationEventBus()
+
+    # sessions are numbered by date whatever order they are sent in
+    await _use_case(write_uow, integration_bus).execute(
+        _series_input(user.id, list(reversed(sessions)))
+    )
+
+    appointments = read_uow.appointments.find_overlap(
+        user_id=user.id, start_date=sessions[0].start_at, end_date=sessions[-1].end_at
+    )
+    logs = read_uow.audit_logs.find_many_by_entity_name(entity_name="appointments")
+
+    assert [appointment.start_at for appointment in appointments] == [
+        session.start_at for session in sessions
+    ]
+    assert [appointment.current_session for appointment in appointments] == [1, 2, 3, 4]
+    assert all(appointment.total_sessions == 4 for appointment in appointments)
+    assert len(logs) == 4
+
+    assert len(integration_bus.events) == 1
+    event = integration_bus.events[0]
+    assert isinstance(event, CreateAppointmentSeriesEmailRequested)
+    assert event.sessions == sessions
+    assert event.client_email_or_vip_id == "jane@doe.com"
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_series_keeps_artist_request_for_digest(
+    make_user, write_uow, make_calendar_settings
+):
+    user = _setup_artist(write_uow, make_user, make_calendar_settings)
+    sessions = _weekly_sessions(_next_day(), 3)
+    integration_bus = FakeIntegrationEventBus()
+
+    await _use_case(write_uow, integration_bus, digest_artist_requests=True).execute(
+        _series_input(user.id, sessions)
+    )
+
+    [entry] = write_uow.appointment_request_digests.entries.values()
+    assert entry.user_id == user.id
+    assert entry.start_at == sessions[0].start_at
+    assert entry.sessions_count == 3
+    assert integration_bus.events[0].notify_artist is False
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_series_is_all_or_nothing(
+    make_user, write_uow, read_uow, make_calendar_settings, make_appointment_base
+):
+    user = _setup_artist(write_uow, make_user, make_calendar_settings)
+    sessions = _weekly_sessions(_next_day(), 3)
+
+    write_uow.appointments.create(
+        make_appointment_base(
+            user_id=user.id,
+            start_at=sessions[2].start_at + timedelta(hours=1),
+            end_at=sessions[2].end_at + timedelta(hours=1),
+        )
+    )
+
+    with pytest.raises(SlotIsAlreadyOccupiedError):
+        await _use_case(write_uow).execute(_series_input(user.id, sessions))
+
+    appointments = read_uow.appointments.find_overlap(
+        user_id=user.id, start_date=sessions[0].start_at, end_date=sessions[-1].end_at
+    )
+    assert len(appointments) == 1
+    assert read_uow.audit_logs.find_many_by_entity_name(entity_name="appointments") == []
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_series_session_outside_working_period(
+    make_user, write_uow, read_uow, make_calendar_settings
+):
+    user = _setup_artist(write_uow, make_user, make_calendar_settings)
+    sessions = _weekly_sessions(_next_day(), 2)
+    sessions.append(
+        TimeSlot(
+            start_at=sessions[-1].start_at + timedelta(weeks=1, hours=5),
+            end_at=sessions[-1].end_at + timedelta(weeks=1, hours=5),
+        )
+    )
+
+    with pytest.raises(UserIsNotWorkingInDesignatedTimeframeError):
+        await _use_case(write_uow).execute(_series_input(user.id, sessions))
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_series_respects_booking_window(
+    make_user, write_uow, read_uow, make_calendar_settings
+):
+    user = _setup_artist(write_uow, make_user, make_calendar_settings, booking_window_days=10)
+    sessions = _weekly_sessions(_next_day(), 3)
+
+    with pytest.raises(SlotIsNotAvailableError):
+        await _use_case(write_uow).execute(_series_input(user.id, sessions))
+
+    await _use_case(write_uow).execute(_series_input(user.id, sessions, actor_id=user.id))
+
+    appointments = read_uow.appointments.find_overlap(
+        user_id=user.id, start_date=sessions[0].start_at, end_date=sessions[-1].end_at
+    )
+    assert len(appointments) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_series_invalid_sessions(
+    make_user, write_uow, read_uow, make_calendar_settings
+):
+    user = _setup_artist(write_uow, make_user, make_calendar_settings)
+    next_day = _next_day()
+    overlapping = [
+        TimeSlot(start_at=next_day + timedelta(hours=8), end_at=next_day + timedelta(hours=10)),
+        TimeSlot(start_at=next_day + timedelta(hours=9), end_at=next_day + timedelta(hours=11)),
+    ]
+
+    with pytest.raises(InvalidAppointmentSeriesError):
+        await _use_case(write_uow).execute(_series_input(user.id, []))
+
+    with pytest.raises(InvalidAppointmentSeriesError):
+        await _use_case(write_uow).execute(_series_input(user.id, overlapping))
+
+    with pytest.raises(InvalidAppointmentSeriesError):
+        await _use_case(write_uow).execute(
+            _series_input(user.id, _weekly_sessions(next_day, MAX_SERIES_SESSIONS + 1))
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_series_user_inactive(
+    make_user, write_uow, read_uow, make_calendar_settings
+):
+    user = make_user(is_active=False)
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    with pytest.raises(UserInactiveError):
+        await _use_case(write_uow).execute(
+            _series_input(user.id, _weekly_sessions(_next_day(), 2))
+        )
@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
@@ -52,7 +53,6 @@ async def test_create_appointment_successful(
 
     use_case = CreateAppointmentUseCase(
         write_uow=write_uow,
-        read_uow=read_uow,
         integration_bus=integration_bus,
         calendar_policy=calendar_policy,
     )
@@ -87,6 +87,53 @@ async def test_create_appointment_successful(
     assert len(integration_bus.events) == 1
 
 
+@pytest.mark.asyncio
+async def test_create_appointment_keeps_artist_request_for_digest(
+    make_user, write_uow, make_calendar_settings
+):
+    user = make_user()
+    write_uow.users.create(user)
+
+    next_day = datetime.now(timezone.utc).replace(hour=8, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    write_uow.calendar_settings.create(
+        make_calendar_settings(
+            user_id=user.id, booking_window_until=(next_day + timedelta(days=30)).date()
+        )
+    )
+
+    integration_bus = FakeIntegrationEventBus()
+    use_case = CreateAppointmentUseCase(
+        write_uow=write_uow,
+        integration_bus=integration_bus,
+        calendar_policy=CalendarAvailabilityPolicy(),
+        digest_artist_requests=True,
+    )
+    dto = CreateAppointmentInput(
+        appointment_type=AppointmentType.PIERCING,
+        user_id=user.id,
+        start_at=next_day + timedelta(hours=1),
+        end_at=next_day + timedelta(hours=2),
+        placement="Orelha",
+        details="Helix",
+        size="pequeno",
+        color=False,
+        client_info=ClientInfo(name="Jane Doe", email="jane@doe.com", phone="11999999999"),
+        referral_code=None,
+        actor_id=None,
+    )
+
+    await use_case.execute(dto)
+
+    [entry] = write_uow.appointment_request_digests.entries.values()
+    assert entry.user_id == user.id
+    assert entry.appointment_type == AppointmentType.PIERCING
+    assert entry.start_at == dto.start_at
+    assert entry.sessions_count == 1
+    assert integration_bus.events[0].notify_artist is False
+
+
 @pytest.mark.asyncio
 async def test_create_appointment_user_not_found(
     make_user,
@@ -117,7 +164,6 @@ async def test_create_appointment_user_not_found(
     calendar_policy = CalendarAvailabilityPolicy()
 
     use_case = CreateAppointmentUseCase(
-        read_uow=read_uow,
         write_uow=write_uow,
         integration_bus=integration_bus,
         calendar_policy=calendar_policy,
@@ -173,7 +219,6 @@ async def test_cannot_create_in_occupy_slot(
     calendar_policy = CalendarAvailabilityPolicy()
 
     use_case = CreateAppointmentUseCase(
-        read_uow=read_uow,
         write_uow=write_uow,
         integration_bus=integration_bus,
         calendar_policy=calendar_policy,
@@ -230,7 +275,6 @@ async def test_create_appointment_outside_booking_window_without_permission(
     write_uow.calendar_settings.create(calendar_settings)
 
     use_case = CreateAppointmentUseCase(
-        read_uow=read_uow,
         write_uow=write_uow,
         integration_bus=FakeIntegrationEventBus(),
         calendar_policy=CalendarAvailabilityPolicy(),
@@ -284,7 +328,6 @@ async def test_admin_can_create_outside_booking_window(
     integration_bus = FakeIntegrationEventBus()
 
     use_case = CreateAppointmentUseCase(
-        read_uow=read_uow,
         write_uow=write_uow,
         integration_bus=integration_bus,
         calendar_policy=CalendarAvailabilityPolicy(),
@@ -342,7 +385,6 @@ async def test_calendar_owner_can_create_outside_booking_window(
     end_at = start_at + timedelta(hours=1)
 
     use_case = CreateAppointmentUseCase(
-        read_uow=read_uow,
         write_uow=write_uow,
         integration_bus=FakeIntegrationEventBus(),
         calendar_policy=CalendarAvailabilityPolicy(),
@@ -403,7 +445,6 @@ async def test_user_cannot_ignore_other_users_booking_window(
     end_at = start_at + timedelta(hours=1)
 
     use_case = CreateAppointmentUseCase(
-        read_uow=read_uow,
         write_uow=write_uow,
         integration_bus=FakeIntegrationEventBus(),
         calendar_policy=CalendarAvailabilityPolicy(),
@@ -468,7 +509,6 @@ async def test_create_appointment_blocked_by_calendar_exception(
     write_uow.calendar_exceptions.create(exception)
 
     use_case = CreateAppointmentUseCase(
-        read_uow=read_uow,
         write_uow=write_uow,
         integration_bus=FakeIntegrationEventBus(),
         calendar_policy=CalendarAvailabilityPolicy(),
@@ -521,7 +561,6 @@ async def test_inactive_user_raises_error(
 
     use_case = CreateAppointmentUseCase(
         write_uow=write_uow,
-        read_uow=read_uow,
         integration_bus=integration_bus,
         calendar_policy=calendar_policy,
     )
@@ -543,3 +582,54 @@ async def test_inactive_user_raises_error(
 
     with pytest.raises(UserInactiveError):
         await use_case.execute(dto)
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_runs_repository_work_off_the_event_loop(
+    make_user, write_uow, read_uow, make_calendar_settings, make_vip_client
+):
+    user = make_user()
+    write_uow.users.create(user)
+
+    vip_client = make_vip_client()
+    write_uow.vip_clients.create(vip_client)
+
+    next_day = datetime.now(timezone.utc).replace(hour=8, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    event_loop_thread = threading.get_ident()
+    threads_used: list[int] = []
+    find_admission = write_uow.scheduling_admission.find_admission
+
+    def spy_find_admission(**kwargs):
+        threads_used.append(threading.get_ident())
+        return find_admission(**kwargs)
+
+    write_uow.scheduling_admission.find_admission = spy_find_admission
+
+    use_case = CreateAppointmentUseCase(
+        write_uow=write_uow,
+        integration_bus=FakeIntegrationEventBus(),
+        calendar_policy=CalendarAvailabilityPolicy(),
+    )
+
+    await use_case.execute(
+        CreateAppointmentInput(
+            appointment_type=AppointmentType.TATTOO,
+            user_id=user.id,
+            start_at=next_day + timedelta(hours=1),
+            end_at=next_day + timedelta(hours=2),
+            placement="Ombro",
+            details="Tatuagem de dragão oriental",
+            size="25cm",
+            color=True,
+            client_info=ClientInfo(vip_client_id=vip_client.id),
+            actor_id=user.id,
+        )
+    )
+
+    assert len(threads_used) == 1
+    assert threads_used[0] != event_loop_thread
+    assert write_uow.committed is True
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.studio.use_cases.appointments_use_cases.find_free_artists_use_case import (
+    FindFreeArtistsUseCase,
+)
+from app.application.studio.use_cases.DTO.find_free_artists_dto import FindFreeArtistsInput
+from app.core.exceptions.calendar import InvalidAvailabilitySearchRangeError
+from app.core.types.appointment_enums import AppointmentType
+from app.core.types.calendar_enums import CalendarExceptionType
+from app.domain.studio.appointments.policies.calendar_availability_policy import (
+    CalendarAvailabilityPolicy,
+)
+
+
+def _next_day() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+
+
+def _search(next_day: datetime, **kwargs) -> FindFreeArtistsInput:
+    return FindFreeArtistsInput(
+        start_at=kwargs.get("start_at", next_day + timedelta(hours=8)),
+        end_at=kwargs.get("end_at", next_day + timedelta(hours=12)),
+        appointment_type=AppointmentType.TATTOO,
+        duration_minutes=kwargs.get("duration_minutes", 60),
+        step_minutes=60,
+        actor_id=kwargs.get("actor_id"),
+    )
+
+
+def test_find_free_artists_successful(
+    make_user,
+    write_uow,
+    read_uow,
+    make_calendar_settings,
+    make_calendar_exception,
+    make_appointment_base,
+):
+    next_day = _next_day()
+
+    free_artist = make_user(username="free_artist", email="free@artist.com")
+    busy_artist = make_user(username="busy_artist", email="busy@artist.com")
+    blocked_artist = make_user(username="blocked_artist", email="blocked@artist.com")
+    inactive_artist = make_user(username="inactive_artist", email="inactive@artist.com", is_active=False)
+    artist_without_calendar = make_user(username="no_calendar", email="no@calendar.com")
+
+    for user in (free_artist, busy_artist, blocked_artist, inactive_artist, artist_without_calendar):
+        write_uow.users.create(user)
+
+    for user in (free_artist, busy_artist, blocked_artist, inactive_artist):
+        write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    write_uow.appointments.create(
+        make_appointment_base(
+            user_id=busy_artist.id,
+            start_at=next_day + timedelta(hours=8),
+            end_at=next_day + timedelta(hours=11),
+        )
+    )
+    write_uow.calendar_exceptions.create(
+        make_calendar_exception(
+            calendar_of_user=blocked_artist.id,
+            start_at=next_day,
+            end_at=next_day + timedelta(days=1),
+            exception_type=CalendarExceptionType.BLOCK,
+        )
+    )
+
+    use_case = FindFreeArtistsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    result = use_case.execute(_search(next_day))
+
+    assert result.appointment_type == AppointmentType.TATTOO
+    assert result.duration_minutes == 60
+    assert [artist.username for artist in result.artists] == ["free_artist", "busy_artist"]
+
+    free, busy = result.artists
+    assert [opening.start_at.hour for opening in free.earliest_openings] == [8, 9, 10]
+    assert [opening.start_at.hour for opening in busy.earliest_openings] == [11]
+
+
+def test_find_free_artists_nobody_free(make_user, write_uow, read_uow, make_calendar_settings):
+    next_day = _next_day()
+    artist = make_user()
+    write_uow.users.create(artist)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=artist.id))
+
+    use_case = FindFreeArtistsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    result = use_case.execute(
+        _search(
+            next_day,
+            start_at=next_day + timedelta(hours=13),
+            end_at=next_day + timedelta(hours=18),
+        )
+    )
+
+    assert result.artists == []
+
+
+def test_find_free_artists_admin_ignores_booking_window(
+    make_user, write_uow, read_uow, make_calendar_settings
+):
+    next_day = _next_day()
+    artist = make_user(username="artist", email="artist@artist.com")
+    admin = make_user(username="admin", email="admin@admin.com", is_admin=True)
+    write_uow.users.create(artist)
+    write_uow.users.create(admin)
+    write_uow.calendar_settings.create(
+        make_calendar_settings(user_id=artist.id, booking_window_until=next_day.date())
+    )
+
+    after_window = next_day + timedelta(days=2)
+    use_case = FindFreeArtistsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    anonymous = use_case.execute(
+        _search(
+            next_day,
+            start_at=after_window + timedelta(hours=8),
+            end_at=after_window + timedelta(hours=12),
+        )
+    )
+    as_admin = use_case.execute(
+        _search(
+            next_day,
+            start_at=after_window + timedelta(hours=8),
+            end_at=after_window + timedelta(hours=12),
+            actor_id=admin.id,
+        )
+    )
+
+    assert anonymous.artists == []
+    assert [artist.username for artist in as_admin.artists] == ["artist"]
+
+
+def test_find_free_artists_invalid_range(read_uow):
+    next_day = _next_day()
+    use_case = FindFreeArtistsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    with pytest.raises(InvalidAvailabilitySearchRangeError):
+        use_case.execute(_search(next_day, start_at=next_day, end_at=next_day + timedelta(days=8)))
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.studio.use_cases.appointments_use_cases.list_appointments_use_case import (
+    ListAppointmentsUseCase,
+)
+from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.list_appointments_dto import ListAppointmentsInput
+from app.core.exceptions.appointments import OnlyAdminOrOwnerOfAppointmentError
+from app.core.exceptions.validation import InvalidPageCursorError
+
+
+def _create_appointments(write_uow, make_quoted_appointment, user_id, quantity):
+    base_time = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+    appointments = []
+
+    for i in range(quantity):
+        appointment = make_quoted_appointment(
+            user_id=user_id,
+            start_at=base_time + timedelta(days=i),
+            end_at=base_time + timedelta(days=i, hours=1),
+        )
+        appointment.created_at = base_time + timedelta(minutes=i)
+        write_uow.appointments.create(appointment)
+        appointments.append(appointment)
+
+    return appointments
+
+
+def test_list_appointments_walks_pages_forward_and_back(
+    make_user, write_uow, read_uow, make_quoted_appointment
+):
+    admin = make_user(is_admin=True)
+    write_uow.users.create(admin)
+
+    created = _create_appointments(write_uow, make_quoted_appointment, admin.id, 5)
+    newest_first = [appointment.id for appointment in reversed(created)]
+
+    use_case = ListAppointmentsUseCase(read_uow)
+
+    first_page = use_case.execute(ListAppointmentsInput(actor=admin, limit=2))
+    second_page = use_case.execute(
+        ListAppointmentsInput(actor=admin, limit=2, cursor=first_page.next_cursor)
+    )
+    last_page = use_case.execute(
+        ListAppointmentsInput(actor=admin, limit=2, cursor=second_page.next_cursor)
+    )
+    back_to_second = use_case.execute(
+        ListAppointmentsInput(actor=admin, limit=2, cursor=last_page.prev_cursor)
+    )
+    back_to_first = use_case.execute(
+        ListAppointmentsInput(actor=admin, limit=2, cursor=back_to_second.prev_cursor)
+    )
+
+    assert [appointment.id for appointment in first_page.appointments] == newest_first[:2]
+    assert first_page.prev_cursor is None
+    assert [appointment.id for appointment in second_page.appointments] == newest_first[2:4]
+    assert [appointment.id for appointment in last_page.appointments] == newest_first[4:]
+    assert last_page.next_cursor is None
+
+    assert [appointment.id for appointment in back_to_second.appointments] == newest_first[2:4]
+    assert [appointment.id for appointment in back_to_first.appointments] == newest_first[:2]
+    assert back_to_first.prev_cursor is None
+    assert back_to_first.next_cursor is not None
+
+
+def test_list_appointments_ascending(make_user, write_uow, read_uow, make_quoted_appointment):
+    admin = make_user(is_admin=True)
+    write_uow.users.create(admin)
+
+    created = _create_appointments(write_uow, make_quoted_appointment, admin.id, 3)
+
+    use_case = ListAppointmentsUseCase(read_uow)
+
+    first_page = use_case.execute(ListAppointmentsInput(actor=admin, limit=2, direction=Direction.asc))
+    second_page = use_case.execute(
+        ListAppointmentsInput(
+            actor=admin, limit=2, direction=Direction.asc, cursor=first_page.next_cursor
+        )
+    )
+
+    assert [appointment.id for appointment in first_page.appointments] == [
+        created[0].id,
+        created[1].id,
+    ]
+    assert [appointment.id for appointment in second_page.appointments] == [created[2].id]
+    assert second_page.next_cursor is None
+
+
+def test_list_appointments_non_admin_only_sees_own_calendar(
+    make_user, write_uow, read_uow, make_quoted_appointment
+):
+    artist = make_user()
+    other_artist = make_user()
+    write_uow.users.create(artist)
+    write_uow.users.create(other_artist)
+
+    _create_appointments(write_uow, make_quoted_appointment, artist.id, 2)
+    _create_appointments(write_uow, make_quoted_appointment, other_artist.id, 3)
+
+    use_case = ListAppointmentsUseCase(read_uow)
+
+    result = use_case.execute(ListAppointmentsInput(actor=artist))
+
+    assert len(result.appointments) == 2
+    assert all(appointment.user_id == artist.id for appointment in result.appointments)
+
+    with pytest.raises(OnlyAdminOrOwnerOfAppointmentError):
+        use_case.execute(ListAppointmentsInput(actor=artist, user_id=other_artist.id))
+
+
+def test_list_appointments_invalid_cursor(make_user, read_uow):
+    admin = make_user(is_admin=True)
+
+    use_case = ListAppointmentsUseCase(read_uow)
+
+    with pytest.raises(InvalidPageCursorError):
+        use_case.execute(ListAppointmentsInput(actor=admin, cursor="not-a-cursor"))
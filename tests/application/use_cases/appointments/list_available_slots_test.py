@@ -0,0 +1,303 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.studio.services.calendar_index import CalendarIndex
+from app.application.studio.use_cases.appointments_use_cases.list_available_slots_use_case import (
+    ListAvailableSlotsUseCase,
+)
+from app.application.studio.use_cases.DTO.list_available_slots_dto import ListAvailableSlotsInput
+from app.core.exceptions.calendar import (
+    CannotFindWorkingPeriodsForThisUserError,
+    InvalidAvailabilitySearchRangeError,
+)
+from app.core.exceptions.users import UserInactiveError, UserNotFoundError
+from app.core.types.appointment_enums import AppointmentStatus
+from app.domain.studio.appointments.policies.calendar_availability_policy import (
+    CalendarAvailabilityPolicy,
+)
+
+
+def _next_day() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+
+
+def test_list_available_slots_successful(
+    make_user, write_uow, read_uow, make_calendar_settings, make_appointment_base
+):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    next_day = _next_day()
+    write_uow.appointments.create(
+        make_appointment_base(
+            user_id=user.id,
+            start_at=next_day + timedelta(hours=9),
+            end_at=next_day + timedelta(hours=10),
+        )
+    )
+
+    use_case = ListAvailableSlotsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    result = use_case.execute(
+        ListAvailableSlotsInput(
+            user_id=user.id,
+            start_at=next_day,
+            end_at=next_day + timedelta(days=1),
+            duration_minutes=60,
+            step_minutes=60,
+        )
+    )
+
+    assert result.user_id == user.id
+    assert result.duration_minutes == 60
+    assert [slot.start_at.hour for slot in result.slots] == [8, 10, 11]
+
+
+def test_list_available_slots_ignores_canceled_appointments(
+    make_user, write_uow, read_uow, make_calendar_settings, make_appointment_base
+):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    next_day = _next_day()
+    write_uow.appointments.create(
+        make_appointment_base(
+            user_id=user.id,
+            start_at=next_day + timedelta(hours=9),
+            end_at=next_day + timedelta(hours=10),
+            status=AppointmentStatus.CANCELED,
+        )
+    )
+
+    use_case = ListAvailableSlotsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    result = use_case.execute(
+        ListAvailableSlotsInput(
+            user_id=user.id,
+            start_at=next_day,
+            end_at=next_day + timedelta(days=1),
+            duration_minutes=60,
+            step_minutes=60,
+        )
+    )
+
+    assert [slot.start_at.hour for slot in result.slots] == [8, 9, 10, 11]
+
+
+def test_list_available_slots_owner_can_ignore_booking_window(
+    make_user, write_uow, read_uow, make_calendar_settings
+):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    after_window = _next_day() + timedelta(days=40)
+
+    use_case = ListAvailableSlotsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    as_client = use_case.execute(
+        ListAvailableSlotsInput(
+            user_id=user.id,
+            start_at=after_window,
+            end_at=after_window + timedelta(days=1),
+            duration_minutes=60,
+            step_minutes=60,
+        )
+    )
+    as_owner = use_case.execute(
+        ListAvailableSlotsInput(
+            user_id=user.id,
+            start_at=after_window,
+            end_at=after_window + timedelta(days=1),
+            duration_minutes=60,
+            step_minutes=60,
+            actor_id=user.id,
+        )
+    )
+
+    assert as_client.slots == []
+    assert len(as_owner.slots) == 4
+
+
+def test_list_available_slots_invalid_range(read_uow):
+    next_day = _next_day()
+    use_case = ListAvailableSlotsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    with pytest.raises(InvalidAvailabilitySearchRangeError):
+        use_case.execute(
+            ListAvailableSlotsInput(
+                user_id=uuid4(),
+                start_at=next_day,
+                end_at=next_day - timedelta(hours=1),
+                duration_minutes=60,
+            )
+        )
+
+    with pytest.raises(InvalidAvailabilitySearchRangeError):
+        use_case.execute(
+            ListAvailableSlotsInput(
+                user_id=uuid4(),
+                start_at=next_day,
+                end_at=next_day + timedelta(days=32),
+                duration_minutes=60,
+            )
+        )
+
+
+def test_list_available_slots_user_not_found(read_uow):
+    next_day = _next_day()
+    use_case = ListAvailableSlotsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    with pytest.raises(UserNotFoundError):
+        use_case.execute(
+            ListAvailableSlotsInput(
+                user_id=uuid4(),
+                start_at=next_day,
+                end_at=next_day + timedelta(days=1),
+                duration_minutes=60,
+            )
+        )
+
+
+def test_list_available_slots_user_inactive(make_user, write_uow, read_uow):
+    user = make_user(is_active=False)
+    write_uow.users.create(user)
+
+    next_day = _next_day()
+    use_case = ListAvailableSlotsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    with pytest.raises(UserInactiveError):
+        use_case.execute(
+            ListAvailableSlotsInput(
+                user_id=user.id,
+                start_at=next_day,
+                end_at=next_day + timedelta(days=1),
+                duration_minutes=60,
+            )
+        )
+
+
+def test_list_available_slots_without_calendar_settings(make_user, write_uow, read_uow):
+    user = make_user()
+    write_uow.users.create(user)
+
+    next_day = _next_day()
+    use_case = ListAvailableSlotsUseCase(uow=read_uow, calendar_policy=CalendarAvailabilityPolicy())
+
+    with pytest.raises(CannotFindWorkingPeriodsForThisUserError):
+        use_case.execute(
+            ListAvailableSlotsInput(
+                user_id=user.id,
+                start_at=next_day,
+                end_at=next_day + timedelta(days=1),
+                duration_minutes=60,
+            )
+        )
+
+
+def test_list_available_slots_answers_from_calendar_index(
+    make_user, write_uow, read_uow, make_calendar_settings, make_appointment_base
+):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    next_day = _next_day()
+    calendar_index = CalendarIndex(ttl=timedelta(seconds=60))
+    use_case = ListAvailableSlotsUseCase(
+        uow=read_uow, calendar_policy=CalendarAvailabilityPolicy(), calendar_index=calendar_index
+    )
+    search = ListAvailableSlotsInput(
+        user_id=user.id,
+        start_at=next_day,
+        end_at=next_day + timedelta(days=1),
+        duration_minutes=60,
+        step_minutes=60,
+    )
+
+    first_result = use_case.execute(search)
+
+    # written behind the index back, so only an invalidation can reveal it
+    write_uow.appointments.create(
+        make_appointment_base(
+            user_id=user.id,
+            start_at=next_day + timedelta(hours=9),
+            end_at=next_day + timedelta(hours=10),
+        )
+    )
+
+    cached_result = use_case.execute(search)
+
+    calendar_index.invalidate([user.id])
+    fresh_result = use_case.execute(search)
+
+    assert [slot.start_at.hour for slot in first_result.slots] == [8, 9, 10, 11]
+    assert cached_result == first_result
+    assert [slot.start_at.hour for slot in fresh_result.slots] == [8, 10, 11]
+
+
+def test_list_available_slots_caches_the_booking_horizon(
+    make_user, write_uow, read_uow, make_calendar_settings, mocker
+):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    next_day = _next_day()
+    calendar_index = CalendarIndex(ttl=timedelta(seconds=60))
+    use_case = ListAvailableSlotsUseCase(
+        uow=read_uow, calendar_policy=CalendarAvailabilityPolicy(), calendar_index=calendar_index
+    )
+    find_overlap = mocker.spy(read_uow.appointments, "find_overlap")
+
+    for days_ahead in (0, 7, 14):
+        use_case.execute(
+            ListAvailableSlotsInput(
+                user_id=user.id,
+                start_at=next_day + timedelta(days=days_ahead),
+                end_at=next_day + timedelta(days=days_ahead + 1),
+                duration_minutes=60,
+            )
+        )
+
+    assert find_overlap.call_count == 1
+
+
+def test_list_available_slots_does_not_cache_snapshot_invalidated_while_loading(
+    make_user, write_uow, read_uow, make_calendar_settings, mocker
+):
+    user = make_user()
+    write_uow.users.create(user)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    next_day = _next_day()
+    calendar_index = CalendarIndex(ttl=timedelta(seconds=60))
+    use_case = ListAvailableSlotsUseCase(
+        uow=read_uow, calendar_policy=CalendarAvailabilityPolicy(), calendar_index=calendar_index
+    )
+    find_overlap = read_uow.appointments.find_overlap
+
+    # a write commits between the reader's load and its put
+    def find_overlap_then_invalidate(**kwargs):
+        appointments = find_overlap(**kwargs)
+        calendar_index.invalidate([user.id])
+        return appointments
+
+    mocker.patch.object(read_uow.appointments, "find_overlap", side_effect=find_overlap_then_invalidate)
+
+    use_case.execute(
+        ListAvailableSlotsInput(
+            user_id=user.id,
+            start_at=next_day,
+            end_at=next_day + timedelta(days=1),
+            duration_minutes=60,
+        )
+    )
+
+    assert calendar_index.get(user.id, start_at=next_day, end_at=next_day + timedelta(days=1)) is None
@@ -12,14 +12,15 @@ from app.core.exceptions.users import AuthenticationFailedError, EmailAlreadyTak
 from app.core.types.audit_actor_type import AuditActorType
 
 
-def test_change_email(write_uow, read_uow, make_user):
+@pytest.mark.asyncio
+async def test_change_email(write_uow, read_uow, make_user):
     user = make_user(access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
 
     use_case = ChangeEmailUseCase(write_uow)
     input_data = ChangeEmailInput(user_id=user.id, password="123456", new_email="new@email.com")
 
-    use_case.execute(input_data)
+    await use_case.execute(input_data)
 
     saved = read_uow.users.find_by_id(user.id)
     assert saved.email == "new@email.com"
@@ -27,7 +28,8 @@ def test_change_email(write_uow, read_uow, make_user):
     assert saved.refresh_token_version == 1
 
 
-def test_change_email_create_log(write_uow, read_uow, make_user):
+@pytest.mark.asyncio
+async def test_change_email_create_log(write_uow, read_uow, make_user):
     user = make_user(access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
     old_email = user.email
@@ -35,7 +37,7 @@ def test_change_email_create_log(write_uow, read_uow, make_user):
     use_case = ChangeEmailUseCase(write_uow)
     input_data = ChangeEmailInput(user_id=user.id, password="123456", new_email="new@email.com")
 
-    use_case.execute(input_data)
+    await use_case.execute(input_data)
 
     logs = read_uow.audit_logs.find_many_by_actor(actor_id=user.id)
     log = logs[0]
@@ -54,14 +56,15 @@ def test_change_email_create_log(write_uow, read_uow, make_user):
     assert abs(log.performed_at - datetime.now(timezone.utc)) < timedelta(seconds=2)
 
 
-def test_change_to_same_email_should_pass(write_uow, read_uow, make_user):
+@pytest.mark.asyncio
+async def test_change_to_same_email_should_pass(write_uow, read_uow, make_user):
     user = make_user(email="jhon@doe.com")
     write_uow.users.create(user)
 
     use_case = ChangeEmailUseCase(write_uow)
     input_data = ChangeEmailInput(user_id=user.id, password="123456", new_email="jhon@doe.com")
 
-    use_case.execute(input_data)
+    await use_case.execute(input_data)
 
     saved = read_uow.users.find_by_id(user.id)
     assert saved.email == "jhon@doe.com"
@@ -70,7 +73,8 @@ def test_change_to_same_email_should_pass(write_uow, read_uow, make_user):
     assert logs == []
 
 
-def test_change_email_wrond_password(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_change_email_wrond_password(write_uow, make_user, read_uow):
     user = make_user(access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
 
@@ -78,7 +82,7 @@ def test_change_email_wrond_password(write_uow, make_user, read_uow):
     input_data = ChangeEmailInput(user_id=user.id, password="wrong_password", new_email="new@email.com")
 
     with pytest.raises(AuthenticationFailedError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
     assert user.access_token_version == 0
     assert user.refresh_token_version == 0
@@ -87,7 +91,8 @@ def test_change_email_wrond_password(write_uow, make_user, read_uow):
     assert logs == []
 
 
-def test_change_email_already_in_use(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_change_email_already_in_use(write_uow, make_user, read_uow):
     user1 = make_user(email="taken@email.com")
     user2 = make_user(email="new_user@email.com")
     write_uow.users.create(user1)
@@ -97,7 +102,7 @@ def test_change_email_already_in_use(write_uow, make_user, read_uow):
     input_data = ChangeEmailInput(user_id=user2.id, password="123456", new_email="taken@email.com")
 
     with pytest.raises(EmailAlreadyTakenError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
     logs = read_uow.audit_logs.find_many_by_actor(actor_id=user2.id)
     assert logs == []
@@ -11,7 +11,8 @@ from app.core.security.passwords import verify_password
 from app.core.types.audit_actor_type import AuditActorType
 
 
-def test_change_password(write_uow, read_uow, make_user):
+@pytest.mark.asyncio
+async def test_change_password(write_uow, read_uow, make_user):
     user = make_user(password_token_version=0, access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
 
@@ -22,7 +23,7 @@ def test_change_password(write_uow, read_uow, make_user):
 
     old_hash = user.hashed_password
 
-    use_case.execute(input_data)
+    await use_case.execute(input_data)
 
     assert user.hashed_password != old_hash
 
@@ -35,7 +36,8 @@ def test_change_password(write_uow, read_uow, make_user):
     assert saved.refresh_token_version == 1
 
 
-def test_change_password_create_log(write_uow, read_uow, make_user):
+@pytest.mark.asyncio
+async def test_change_password_create_log(write_uow, read_uow, make_user):
     user = make_user(password_token_version=0, access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
 
@@ -44,7 +46,7 @@ def test_change_password_create_log(write_uow, read_uow, make_user):
         user_id=user.id, old_password="123456", new_password="StrongPassword1"
     )
 
-    use_case.execute(input_data)
+    await use_case.execute(input_data)
 
     logs = read_uow.audit_logs.find_many_by_actor(actor_id=user.id)
     log = logs[0]
@@ -58,7 +60,8 @@ def test_change_password_create_log(write_uow, read_uow, make_user):
     assert abs(log.performed_at - datetime.now(timezone.utc)) < timedelta(seconds=2)
 
 
-def test_wrong_old_password(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_wrong_old_password(write_uow, make_user, read_uow):
     user = make_user(password_token_version=0, access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
 
@@ -68,7 +71,7 @@ def test_wrong_old_password(write_uow, make_user, read_uow):
     )
 
     with pytest.raises(AuthenticationFailedError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
     assert user.password_token_version == 0
     assert user.access_token_version == 0
@@ -19,7 +19,8 @@ from app.core.security.passwords import verify_password
 from app.core.types.audit_actor_type import AuditActorType
 
 
-def test_first_activation_of_user_success(write_uow, make_user):
+@pytest.mark.asyncio
+async def test_first_activation_of_user_success(write_uow, make_user):
     user = make_user(
         has_activated_once=False,
         is_active=False,
@@ -30,7 +31,7 @@ def test_first_activation_of_user_success(write_uow, make_user):
     use_case = FirstActivationUserUseCase(write_uow)
     dto = FirstActivationInput(user_id=user.id, token_version=0, username="JhonDoe", password="JhonDoe1")
 
-    use_case.execute(dto)
+    await use_case.execute(dto)
 
     assert user.username == "JhonDoe"
     assert verify_password("JhonDoe1", user.hashed_password) is True
@@ -39,7 +40,8 @@ def test_first_activation_of_user_success(write_uow, make_user):
     assert user.activation_token_version == 1
 
 
-def test_first_activation_of_user_create_log(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_first_activation_of_user_create_log(write_uow, make_user, read_uow):
     user = make_user(
         has_activated_once=False,
         is_active=False,
@@ -50,7 +52,7 @@ def test_first_activation_of_user_create_log(write_uow, make_user, read_uow):
     use_case = FirstActivationUserUseCase(write_uow)
     dto = FirstActivationInput(user_id=user.id, token_version=0, username="JhonDoe", password="JhonDoe1")
 
-    use_case.execute(dto)
+    await use_case.execute(dto)
 
     logs = read_uow.audit_logs.find_many_by_entity_name(entity_name="users")
 
@@ -73,7 +75,8 @@ def test_first_activation_of_user_create_log(write_uow, make_user, read_uow):
     assert abs(log.performed_at - datetime.now(timezone.utc)) < timedelta(seconds=2)
 
 
-def test_not_user_cannot_be_activated(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_not_user_cannot_be_activated(write_uow, make_user, read_uow):
     user = make_user(
         has_activated_once=False,
         is_active=False,
@@ -83,7 +86,7 @@ def test_not_user_cannot_be_activated(write_uow, make_user, read_uow):
     use_case = FirstActivationUserUseCase(write_uow)
     dto = FirstActivationInput(user_id=user.id, token_version=0, username="JhonDoe", password="JhonDoe1")
     with pytest.raises(UserNotFoundError):
-        use_case.execute(dto)
+        await use_case.execute(dto)
 
     assert user.username == ""
     assert user.has_activated_once is False
@@ -94,7 +97,8 @@ def test_not_user_cannot_be_activated(write_uow, make_user, read_uow):
     assert logs == []
 
 
-def test_user_activated_before_cannot_be_first_activated(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_user_activated_before_cannot_be_first_activated(write_uow, make_user, read_uow):
     user = make_user(
         has_activated_once=True,
         is_active=False,
@@ -105,7 +109,7 @@ def test_user_activated_before_cannot_be_first_activated(write_uow, make_user, r
     use_case = FirstActivationUserUseCase(write_uow)
     dto = FirstActivationInput(user_id=user.id, token_version=1, username="JhonDoe", password="JhonDoe1")
     with pytest.raises(UserActivatedBeforeError):
-        use_case.execute(dto)
+        await use_case.execute(dto)
 
     assert user.username == ""
     assert user.has_activated_once is True
@@ -116,7 +120,8 @@ def test_user_activated_before_cannot_be_first_activated(write_uow, make_user, r
     assert logs == []
 
 
-def test_invalid_token_version(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_invalid_token_version(write_uow, make_user, read_uow):
     user = make_user(
         has_activated_once=False,
         is_active=False,
@@ -127,7 +132,7 @@ def test_invalid_token_version(write_uow, make_user, read_uow):
     use_case = FirstActivationUserUseCase(write_uow)
     dto = FirstActivationInput(user_id=user.id, token_version=1, username="JhonDoe", password="JhonDoe1")
     with pytest.raises(InvalidActivationTokenError):
-        use_case.execute(dto)
+        await use_case.execute(dto)
 
     assert user.username == ""
     assert user.has_activated_once is False
@@ -138,7 +143,8 @@ def test_invalid_token_version(write_uow, make_user, read_uow):
     assert logs == []
 
 
-def test_invalid_username(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_invalid_username(write_uow, make_user, read_uow):
     user = make_user(
         has_activated_once=False,
         is_active=False,
@@ -149,7 +155,7 @@ def test_invalid_username(write_uow, make_user, read_uow):
     use_case = FirstActivationUserUseCase(write_uow)
     dto = FirstActivationInput(user_id=user.id, token_version=0, username="jh", password="JhonDoe1")
     with pytest.raises(ValidationError) as exception:
-        use_case.execute(dto)
+        await use_case.execute(dto)
 
     assert str(exception.value) == "username_must_have_between_3_and_30_characters"
     assert user.username == ""
@@ -161,7 +167,8 @@ def test_invalid_username(write_uow, make_user, read_uow):
     assert logs == []
 
 
-def test_username_already_taken(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_username_already_taken(write_uow, make_user, read_uow):
     first_user = make_user(username="JhonDoe")
     write_uow.users.create(first_user)
     user = make_user(
@@ -175,7 +182,7 @@ def test_username_already_taken(write_uow, make_user, read_uow):
     use_case = FirstActivationUserUseCase(write_uow)
     dto = FirstActivationInput(user_id=user.id, token_version=0, username="JhonDoe", password="JhonDoe1")
     with pytest.raises(UsernameAlreadyTakenError):
-        use_case.execute(dto)
+        await use_case.execute(dto)
 
     assert user.username == ""
     assert user.has_activated_once is False
@@ -186,7 +193,8 @@ def test_username_already_taken(write_uow, make_user, read_uow):
     assert logs == []
 
 
-def test_invalid_password(write_uow, make_user, read_uow):
+@pytest.mark.asyncio
+async def test_invalid_password(write_uow, make_user, read_uow):
 
     user = make_user(
         has_activated_once=False,
@@ -201,7 +209,7 @@ def test_invalid_password(write_uow, make_user, read_uow):
         user_id=user.id, token_version=0, username="JhonDoe", password="Jhon Doe 1"
     )
     with pytest.raises(ValidationError) as exception:
-        use_case.execute(dto)
+        await use_case.execute(dto)
 
     assert str(exception.value) == "password_cannot_contain_spaces"
     assert user.username == ""
@@ -6,14 +6,15 @@ from app.core.exceptions.users import AuthenticationFailedError, UserInactiveErr
 from app.core.security import jwt_service
 
 
-def test_login_sucess(read_uow, write_uow, make_user, access_token_service, refresh_token_service):
+@pytest.mark.asyncio
+async def test_login_sucess(read_uow, write_uow, make_user, access_token_service, refresh_token_service):
     user = make_user(access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
 
     use_case = LoginUserUseCase(read_uow, access_token_service, refresh_token_service)
     input_data = LoginInput(identifier="JhonDoe", password="123456")
 
-    result = use_case.execute(input_data)
+    result = await use_case.execute(input_data)
 
     access_payload = jwt_service.decode(result.access_token)
     refresh_payload = jwt_service.decode(result.refresh_token)
@@ -27,7 +28,10 @@ def test_login_sucess(read_uow, write_uow, make_user, access_token_service, refr
     assert len(result.refresh_token) > 10
 
 
-def test_user_not_found(read_uow, write_uow, make_user, access_token_service, refresh_token_service):
+@pytest.mark.asyncio
+async def test_user_not_found(
+    read_uow, write_uow, make_user, access_token_service, refresh_token_service
+):
     user = make_user()
     write_uow.users.create(user)
 
@@ -36,10 +40,13 @@ def test_user_not_found(read_uow, write_uow, make_user, access_token_service, re
     input_data = LoginInput(identifier="invalidUser", password="123456")
 
     with pytest.raises(AuthenticationFailedError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
 
-def test_wrong_password(read_uow, write_uow, make_user, access_token_service, refresh_token_service):
+@pytest.mark.asyncio
+async def test_wrong_password(
+    read_uow, write_uow, make_user, access_token_service, refresh_token_service
+):
     user = make_user()
     write_uow.users.create(user)
 
@@ -47,10 +54,13 @@ def test_wrong_password(read_uow, write_uow, make_user, access_token_service, re
     input_data = LoginInput(identifier="JhonDoe", password="wrong_password")
 
     with pytest.raises(AuthenticationFailedError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
 
-def test_inactive_user(read_uow, write_uow, make_user, access_token_service, refresh_token_service):
+@pytest.mark.asyncio
+async def test_inactive_user(
+    read_uow, write_uow, make_user, access_token_service, refresh_token_service
+):
     user = make_user(is_active=False)
     write_uow.users.create(user)
 
@@ -58,4 +68,4 @@ def test_inactive_user(read_uow, write_uow, make_user, access_token_service, ref
     input_data = LoginInput(identifier="JhonDoe", password="123456")
 
     with pytest.raises(UserInactiveError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
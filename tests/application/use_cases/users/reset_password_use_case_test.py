@@ -16,7 +16,8 @@ from app.core.security.passwords import verify_password
 from app.core.types.audit_actor_type import AuditActorType
 
 
-def test_reset_password_success(read_uow, write_uow, make_user):
+@pytest.mark.asyncio
+async def test_reset_password_success(read_uow, write_uow, make_user):
     user = make_user(password_token_version=0, access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
     old_hash = user.hashed_password
@@ -27,7 +28,7 @@ def test_reset_password_success(read_uow, write_uow, make_user):
         password="StrongPassword1", user_id=user.id, password_token_version=0
     )
 
-    use_case.execute(input_data)
+    await use_case.execute(input_data)
 
     assert old_hash != user.hashed_password
     saved = read_uow.users.find_by_id(user.id)
@@ -37,7 +38,8 @@ def test_reset_password_success(read_uow, write_uow, make_user):
     assert saved.refresh_token_version == 1
 
 
-def test_reset_password_create_log(read_uow, write_uow, make_user):
+@pytest.mark.asyncio
+async def test_reset_password_create_log(read_uow, write_uow, make_user):
     user = make_user(password_token_version=0, access_token_version=0, refresh_token_version=0)
     write_uow.users.create(user)
 
@@ -47,7 +49,7 @@ def test_reset_password_create_log(read_uow, write_uow, make_user):
         password="StrongPassword1", user_id=user.id, password_token_version=0
     )
 
-    use_case.execute(input_data)
+    await use_case.execute(input_data)
 
     logs = read_uow.audit_logs.find_many_by_entity_name(entity_name="users")
 
@@ -66,7 +68,8 @@ def test_reset_password_create_log(read_uow, write_uow, make_user):
     assert abs(log.performed_at - datetime.now(timezone.utc)) < timedelta(seconds=2)
 
 
-def test_reset_password_wrong_user_id(read_uow, write_uow, make_user):
+@pytest.mark.asyncio
+async def test_reset_password_wrong_user_id(read_uow, write_uow, make_user):
     user = make_user(password_token_version=0)
     write_uow.users.create(user)
     wrong_id = uuid4()
@@ -78,7 +81,7 @@ def test_reset_password_wrong_user_id(read_uow, write_uow, make_user):
     )
 
     with pytest.raises(UserNotFoundError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
     saved = read_uow.users.find_by_id(user.id)
     assert saved.password_token_version == 0
@@ -87,7 +90,8 @@ def test_reset_password_wrong_user_id(read_uow, write_uow, make_user):
     assert logs == []
 
 
-def test_reset_password_wrong_token_version(write_uow, read_uow, make_user):
+@pytest.mark.asyncio
+async def test_reset_password_wrong_token_version(write_uow, read_uow, make_user):
     user = make_user(password_token_version=1)
     write_uow.users.create(user)
 
@@ -98,7 +102,7 @@ def test_reset_password_wrong_token_version(write_uow, read_uow, make_user):
     )
 
     with pytest.raises(InvalidPasswordTokenError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
     saved = read_uow.users.find_by_id(user.id)
     assert saved.password_token_version == 1
@@ -107,7 +111,8 @@ def test_reset_password_wrong_token_version(write_uow, read_uow, make_user):
     assert logs == []
 
 
-def test_reset_password_user_inactive(write_uow, read_uow, make_user):
+@pytest.mark.asyncio
+async def test_reset_password_user_inactive(write_uow, read_uow, make_user):
     user = make_user(password_token_version=0, is_active=False)
     write_uow.users.create(user)
 
@@ -118,7 +123,7 @@ def test_reset_password_user_inactive(write_uow, read_uow, make_user):
     )
 
     with pytest.raises(UserInactiveError):
-        use_case.execute(input_data)
+        await use_case.execute(input_data)
 
     saved = read_uow.users.find_by_id(user.id)
     assert saved.password_token_version == 0
@@ -1,7 +1,9 @@
+from datetime import timedelta
 from uuid import uuid4
 
 import pytest
 
+from app.application.studio.services.access_token_cache import AccessTokenCache
 from app.application.studio.use_cases.DTO.login_dto import VerifyInput
 from app.application.studio.use_cases.users_use_cases.verify_user import (
     VerifyUserUseCase,
@@ -92,3 +94,50 @@ def test_expired_token(read_uow, write_uow, make_user, access_token_service):
         use_case.execute(input_data)
 
     assert str(exception.value) == "invalid_token"
+
+
+def test_verify_user_with_cache_skips_decoding_and_user_lookup(
+    read_uow, write_uow, make_user, access_token_service, mocker
+):
+    user = make_user(is_admin=True)
+    write_uow.users.create(user)
+
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30))
+    use_case = VerifyUserUseCase(read_uow, access_token_service, cache)
+    access_token = access_token_service.create(user_id=str(user.id), version=0)
+    input_data = VerifyInput(authorization=f"Bearer {access_token}")
+
+    use_case.execute(input_data)
+
+    verify_spy = mocker.spy(access_token_service, "verify")
+    find_spy = mocker.spy(read_uow.users, "find_by_id")
+
+    result = use_case.execute(input_data)
+
+    assert result.user.id == user.id
+    assert result.user.is_admin is True
+    assert verify_spy.call_count == 0
+    assert find_spy.call_count == 0
+
+
+def test_verify_user_with_cache_sees_revocation_after_invalidation(
+    read_uow, write_uow, make_user, access_token_service
+):
+    user = make_user(access_token_version=0)
+    write_uow.users.create(user)
+
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30))
+    use_case = VerifyUserUseCase(read_uow, access_token_service, cache)
+    access_token = access_token_service.create(user_id=str(user.id), version=0)
+    input_data = VerifyInput(authorization=f"Bearer {access_token}")
+
+    use_case.execute(input_data)
+
+    user.logout()
+    write_uow.users.update(user)
+    cache.invalidate_users([user.id])
+
+    with pytest.raises(TokenError) as exception:
+        use_case.execute(input_data)
+
+    assert str(exception.value) == "token_revoked"
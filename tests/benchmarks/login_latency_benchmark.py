@@ -0,0 +1,74 @@
+"""
+Latency of unrelated sync work during a burst of concurrent logins. Each login is a
+bcrypt verify; the unrelated work is a no-op handed to the shared anyio thread
+pool, like a sync route or dependency would be. The burst runs once with bcrypt on
+that shared pool, as before the dedicated executor, and once on
+`password_hashing_pool`. Not collected by pytest, run it from the repository root
+with
+
+    python -m tests.benchmarks.login_latency_benchmark
+"""
+
+import asyncio
+import statistics
+import time
+
+import anyio
+
+from app.core.security.passwords import hash_password, verify_password, verify_password_async
+
+LOGINS = 120
+PROBE_INTERVAL = 0.01
+HASHED = hash_password("123456")
+
+
+async def _shared_pool_login() -> None:
+    await anyio.to_thread.run_sync(verify_password, "123456", HASHED)
+
+
+async def _dedicated_pool_login() -> None:
+    await verify_password_async("123456", HASHED)
+
+
+async def _probe(latencies: list[float], done: asyncio.Event) -> None:
+    while not done.is_set():
+        started = time.perf_counter()
+        await anyio.to_thread.run_sync(lambda: None)
+        latencies.append(time.perf_counter() - started)
+
+        await asyncio.sleep(PROBE_INTERVAL)
+
+
+async def _burst(login) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    done = asyncio.Event()
+    probe = asyncio.create_task(_probe(latencies, done))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(LOGINS)))
+    elapsed = time.perf_counter() - started
+
+    done.set()
+    await probe
+
+    return latencies, elapsed
+
+
+def _percentile(latencies: list[float], percentile: int) -> float:
+    return statistics.quantiles(latencies, n=100, method="inclusive")[percentile - 1]
+
+
+async def main() -> None:
+    print(f"{LOGINS} concurrent logins, no-op probe on the shared thread pool")
+    print(f"{'bcrypt on':<16}{'p50':>12}{'p99':>12}{'burst':>12}")
+
+    for name, login in (("shared pool", _shared_pool_login), ("dedicated pool", _dedicated_pool_login)):
+        latencies, elapsed = await _burst(login)
+
+        p50 = _percentile(latencies, 50) * 1_000
+        p99 = _percentile(latencies, 99) * 1_000
+        print(f"{name:<16}{p50:>9.1f} ms{p99:>9.1f} ms{elapsed:>10.1f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
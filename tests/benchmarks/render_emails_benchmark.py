@@ -0,0 +1,87 @@
+"""
+Times every notification renderer, one email at a time and for a bulk run of
+many recipients. Inputs repeat like in a bulk announcement, so the cached
+renderers report their warm cost. Not collected by pytest, run it from the
+repository root with
+
+    python -m tests.benchmarks.render_emails_benchmark
+"""
+
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from app.application.notifications.handlers.utils.render_account_activated_email import (
+    render_account_activated_email,
+)
+from app.application.notifications.handlers.utils.render_activation_email import (
+    render_activation_email,
+)
+from app.application.notifications.handlers.utils.render_booking_window_email import (
+    render_booking_window_email,
+)
+from app.application.notifications.handlers.utils.render_create_appointment_client_email import (
+    render_create_appointment_client_email,
+)
+from app.application.notifications.handlers.utils.render_create_appointment_series_client_email import (
+    render_create_appointment_series_client_email,
+)
+from app.application.notifications.handlers.utils.render_create_appointment_series_user_email import (
+    render_create_appointment_series_user_email,
+)
+from app.application.notifications.handlers.utils.render_create_appointment_user_email import (
+    render_create_appointment_user_email,
+)
+from app.application.notifications.handlers.utils.render_password_reset_email import (
+    render_password_reset_email,
+)
+from app.application.notifications.handlers.utils.render_quote_appointment_email import (
+    render_quote_appointment_client_email,
+)
+from app.application.notifications.handlers.utils.render_vip_account_created_email import (
+    render_vip_account_created_email,
+)
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+
+START_AT = datetime(2026, 3, 4, 10, 0)
+END_AT = START_AT + timedelta(hours=2)
+SESSIONS = [
+    TimeSlot(start_at=START_AT + timedelta(weeks=week), end_at=END_AT + timedelta(weeks=week))
+    for week in range(4)
+]
+RECIPIENTS = 10_000
+
+RENDERERS = {
+    "account_activated": lambda: render_account_activated_email(),
+    "activation": lambda: render_activation_email("https://frontend/activate?token=abc"),
+    "booking_window": lambda: render_booking_window_email(date(2026, 5, 1)),
+    "create_appointment_client": lambda: render_create_appointment_client_email(
+        start_at=START_AT, end_at=END_AT, appointment_type="tattoo"
+    ),
+    "create_appointment_user": lambda: render_create_appointment_user_email(
+        start_at=START_AT, end_at=END_AT, appointment_type="tattoo"
+    ),
+    "create_appointment_series_client": lambda: render_create_appointment_series_client_email(
+        sessions=SESSIONS, appointment_type="tattoo"
+    ),
+    "create_appointment_series_user": lambda: render_create_appointment_series_user_email(
+        sessions=SESSIONS, appointment_type="tattoo"
+    ),
+    "password_reset": lambda: render_password_reset_email("https://frontend/reset?token=abc"),
+    "quote_appointment": lambda: render_quote_appointment_client_email(Decimal("1234.50"), "tattoo"),
+    "vip_account_created": lambda: render_vip_account_created_email("ABC123"),
+}
+
+
+def main() -> None:
+    print(f"{'renderer':<36}{'per email':>12}{f'{RECIPIENTS} emails':>16}")
+
+    for name, render in RENDERERS.items():
+        per_email = min(timeit.repeat(render, number=1_000, repeat=5)) / 1_000
+        bulk = min(timeit.repeat(render, number=RECIPIENTS, repeat=3))
+
+        print(f"{name:<36}{per_email * 1_000_000:>9.2f} us{bulk * 1_000:>13.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,9 @@ from app.domain.studio.finances.entities.refund import Refund
 from app.domain.studio.users.entities.user import User
 from app.domain.studio.users.entities.vip_client import VipClient
 from app.domain.studio.value_objects.client_code import ClientCode
+from tests.fakes.fake_appointment_request_digests_repository import (
+    FakeAppointmentRequestDigestsRepository,
+)
 from tests.fakes.fake_appointments_repository import FakeAppointmentsRepository
 from tests.fakes.fake_audit_logs_repository import FakeAuditLogsRepository
 from tests.fakes.fake_calendar_exceptions_repository import FakeCalendarExceptionsRepository
@@ -44,14 +47,47 @@ from tests.fakes.fake_event_bus import (
     FakeIntegrationEventBus,
     FakeTransactionalEventBus,
 )
+from tests.fakes.fake_job_runs_repository import FakeJobRunsRepository
+from tests.fakes.fake_outbox_repository import FakeOutboxRepository
 from tests.fakes.fake_payments_repository import FakePaymentsRepository
 from tests.fakes.fake_read_unit_of_work import FakeReadUnitOfWork
 from tests.fakes.fake_refunds_repository import FakeRefundsRepository
+from tests.fakes.fake_scheduling_admission_repository import FakeSchedulingAdmissionRepository
 from tests.fakes.fake_users_repository import FakeUsersRepository
 from tests.fakes.fake_vip_clients_repository import FakeVipClientsRepository
 from tests.fakes.fake_write_unit_of_work import FakeWriteUnitOfWork
 
 
+@pytest.fixture(autouse=True)
+def disable_access_token_cache():
+    """
+    Fake repositories do not invalidate the process wide access token cache, so route
+    tests verify every token against their fake users instead.
+    """
+    from app.api.dependencies.security import get_access_token_cache
+    from app.main import app
+
+    app.dependency_overrides[get_access_token_cache] = lambda: None
+    yield
+    app.dependency_overrides.pop(get_access_token_cache, None)
+
+
+@pytest.fixture(autouse=True)
+def login_rate_limiter():
+    """
+    Every test logs in from the same test client, give each one its own budget.
+    """
+    from app.api.dependencies.login_rate_limiter import get_login_rate_limiter
+    from app.application.studio.services.login_rate_limiter import InMemoryLoginRateLimiter
+    from app.main import app
+
+    limiter = InMemoryLoginRateLimiter(window=timedelta(minutes=15))
+
+    app.dependency_overrides[get_login_rate_limiter] = lambda: limiter
+    yield limiter
+    app.dependency_overrides.pop(get_login_rate_limiter, None)
+
+
 @pytest.fixture
 def shared_users_repo():
     return FakeUsersRepository()
@@ -97,6 +133,36 @@ def shared_calendar_exceptions_repo():
     return FakeCalendarExceptionsRepository()
 
 
+@pytest.fixture
+def shared_scheduling_admission_repo(
+    shared_users_repo,
+    shared_appointments_repo,
+    shared_calendar_settings_repo,
+    shared_calendar_exceptions_repo,
+):
+    return FakeSchedulingAdmissionRepository(
+        users=shared_users_repo,
+        appointments=shared_appointments_repo,
+        calendar_settings=shared_calendar_settings_repo,
+        calendar_exceptions=shared_calendar_exceptions_repo,
+    )
+
+
+@pytest.fixture
+def shared_outbox_repo():
+    return FakeOutboxRepository()
+
+
+@pytest.fixture
+def shared_appointment_request_digests_repo():
+    return FakeAppointmentRequestDigestsRepository()
+
+
+@pytest.fixture
+def shared_job_runs_repo():
+    return FakeJobRunsRepository()
+
+
 @pytest.fixture
 def read_uow(
     shared_users_repo,
@@ -108,6 +174,10 @@ def read_uow(
     shared_refunds_repo,
     shared_calendar_settings_repo,
     shared_calendar_exceptions_repo,
+    shared_scheduling_admission_repo,
+    shared_outbox_repo,
+    shared_appointment_request_digests_repo,
+    shared_job_runs_repo,
 ):
     uow = FakeReadUnitOfWork()
     uow.users = shared_users_repo
@@ -119,6 +189,10 @@ def read_uow(
     uow.refunds = shared_refunds_repo
     uow.calendar_settings = shared_calendar_settings_repo
     uow.calendar_exceptions = shared_calendar_exceptions_repo
+    uow.scheduling_admission = shared_scheduling_admission_repo
+    uow.outbox = shared_outbox_repo
+    uow.appointment_request_digests = shared_appointment_request_digests_repo
+    uow.job_runs = shared_job_runs_repo
     return uow
 
 
@@ -133,6 +207,10 @@ def write_uow(
     shared_refunds_repo,
     shared_calendar_settings_repo,
     shared_calendar_exceptions_repo,
+    shared_scheduling_admission_repo,
+    shared_outbox_repo,
+    shared_appointment_request_digests_repo,
+    shared_job_runs_repo,
 ):
     uow = FakeWriteUnitOfWork()
     uow.users = shared_users_repo
@@ -144,6 +222,10 @@ def write_uow(
     uow.refunds = shared_refunds_repo
     uow.calendar_settings = shared_calendar_settings_repo
     uow.calendar_exceptions = shared_calendar_exceptions_repo
+    uow.scheduling_admission = shared_scheduling_admission_repo
+    uow.outbox = shared_outbox_repo
+    uow.appointment_request_digests = shared_appointment_request_digests_repo
+    uow.job_runs = shared_job_runs_repo
     return uow
 
 
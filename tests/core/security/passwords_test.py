@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.security.passwords import (
+    PasswordHashingPool,
+    hash_password_async,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password_async():
+    hashed = await hash_password_async("Strong_password1")
+
+    assert await verify_password_async("Strong_password1", hashed) is True
+    assert await verify_password_async("Wrong_password1", hashed) is False
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_work_on_its_own_threads():
+    pool = PasswordHashingPool(max_workers=1)
+
+    thread_name = await pool.run(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("password-hashing")
+
+
+@pytest.mark.asyncio
+async def test_pool_queues_work_beyond_max_workers():
+    pool = PasswordHashingPool(max_workers=1)
+    release = threading.Event()
+
+    first = asyncio.ensure_future(pool.run(release.wait))
+    second = asyncio.ensure_future(pool.run(release.wait))
+
+    while pool.stats().running == 0:
+        await asyncio.sleep(0.01)
+
+    stats = pool.stats()
+    assert stats.max_workers == 1
+    assert stats.running == 1
+    assert stats.queued == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    stats = pool.stats()
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.completed == 2
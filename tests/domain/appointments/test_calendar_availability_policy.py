@@ -4,7 +4,8 @@ import pytest
 
 from app.core.exceptions.appointments import SlotIsNotAvailableError
 from app.core.exceptions.calendar import UserIsNotWorkingInDesignatedTimeframeError
-from app.core.types.calendar_enums import CalendarExceptionType
+from app.core.types.calendar_enums import CalendarExceptionType, SlotVerdictReason
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
 from app.domain.studio.appointments.policies.calendar_availability_policy import (
     CalendarAvailabilityPolicy,
 )
@@ -408,3 +409,278 @@ def test_block_same_size_of_allow(make_calendar_settings, make_user, make_calend
             start_at=start_at,
             end_at=end_at,
         )
+
+
+def test_find_available_slots_returns_slots_inside_working_period(make_calendar_settings, make_user):
+    next_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    user = make_user()
+    calendar_settings = make_calendar_settings(user_id=user.id)
+
+    policy = CalendarAvailabilityPolicy()
+
+    slots = policy.find_available_slots(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=[],
+        booked_slots=[],
+        start_at=next_day,
+        end_at=next_day + timedelta(days=1),
+        duration=timedelta(hours=1),
+        step=timedelta(hours=1),
+        can_ignore_booking_window=False,
+    )
+
+    assert [slot.start_at.hour for slot in slots] == [8, 9, 10, 11]
+    assert all(slot.end_at - slot.start_at == timedelta(hours=1) for slot in slots)
+
+
+def test_find_available_slots_skips_booked_slots(make_calendar_settings, make_user):
+    next_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    user = make_user()
+    calendar_settings = make_calendar_settings(user_id=user.id)
+
+    policy = CalendarAvailabilityPolicy()
+
+    slots = policy.find_available_slots(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=[],
+        booked_slots=[
+            TimeSlot(
+                start_at=next_day + timedelta(hours=9), end_at=next_day + timedelta(hours=10, minutes=30)
+            )
+        ],
+        start_at=next_day,
+        end_at=next_day + timedelta(days=1),
+        duration=timedelta(hours=1),
+        step=timedelta(minutes=30),
+        can_ignore_booking_window=False,
+    )
+
+    assert [(slot.start_at.hour, slot.start_at.minute) for slot in slots] == [(8, 0), (10, 30), (11, 0)]
+
+
+def test_find_available_slots_respects_block_and_allow_exceptions(
+    make_calendar_settings, make_user, make_calendar_exception
+):
+    next_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    user = make_user()
+    calendar_settings = make_calendar_settings(user_id=user.id)
+
+    block = make_calendar_exception(
+        calendar_of_user=user.id,
+        start_at=next_day + timedelta(hours=8),
+        end_at=next_day + timedelta(hours=10),
+        exception_type=CalendarExceptionType.BLOCK,
+    )
+    allow = make_calendar_exception(
+        calendar_of_user=user.id,
+        start_at=next_day + timedelta(hours=14),
+        end_at=next_day + timedelta(hours=16),
+        exception_type=CalendarExceptionType.ALLOW,
+    )
+
+    policy = CalendarAvailabilityPolicy()
+
+    slots = policy.find_available_slots(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=[block, allow],
+        booked_slots=[],
+        start_at=next_day,
+        end_at=next_day + timedelta(days=1),
+        duration=timedelta(hours=1),
+        step=timedelta(hours=1),
+        can_ignore_booking_window=False,
+    )
+
+    assert [slot.start_at.hour for slot in slots] == [10, 11, 14, 15]
+
+
+def test_find_available_slots_outside_booking_window(make_calendar_settings, make_user):
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    after_window = today + timedelta(days=40)
+    user = make_user()
+    calendar_settings = make_calendar_settings(user_id=user.id)
+
+    policy = CalendarAvailabilityPolicy()
+
+    slots = policy.find_available_slots(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=[],
+        booked_slots=[],
+        start_at=after_window,
+        end_at=after_window + timedelta(days=1),
+        duration=timedelta(hours=1),
+        step=timedelta(hours=1),
+        can_ignore_booking_window=False,
+    )
+
+    slots_ignoring_window = policy.find_available_slots(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=[],
+        booked_slots=[],
+        start_at=after_window,
+        end_at=after_window + timedelta(days=1),
+        duration=timedelta(hours=1),
+        step=timedelta(hours=1),
+        can_ignore_booking_window=True,
+    )
+
+    assert slots == []
+    assert len(slots_ignoring_window) == 4
+
+
+def test_find_available_slots_are_accepted_by_can_schedule(make_calendar_settings, make_user):
+    next_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    user = make_user()
+    calendar_settings = make_calendar_settings(user_id=user.id)
+
+    policy = CalendarAvailabilityPolicy()
+
+    slots = policy.find_available_slots(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=[],
+        booked_slots=[],
+        start_at=next_day,
+        end_at=next_day + timedelta(days=3),
+        duration=timedelta(minutes=90),
+        step=timedelta(minutes=15),
+        can_ignore_booking_window=False,
+    )
+
+    assert slots
+    for slot in slots:
+        policy.can_schedule(
+            calendar_settings=calendar_settings,
+            calendar_exceptions=[],
+            start_at=slot.start_at,
+            end_at=slot.end_at,
+            can_ignore_booking_window=False,
+        )
+
+
+def test_evaluate_many_gives_a_reason_per_candidate(
+    make_calendar_settings, make_user, make_calendar_exception
+):
+    next_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    user = make_user()
+    calendar_settings = make_calendar_settings(
+        user_id=user.id, booking_window_until=(next_day + timedelta(days=5)).date()
+    )
+
+    exceptions = [
+        make_calendar_exception(
+            calendar_of_user=user.id,
+            start_at=next_day + timedelta(hours=9),
+            end_at=next_day + timedelta(hours=10),
+            exception_type=CalendarExceptionType.BLOCK,
+        ),
+        make_calendar_exception(
+            calendar_of_user=user.id,
+            start_at=next_day + timedelta(hours=18),
+            end_at=next_day + timedelta(hours=20),
+            exception_type=CalendarExceptionType.ALLOW,
+        ),
+    ]
+
+    def slot(hours_from_next_day: int, length: int = 1) -> TimeSlot:
+        start = next_day + timedelta(hours=hours_from_next_day)
+        return TimeSlot(start_at=start, end_at=start + timedelta(hours=length))
+
+    candidates = [
+        slot(8),
+        slot(9),
+        slot(13),
+        slot(18),
+        slot(24 * 10 + 8),
+        slot(23, length=2),
+    ]
+
+    policy = CalendarAvailabilityPolicy()
+
+    verdicts = policy.evaluate_many(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=exceptions,
+        candidates=candidates,
+        can_ignore_booking_window=False,
+    )
+
+    assert [verdict.slot for verdict in verdicts] == candidates
+    assert [verdict.reason for verdict in verdicts] == [
+        SlotVerdictReason.INSIDE_WORKING_PERIOD,
+        SlotVerdictReason.BLOCKED_BY_EXCEPTION,
+        SlotVerdictReason.OUTSIDE_WORKING_PERIOD,
+        SlotVerdictReason.ALLOWED_BY_EXCEPTION,
+        SlotVerdictReason.OUTSIDE_BOOKING_WINDOW,
+        SlotVerdictReason.LASTS_OVERNIGHT,
+    ]
+    assert [verdict.is_available for verdict in verdicts] == [True, False, False, True, False, False]
+
+
+def test_evaluate_many_agrees_with_can_schedule(
+    make_calendar_settings, make_user, make_calendar_exception
+):
+    next_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        days=1
+    )
+    user = make_user()
+    calendar_settings = make_calendar_settings(user_id=user.id)
+
+    exceptions = [
+        make_calendar_exception(
+            calendar_of_user=user.id,
+            start_at=next_day + timedelta(hours=7),
+            end_at=next_day + timedelta(hours=11),
+            exception_type=CalendarExceptionType.ALLOW,
+        ),
+        make_calendar_exception(
+            calendar_of_user=user.id,
+            start_at=next_day + timedelta(hours=9, minutes=30),
+            end_at=next_day + timedelta(hours=10),
+            exception_type=CalendarExceptionType.BLOCK,
+        ),
+    ]
+    candidates = [
+        TimeSlot(
+            start_at=next_day + timedelta(minutes=minutes),
+            end_at=next_day + timedelta(minutes=minutes + 60),
+        )
+        for minutes in range(6 * 60, 13 * 60, 15)
+    ]
+
+    policy = CalendarAvailabilityPolicy()
+
+    verdicts = policy.evaluate_many(
+        calendar_settings=calendar_settings,
+        calendar_exceptions=exceptions,
+        candidates=candidates,
+        can_ignore_booking_window=False,
+    )
+
+    for verdict in verdicts:
+        overlapping = [
+            exception
+            for exception in exceptions
+            if exception.start_at < verdict.slot.end_at and exception.end_at > verdict.slot.start_at
+        ]
+        try:
+            policy.can_schedule(
+                calendar_settings=calendar_settings,
+                calendar_exceptions=overlapping,
+                start_at=verdict.slot.start_at,
+                end_at=verdict.slot.end_at,
+                can_ignore_booking_window=False,
+            )
+            accepted = True
+        except UserIsNotWorkingInDesignatedTimeframeError:
+            accepted = False
+
+        assert verdict.is_available is accepted
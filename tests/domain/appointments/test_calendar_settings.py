@@ -4,6 +4,7 @@ from uuid import uuid4
 import pytest
 
 from app.core.exceptions.calendar import (
+    AppointmentCannotLastOvernightError,
     BookingWindowMustBeInTheFutureError,
     WorkingPeriodsNotFoundError,
     WorkingPeriodsOverlapError,
@@ -194,3 +195,76 @@ def test_is_inside_booking_window_false(make_working_period, make_user, make_dat
     )
 
     assert is_inside is False
+
+
+def _calendar_with(working_periods, make_user):
+    return CalendarSettings(
+        user_id=make_user().id,
+        booking_window_until=(datetime.now(timezone.utc) + timedelta(days=30)).date(),
+        working_periods=working_periods,
+    )
+
+
+def test_is_inside_working_period_boundaries(make_working_period, make_user, make_datetime):
+    calendar = _calendar_with(
+        [make_working_period(weekday=1, start_at=time(8, 0), end_at=time(12, 0))], make_user
+    )
+
+    assert calendar.is_inside_working_period(start=make_datetime(1, 8), end=make_datetime(1, 12))
+    assert not calendar.is_inside_working_period(start=make_datetime(1, 7, 59), end=make_datetime(1, 9))
+    assert not calendar.is_inside_working_period(
+        start=make_datetime(1, 11), end=make_datetime(1, 12) + timedelta(seconds=1)
+    )
+    assert not calendar.is_inside_working_period(start=make_datetime(2, 9), end=make_datetime(2, 10))
+
+
+def test_is_inside_working_period_needs_a_single_period(make_working_period, make_user, make_datetime):
+    calendar = _calendar_with(
+        [
+            make_working_period(weekday=1, start_at=time(8, 0), end_at=time(12, 0)),
+            make_working_period(weekday=1, start_at=time(12, 0), end_at=time(16, 0)),
+        ],
+        make_user,
+    )
+
+    assert calendar.is_inside_working_period(start=make_datetime(1, 12), end=make_datetime(1, 16))
+    assert not calendar.is_inside_working_period(start=make_datetime(1, 11), end=make_datetime(1, 13))
+
+
+def test_is_inside_working_period_follows_period_changes(make_working_period, make_user, make_datetime):
+    period = make_working_period(weekday=1, start_at=time(8, 0), end_at=time(12, 0))
+    calendar = _calendar_with([period], make_user)
+
+    assert not calendar.is_inside_working_period(start=make_datetime(1, 13), end=make_datetime(1, 14))
+
+    calendar.update_working_period(period_id=period.id, start_at=time(8, 0), end_at=time(14, 0))
+    assert calendar.is_inside_working_period(start=make_datetime(1, 13), end=make_datetime(1, 14))
+
+    calendar.add_working_period(make_working_period(weekday=2, start_at=time(8, 0), end_at=time(12, 0)))
+    assert calendar.is_inside_working_period(start=make_datetime(2, 9), end=make_datetime(2, 10))
+
+    calendar.remove_working_period(period.id)
+    assert not calendar.is_inside_working_period(start=make_datetime(1, 13), end=make_datetime(1, 14))
+
+    calendar.replace_working_periods([])
+    assert not calendar.is_inside_working_period(start=make_datetime(2, 9), end=make_datetime(2, 10))
+
+
+def test_is_inside_working_period_not_aligned_to_the_minute(
+    make_working_period, make_user, make_datetime
+):
+    calendar = _calendar_with(
+        [make_working_period(weekday=1, start_at=time(8, 0, 30), end_at=time(12, 0))], make_user
+    )
+
+    assert not calendar.is_inside_working_period(start=make_datetime(1, 8), end=make_datetime(1, 9))
+    assert calendar.is_inside_working_period(start=make_datetime(1, 8, 1), end=make_datetime(1, 9))
+
+
+def test_is_inside_working_period_overnight(make_working_period, make_user, make_datetime):
+    calendar = _calendar_with(
+        [make_working_period(weekday=1, start_at=time(8, 0), end_at=time(12, 0))], make_user
+    )
+
+    with pytest.raises(AppointmentCannotLastOvernightError):
+        calendar.is_inside_working_period(start=make_datetime(1, 23), end=make_datetime(2, 1))
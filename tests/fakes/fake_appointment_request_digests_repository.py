@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from app.application.studio.repositories.appointment_request_digests_repository import (
+    AppointmentRequestDigestsRepository,
+)
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
+
+
+class FakeAppointmentRequestDigestsRepository(AppointmentRequestDigestsRepository):
+    def __init__(self):
+        self.entries: dict[UUID, AppointmentRequestDigestEntry] = {}
+
+    def add(self, entry: AppointmentRequestDigestEntry) -> None:
+        self.entries[entry.id] = entry
+
+    def take_due(self, *, until: datetime) -> List[AppointmentRequestDigestEntry]:
+        due = sorted(
+            (entry for entry in self.entries.values() if entry.created_at <= until),
+            key=lambda entry: (str(entry.user_id), entry.created_at),
+        )
+
+        for entry in due:
+            del self.entries[entry.id]
+
+        return due
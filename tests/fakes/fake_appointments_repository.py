@@ -6,7 +6,7 @@ from app.application.studio.repositories.appointments_repository import (
     AppointmentsRepository,
 )
 from app.application.studio.use_cases.DTO.client_filters import ClientInfoFilter
-from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.commun import Direction, PageCursor
 from app.core.types.appointment_enums import (
     AppointmentStatus,
     AppointmentType,
@@ -22,6 +22,9 @@ class FakeAppointmentsRepository(AppointmentsRepository):
     def create(self, appointment: Appointment) -> None:
         self._appointments.append(appointment)
 
+    def create_many(self, appointments: List[Appointment]) -> None:
+        self._appointments.extend(appointments)
+
     def update(self, appointment: Appointment) -> None:
         for index, appointment_in_memory in enumerate(self._appointments):
             if appointment_in_memory.id == appointment.id:
@@ -51,6 +54,7 @@ class FakeAppointmentsRepository(AppointmentsRepository):
         limit: int = 100,
         offset: int = 0,
         direction: Direction = Direction.desc,
+        cursor: PageCursor | None = None,
     ) -> List[Appointment]:
 
         MAX_LIMIT = 5000
@@ -69,6 +73,30 @@ class FakeAppointmentsRepository(AppointmentsRepository):
             referral_code=referral_code,
         )
 
+        if cursor is not None:
+            scan_direction = self._reverse(direction) if cursor.backward else direction
+            position = (cursor.created_at, cursor.id)
+
+            if scan_direction == Direction.asc:
+                filtered_appointments = [
+                    appointment
+                    for appointment in filtered_appointments
+                    if (appointment.created_at, appointment.id) > position
+                ]
+            else:
+                filtered_appointments = [
+                    appointment
+                    for appointment in filtered_appointments
+                    if (appointment.created_at, appointment.id) < position
+                ]
+
+            paginated = self._apply_order(filtered_appointments, scan_direction)[:limit]
+
+            if scan_direction != direction:
+                paginated.reverse()
+
+            return paginated
+
         order_appointments = self._apply_order(filtered_appointments, direction)
         paginated = order_appointments[offset : offset + limit]
 
@@ -110,7 +138,36 @@ class FakeAppointmentsRepository(AppointmentsRepository):
         end_date: datetime | None = None,
         user_id: UUID | None = None,
     ):
-        return self.find_many(start_date=start_date, end_date=end_date, user_id=user_id)
+        filtered = self._filter_appointments(
+            start_date=start_date,
+            end_date=end_date,
+            status=None,
+            appointment_type=None,
+            user_id=user_id,
+            client_info=None,
+            color=None,
+            is_posted_on_socials=None,
+            has_deposit=None,
+            referral_code=None,
+        )
+
+        return sorted(
+            [
+                appointment
+                for appointment in filtered
+                if appointment.status != AppointmentStatus.CANCELED
+            ],
+            key=lambda appointment: (appointment.start_at, appointment.id),
+        )
+
+    def exists_overlap(
+        self,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        user_id: UUID,
+    ) -> bool:
+        return bool(self.find_overlap(start_date=start_date, end_date=end_date, user_id=user_id))
 
     def _filter_appointments(
         self,
@@ -200,3 +257,7 @@ class FakeAppointmentsRepository(AppointmentsRepository):
             key=lambda appointment: (appointment.created_at, appointment.id),
             reverse=reverse,
         )
+
+    @staticmethod
+    def _reverse(direction: Direction) -> Direction:
+        return Direction.asc if direction == Direction.desc else Direction.desc
@@ -14,6 +14,9 @@ class FakeAuditLogsRepository(AuditLogsRepository):
     def create(self, audit_log: AuditLogEntry) -> None:
         self._logs.append(audit_log)
 
+    def create_many(self, audit_logs: List[AuditLogEntry]) -> None:
+        self._logs.extend(audit_logs)
+
     def find_many_by_entity_name(
         self, *, entity_name: str, limit: int = 100, offset: int = 0
     ) -> List[AuditLogEntry]:
@@ -5,6 +5,7 @@ from app.application.studio.repositories.client_credit_entries_repository import
     ClientCreditEntriesRepository,
 )
 from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.credit_balance_drift_dto import CreditBalanceDrift
 from app.core.types.client_credit_source_type import (
     ClientCreditSourceType,
 )
@@ -14,16 +15,36 @@ from app.domain.studio.finances.entities.client_credit_entry import ClientCredit
 class FakeClientCreditEntriesRepository(ClientCreditEntriesRepository):
     def __init__(self):
         self._entries: list[ClientCreditEntry] = []
+        self.balances: dict[UUID, int] = {}
 
     def create(self, client_credit_entry: ClientCreditEntry) -> None:
         self._entries.append(client_credit_entry)
 
+        balance = self.get_balance(vip_client_id=client_credit_entry.vip_client_id)
+        self.balances[client_credit_entry.vip_client_id] = balance + client_credit_entry.quantity
+
     def get_balance(self, *, vip_client_id: UUID) -> int:
-        balance = 0
-        for credit in self._entries:
-            if credit.vip_client_id == vip_client_id:
-                balance = balance + credit.quantity
-        return balance
+        return self.balances.get(vip_client_id, 0)
+
+    def get_balance_for_update(self, *, vip_client_id: UUID) -> int:
+        return self.get_balance(vip_client_id=vip_client_id)
+
+    def find_balance_drift(self) -> List[CreditBalanceDrift]:
+        vip_client_ids = {entry.vip_client_id for entry in self._entries} | self.balances.keys()
+        drifts = [
+            CreditBalanceDrift(
+                vip_client_id=vip_client_id,
+                recorded=self.get_balance(vip_client_id=vip_client_id),
+                ledger=self._ledger_sum(vip_client_id),
+            )
+            for vip_client_id in sorted(vip_client_ids)
+        ]
+
+        return [drift for drift in drifts if drift.recorded != drift.ledger]
+
+    def rebuild_balance(self, *, vip_client_id: UUID) -> int:
+        self.balances[vip_client_id] = self._ledger_sum(vip_client_id)
+        return self.balances[vip_client_id]
 
     def find_by_id(self, credit_id: UUID) -> Optional[ClientCreditEntry]:
         for entry in self._entries:
@@ -105,3 +126,6 @@ class FakeClientCreditEntriesRepository(ClientCreditEntriesRepository):
             key=lambda entry: (entry.created_at, entry.id),
             reverse=reverse,
         )
+
+    def _ledger_sum(self, vip_client_id: UUID) -> int:
+        return sum(entry.quantity for entry in self._entries if entry.vip_client_id == vip_client_id)
@@ -1,6 +1,6 @@
 from typing import TypedDict
 
-from app.application.notifications.ports.email_service import EmailService
+from app.application.notifications.ports.email_service import EmailMessage, EmailService
 from app.core.exceptions.services import (
     EmailSentFailedError,
     EmailServiceUnavailableError,
@@ -14,9 +14,11 @@ class EmailPayload(TypedDict):
 
 
 class FakeEmailService(EmailService):
-    def __init__(self, *, fail_with: str | None = None):
+    def __init__(self, *, fail_with: str | None = None, refused_recipients: set[str] | None = None):
         self.fail_with = fail_with
+        self.refused_recipients = refused_recipients or set()
         self.sent_emails: list[EmailPayload] = []
+        self.batches: list[list[EmailMessage]] = []
 
     @property
     def last_payload(self) -> EmailPayload | None:
@@ -33,6 +35,8 @@ class FakeEmailService(EmailService):
             raise EmailServiceUnavailableError()
         if self.fail_with == "email_send_failed":
             raise EmailSentFailedError()
+        if to in self.refused_recipients:
+            raise EmailSentFailedError()
 
         self.sent_emails.append(
             {
@@ -41,3 +45,12 @@ class FakeEmailService(EmailService):
                 "html": html_content,
             }
         )
+
+    async def send_batch(self, messages):
+        self.batches.append(list(messages))
+
+        # like the provider, one refused recipient refuses the whole request
+        if any(message.to in self.refused_recipients for message in messages):
+            raise EmailSentFailedError()
+
+        await super().send_batch(messages)
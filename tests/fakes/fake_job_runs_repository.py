@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from app.application.studio.repositories.job_runs_repository import JobRunsRepository
+
+
+class FakeJobRunsRepository(JobRunsRepository):
+    def __init__(self):
+        self.runs: dict[str, datetime] = {}
+
+    def try_claim(self, job: str, *, window_start: datetime) -> bool:
+        last_window_start = self.runs.get(job)
+        if last_window_start is not None and last_window_start >= window_start:
+            return False
+
+        self.runs[job] = window_start
+        return True
@@ -0,0 +1,54 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import List
+from uuid import UUID
+
+from app.application.studio.repositories.outbox_repository import OutboxRepository
+from app.application.studio.use_cases.DTO.outbox_dto import OutboxMessage
+from app.core.types.outbox_enums import OutboxStatus
+
+
+class FakeOutboxRepository(OutboxRepository):
+    def __init__(self):
+        self.messages: dict[UUID, OutboxMessage] = {}
+
+    def add_many(self, messages: List[OutboxMessage]) -> None:
+        for message in messages:
+            self.messages[message.id] = message
+
+    def claim_batch(self, *, limit: int, now: datetime, lease: timedelta) -> List[OutboxMessage]:
+        available = sorted(
+            (
+                message
+                for message in self.messages.values()
+                if message.status == OutboxStatus.PENDING and message.available_at <= now
+            ),
+            key=lambda message: message.available_at,
+        )[:limit]
+
+        for message in available:
+            message.attempts += 1
+            message.available_at = now + lease
+
+        return [replace(message) for message in available]
+
+    def mark_dispatched(self, message_id: UUID, *, dispatched_at: datetime) -> None:
+        message = self.messages[message_id]
+        message.status = OutboxStatus.DISPATCHED
+        message.dispatched_at = dispatched_at
+        message.last_error = None
+
+    def mark_failed(self, message_id: UUID, *, error: str, retry_at: datetime | None) -> None:
+        message = self.messages[message_id]
+        message.last_error = error
+
+        if retry_at is None:
+            message.status = OutboxStatus.FAILED
+        else:
+            message.available_at = retry_at
+
+    def mark_deferred(self, message_id: UUID, *, error: str, retry_at: datetime) -> None:
+        message = self.messages[message_id]
+        message.last_error = error
+        message.available_at = retry_at
+        message.attempts -= 1
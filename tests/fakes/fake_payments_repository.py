@@ -54,6 +54,9 @@ class FakePaymentsRepository(PaymentsRepository):
                 total += payment.amount
         return total
 
+    def sum_payable_by_appointment_id(self, appointment_id: UUID) -> Decimal:
+        return self.sum_by_appointment_id(appointment_id)
+
     def find_by_external_reference(self, external_reference: str) -> Optional[Payment]:
         for payment in self._payments:
             if payment.external_reference == external_reference:
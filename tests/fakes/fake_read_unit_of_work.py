@@ -1,4 +1,7 @@
 from app.application.studio.unit_of_work.read_unit_of_work import ReadUnitOfWork
+from tests.fakes.fake_appointment_request_digests_repository import (
+    FakeAppointmentRequestDigestsRepository,
+)
 from tests.fakes.fake_appointments_repository import FakeAppointmentsRepository
 from tests.fakes.fake_audit_logs_repository import FakeAuditLogsRepository
 from tests.fakes.fake_calendar_exceptions_repository import FakeCalendarExceptionsRepository
@@ -6,8 +9,11 @@ from tests.fakes.fake_calendar_settings_repository import FakeCalendarSettingsRe
 from tests.fakes.fake_client_credit_entries_repository import (
     FakeClientCreditEntriesRepository,
 )
+from tests.fakes.fake_job_runs_repository import FakeJobRunsRepository
+from tests.fakes.fake_outbox_repository import FakeOutboxRepository
 from tests.fakes.fake_payments_repository import FakePaymentsRepository
 from tests.fakes.fake_refunds_repository import FakeRefundsRepository
+from tests.fakes.fake_scheduling_admission_repository import FakeSchedulingAdmissionRepository
 from tests.fakes.fake_users_repository import FakeUsersRepository
 from tests.fakes.fake_vip_clients_repository import FakeVipClientsRepository
 
@@ -23,6 +29,15 @@ class FakeReadUnitOfWork(ReadUnitOfWork):
         self.refunds = FakeRefundsRepository()
         self.calendar_settings = FakeCalendarSettingsRepository()
         self.calendar_exceptions = FakeCalendarExceptionsRepository()
+        self.scheduling_admission = FakeSchedulingAdmissionRepository(
+            users=self.users,
+            appointments=self.appointments,
+            calendar_settings=self.calendar_settings,
+            calendar_exceptions=self.calendar_exceptions,
+        )
+        self.outbox = FakeOutboxRepository()
+        self.appointment_request_digests = FakeAppointmentRequestDigestsRepository()
+        self.job_runs = FakeJobRunsRepository()
 
     def __enter__(self):
         return self
@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.application.studio.repositories.scheduling_admission_repository import (
+    SchedulingAdmissionRepository,
+)
+from app.application.studio.use_cases.DTO.find_free_artists_dto import ArtistCalendar
+from app.application.studio.use_cases.DTO.scheduling_admission_dto import SchedulingAdmission
+from app.domain.studio.appointments.entities.value_objects.time_slot import TimeSlot
+from tests.fakes.fake_appointments_repository import FakeAppointmentsRepository
+from tests.fakes.fake_calendar_exceptions_repository import FakeCalendarExceptionsRepository
+from tests.fakes.fake_calendar_settings_repository import FakeCalendarSettingsRepository
+from tests.fakes.fake_users_repository import FakeUsersRepository
+
+
+class FakeSchedulingAdmissionRepository(SchedulingAdmissionRepository):
+    def __init__(
+        self,
+        *,
+        users: FakeUsersRepository,
+        appointments: FakeAppointmentsRepository,
+        calendar_settings: FakeCalendarSettingsRepository,
+        calendar_exceptions: FakeCalendarExceptionsRepository,
+    ):
+        self.users = users
+        self.appointments = appointments
+        self.calendar_settings = calendar_settings
+        self.calendar_exceptions = calendar_exceptions
+
+    def find_admission(
+        self,
+        *,
+        user_id: UUID,
+        start_at: datetime,
+        end_at: datetime,
+        actor_id: UUID | None = None,
+    ) -> Optional[SchedulingAdmission]:
+        user = self.users.find_by_id(user_id)
+
+        if user is None:
+            return None
+
+        actor = self.users.find_by_id(actor_id) if actor_id is not None else None
+        calendar_settings = self.calendar_settings.find_by_user_id(user_id)
+
+        return SchedulingAdmission(
+            user_is_active=user.is_active,
+            calendar_settings=calendar_settings,
+            slot_is_occupied=self.appointments.exists_overlap(
+                start_date=start_at, end_date=end_at, user_id=user_id
+            ),
+            actor_is_admin=actor is not None and actor.is_admin,
+            calendar_exceptions=(
+                self.calendar_exceptions.find_overlap(user_id=user_id, start_at=start_at, end_at=end_at)
+                if calendar_settings is not None
+                else []
+            ),
+        )
+
+    def find_artist_calendars(self, *, start_at: datetime, end_at: datetime) -> List[ArtistCalendar]:
+        artist_calendars = []
+
+        for user in sorted(self.users.users, key=lambda user: user.username):
+            calendar_settings = self.calendar_settings.find_by_user_id(user.id)
+
+            if not user.is_active or calendar_settings is None:
+                continue
+
+            artist_calendars.append(
+                ArtistCalendar(
+                    user_id=user.id,
+                    username=user.username,
+                    calendar_settings=calendar_settings,
+                    calendar_exceptions=self.calendar_exceptions.find_overlap(
+                        user_id=user.id, start_at=start_at, end_at=end_at
+                    ),
+                    booked_slots=[
+                        TimeSlot(start_at=appointment.start_at, end_at=appointment.end_at)
+                        for appointment in self.appointments.find_overlap(
+                            user_id=user.id, start_date=start_at, end_date=end_at
+                        )
+                    ],
+                )
+            )
+
+        return artist_calendars
@@ -3,7 +3,7 @@ from uuid import uuid4
 
 import pytest
 
-from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.commun import Direction, PageCursor
 from app.core.types.appointment_enums import (
     AppointmentStatus,
     AppointmentType,
@@ -45,6 +45,17 @@ def test_create_and_find_by_id(make_completed_appointment, appointments_repo, ma
     assert found.status == AppointmentStatus.COMPLETED
 
 
+def test_create_many(make_quoted_appointment, appointments_repo, make_user, users_repo):
+    user = make_user()
+    users_repo.create(user)
+    appointments = [make_quoted_appointment(user_id=user.id) for _ in range(3)]
+
+    appointments_repo.create_many(appointments)
+
+    for appointment in appointments:
+        assert appointments_repo.find_by_id(appointment_id=appointment.id) is appointment
+
+
 def test_not_found_by_id(appointments_repo, make_user, users_repo):
     user = make_user()
     users_repo.create(user)
@@ -477,3 +488,61 @@ def test_find_overlap_has_multiple_overlaps(
     )
 
     assert len(result) == 2
+
+
+def test_find_overlap_ignores_canceled_and_is_ordered_by_start(
+    appointments_repo, make_quoted_appointment, make_user, users_repo
+):
+    user = make_user()
+    users_repo.create(user)
+
+    base_time = datetime(2026, 1, 10, 10, 0, tzinfo=timezone.utc)
+
+    later = make_quoted_appointment(
+        start_at=base_time + timedelta(hours=2), end_at=base_time + timedelta(hours=3), user_id=user.id
+    )
+    earlier = make_quoted_appointment(
+        start_at=base_time, end_at=base_time + timedelta(hours=1), user_id=user.id
+    )
+    canceled = make_quoted_appointment(
+        start_at=base_time, end_at=base_time + timedelta(hours=1), user_id=user.id
+    )
+    canceled.status = AppointmentStatus.CANCELED
+
+    appointments_repo.create(later)
+    appointments_repo.create(earlier)
+    appointments_repo.create(canceled)
+
+    result = appointments_repo.find_overlap(
+        start_date=base_time, end_date=base_time + timedelta(hours=4), user_id=user.id
+    )
+
+    assert [appointment.id for appointment in result] == [earlier.id, later.id]
+
+
+def test_find_many_with_cursor(appointments_repo, make_quoted_appointment, make_user, users_repo):
+    user = make_user()
+    users_repo.create(user)
+
+    base_time = datetime(2026, 1, 10, 0, 0, tzinfo=timezone.utc)
+    created = []
+
+    for i in range(4):
+        appointment = make_quoted_appointment(user_id=user.id)
+        appointment.created_at = base_time + timedelta(minutes=i)
+        appointments_repo.create(appointment)
+        created.append(appointment)
+
+    forward = appointments_repo.find_many(
+        limit=2,
+        direction=Direction.asc,
+        cursor=PageCursor(created_at=created[0].created_at, id=created[0].id),
+    )
+    backward = appointments_repo.find_many(
+        limit=2,
+        direction=Direction.asc,
+        cursor=PageCursor(created_at=created[3].created_at, id=created[3].id, backward=True),
+    )
+
+    assert [appointment.id for appointment in forward] == [created[1].id, created[2].id]
+    assert [appointment.id for appointment in backward] == [created[1].id, created[2].id]
@@ -37,6 +37,21 @@ def test_create_and_find_many_by_entity_name(make_audit_log, logs_repo):
     ]
 
 
+def test_create_many(make_audit_log, logs_repo):
+    base_time = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+    logs_repo.create_many(
+        [
+            make_audit_log(reason=f"session {i}", performed_at=base_time + timedelta(hours=i))
+            for i in range(3)
+        ]
+    )
+
+    logs = logs_repo.find_many_by_entity_name(entity_name="users")
+
+    assert [log.reason for log in logs] == ["session 2", "session 1", "session 0"]
+
+
 def test_find_many_by_actor(make_audit_log, logs_repo):
     user_id = uuid4()
 
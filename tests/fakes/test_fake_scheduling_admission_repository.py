@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.core.types.appointment_enums import AppointmentStatus
+
+
+def test_find_admission_unknown_user(write_uow):
+    start_at = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+
+    admission = write_uow.scheduling_admission.find_admission(
+        user_id=uuid4(), start_at=start_at, end_at=start_at + timedelta(hours=1)
+    )
+
+    assert admission is None
+
+
+def test_find_admission_reads_shared_repositories(
+    write_uow, make_user, make_calendar_settings, make_calendar_exception, make_quoted_appointment
+):
+    user = make_user()
+    admin = make_user(is_admin=True)
+    write_uow.users.create(user)
+    write_uow.users.create(admin)
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=user.id))
+
+    start_at = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+    end_at = start_at + timedelta(hours=1)
+
+    write_uow.calendar_exceptions.create(
+        make_calendar_exception(calendar_of_user=user.id, start_at=start_at, end_at=end_at)
+    )
+    canceled = make_quoted_appointment(user_id=user.id, start_at=start_at, end_at=end_at)
+    canceled.status = AppointmentStatus.CANCELED
+    write_uow.appointments.create(canceled)
+
+    free = write_uow.scheduling_admission.find_admission(
+        user_id=user.id, start_at=start_at, end_at=end_at, actor_id=admin.id
+    )
+
+    write_uow.appointments.create(
+        make_quoted_appointment(user_id=user.id, start_at=start_at, end_at=end_at)
+    )
+
+    occupied = write_uow.scheduling_admission.find_admission(
+        user_id=user.id, start_at=start_at, end_at=end_at
+    )
+
+    assert free is not None
+    assert free.calendar_settings is not None
+    assert free.actor_is_admin is True
+    assert free.slot_is_occupied is False
+    assert len(free.calendar_exceptions) == 1
+
+    assert occupied is not None
+    assert occupied.actor_is_admin is False
+    assert occupied.slot_is_occupied is True
+
+
+def test_find_artist_calendars_skips_inactive_and_without_calendar(
+    write_uow, make_user, make_calendar_settings, make_quoted_appointment
+):
+    artist = make_user(username="artist", email="artist@studio.com")
+    inactive = make_user(username="inactive", email="inactive@studio.com", is_active=False)
+    without_calendar = make_user(username="no_calendar", email="no@studio.com")
+
+    for user in (artist, inactive, without_calendar):
+        write_uow.users.create(user)
+
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=artist.id))
+    write_uow.calendar_settings.create(make_calendar_settings(user_id=inactive.id))
+
+    start_at = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+    write_uow.appointments.create(
+        make_quoted_appointment(
+            user_id=artist.id, start_at=start_at, end_at=start_at + timedelta(hours=1)
+        )
+    )
+
+    calendars = write_uow.scheduling_admission.find_artist_calendars(
+        start_at=start_at - timedelta(hours=1), end_at=start_at + timedelta(hours=3)
+    )
+
+    assert [calendar.user_id for calendar in calendars] == [artist.id]
+    assert calendars[0].username == "artist"
+    assert len(calendars[0].booked_slots) == 1
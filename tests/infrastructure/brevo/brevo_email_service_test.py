@@ -4,7 +4,10 @@ import httpx
 import pytest
 import respx
 
+from app.application.notifications.ports.email_service import EmailMessage
 from app.core.exceptions.services import (
+    EmailProviderServerError,
+    EmailRateLimitedError,
     EmailSentFailedError,
     EmailServiceUnavailableError,
 )
@@ -68,3 +71,72 @@ async def test_brevo_email_service_raises_on_error():
             subject="Teste",
             html_content="<p>Hello</p>",
         )
+
+
+@respx.mock
+async def test_brevo_email_service_reuses_its_client():
+    route = respx.post("https://api.brevo.com/v3/smtp/email").mock(
+        return_value=Response(201, json={"messageId": "123"})
+    )
+
+    client = httpx.AsyncClient()
+    service = BrevoEmailService(client=client)
+
+    await service.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>Hello</p>")
+    await service.send_email(to="jane@doe.com", subject="Teste", html_content="<p>Hello</p>")
+
+    assert route.calls.call_count == 2
+    assert service.client is client
+
+    await service.aclose()
+
+    assert client.is_closed
+
+
+@respx.mock
+async def test_brevo_email_service_sends_batch_as_message_versions():
+    route = respx.post("https://api.brevo.com/v3/smtp/email").mock(
+        return_value=Response(201, json={"messageIds": ["1", "2"]})
+    )
+
+    service = BrevoEmailService()
+
+    await service.send_batch(
+        [
+            EmailMessage(to="jhon@doe.com", subject="Primeiro", html_content="<p>1</p>"),
+            EmailMessage(to="jane@doe.com", subject="Segundo", html_content="<p>2</p>"),
+        ]
+    )
+
+    assert route.calls.call_count == 1
+
+    body = json.loads(route.calls[0].request.content.decode())
+    versions = body["messageVersions"]
+
+    assert [version["to"][0]["email"] for version in versions] == ["jhon@doe.com", "jane@doe.com"]
+    assert [version["subject"] for version in versions] == ["Primeiro", "Segundo"]
+    assert versions[1]["htmlContent"] == "<p>2</p>"
+
+
+@respx.mock
+async def test_brevo_email_service_raises_rate_limited_with_retry_after():
+    respx.post("https://api.brevo.com/v3/smtp/email").mock(
+        return_value=Response(429, headers={"Retry-After": "7"}, text="too many requests")
+    )
+
+    service = BrevoEmailService()
+
+    with pytest.raises(EmailRateLimitedError) as exc_info:
+        await service.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>Hello</p>")
+
+    assert exc_info.value.retry_after == 7
+
+
+@respx.mock
+async def test_brevo_email_service_raises_provider_error_on_5xx():
+    respx.post("https://api.brevo.com/v3/smtp/email").mock(return_value=Response(503, text="down"))
+
+    service = BrevoEmailService()
+
+    with pytest.raises(EmailProviderServerError):
+        await service.send_email(to="jhon@doe.com", subject="Teste", html_content="<p>Hello</p>")
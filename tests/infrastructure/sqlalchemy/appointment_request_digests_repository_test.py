@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from app.application.studio.use_cases.DTO.appointment_request_digest_dto import (
+    AppointmentRequestDigestEntry,
+)
+from app.core.types.appointment_enums import AppointmentType
+from app.infrastructure.sqlalchemy.repositories.appointment_digests_repository_sqlalchemy import (
+    SQLAlchemyAppointmentRequestDigestsRepository,
+)
+
+NOW = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def _entry(user_id: UUID, created_at: datetime = NOW, sessions_count: int = 1):
+    return AppointmentRequestDigestEntry(
+        id=uuid4(),
+        user_id=user_id,
+        appointment_type=AppointmentType.TATTOO,
+        start_at=NOW + timedelta(days=3),
+        end_at=NOW + timedelta(days=3, hours=2),
+        created_at=created_at,
+        sessions_count=sessions_count,
+    )
+
+
+def test_take_due_returns_entries_grouped_by_artist_and_removes_them(
+    db_session, sqlalchemy_users_repo, make_user
+):
+    first_artist = make_user(username="first", email="first@doe.com")
+    second_artist = make_user(username="second", email="second@doe.com")
+    sqlalchemy_users_repo.create(first_artist)
+    sqlalchemy_users_repo.create(second_artist)
+
+    repo = SQLAlchemyAppointmentRequestDigestsRepository(db_session)
+    entries = [
+        _entry(first_artist.id, created_at=NOW - timedelta(hours=2)),
+        _entry(second_artist.id, created_at=NOW - timedelta(hours=1)),
+        _entry(first_artist.id, created_at=NOW - timedelta(hours=1), sessions_count=3),
+    ]
+    for entry in entries:
+        repo.add(entry)
+
+    taken = repo.take_due(until=NOW)
+
+    assert len(taken) == 3
+    assert [entry.user_id for entry in taken] == sorted(entry.user_id for entry in taken)
+    first_artist_entries = [entry for entry in taken if entry.user_id == first_artist.id]
+    assert [entry.id for entry in first_artist_entries] == [entries[0].id, entries[2].id]
+    assert first_artist_entries[1].sessions_count == 3
+    assert repo.take_due(until=NOW) == []
+
+
+def test_take_due_leaves_entries_created_after_until(db_session, sqlalchemy_users_repo, make_user):
+    artist = make_user()
+    sqlalchemy_users_repo.create(artist)
+
+    repo = SQLAlchemyAppointmentRequestDigestsRepository(db_session)
+    due = _entry(artist.id)
+    later = _entry(artist.id, created_at=NOW + timedelta(minutes=1))
+    repo.add(due)
+    repo.add(later)
+
+    assert [entry.id for entry in repo.take_due(until=NOW)] == [due.id]
+    assert [entry.id for entry in repo.take_due(until=NOW + timedelta(minutes=1))] == [later.id]
@@ -5,6 +5,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from app.application.studio.use_cases.DTO.commun import Direction, PageCursor
 from app.core.types.appointment_enums import (
     AppointmentStatus,
     AppointmentType,
@@ -237,3 +238,134 @@ def test_count_matches_find_many(
     total = sqlalchemy_appointments_repo.count_many(color=True)
 
     assert result_len == total
+
+
+def test_find_overlap_ignores_canceled_and_touching_appointments(
+    sqlalchemy_appointments_repo: SQLAlchemyAppointmentsRepository,
+    make_quoted_appointment,
+    make_user,
+    sqlalchemy_users_repo,
+):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    base_time = datetime(2026, 1, 10, 10, 0, tzinfo=timezone.utc)
+
+    overlapping = make_quoted_appointment(
+        start_at=base_time, end_at=base_time + timedelta(hours=2), user_id=user.id
+    )
+    touching = make_quoted_appointment(
+        start_at=base_time + timedelta(hours=3), end_at=base_time + timedelta(hours=4), user_id=user.id
+    )
+    canceled = make_quoted_appointment(
+        start_at=base_time + timedelta(hours=1), end_at=base_time + timedelta(hours=2), user_id=user.id
+    )
+    canceled.status = AppointmentStatus.CANCELED
+
+    sqlalchemy_appointments_repo.create(overlapping)
+    sqlalchemy_appointments_repo.create(touching)
+    sqlalchemy_appointments_repo.create(canceled)
+
+    result = sqlalchemy_appointments_repo.find_overlap(
+        start_date=base_time + timedelta(hours=1),
+        end_date=base_time + timedelta(hours=3),
+        user_id=user.id,
+    )
+
+    assert [appointment.id for appointment in result] == [overlapping.id]
+
+
+def test_find_overlap_is_not_limited_by_page_size(
+    sqlalchemy_appointments_repo: SQLAlchemyAppointmentsRepository,
+    make_quoted_appointment,
+    make_user,
+    sqlalchemy_users_repo,
+):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    base_time = datetime(2026, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+    for i in range(150):
+        sqlalchemy_appointments_repo.create(
+            make_quoted_appointment(
+                start_at=base_time + timedelta(hours=i),
+                end_at=base_time + timedelta(hours=i, minutes=30),
+                user_id=user.id,
+            )
+        )
+
+    result = sqlalchemy_appointments_repo.find_overlap(
+        start_date=base_time, end_date=base_time + timedelta(days=30), user_id=user.id
+    )
+
+    assert len(result) == 150
+
+
+def test_create_many_persists_every_appointment(
+    sqlalchemy_appointments_repo: SQLAlchemyAppointmentsRepository,
+    make_quoted_appointment,
+    make_user,
+    sqlalchemy_users_repo,
+):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    base_time = datetime(2026, 1, 10, 10, 0, tzinfo=timezone.utc)
+
+    appointments = [
+        make_quoted_appointment(
+            start_at=base_time + timedelta(weeks=i),
+            end_at=base_time + timedelta(weeks=i, hours=2),
+            current_session=i + 1,
+            total_sessions=3,
+            user_id=user.id,
+        )
+        for i in range(3)
+    ]
+
+    sqlalchemy_appointments_repo.create_many(appointments)
+
+    result = sqlalchemy_appointments_repo.find_overlap(
+        start_date=base_time, end_date=base_time + timedelta(weeks=3), user_id=user.id
+    )
+
+    assert [appointment.id for appointment in result] == [appointment.id for appointment in appointments]
+    assert [appointment.current_session for appointment in result] == [1, 2, 3]
+
+
+def test_find_many_with_cursor_seeks_from_position(
+    sqlalchemy_appointments_repo: SQLAlchemyAppointmentsRepository,
+    make_quoted_appointment,
+    make_user,
+    sqlalchemy_users_repo,
+):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    base_time = datetime(2026, 1, 10, 0, 0, tzinfo=timezone.utc)
+    created = []
+
+    for i in range(5):
+        appointment = make_quoted_appointment(
+            start_at=base_time + timedelta(hours=i),
+            end_at=base_time + timedelta(hours=i, minutes=30),
+            user_id=user.id,
+        )
+        appointment.created_at = base_time + timedelta(minutes=i)
+        sqlalchemy_appointments_repo.create(appointment)
+        created.append(appointment)
+
+    forward = sqlalchemy_appointments_repo.find_many(
+        limit=2,
+        direction=Direction.desc,
+        cursor=PageCursor(created_at=created[3].created_at, id=created[3].id),
+    )
+    backward = sqlalchemy_appointments_repo.find_many(
+        limit=2,
+        direction=Direction.desc,
+        cursor=PageCursor(created_at=created[1].created_at, id=created[1].id, backward=True),
+    )
+
+    assert [appointment.id for appointment in forward] == [created[2].id, created[1].id]
+    assert [appointment.id for appointment in backward] == [created[3].id, created[2].id]
@@ -37,6 +37,26 @@ def test_create_and_find_many_by_entity_name(
     ]
 
 
+def test_create_many(make_audit_log, sqlalchemy_audit_logs_repo, make_user, sqlalchemy_users_repo):
+    base_time = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    sqlalchemy_audit_logs_repo.create_many(
+        [
+            make_audit_log(
+                reason=f"session {i}", performed_at=base_time + timedelta(hours=i), actor_id=user.id
+            )
+            for i in range(3)
+        ]
+    )
+
+    logs = sqlalchemy_audit_logs_repo.find_many_by_entity_name(entity_name="users")
+
+    assert [log.reason for log in logs] == ["session 2", "session 1", "session 0"]
+
+
 def test_actor_id_not_an_user_raises_error(
     make_audit_log, sqlalchemy_audit_logs_repo, make_user, sqlalchemy_users_repo
 ):
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+
+from app.application.studio.services.calendar_index import CalendarIndex, CalendarSnapshot
+from app.infrastructure.sqlalchemy.unit_of_work.write_unit_of_work import SqlAlchemyWriteUnitOfWork
+
+NOW = datetime.now(timezone.utc)
+
+
+def _cached_snapshot(calendar_index, user_id):
+    return calendar_index.get(user_id, start_at=NOW, end_at=NOW + timedelta(days=1))
+
+
+def _put_snapshot(calendar_index, user_id):
+    calendar_index.put(
+        CalendarSnapshot(
+            user_id=user_id,
+            user_is_active=True,
+            calendar_settings=None,
+            horizon_start=NOW,
+            horizon_end=NOW + timedelta(days=7),
+        )
+    )
+
+
+def test_commit_invalidates_changed_calendars(
+    db_session, make_user, make_calendar_settings, make_appointment_base
+):
+    calendar_index = CalendarIndex(ttl=timedelta(seconds=60))
+    uow = SqlAlchemyWriteUnitOfWork(session=db_session, calendar_index=calendar_index)
+
+    artist = make_user()
+    other_artist = make_user(username="other_artist", email="other@artist.com")
+    uow.users.create(artist)
+    uow.users.create(other_artist)
+    uow.calendar_settings.create(make_calendar_settings(user_id=artist.id))
+    uow.commit()
+
+    _put_snapshot(calendar_index, artist.id)
+    _put_snapshot(calendar_index, other_artist.id)
+
+    uow.appointments.create(make_appointment_base(user_id=artist.id))
+
+    assert _cached_snapshot(calendar_index, artist.id) is not None
+
+    uow.commit()
+
+    assert _cached_snapshot(calendar_index, artist.id) is None
+    assert _cached_snapshot(calendar_index, other_artist.id) is not None
+
+
+def test_commit_invalidates_calendar_exception_and_settings_writes(
+    db_session, make_user, make_calendar_settings, make_calendar_exception
+):
+    calendar_index = CalendarIndex(ttl=timedelta(seconds=60))
+    uow = SqlAlchemyWriteUnitOfWork(session=db_session, calendar_index=calendar_index)
+
+    artist = make_user()
+    calendar_settings = make_calendar_settings(user_id=artist.id)
+    uow.users.create(artist)
+    uow.calendar_settings.create(calendar_settings)
+    uow.commit()
+
+    _put_snapshot(calendar_index, artist.id)
+    calendar_exception = make_calendar_exception(calendar_of_user=artist.id, created_by=artist.id)
+    uow.calendar_exceptions.create(calendar_exception)
+    uow.commit()
+
+    assert _cached_snapshot(calendar_index, artist.id) is None
+
+    _put_snapshot(calendar_index, artist.id)
+    uow.calendar_exceptions.delete(calendar_exception.id)
+    uow.commit()
+
+    assert _cached_snapshot(calendar_index, artist.id) is None
+
+    _put_snapshot(calendar_index, artist.id)
+    uow.calendar_settings.update(calendar_settings)
+    uow.commit()
+
+    assert _cached_snapshot(calendar_index, artist.id) is None
+
+
+def test_rollback_keeps_the_index(db_session, make_user, make_appointment_base):
+    calendar_index = CalendarIndex(ttl=timedelta(seconds=60))
+    uow = SqlAlchemyWriteUnitOfWork(session=db_session, calendar_index=calendar_index)
+
+    artist = make_user()
+    uow.users.create(artist)
+    uow.commit()
+
+    _put_snapshot(calendar_index, artist.id)
+    uow.appointments.create(make_appointment_base(user_id=artist.id))
+    uow.rollback()
+    uow.commit()
+
+    assert _cached_snapshot(calendar_index, artist.id) is not None
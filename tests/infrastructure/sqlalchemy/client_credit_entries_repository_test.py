@@ -3,10 +3,14 @@ from uuid import uuid4
 import pytest
 
 from app.application.studio.use_cases.DTO.commun import Direction
+from app.application.studio.use_cases.DTO.credit_balance_drift_dto import CreditBalanceDrift
 from app.domain.studio.finances.entities.client_credit_entry import ClientCreditEntry
 from app.core.types.client_credit_source_type import (
     ClientCreditSourceType,
 )
+from app.infrastructure.sqlalchemy.models.vip_client_credit_balance import (
+    VipClientCreditBalanceModel,
+)
 from app.infrastructure.sqlalchemy.repositories.client_credit_entries_repository import (
     SQLAlchemyClientCreditEntriesRepository,
 )
@@ -14,6 +18,7 @@ from app.infrastructure.sqlalchemy.repositories.vip_clients_repository_sqlalchem
     SQLAlchemyVipClientsRepository,
 )
 
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 
 
@@ -605,3 +610,58 @@ def test_combined_queries(
     assert result[0].created_at >= result[-1].created_at
 
     assert len(result) == 2
+
+
+def test_balance_follows_entries_and_drift_is_rebuilt_from_ledger(
+    sqlalchemy_client_credits_entries_repo: SQLAlchemyClientCreditEntriesRepository,
+    sqlalchemy_vip_clients_repo: SQLAlchemyVipClientsRepository,
+    make_vip_client,
+    make_client_credit_entry,
+):
+    vip_client = make_vip_client()
+    sqlalchemy_vip_clients_repo.create(vip_client)
+
+    for quantity in (10, 5):
+        sqlalchemy_client_credits_entries_repo.create(
+            make_client_credit_entry(
+                quantity=quantity,
+                source_type=ClientCreditSourceType.INDICATION,
+                vip_client_id=vip_client.id,
+            )
+        )
+
+    balance = sqlalchemy_client_credits_entries_repo.get_balance_for_update(vip_client_id=vip_client.id)
+
+    assert balance == 15
+    assert sqlalchemy_client_credits_entries_repo.find_balance_drift() == []
+
+    session = sqlalchemy_client_credits_entries_repo.session
+    session.execute(
+        update(VipClientCreditBalanceModel)
+        .where(VipClientCreditBalanceModel.vip_client_id == vip_client.id)
+        .values(balance=40)
+    )
+
+    assert sqlalchemy_client_credits_entries_repo.find_balance_drift() == [
+        CreditBalanceDrift(vip_client_id=vip_client.id, recorded=40, ledger=15)
+    ]
+
+    rebuilt = sqlalchemy_client_credits_entries_repo.rebuild_balance(vip_client_id=vip_client.id)
+
+    assert rebuilt == 15
+    assert sqlalchemy_client_credits_entries_repo.get_balance(vip_client_id=vip_client.id) == 15
+    assert sqlalchemy_client_credits_entries_repo.find_balance_drift() == []
+
+
+def test_get_balance_for_update_starts_client_without_entries_at_zero(
+    sqlalchemy_client_credits_entries_repo: SQLAlchemyClientCreditEntriesRepository,
+    sqlalchemy_vip_clients_repo: SQLAlchemyVipClientsRepository,
+    make_vip_client,
+):
+    vip_client = make_vip_client()
+    sqlalchemy_vip_clients_repo.create(vip_client)
+
+    balance = sqlalchemy_client_credits_entries_repo.get_balance_for_update(vip_client_id=vip_client.id)
+
+    assert balance == 0
+    assert sqlalchemy_client_credits_entries_repo.find_balance_drift() == []
@@ -26,6 +26,9 @@ from app.infrastructure.sqlalchemy.repositories.payments_repository_sqlalchemy i
 from app.infrastructure.sqlalchemy.repositories.refunds_repository_sqlalchemy import (
     SQLAlchemyRefundsRepository,
 )
+from app.infrastructure.sqlalchemy.repositories.scheduling_admission_repository_sqlalchemy import (
+    SQLAlchemySchedulingAdmissionRepository,
+)
 from app.infrastructure.sqlalchemy.repositories.users_repository_sqlalchemy import (
     SQLAlchemyUsersRepository,
 )
@@ -134,6 +137,13 @@ def sqlalchemy_calendar_exceptions_repo(
     return SQLAlchemyCalendarExceptionsRepository(session=db_session)
 
 
+@pytest.fixture
+def sqlalchemy_scheduling_admission_repo(
+    db_session: Session,
+) -> SQLAlchemySchedulingAdmissionRepository:
+    return SQLAlchemySchedulingAdmissionRepository(session=db_session)
+
+
 @pytest.fixture
 def sqlalchemy_write_uow(db_session):
     write_uow = SqlAlchemyWriteUnitOfWork(session=db_session)
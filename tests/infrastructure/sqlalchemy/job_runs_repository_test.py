@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta, timezone
+
+from app.infrastructure.sqlalchemy.repositories.job_runs_repository_sqlalchemy import (
+    SQLAlchemyJobRunsRepository,
+)
+
+WINDOW_START = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+
+def test_try_claim_runs_each_window_once(db_session):
+    repo = SQLAlchemyJobRunsRepository(db_session)
+
+    assert repo.try_claim("digest", window_start=WINDOW_START) is True
+    assert repo.try_claim("digest", window_start=WINDOW_START) is False
+    assert repo.try_claim("digest", window_start=WINDOW_START - timedelta(days=1)) is False
+
+    assert repo.try_claim("digest", window_start=WINDOW_START + timedelta(days=1)) is True
+
+
+def test_try_claim_keeps_jobs_apart(db_session):
+    repo = SQLAlchemyJobRunsRepository(db_session)
+
+    assert repo.try_claim("digest", window_start=WINDOW_START) is True
+    assert repo.try_claim("reconciliation", window_start=WINDOW_START) is True
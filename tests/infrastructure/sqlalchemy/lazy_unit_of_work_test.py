@@ -0,0 +1,85 @@
+from sqlalchemy import event
+
+from app.infrastructure.sqlalchemy.repositories.users_repository_sqlalchemy import (
+    SQLAlchemyUsersRepository,
+)
+from app.infrastructure.sqlalchemy.session import RequestSession, hold_identity_map
+from app.infrastructure.sqlalchemy.unit_of_work.read_unit_of_work import SqlAlchemyReadUnitOfWork
+from app.infrastructure.sqlalchemy.unit_of_work.write_unit_of_work import SqlAlchemyWriteUnitOfWork
+
+
+def test_unit_of_work_does_not_open_a_session_before_it_is_used():
+    read_uow = SqlAlchemyReadUnitOfWork()
+    write_uow = SqlAlchemyWriteUnitOfWork()
+
+    with write_uow:
+        pass
+    read_uow.close()
+
+    assert read_uow.has_session is False
+    assert write_uow.has_session is False
+    assert "users" not in vars(read_uow)
+
+
+def test_repositories_are_built_once_on_first_access(db_session):
+    uow = SqlAlchemyReadUnitOfWork(session=db_session)
+
+    users = uow.users
+
+    assert isinstance(users, SQLAlchemyUsersRepository)
+    assert uow.users is users
+    assert users.session is db_session
+    assert "appointments" not in vars(uow)
+
+
+def test_write_unit_of_work_commits_through_lazy_repositories(db_session, make_user):
+    write_uow = SqlAlchemyWriteUnitOfWork(session=db_session)
+    user = make_user()
+
+    write_uow.users.create(user)
+    write_uow.commit()
+
+    assert SqlAlchemyReadUnitOfWork(session=db_session).users.find_by_id(user.id) is not None
+
+
+def test_request_session_is_opened_once_and_shared(db_session):
+    opened = []
+
+    def session_factory():
+        opened.append(db_session)
+        return db_session
+
+    request_session = RequestSession(session_factory)
+    read_uow = SqlAlchemyReadUnitOfWork(session_factory=request_session)
+    write_uow = SqlAlchemyWriteUnitOfWork(session_factory=request_session)
+
+    assert opened == []
+
+    assert read_uow.users.session is write_uow.users.session
+    assert len(opened) == 1
+
+
+def test_read_side_is_served_from_the_write_identity_map(engine, db_session, make_user):
+    hold_identity_map(db_session)
+    request_session = RequestSession(lambda: db_session)
+    read_uow = SqlAlchemyReadUnitOfWork(session_factory=request_session)
+    write_uow = SqlAlchemyWriteUnitOfWork(session_factory=request_session)
+
+    user = make_user()
+    write_uow.users.create(user)
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        found_by_read = read_uow.users.find_by_id(user.id)
+        found_by_write = write_uow.users.find_by_id(user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert found_by_read is not None and found_by_write is not None
+    assert found_by_read.id == found_by_write.id == user.id
+    assert statements == []
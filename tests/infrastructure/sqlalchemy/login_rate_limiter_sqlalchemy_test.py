@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.application.studio.services.login_rate_limiter import LoginRateLimit
+from app.infrastructure.sqlalchemy.login_rate_limiter import SqlAlchemyLoginRateLimiter
+from app.infrastructure.sqlalchemy.models.login_attempts import LoginAttemptModel
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, future=True)
+
+
+@pytest.mark.asyncio
+async def test_attempts_are_shared_through_the_table(session_factory):
+    limits = [LoginRateLimit(key="identifier:jhon", max_attempts=2)]
+    first_worker = SqlAlchemyLoginRateLimiter(
+        window=timedelta(minutes=15), session_factory=session_factory
+    )
+    second_worker = SqlAlchemyLoginRateLimiter(
+        window=timedelta(minutes=15), session_factory=session_factory
+    )
+
+    assert await first_worker.acquire(limits) is None
+    assert await second_worker.acquire(limits) is None
+
+    retry_after = await first_worker.acquire(limits)
+
+    assert retry_after is not None
+    assert 0 < retry_after <= 15 * 60
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(LoginAttemptModel)) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_attempts_are_deleted(session_factory):
+    limiter = SqlAlchemyLoginRateLimiter(window=timedelta(minutes=15), session_factory=session_factory)
+
+    with session_factory() as session, session.begin():
+        session.add(
+            LoginAttemptModel(
+                key="identifier:jhon",
+                attempted_at=datetime.now(timezone.utc) - timedelta(minutes=16),
+            )
+        )
+
+    assert await limiter.acquire([LoginRateLimit(key="identifier:jhon", max_attempts=1)]) is None
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(LoginAttemptModel)) == 1
+
+
+@pytest.mark.asyncio
+async def test_login_only_prunes_its_own_keys_and_the_sweep_prunes_the_rest(session_factory):
+    limiter = SqlAlchemyLoginRateLimiter(window=timedelta(minutes=15), session_factory=session_factory)
+
+    with session_factory() as session, session.begin():
+        session.add(
+            LoginAttemptModel(
+                key="identifier:jane",
+                attempted_at=datetime.now(timezone.utc) - timedelta(minutes=16),
+            )
+        )
+
+    assert await limiter.acquire([LoginRateLimit(key="identifier:jhon", max_attempts=1)]) is None
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(LoginAttemptModel)) == 2
+
+    assert await limiter.prune_expired() == 1
+
+    with session_factory() as session:
+        assert session.scalars(select(LoginAttemptModel.key)).all() == ["identifier:jhon"]
+
+
+@pytest.mark.asyncio
+async def test_reset_deletes_the_key_attempts(session_factory):
+    limiter = SqlAlchemyLoginRateLimiter(window=timedelta(minutes=15), session_factory=session_factory)
+    limits = [LoginRateLimit(key="identifier:jhon", max_attempts=1)]
+
+    await limiter.acquire(limits)
+    await limiter.reset("identifier:jhon")
+
+    assert await limiter.acquire(limits) is None
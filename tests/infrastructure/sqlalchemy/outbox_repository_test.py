@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.application.studio.use_cases.DTO.outbox_dto import OutboxMessage
+from app.core.types.outbox_enums import OutboxStatus
+from app.infrastructure.sqlalchemy.repositories.outbox_repository_sqlalchemy import (
+    SQLAlchemyOutboxRepository,
+)
+
+NOW = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def _message(available_at: datetime = NOW) -> OutboxMessage:
+    return OutboxMessage(
+        id=uuid4(),
+        event_type="ActivationEmailRequested",
+        handler_name="SendUserActivationHandler",
+        payload={"email": "jhon@doe.com"},
+        created_at=NOW,
+        available_at=available_at,
+    )
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # sqlite hands timezone aware columns back as naive UTC
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment
+
+
+def test_claim_batch_takes_available_messages_and_hides_them(db_session):
+    repo = SQLAlchemyOutboxRepository(db_session)
+    available = _message()
+    later = _message(available_at=NOW + timedelta(minutes=5))
+    repo.add_many([available, later])
+
+    claimed = repo.claim_batch(limit=10, now=NOW, lease=timedelta(minutes=1))
+
+    assert [message.id for message in claimed] == [available.id]
+    assert claimed[0].attempts == 1
+    assert claimed[0].payload == {"email": "jhon@doe.com"}
+    assert repo.claim_batch(limit=10, now=NOW, lease=timedelta(minutes=1)) == []
+
+    reclaimed = repo.claim_batch(limit=10, now=NOW + timedelta(minutes=1), lease=timedelta(minutes=1))
+    assert [message.id for message in reclaimed] == [available.id]
+    assert reclaimed[0].attempts == 2
+
+
+def test_claim_batch_respects_limit(db_session):
+    repo = SQLAlchemyOutboxRepository(db_session)
+    repo.add_many([_message() for _ in range(3)])
+
+    assert len(repo.claim_batch(limit=2, now=NOW, lease=timedelta(minutes=1))) == 2
+
+
+def test_dispatched_and_failed_messages_are_not_claimed_again(db_session):
+    repo = SQLAlchemyOutboxRepository(db_session)
+    dispatched = _message()
+    failed = _message()
+    retried = _message()
+    repo.add_many([dispatched, failed, retried])
+
+    repo.mark_dispatched(dispatched.id, dispatched_at=NOW)
+    repo.mark_failed(failed.id, error="boom", retry_at=None)
+    repo.mark_failed(retried.id, error="boom", retry_at=NOW + timedelta(minutes=2))
+
+    later = NOW + timedelta(minutes=2)
+    claimed = repo.claim_batch(limit=10, now=later, lease=timedelta(minutes=1))
+
+    assert [message.id for message in claimed] == [retried.id]
+    assert claimed[0].last_error == "boom"
+    assert claimed[0].status == OutboxStatus.PENDING
+    assert _as_utc(claimed[0].available_at) == later + timedelta(minutes=1)
+
+
+def test_deferred_message_gets_its_attempt_back(db_session):
+    repo = SQLAlchemyOutboxRepository(db_session)
+    message = _message()
+    repo.add_many([message])
+    repo.claim_batch(limit=10, now=NOW, lease=timedelta(minutes=1))
+
+    repo.mark_deferred(message.id, error="circuit open", retry_at=NOW + timedelta(minutes=5))
+
+    assert repo.claim_batch(limit=10, now=NOW + timedelta(minutes=4), lease=timedelta(minutes=1)) == []
+
+    [claimed] = repo.claim_batch(limit=10, now=NOW + timedelta(minutes=5), lease=timedelta(minutes=1))
+    assert claimed.attempts == 1
+    assert claimed.last_error == "circuit open"
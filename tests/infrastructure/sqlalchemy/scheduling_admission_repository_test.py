@@ -0,0 +1,380 @@
+from datetime import datetime, time, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from app.core.types.appointment_enums import AppointmentStatus
+from app.core.types.calendar_enums import CalendarExceptionType
+from app.infrastructure.sqlalchemy.repositories.scheduling_admission_repository_sqlalchemy import (
+    SQLAlchemySchedulingAdmissionRepository,
+)
+
+# 2026-01-05 is a monday
+MONDAY = datetime(2026, 1, 5, 0, 0, tzinfo=timezone.utc)
+
+
+def _setup_calendar(
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    calendar = make_calendar_settings(
+        user_id=user.id,
+        working_periods=[
+            make_working_period(weekday=0, start_at=time(8, 0), end_at=time(12, 0)),
+            make_working_period(weekday=0, start_at=time(14, 0), end_at=time(18, 0)),
+            make_working_period(weekday=1, start_at=time(8, 0), end_at=time(12, 0)),
+        ],
+    )
+    sqlalchemy_calendar_settings_repo.create(calendar)
+
+    return user
+
+
+def test_find_admission_returns_none_for_unknown_user(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+):
+    admission = sqlalchemy_scheduling_admission_repo.find_admission(
+        user_id=uuid4(), start_at=MONDAY, end_at=MONDAY + timedelta(hours=1)
+    )
+
+    assert admission is None
+
+
+def test_find_admission_without_calendar(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+    sqlalchemy_users_repo,
+    make_user,
+):
+    user = make_user(is_active=False)
+    sqlalchemy_users_repo.create(user)
+
+    admission = sqlalchemy_scheduling_admission_repo.find_admission(
+        user_id=user.id, start_at=MONDAY, end_at=MONDAY + timedelta(hours=1)
+    )
+
+    assert admission is not None
+    assert admission.user_is_active is False
+    assert admission.calendar_settings is None
+    assert admission.calendar_exceptions == []
+    assert admission.slot_is_occupied is False
+
+
+def test_find_admission_only_loads_periods_of_the_start_weekday(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+):
+    user = _setup_calendar(
+        sqlalchemy_users_repo,
+        sqlalchemy_calendar_settings_repo,
+        make_user,
+        make_calendar_settings,
+        make_working_period,
+    )
+
+    admission = sqlalchemy_scheduling_admission_repo.find_admission(
+        user_id=user.id,
+        start_at=MONDAY + timedelta(hours=9),
+        end_at=MONDAY + timedelta(hours=10),
+    )
+
+    assert admission is not None
+    assert admission.user_is_active is True
+    assert admission.calendar_settings is not None
+    assert admission.calendar_settings.user_id == user.id
+    assert [period.start_at for period in admission.calendar_settings.working_periods] == [
+        time(8, 0),
+        time(14, 0),
+    ]
+    assert all(period.weekday == 0 for period in admission.calendar_settings.working_periods)
+
+
+def test_find_admission_detects_active_overlap_only(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    sqlalchemy_appointments_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+    make_quoted_appointment,
+):
+    user = _setup_calendar(
+        sqlalchemy_users_repo,
+        sqlalchemy_calendar_settings_repo,
+        make_user,
+        make_calendar_settings,
+        make_working_period,
+    )
+
+    canceled = make_quoted_appointment(
+        user_id=user.id,
+        start_at=MONDAY + timedelta(hours=9),
+        end_at=MONDAY + timedelta(hours=10),
+    )
+    canceled.status = AppointmentStatus.CANCELED
+    sqlalchemy_appointments_repo.create(canceled)
+
+    free = sqlalchemy_scheduling_admission_repo.find_admission(
+        user_id=user.id,
+        start_at=MONDAY + timedelta(hours=9),
+        end_at=MONDAY + timedelta(hours=10),
+    )
+
+    sqlalchemy_appointments_repo.create(
+        make_quoted_appointment(
+            user_id=user.id,
+            start_at=MONDAY + timedelta(hours=9, minutes=30),
+            end_at=MONDAY + timedelta(hours=11),
+        )
+    )
+
+    occupied = sqlalchemy_scheduling_admission_repo.find_admission(
+        user_id=user.id,
+        start_at=MONDAY + timedelta(hours=9),
+        end_at=MONDAY + timedelta(hours=10),
+    )
+
+    assert free is not None and free.slot_is_occupied is False
+    assert occupied is not None and occupied.slot_is_occupied is True
+
+
+def test_find_admission_reads_actor_role_and_exceptions(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    sqlalchemy_calendar_exceptions_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+    make_calendar_exception,
+):
+    user = _setup_calendar(
+        sqlalchemy_users_repo,
+        sqlalchemy_calendar_settings_repo,
+        make_user,
+        make_calendar_settings,
+        make_working_period,
+    )
+    admin = make_user(username="admin", email="admin@doe.com", is_admin=True)
+    sqlalchemy_users_repo.create(admin)
+
+    sqlalchemy_calendar_exceptions_repo.create(
+        make_calendar_exception(
+            calendar_of_user=user.id,
+            start_at=MONDAY + timedelta(hours=8),
+            end_at=MONDAY + timedelta(hours=12),
+            exception_type=CalendarExceptionType.BLOCK,
+            created_by=admin.id,
+        )
+    )
+
+    as_admin = sqlalchemy_scheduling_admission_repo.find_admission(
+        user_id=user.id,
+        start_at=MONDAY + timedelta(hours=9),
+        end_at=MONDAY + timedelta(hours=10),
+        actor_id=admin.id,
+    )
+    as_client = sqlalchemy_scheduling_admission_repo.find_admission(
+        user_id=user.id,
+        start_at=MONDAY + timedelta(hours=9),
+        end_at=MONDAY + timedelta(hours=10),
+    )
+
+    assert as_admin is not None and as_admin.actor_is_admin is True
+    assert as_client is not None and as_client.actor_is_admin is False
+    assert len(as_admin.calendar_exceptions) == 1
+    assert as_admin.calendar_exceptions[0].exception_type == CalendarExceptionType.BLOCK
+
+
+def test_find_admission_uses_at_most_two_statements(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+    db_session,
+):
+    user = _setup_calendar(
+        sqlalchemy_users_repo,
+        sqlalchemy_calendar_settings_repo,
+        make_user,
+        make_calendar_settings,
+        make_working_period,
+    )
+    db_session.expunge_all()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+
+    try:
+        sqlalchemy_scheduling_admission_repo.find_admission(
+            user_id=user.id,
+            start_at=MONDAY + timedelta(hours=9),
+            end_at=MONDAY + timedelta(hours=10),
+            actor_id=user.id,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert len(statements) == 2
+
+
+def _setup_studio(
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    sqlalchemy_calendar_exceptions_repo,
+    sqlalchemy_appointments_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+    make_calendar_exception,
+    make_appointment_base,
+):
+    artists = [
+        make_user(username=f"artist_{index}", email=f"artist_{index}@studio.com") for index in range(3)
+    ]
+    inactive = make_user(username="inactive", email="inactive@studio.com", is_active=False)
+
+    for artist in [*artists, inactive]:
+        sqlalchemy_users_repo.create(artist)
+        sqlalchemy_calendar_settings_repo.create(
+            make_calendar_settings(
+                user_id=artist.id,
+                working_periods=[
+                    make_working_period(weekday=0, start_at=time(8, 0), end_at=time(12, 0)),
+                    make_working_period(weekday=1, start_at=time(8, 0), end_at=time(12, 0)),
+                ],
+            )
+        )
+
+    sqlalchemy_calendar_exceptions_repo.create(
+        make_calendar_exception(
+            calendar_of_user=artists[0].id,
+            start_at=MONDAY + timedelta(hours=8),
+            end_at=MONDAY + timedelta(hours=9),
+            exception_type=CalendarExceptionType.BLOCK,
+            created_by=artists[0].id,
+        )
+    )
+    sqlalchemy_appointments_repo.create(
+        make_appointment_base(
+            user_id=artists[1].id,
+            start_at=MONDAY + timedelta(hours=10),
+            end_at=MONDAY + timedelta(hours=11),
+        )
+    )
+    canceled = make_appointment_base(
+        user_id=artists[1].id,
+        start_at=MONDAY + timedelta(hours=8),
+        end_at=MONDAY + timedelta(hours=9),
+    )
+    canceled.status = AppointmentStatus.CANCELED
+    sqlalchemy_appointments_repo.create(canceled)
+    sqlalchemy_appointments_repo.create(
+        make_appointment_base(
+            user_id=artists[2].id,
+            start_at=MONDAY + timedelta(days=3, hours=8),
+            end_at=MONDAY + timedelta(days=3, hours=9),
+        )
+    )
+
+    return artists
+
+
+def test_find_artist_calendars_loads_every_active_calendar(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    sqlalchemy_calendar_exceptions_repo,
+    sqlalchemy_appointments_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+    make_calendar_exception,
+    make_appointment_base,
+):
+    artists = _setup_studio(
+        sqlalchemy_users_repo,
+        sqlalchemy_calendar_settings_repo,
+        sqlalchemy_calendar_exceptions_repo,
+        sqlalchemy_appointments_repo,
+        make_user,
+        make_calendar_settings,
+        make_working_period,
+        make_calendar_exception,
+        make_appointment_base,
+    )
+
+    calendars = sqlalchemy_scheduling_admission_repo.find_artist_calendars(
+        start_at=MONDAY, end_at=MONDAY + timedelta(days=1)
+    )
+
+    assert [calendar.user_id for calendar in calendars] == [artist.id for artist in artists]
+    assert all(len(calendar.calendar_settings.working_periods) == 2 for calendar in calendars)
+
+    first, second, third = calendars
+    assert len(first.calendar_exceptions) == 1
+    assert first.booked_slots == []
+    assert second.calendar_exceptions == []
+    assert [slot.start_at.hour for slot in second.booked_slots] == [10]
+    assert third.booked_slots == []
+
+
+def test_find_artist_calendars_statement_count_does_not_grow_with_artists(
+    sqlalchemy_scheduling_admission_repo: SQLAlchemySchedulingAdmissionRepository,
+    sqlalchemy_users_repo,
+    sqlalchemy_calendar_settings_repo,
+    sqlalchemy_calendar_exceptions_repo,
+    sqlalchemy_appointments_repo,
+    make_user,
+    make_calendar_settings,
+    make_working_period,
+    make_calendar_exception,
+    make_appointment_base,
+    db_session,
+):
+    _setup_studio(
+        sqlalchemy_users_repo,
+        sqlalchemy_calendar_settings_repo,
+        sqlalchemy_calendar_exceptions_repo,
+        sqlalchemy_appointments_repo,
+        make_user,
+        make_calendar_settings,
+        make_working_period,
+        make_calendar_exception,
+        make_appointment_base,
+    )
+    db_session.expunge_all()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+
+    try:
+        sqlalchemy_scheduling_admission_repo.find_artist_calendars(
+            start_at=MONDAY, end_at=MONDAY + timedelta(days=7)
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert len(statements) == 3
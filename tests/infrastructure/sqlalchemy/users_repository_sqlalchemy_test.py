@@ -1,14 +1,18 @@
+from datetime import timedelta
 from uuid import UUID
 
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from app.application.studio.services.access_token_cache import AccessTokenCache, UserAccess
 from app.core.security.passwords import hash_password, verify_password
 
 from app.domain.studio.users.entities.user import User
+from app.infrastructure.sqlalchemy.access_changes import access_token_cache
 from app.infrastructure.sqlalchemy.repositories.users_repository_sqlalchemy import (
     SQLAlchemyUsersRepository,
 )
+from app.infrastructure.sqlalchemy.unit_of_work.write_unit_of_work import SqlAlchemyWriteUnitOfWork
 
 
 def test_create_and_find_by_id(
@@ -170,3 +174,33 @@ def test_update_does_not_modify_immutable_fields(sqlalchemy_users_repo, make_use
     assert original is not None
 
     assert result.created_at == original.created_at
+
+
+def test_update_invalidates_cached_user_access(sqlalchemy_users_repo, make_user):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+    access_token_cache.put_user(
+        user.id, UserAccess(access_token_version=0, is_active=True, is_admin=False)
+    )
+
+    user.deactivate()
+    sqlalchemy_users_repo.update(user)
+
+    assert access_token_cache.get_user(user.id) is None
+
+
+def test_write_commit_invalidates_users_reloaded_before_it(db_session, make_user):
+    cache = AccessTokenCache(user_ttl=timedelta(seconds=30))
+    uow = SqlAlchemyWriteUnitOfWork(session=db_session, access_token_cache=cache)
+
+    user = make_user()
+    uow.users.create(user)
+    user.promote_to_admin()
+    uow.users.update(user)
+
+    # a verification that ran between the update and the commit
+    cache.put_user(user.id, UserAccess(access_token_version=0, is_active=True, is_admin=False))
+
+    uow.commit()
+
+    assert cache.get_user(user.id) is None
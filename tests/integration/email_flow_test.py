@@ -8,7 +8,7 @@ from app.api.dependencies.write_unit_of_work import get_write_unit_of_work
 from app.application.event_bus.setup import setup_event_bus
 from app.main import app
 from tests.fakes.fake_email_service import FakeEmailService
-from tests.integration.utils.wait_until import wait_until
+from tests.integration.utils.dispatch_outbox import dispatch_outbox
 
 client = TestClient(app)
 
@@ -40,7 +40,7 @@ def test_create_user_triggers_email(write_uow, read_uow, make_user, make_token,
 
         assert response.status_code == 201
 
-        wait_until(lambda: fake_email_service.sent)
+        dispatch_outbox(integration_bus, write_uow, read_uow)
 
         assert fake_email_service.sent is True
         assert fake_email_service.last_payload is not None
@@ -79,6 +79,9 @@ def test_create_user_failure_does_not_trigger_email(
         )
 
         assert response.status_code == 409
+
+        dispatch_outbox(integration_bus, write_uow, read_uow)
+
         assert fake_email_service.sent is False
 
     app.dependency_overrides = {}
@@ -111,7 +114,7 @@ def test_resend_activation_email_triggers_email(
 
         assert response.status_code == 200
 
-        wait_until(lambda: fake_email_service.sent)
+        dispatch_outbox(integration_bus, write_uow, read_uow)
 
         assert fake_email_service.sent is True
         assert fake_email_service.last_payload is not None
@@ -147,6 +150,9 @@ def test_resend_activation_email_error_does_not_triggers_email(
         )  # email is from a not found user
 
         assert response.status_code == 404
+
+        dispatch_outbox(integration_bus, write_uow, read_uow)
+
         assert fake_email_service.sent is False
 
     app.dependency_overrides = {}
@@ -187,7 +193,7 @@ def test_create_vip_client_triggers_email(
 
     assert response.status_code == 201
 
-    wait_until(lambda: fake_email_service.sent)
+    dispatch_outbox(integration_bus, write_uow, read_uow)
 
     assert fake_email_service.sent is True
     assert fake_email_service.last_payload is not None
@@ -239,6 +245,9 @@ def test_create_vip_client_failure_does_not_trigger_email(
     )
 
     assert response.status_code == 409
+
+    dispatch_outbox(integration_bus, write_uow, read_uow)
+
     assert fake_email_service.sent is False
 
     app.dependency_overrides = {}
@@ -271,7 +280,7 @@ def test_reset_password_request_triggers_email(
 
     assert response.status_code == 200
 
-    wait_until(lambda: fake_email_service.sent)
+    dispatch_outbox(integration_bus, write_uow, read_uow)
 
     assert fake_email_service.sent is True
     assert fake_email_service.last_payload is not None
@@ -306,6 +315,9 @@ def test_reset_password_request_failure_does_not_trigger_email(
     )  # email is from a not found user
 
     assert response.status_code == 200  # route respond 200 even if not found
+
+    dispatch_outbox(integration_bus, write_uow, read_uow)
+
     assert fake_email_service.sent is False
 
     app.dependency_overrides = {}
@@ -371,7 +383,7 @@ def test_create_appointment_request_triggers_email(
 
     assert response.status_code == 201
 
-    wait_until(lambda: len(fake_email_service.sent_emails) >= 2)
+    dispatch_outbox(integration_bus, write_uow, read_uow)
 
     recipients = {email["to"] for email in fake_email_service.sent_emails}
 
@@ -0,0 +1,13 @@
+import asyncio
+
+from app.application.event_bus.outbox_dispatcher import OutboxDispatcher
+
+
+def dispatch_outbox(integration_bus, write_uow, read_uow) -> int:
+    dispatcher = OutboxDispatcher(
+        integration_bus=integration_bus,
+        write_uow_factory=lambda: write_uow,
+        read_uow_factory=lambda: read_uow,
+    )
+
+    return asyncio.run(dispatcher.dispatch_once())
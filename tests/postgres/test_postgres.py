@@ -4,8 +4,10 @@ from uuid import uuid4
 
 import pytest
 from sqlalchemy.exc import DatabaseError, IntegrityError
+from sqlalchemy.orm import Session
 
-from app.core.types.appointment_enums import AppointmentType
+from app.core.exceptions.appointments import SlotIsAlreadyOccupiedError
+from app.core.types.appointment_enums import AppointmentStatus, AppointmentType
 from app.infrastructure.sqlalchemy.models.appointments import AppointmentModel
 from app.infrastructure.sqlalchemy.repositories.appointments_repository_sqlalchemy import (
     SQLAlchemyAppointmentsRepository,
@@ -13,6 +15,9 @@ from app.infrastructure.sqlalchemy.repositories.appointments_repository_sqlalche
 from app.infrastructure.sqlalchemy.repositories.audit_logs_repository import (
     SQLAlchemyAuditLogsRepository,
 )
+from app.infrastructure.sqlalchemy.repositories.job_runs_repository_sqlalchemy import (
+    SQLAlchemyJobRunsRepository,
+)
 from app.infrastructure.sqlalchemy.repositories.users_repository_sqlalchemy import (
     SQLAlchemyUsersRepository,
 )
@@ -197,3 +202,72 @@ def test_session_recovers_after_rollback(
     found = sqlalchemy_appointments_repo.find_by_id(valid.id)
 
     assert found is not None
+
+
+def test_exclusion_constraint_rejects_overlapping_appointments(
+    sqlalchemy_appointments_repo: SQLAlchemyAppointmentsRepository,
+    make_quoted_appointment,
+    make_user,
+    sqlalchemy_users_repo: SQLAlchemyUsersRepository,
+):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    start = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+    sqlalchemy_appointments_repo.create(
+        make_quoted_appointment(start_at=start, end_at=start + timedelta(hours=2), user_id=user.id)
+    )
+
+    with pytest.raises(SlotIsAlreadyOccupiedError):
+        sqlalchemy_appointments_repo.create(
+            make_quoted_appointment(
+                start_at=start + timedelta(hours=1), end_at=start + timedelta(hours=3), user_id=user.id
+            )
+        )
+
+
+def test_exclusion_constraint_allows_touching_and_canceled_appointments(
+    sqlalchemy_appointments_repo: SQLAlchemyAppointmentsRepository,
+    make_quoted_appointment,
+    make_user,
+    sqlalchemy_users_repo: SQLAlchemyUsersRepository,
+):
+    user = make_user()
+    sqlalchemy_users_repo.create(user)
+
+    start = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+    canceled = make_quoted_appointment(
+        start_at=start, end_at=start + timedelta(hours=2), user_id=user.id
+    )
+    canceled.status = AppointmentStatus.CANCELED
+    sqlalchemy_appointments_repo.create(canceled)
+
+    sqlalchemy_appointments_repo.create(
+        make_quoted_appointment(start_at=start, end_at=start + timedelta(hours=2), user_id=user.id)
+    )
+    sqlalchemy_appointments_repo.create(
+        make_quoted_appointment(
+            start_at=start + timedelta(hours=2), end_at=start + timedelta(hours=3), user_id=user.id
+        )
+    )
+
+    found = sqlalchemy_appointments_repo.find_overlap(
+        start_date=start, end_date=start + timedelta(hours=3), user_id=user.id
+    )
+
+    assert len(found) == 2
+
+
+def test_job_claim_keeps_a_second_worker_out_while_the_first_runs(engine):
+    window_start = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+    with Session(engine) as first_worker, Session(engine) as second_worker:
+        assert SQLAlchemyJobRunsRepository(first_worker).try_claim("test_job", window_start=window_start)
+        assert not SQLAlchemyJobRunsRepository(second_worker).try_claim(
+            "test_job", window_start=window_start
+        )
+
+        first_worker.rollback()
+        second_worker.rollback()